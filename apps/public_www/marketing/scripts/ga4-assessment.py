@@ -8,21 +8,29 @@ Required environment variables:
     EVOLVESPROUTS_GOOGLE_SERVICE_ACCOUNT_JSON    Service account credentials JSON
 
 Usage:
-    python3 ga4-assessment.py [--out PATH]
+    python3 ga4-assessment.py [--out PATH] [--cache-mode MODE] [--as-of DATE]
 
 `--out` mirrors stdout to the given file (raw plaintext). Intended to be
 committed into `marketing/generated-reports/` (git-ignored) for later
 reference when authoring the narrative markdown assessment.
+
+Reports are sent in `batchRunReports` calls (five per call) that run
+concurrently; responses are cached on disk (see `report_runner.py`).
 """
 
 import argparse
 import contextlib
+import json
 import os
 import sys
 import tempfile
+import threading
+from datetime import timedelta
 
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
+    BatchRunReportsResponse,
     DateRange,
     Dimension,
     Metric,
@@ -30,6 +38,13 @@ from google.analytics.data_v1beta.types import (
 )
 from google.oauth2 import service_account
 
+from report_runner import add_runner_args, runner_from_args
+
+# batchRunReports accepts at most five report requests per call.
+GA4_BATCH_SIZE = 5
+# Stay well under the per-property concurrent request quota.
+GA4_MIN_INTERVAL_SECONDS = 0.2
+
 
 class _Tee:
     """Minimal tee: write to every underlying stream."""
@@ -60,19 +75,32 @@ def _client():
     return BetaAnalyticsDataClient(credentials=creds)
 
 
-def _run(
-    client,
+class _LazyClient:
+    """Create the Data API client on first use (never in replay mode)."""
+
+    def __init__(self):
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._client is None:
+                self._client = _client()
+            return self._client
+
+
+def _request(
     prop,
     dims,
     mets,
+    date_range,
     dim_filter=None,
     order_bys=None,
     limit=25,
-    date_range="30daysAgo",
 ):
     req = RunReportRequest(
         property=prop,
-        date_ranges=[DateRange(start_date=date_range, end_date="today")],
+        date_ranges=[DateRange(start_date=date_range[0], end_date=date_range[1])],
         dimensions=[Dimension(name=d) for d in dims],
         metrics=[Metric(name=m) for m in mets],
         limit=limit,
@@ -81,162 +109,158 @@ def _run(
         req.dimension_filter = dim_filter
     if order_bys:
         req.order_bys = order_bys
-    return client.run_report(req)
+    return req
 
 
-def main():
-    prop_id = os.environ.get("EVOLVESPROUTS_GA4_PROPERTY_ID", "")
-    if not prop_id:
-        sys.exit("EVOLVESPROUTS_GA4_PROPERTY_ID not set")
+def _run_reports(runner, client, prop, requests, date_range):
+    """Run reports in concurrent batches; ``(response, error)`` per request."""
+    batches = [
+        requests[i : i + GA4_BATCH_SIZE]
+        for i in range(0, len(requests), GA4_BATCH_SIZE)
+    ]
+
+    def job(batch):
+        def load():
+            response = client.get().batch_run_reports(
+                BatchRunReportsRequest(property=prop, requests=batch)
+            )
+            return BatchRunReportsResponse.to_json(response)
+
+        key = [json.loads(RunReportRequest.to_json(req)) for req in batch]
+        payload = runner.fetch("ga4", key, date_range, load)
+        return BatchRunReportsResponse.from_json(payload).reports
+
+    outcomes = []
+    for (reports, error), batch in zip(
+        runner.run_all([lambda b=batch: job(b) for batch in batches]), batches
+    ):
+        if error is not None:
+            outcomes.extend((None, error) for _ in batch)
+        else:
+            outcomes.extend((report, None) for report in reports)
+    return outcomes
+
+
+def _print_overview(r):
+    for row in r.rows:
+        v = row.metric_values
+        print(
+            f"  Sessions: {v[0].value} | Users: {v[1].value} "
+            f"(New: {v[2].value})\n"
+            f"  Engaged: {v[3].value} | Avg Session Duration: "
+            f"{float(v[4].value):.0f}s | "
+            f"Bounce: {float(v[5].value) * 100:.1f}%\n"
+            f"  Engagement Rate: {float(v[6].value) * 100:.1f}% | "
+            f"Avg Engagement Time: {float(v[7].value) / max(int(v[1].value or 1), 1):.1f}s/user\n"
+            f"  Pageviews: {v[8].value} | Conversions: {v[9].value}"
+        )
 
-    client = _client()
-    prop = f"properties/{prop_id}"
 
-    # Site overview
-    print("--- SITE OVERVIEW (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            [],
-            [
-                "sessions",
-                "totalUsers",
-                "newUsers",
-                "engagedSessions",
-                "averageSessionDuration",
-                "bounceRate",
-                "engagementRate",
-                "userEngagementDuration",
-                "screenPageViews",
-                "conversions",
-            ],
+def _print_source_medium(r):
+    for row in r.rows:
+        src = row.dimension_values[0].value
+        med = row.dimension_values[1].value
+        v = row.metric_values
+        bounce = float(v[4].value) * 100
+        print(
+            f"  {src}/{med} | Sessions: {v[0].value} | "
+            f"Users: {v[1].value} | Engaged: {v[2].value} | "
+            f"Conv: {v[3].value} | Bounce: {bounce:.0f}%"
         )
-        for row in r.rows:
-            v = row.metric_values
-            print(
-                f"  Sessions: {v[0].value} | Users: {v[1].value} "
-                f"(New: {v[2].value})\n"
-                f"  Engaged: {v[3].value} | Avg Session Duration: "
-                f"{float(v[4].value):.0f}s | "
-                f"Bounce: {float(v[5].value) * 100:.1f}%\n"
-                f"  Engagement Rate: {float(v[6].value) * 100:.1f}% | "
-                f"Avg Engagement Time: {float(v[7].value) / max(int(v[1].value or 1), 1):.1f}s/user\n"
-                f"  Pageviews: {v[8].value} | Conversions: {v[9].value}"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Traffic by source/medium
-    print("--- TRAFFIC BY SOURCE/MEDIUM (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["sessionSource", "sessionMedium"],
-            ["sessions", "totalUsers", "engagedSessions", "conversions", "bounceRate"],
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-            limit=20,
+
+
+def _print_cpc(r):
+    if not r.rows:
+        print("  No CPC traffic.")
+    for row in r.rows:
+        d = row.dimension_values
+        v = row.metric_values
+        print(
+            f"  {d[0].value}/{d[1].value}/{d[2].value} | "
+            f"Sessions: {v[0].value} | Users: {v[1].value} | "
+            f"Conv: {v[2].value}"
         )
-        for row in r.rows:
-            src = row.dimension_values[0].value
-            med = row.dimension_values[1].value
-            v = row.metric_values
-            bounce = float(v[4].value) * 100
-            print(
-                f"  {src}/{med} | Sessions: {v[0].value} | "
-                f"Users: {v[1].value} | Engaged: {v[2].value} | "
-                f"Conv: {v[3].value} | Bounce: {bounce:.0f}%"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Google Ads (CPC) traffic
-    print("--- GOOGLE ADS (CPC) TRAFFIC (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["sessionSource", "sessionMedium", "sessionCampaignName"],
-            ["sessions", "totalUsers", "conversions"],
-            dim_filter={
-                "filter": {
-                    "field_name": "sessionMedium",
-                    "string_filter": {"value": "cpc"},
-                }
-            },
-            limit=20,
+
+
+def _print_social(r):
+    if not r.rows:
+        print("  No social traffic.")
+    for row in r.rows:
+        d = row.dimension_values
+        v = row.metric_values
+        print(
+            f"  {d[0].value}/{d[1].value} | Sessions: {v[0].value} | "
+            f"Users: {v[1].value} | Engaged: {v[2].value} | "
+            f"Conv: {v[3].value}"
         )
-        if not r.rows:
-            print("  No CPC traffic.")
-        for row in r.rows:
-            d = row.dimension_values
-            v = row.metric_values
-            print(
-                f"  {d[0].value}/{d[1].value}/{d[2].value} | "
-                f"Sessions: {v[0].value} | Users: {v[1].value} | "
-                f"Conv: {v[2].value}"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Social traffic
-    print("--- SOCIAL TRAFFIC (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["sessionSource", "sessionMedium"],
-            ["sessions", "totalUsers", "engagedSessions", "conversions"],
-            dim_filter={
-                "or_group": {
-                    "expressions": [
-                        {
-                            "filter": {
-                                "field_name": "sessionSource",
-                                "string_filter": {"value": s, "match_type": 1},
-                            }
-                        }
-                        for s in [
-                            "instagram",
-                            "facebook",
-                            "l.instagram.com",
-                            "l.facebook.com",
-                            "facebook.com",
-                            "m.facebook.com",
-                        ]
-                    ]
-                    + [
-                        {
-                            "filter": {
-                                "field_name": "sessionMedium",
-                                "string_filter": {"value": m, "match_type": 1},
-                            }
-                        }
-                        for m in ["social", "paid_social"]
-                    ]
-                }
-            },
-            limit=20,
+
+
+def _print_key_events(r):
+    if not r.rows:
+        print("  No key events.")
+    for row in r.rows:
+        print(
+            f"  {row.dimension_values[0].value}: "
+            f"{row.metric_values[0].value} events "
+            f"({row.metric_values[1].value} users)"
+        )
+
+
+def _print_events_by_date(r):
+    if not r.rows:
+        print("  No data.")
+    for row in r.rows:
+        print(
+            f"  {row.dimension_values[0].value} | "
+            f"{row.dimension_values[1].value}: "
+            f"{row.metric_values[0].value} "
+            f"({row.metric_values[1].value} users)"
         )
+
+
+def _print_landing_pages(r):
+    for row in r.rows:
+        page = row.dimension_values[0].value
+        v = row.metric_values
+        bounce = float(v[2].value) * 100
+        print(
+            f"  {page} | Sessions: {v[0].value} | "
+            f"Conv: {v[1].value} | Bounce: {bounce:.0f}%"
+        )
+
+
+def _landing_quality_printer(empty_message):
+    def _print(r):
         if not r.rows:
-            print("  No social traffic.")
+            print(empty_message)
         for row in r.rows:
-            d = row.dimension_values
+            page = row.dimension_values[0].value
             v = row.metric_values
+            bounce = float(v[3].value) * 100
             print(
-                f"  {d[0].value}/{d[1].value} | Sessions: {v[0].value} | "
-                f"Users: {v[1].value} | Engaged: {v[2].value} | "
-                f"Conv: {v[3].value}"
+                f"  {page} | Sessions: {v[0].value} | "
+                f"Engaged: {v[1].value} | Conv: {v[2].value} | "
+                f"Bounce: {bounce:.0f}%"
             )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
 
-    # Key events & booking funnel
+    return _print
+
+
+def _string_filters(field_name, values, match_type=None):
+    string_filter = {} if match_type is None else {"match_type": match_type}
+    return [
+        {
+            "filter": {
+                "field_name": field_name,
+                "string_filter": {"value": value, **string_filter},
+            }
+        }
+        for value in values
+    ]
+
+
+def _sections(prop, date_range):
+    """``(heading, request, printer)`` for every report, in print order."""
     booking_events = [
         "booking_modal_open",
         "booking_age_selected",
@@ -256,173 +280,192 @@ def main():
         "whatsapp_click",
     ]
     all_events = booking_events + lead_events
+    events_filter = {
+        "or_group": {"expressions": _string_filters("eventName", all_events, 1)}
+    }
+    cpc_filter = _string_filters("sessionMedium", ["cpc"])[0]
+    sessions_desc = [{"metric": {"metric_name": "sessions"}, "desc": True}]
+
+    return [
+        (
+            "SITE OVERVIEW",
+            _request(
+                prop,
+                [],
+                [
+                    "sessions",
+                    "totalUsers",
+                    "newUsers",
+                    "engagedSessions",
+                    "averageSessionDuration",
+                    "bounceRate",
+                    "engagementRate",
+                    "userEngagementDuration",
+                    "screenPageViews",
+                    "conversions",
+                ],
+                date_range,
+            ),
+            _print_overview,
+        ),
+        (
+            "TRAFFIC BY SOURCE/MEDIUM",
+            _request(
+                prop,
+                ["sessionSource", "sessionMedium"],
+                [
+                    "sessions",
+                    "totalUsers",
+                    "engagedSessions",
+                    "conversions",
+                    "bounceRate",
+                ],
+                date_range,
+                order_bys=sessions_desc,
+                limit=20,
+            ),
+            _print_source_medium,
+        ),
+        (
+            "GOOGLE ADS (CPC) TRAFFIC",
+            _request(
+                prop,
+                ["sessionSource", "sessionMedium", "sessionCampaignName"],
+                ["sessions", "totalUsers", "conversions"],
+                date_range,
+                dim_filter=cpc_filter,
+                limit=20,
+            ),
+            _print_cpc,
+        ),
+        (
+            "SOCIAL TRAFFIC",
+            _request(
+                prop,
+                ["sessionSource", "sessionMedium"],
+                ["sessions", "totalUsers", "engagedSessions", "conversions"],
+                date_range,
+                dim_filter={
+                    "or_group": {
+                        "expressions": _string_filters(
+                            "sessionSource",
+                            [
+                                "instagram",
+                                "facebook",
+                                "l.instagram.com",
+                                "l.facebook.com",
+                                "facebook.com",
+                                "m.facebook.com",
+                            ],
+                            1,
+                        )
+                        + _string_filters("sessionMedium", ["social", "paid_social"], 1)
+                    }
+                },
+                limit=20,
+            ),
+            _print_social,
+        ),
+        (
+            "KEY EVENTS & BOOKING FUNNEL",
+            _request(
+                prop,
+                ["eventName"],
+                ["eventCount", "totalUsers"],
+                date_range,
+                dim_filter=events_filter,
+            ),
+            _print_key_events,
+        ),
+        (
+            "BOOKING EVENTS BY DATE",
+            _request(
+                prop,
+                ["date", "eventName"],
+                ["eventCount", "totalUsers"],
+                date_range,
+                dim_filter=events_filter,
+                order_bys=[{"dimension": {"dimension_name": "date"}, "desc": True}],
+            ),
+            _print_events_by_date,
+        ),
+        (
+            "TOP LANDING PAGES",
+            _request(
+                prop,
+                ["landingPage"],
+                ["sessions", "conversions", "bounceRate"],
+                date_range,
+                order_bys=sessions_desc,
+                limit=15,
+            ),
+            _print_landing_pages,
+        ),
+        # Google CPC landing page performance (paid-quality deep dive)
+        (
+            "GOOGLE CPC LANDING PAGES",
+            _request(
+                prop,
+                ["landingPage"],
+                ["sessions", "engagedSessions", "conversions", "bounceRate"],
+                date_range,
+                dim_filter=cpc_filter,
+                order_bys=sessions_desc,
+                limit=15,
+            ),
+            _landing_quality_printer("  No CPC landing data."),
+        ),
+        # (direct)/(none) landing page breakdown (dark-social visibility)
+        (
+            "(DIRECT)/(NONE) LANDING PAGES",
+            _request(
+                prop,
+                ["landingPage"],
+                ["sessions", "engagedSessions", "conversions", "bounceRate"],
+                date_range,
+                dim_filter={
+                    "and_group": {
+                        "expressions": _string_filters("sessionSource", ["(direct)"])
+                        + _string_filters("sessionMedium", ["(none)"])
+                    }
+                },
+                order_bys=sessions_desc,
+                limit=15,
+            ),
+            _landing_quality_printer("  No direct traffic."),
+        ),
+    ]
 
-    print("--- KEY EVENTS & BOOKING FUNNEL (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["eventName"],
-            ["eventCount", "totalUsers"],
-            dim_filter={
-                "or_group": {
-                    "expressions": [
-                        {
-                            "filter": {
-                                "field_name": "eventName",
-                                "string_filter": {"value": ev, "match_type": 1},
-                            }
-                        }
-                        for ev in all_events
-                    ]
-                }
-            },
-        )
-        if not r.rows:
-            print("  No key events.")
-        for row in r.rows:
-            print(
-                f"  {row.dimension_values[0].value}: "
-                f"{row.metric_values[0].value} events "
-                f"({row.metric_values[1].value} users)"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Booking events by date
-    print("--- BOOKING EVENTS BY DATE (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["date", "eventName"],
-            ["eventCount", "totalUsers"],
-            dim_filter={
-                "or_group": {
-                    "expressions": [
-                        {
-                            "filter": {
-                                "field_name": "eventName",
-                                "string_filter": {"value": ev, "match_type": 1},
-                            }
-                        }
-                        for ev in all_events
-                    ]
-                }
-            },
-            order_bys=[{"dimension": {"dimension_name": "date"}, "desc": True}],
-        )
-        if not r.rows:
-            print("  No data.")
-        for row in r.rows:
-            print(
-                f"  {row.dimension_values[0].value} | "
-                f"{row.dimension_values[1].value}: "
-                f"{row.metric_values[0].value} "
-                f"({row.metric_values[1].value} users)"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Top landing pages
-    print("--- TOP LANDING PAGES (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["landingPage"],
-            ["sessions", "conversions", "bounceRate"],
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-            limit=15,
-        )
-        for row in r.rows:
-            page = row.dimension_values[0].value
-            v = row.metric_values
-            bounce = float(v[2].value) * 100
-            print(
-                f"  {page} | Sessions: {v[0].value} | "
-                f"Conv: {v[1].value} | Bounce: {bounce:.0f}%"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # Google CPC landing page performance (paid-quality deep dive)
-    print("--- GOOGLE CPC LANDING PAGES (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["landingPage"],
-            ["sessions", "engagedSessions", "conversions", "bounceRate"],
-            dim_filter={
-                "filter": {
-                    "field_name": "sessionMedium",
-                    "string_filter": {"value": "cpc"},
-                }
-            },
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-            limit=15,
-        )
-        if not r.rows:
-            print("  No CPC landing data.")
-        for row in r.rows:
-            page = row.dimension_values[0].value
-            v = row.metric_values
-            bounce = float(v[3].value) * 100
-            print(
-                f"  {page} | Sessions: {v[0].value} | "
-                f"Engaged: {v[1].value} | Conv: {v[2].value} | "
-                f"Bounce: {bounce:.0f}%"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
-    print()
-
-    # (direct)/(none) landing page breakdown (dark-social visibility)
-    print("--- (DIRECT)/(NONE) LANDING PAGES (Last 30 Days) ---")
-    try:
-        r = _run(
-            client,
-            prop,
-            ["landingPage"],
-            ["sessions", "engagedSessions", "conversions", "bounceRate"],
-            dim_filter={
-                "and_group": {
-                    "expressions": [
-                        {
-                            "filter": {
-                                "field_name": "sessionSource",
-                                "string_filter": {"value": "(direct)"},
-                            }
-                        },
-                        {
-                            "filter": {
-                                "field_name": "sessionMedium",
-                                "string_filter": {"value": "(none)"},
-                            }
-                        },
-                    ]
-                }
-            },
-            order_bys=[{"metric": {"metric_name": "sessions"}, "desc": True}],
-            limit=15,
-        )
-        if not r.rows:
-            print("  No direct traffic.")
-        for row in r.rows:
-            page = row.dimension_values[0].value
-            v = row.metric_values
-            bounce = float(v[3].value) * 100
-            print(
-                f"  {page} | Sessions: {v[0].value} | "
-                f"Engaged: {v[1].value} | Conv: {v[2].value} | "
-                f"Bounce: {bounce:.0f}%"
-            )
-    except Exception as exc:
-        print(f"  Error: {exc}")
+
+def main(runner):
+    prop_id = os.environ.get("EVOLVESPROUTS_GA4_PROPERTY_ID", "")
+    if not prop_id:
+        sys.exit("EVOLVESPROUTS_GA4_PROPERTY_ID not set")
+
+    prop = f"properties/{prop_id}"
+    date_range = (
+        (runner.as_of - timedelta(days=30)).isoformat(),
+        runner.as_of.isoformat(),
+    )
+    sections = _sections(prop, date_range)
+    outcomes = _run_reports(
+        runner,
+        _LazyClient(),
+        prop,
+        [request for _heading, request, _printer in sections],
+        date_range,
+    )
+
+    for index, ((heading, _request_, printer), (report, error)) in enumerate(
+        zip(sections, outcomes)
+    ):
+        if index:
+            print()
+        print(f"--- {heading} (Last 30 Days) ---")
+        if error is not None:
+            print(f"  Error: {error}")
+        else:
+            printer(report)
 
     print("\n--- GA4 ASSESSMENT COMPLETE ---")
 
@@ -434,11 +477,13 @@ def _parse_args():
         help="Optional path to tee stdout into (plaintext). Useful for "
         "auto-capturing raw output into marketing/generated-reports/.",
     )
+    add_runner_args(parser)
     return parser.parse_args()
 
 
 def _run_main():
     args = _parse_args()
+    runner = runner_from_args(args, min_interval=GA4_MIN_INTERVAL_SECONDS)
     if args.out:
         out_dir = os.path.dirname(os.path.abspath(args.out))
         if out_dir:
@@ -446,9 +491,9 @@ def _run_main():
         with open(args.out, "w", encoding="utf-8") as fh:
             tee = _Tee(sys.stdout, fh)
             with contextlib.redirect_stdout(tee):
-                main()
+                main(runner)
     else:
-        main()
+        main(runner)
 
 
 if __name__ == "__main__":
@@ -9,20 +9,29 @@ Required environment variables:
     EVOLVESPROUTS_GOOGLE_SERVICE_ACCOUNT_JSON  Service account credentials JSON
 
 Usage:
-    python3 google-ads-assessment.py [--out PATH]
+    python3 google-ads-assessment.py [--out PATH] [--cache-mode MODE] [--as-of DATE]
 
-`--out` mirrors stdout to the given file (plaintext).
+`--out` mirrors stdout to the given file (plaintext). GAQL searches run
+concurrently and are cached on disk (see `report_runner.py`).
 """
 
 import argparse
 import contextlib
+import importlib
+import json
 import os
 import sys
 import tempfile
+import threading
+from datetime import timedelta
 
 from google.ads.googleads.client import GoogleAdsClient
 
+from report_runner import add_runner_args, runner_from_args
+
 API_VERSION = "v20"
+# Google Ads allows bursts, but keep searches spaced for the developer token.
+GOOGLE_ADS_MIN_INTERVAL_SECONDS = 0.1
 
 
 class _Tee:
@@ -55,7 +64,339 @@ def _micros(value):
     return value / 1_000_000 if value else 0
 
 
-def main():
+def _row_type():
+    module = importlib.import_module(
+        f"google.ads.googleads.{API_VERSION}.services.types.google_ads_service"
+    )
+    return module.GoogleAdsRow
+
+
+class _Search:
+    """Cached GAQL search; the API client is only built on a cache miss."""
+
+    def __init__(self, runner, manager_id, dev_token):
+        self._runner = runner
+        self._manager_id = manager_id
+        self._dev_token = dev_token
+        self._svc = None
+        self._lock = threading.Lock()
+        self._row_cls = _row_type()
+
+    def _service(self):
+        with self._lock:
+            if self._svc is None:
+                client = GoogleAdsClient.load_from_dict(
+                    {
+                        "developer_token": self._dev_token,
+                        "json_key_file_path": _sa_path(),
+                        "impersonated_email": "",
+                        "login_customer_id": self._manager_id,
+                        "use_proto_plus": True,
+                    },
+                    version=API_VERSION,
+                )
+                self._svc = client.get_service("GoogleAdsService")
+            return self._svc
+
+    def __call__(self, customer_id, query, date_range):
+        def load():
+            rows = self._service().search(customer_id=customer_id, query=query)
+            return json.dumps([json.loads(self._row_cls.to_json(row)) for row in rows])
+
+        payload = self._runner.fetch(
+            "google-ads",
+            {"customer_id": customer_id, "query": " ".join(query.split())},
+            date_range,
+            load,
+        )
+        return [self._row_cls.from_json(json.dumps(row)) for row in json.loads(payload)]
+
+
+def _between(as_of, days):
+    """GAQL equivalent of ``DURING LAST_<days>_DAYS`` ending the day before ``as_of``."""
+    start = (as_of - timedelta(days=days)).isoformat()
+    end = (as_of - timedelta(days=1)).isoformat()
+    return f"segments.date BETWEEN '{start}' AND '{end}'", (start, end)
+
+
+def _print_account(rows):
+    for r in rows:
+        c = r.customer
+        print(
+            f"\nAccount: {c.descriptive_name} | {c.currency_code} | "
+            f"{c.time_zone} | {c.status.name}"
+        )
+
+
+def _print_campaigns(rows):
+    for r in rows:
+        camp = r.campaign
+        budget = _micros(r.campaign_budget.amount_micros)
+        print(
+            f"  {camp.name} | {camp.status.name} | "
+            f"{camp.advertising_channel_type.name} | "
+            f"HK${budget:.2f}/day | {camp.bidding_strategy_type.name} | "
+            f"Start: {camp.start_date}"
+        )
+
+
+def _print_campaign_performance(empty_message=None):
+    def _print(rows):
+        for r in rows:
+            m = r.metrics
+            print(
+                f"  {r.campaign.name} ({r.campaign.status.name})\n"
+                f"    Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+                f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
+                f"Cost: HK${_micros(m.cost_micros):.2f} | "
+                f"Conv: {m.conversions:.1f}"
+            )
+        if empty_message and not rows:
+            print(empty_message)
+
+    return _print
+
+
+def _print_ad_groups(rows):
+    for r in rows:
+        ag = r.ad_group
+        m = r.metrics
+        print(
+            f"  {ag.name} ({ag.status.name}) in '{r.campaign.name}'\n"
+            f"    Bid: HK${_micros(ag.cpc_bid_micros):.2f} | "
+            f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+            f"Cost: HK${_micros(m.cost_micros):.2f} | "
+            f"Conv: {m.conversions:.1f}"
+        )
+
+
+def _print_keywords(rows):
+    for r in rows:
+        kw = r.ad_group_criterion.keyword
+        qi = r.ad_group_criterion.quality_info
+        m = r.metrics
+        qs = qi.quality_score if qi.quality_score else "N/A"
+        print(
+            f'  "{kw.text}" ({kw.match_type.name}) | QS: {qs} | '
+            f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+            f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
+            f"Cost: HK${_micros(m.cost_micros):.2f}"
+        )
+    if not rows:
+        print("  No keyword data.")
+
+
+def _print_ads(rows):
+    for r in rows:
+        ad = r.ad_group_ad.ad
+        ps = r.ad_group_ad.policy_summary
+        m = r.metrics
+        urls = list(ad.final_urls) if ad.final_urls else []
+        approval = ps.approval_status.name if ps and ps.approval_status else "UNKNOWN"
+        print(
+            f"  Ad {ad.id} ({ad.type.name}) | "
+            f"{r.ad_group_ad.status.name} | Approval: {approval}\n"
+            f"    {r.campaign.name} > {r.ad_group.name}"
+        )
+        if urls:
+            print(f"    URL: {urls[0]}")
+        print(
+            f"    Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+            f"Cost: HK${_micros(m.cost_micros):.2f}"
+        )
+
+
+def _print_conversion_actions(rows):
+    for r in rows:
+        ca = r.conversion_action
+        print(f"  {ca.name} | {ca.status.name} | {ca.type.name} | {ca.category.name}")
+
+
+def _print_search_terms(rows):
+    for r in rows:
+        m = r.metrics
+        st = r.search_term_view
+        mt = r.segments.search_term_match_type
+        print(
+            f'  "{st.search_term}" ({mt.name}) | {st.status.name} | '
+            f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+            f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
+            f"Cost: HK${_micros(m.cost_micros):.2f} | "
+            f"Conv: {m.conversions:.1f}"
+        )
+    if not rows:
+        print("  No search term data.")
+
+
+def _print_daily(rows):
+    for r in rows:
+        m = r.metrics
+        print(
+            f"  {r.segments.date} | {r.campaign.name} | "
+            f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
+            f"Cost: HK${_micros(m.cost_micros):.2f} | "
+            f"Conv: {m.conversions:.1f}"
+        )
+    if not rows:
+        print("  No daily data.")
+
+
+def _client_sections(as_of):
+    """``(heading, query, date_range, printer, error_label)`` per client report.
+
+    The first entry is account info; when it fails the client is skipped.
+    """
+    all_time = ("all", as_of.isoformat())
+    last_7, last_7_range = _between(as_of, 7)
+    last_14, last_14_range = _between(as_of, 14)
+    return [
+        (
+            None,
+            (
+                "SELECT customer.id, customer.descriptive_name, "
+                "customer.currency_code, customer.time_zone, customer.status "
+                "FROM customer LIMIT 1"
+            ),
+            all_time,
+            _print_account,
+            "Account info error",
+        ),
+        (
+            "CAMPAIGNS",
+            """
+                SELECT campaign.id, campaign.name, campaign.status,
+                       campaign.advertising_channel_type,
+                       campaign_budget.amount_micros,
+                       campaign.start_date, campaign.bidding_strategy_type
+                FROM campaign ORDER BY campaign.id
+            """,
+            all_time,
+            _print_campaigns,
+            "Campaign error",
+        ),
+        (
+            "CAMPAIGN PERFORMANCE (All Time)",
+            """
+                SELECT campaign.name, campaign.status,
+                       metrics.impressions, metrics.clicks, metrics.ctr,
+                       metrics.average_cpc, metrics.cost_micros,
+                       metrics.conversions, metrics.all_conversions,
+                       metrics.interactions
+                FROM campaign ORDER BY metrics.impressions DESC
+            """,
+            all_time,
+            _print_campaign_performance(),
+            "All-time performance error",
+        ),
+        (
+            "CAMPAIGN PERFORMANCE (Last 7 Days)",
+            f"""
+                SELECT campaign.name, campaign.status,
+                       metrics.impressions, metrics.clicks, metrics.ctr,
+                       metrics.average_cpc, metrics.cost_micros,
+                       metrics.conversions
+                FROM campaign
+                WHERE {last_7}
+                ORDER BY metrics.impressions DESC
+            """,
+            last_7_range,
+            _print_campaign_performance("  No data for last 7 days."),
+            "7-day performance error",
+        ),
+        (
+            "AD GROUP PERFORMANCE (All Time)",
+            """
+                SELECT ad_group.name, ad_group.status, campaign.name,
+                       ad_group.cpc_bid_micros, metrics.impressions,
+                       metrics.clicks, metrics.cost_micros, metrics.conversions
+                FROM ad_group ORDER BY metrics.impressions DESC
+            """,
+            all_time,
+            _print_ad_groups,
+            "Ad group error",
+        ),
+        (
+            "KEYWORD PERFORMANCE (All Time, Top 30)",
+            """
+                SELECT ad_group_criterion.keyword.text,
+                       ad_group_criterion.keyword.match_type,
+                       ad_group_criterion.status,
+                       ad_group_criterion.quality_info.quality_score,
+                       metrics.impressions, metrics.clicks, metrics.ctr,
+                       metrics.average_cpc, metrics.cost_micros,
+                       metrics.conversions
+                FROM keyword_view
+                ORDER BY metrics.impressions DESC LIMIT 30
+            """,
+            all_time,
+            _print_keywords,
+            "Keyword error",
+        ),
+        (
+            "AD PERFORMANCE & APPROVAL STATUS",
+            """
+                SELECT ad_group_ad.ad.id, ad_group_ad.ad.type,
+                       ad_group_ad.ad.final_urls, ad_group_ad.status,
+                       ad_group_ad.policy_summary.approval_status,
+                       campaign.name, ad_group.name,
+                       metrics.impressions, metrics.clicks,
+                       metrics.cost_micros, metrics.conversions
+                FROM ad_group_ad
+                ORDER BY metrics.impressions DESC LIMIT 10
+            """,
+            all_time,
+            _print_ads,
+            "Ad performance error",
+        ),
+        (
+            "CONVERSION ACTIONS",
+            """
+                SELECT conversion_action.id, conversion_action.name,
+                       conversion_action.status, conversion_action.type,
+                       conversion_action.category
+                FROM conversion_action ORDER BY conversion_action.id
+            """,
+            all_time,
+            _print_conversion_actions,
+            "Conversion actions error",
+        ),
+        # Search terms (last 14 days) — surface wasted spend + negatives candidates
+        (
+            "SEARCH TERMS (Last 14 Days, Top 50)",
+            f"""
+                SELECT search_term_view.search_term,
+                       search_term_view.status,
+                       segments.search_term_match_type,
+                       metrics.impressions, metrics.clicks, metrics.ctr,
+                       metrics.average_cpc, metrics.cost_micros,
+                       metrics.conversions
+                FROM search_term_view
+                WHERE {last_14}
+                ORDER BY metrics.impressions DESC
+                LIMIT 50
+            """,
+            last_14_range,
+            _print_search_terms,
+            "Search terms error",
+        ),
+        (
+            "DAILY PERFORMANCE (Last 14 Days)",
+            f"""
+                SELECT segments.date, campaign.name,
+                       metrics.impressions, metrics.clicks,
+                       metrics.cost_micros, metrics.conversions
+                FROM campaign
+                WHERE {last_14}
+                ORDER BY segments.date DESC
+            """,
+            last_14_range,
+            _print_daily,
+            "Daily performance error",
+        ),
+    ]
+
+
+def main(runner):
     manager_id = os.environ.get("EVOLVESPROUTS_GOOGLE_ADS_CUSTOMER_ID", "").replace(
         "-", ""
     )
@@ -63,17 +404,8 @@ def main():
     if not manager_id or not dev_token:
         sys.exit("Missing GOOGLE_ADS_CUSTOMER_ID or DEVELOPER_TOKEN")
 
-    client = GoogleAdsClient.load_from_dict(
-        {
-            "developer_token": dev_token,
-            "json_key_file_path": _sa_path(),
-            "impersonated_email": "",
-            "login_customer_id": manager_id,
-            "use_proto_plus": True,
-        },
-        version=API_VERSION,
-    )
-    svc = client.get_service("GoogleAdsService")
+    search = _Search(runner, manager_id, dev_token)
+    as_of = runner.as_of
 
     print("=" * 60)
     print(f"MANAGER ACCOUNT: {manager_id}")
@@ -81,14 +413,15 @@ def main():
 
     # List client accounts under MCC
     try:
-        rows = svc.search(
-            customer_id=manager_id,
-            query="""
+        rows = search(
+            manager_id,
+            """
                 SELECT customer_client.id, customer_client.descriptive_name,
                        customer_client.status
                 FROM customer_client
                 WHERE customer_client.manager = FALSE
             """,
+            ("all", as_of.isoformat()),
         )
         client_ids = []
         print("\n--- CLIENT ACCOUNTS ---")
@@ -100,284 +433,31 @@ def main():
         print(f"Error listing clients: {exc}")
         client_ids = ["4991144901"]
 
-    for cid in client_ids:
+    sections = _client_sections(as_of)
+    calls = [
+        (cid, query, date_range)
+        for cid in client_ids
+        for _heading, query, date_range, _printer, _label in sections
+    ]
+    outcomes = runner.run_all([lambda call=call: search(*call) for call in calls])
+
+    for index, cid in enumerate(client_ids):
         print(f"\n{'=' * 60}")
         print(f"CLIENT ACCOUNT: {cid}")
         print(f"{'=' * 60}")
 
-        # Account info
-        try:
-            for r in svc.search(
-                customer_id=cid,
-                query="SELECT customer.id, customer.descriptive_name, "
-                "customer.currency_code, customer.time_zone, customer.status "
-                "FROM customer LIMIT 1",
-            ):
-                c = r.customer
-                print(
-                    f"\nAccount: {c.descriptive_name} | {c.currency_code} | "
-                    f"{c.time_zone} | {c.status.name}"
-                )
-        except Exception as exc:
-            print(f"Account info error: {exc}")
-            continue
-
-        # Campaigns
-        try:
-            print("\n--- CAMPAIGNS ---")
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT campaign.id, campaign.name, campaign.status,
-                           campaign.advertising_channel_type,
-                           campaign_budget.amount_micros,
-                           campaign.start_date, campaign.bidding_strategy_type
-                    FROM campaign ORDER BY campaign.id
-                """,
-            ):
-                camp = r.campaign
-                budget = _micros(r.campaign_budget.amount_micros)
-                print(
-                    f"  {camp.name} | {camp.status.name} | "
-                    f"{camp.advertising_channel_type.name} | "
-                    f"HK${budget:.2f}/day | {camp.bidding_strategy_type.name} | "
-                    f"Start: {camp.start_date}"
-                )
-        except Exception as exc:
-            print(f"Campaign error: {exc}")
-
-        # Campaign performance (all time)
-        try:
-            print("\n--- CAMPAIGN PERFORMANCE (All Time) ---")
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT campaign.name, campaign.status,
-                           metrics.impressions, metrics.clicks, metrics.ctr,
-                           metrics.average_cpc, metrics.cost_micros,
-                           metrics.conversions, metrics.all_conversions,
-                           metrics.interactions
-                    FROM campaign ORDER BY metrics.impressions DESC
-                """,
-            ):
-                m = r.metrics
-                print(
-                    f"  {r.campaign.name} ({r.campaign.status.name})\n"
-                    f"    Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f} | "
-                    f"Conv: {m.conversions:.1f}"
-                )
-        except Exception as exc:
-            print(f"All-time performance error: {exc}")
-
-        # Campaign performance (last 7 days)
-        try:
-            print("\n--- CAMPAIGN PERFORMANCE (Last 7 Days) ---")
-            count = 0
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT campaign.name, campaign.status,
-                           metrics.impressions, metrics.clicks, metrics.ctr,
-                           metrics.average_cpc, metrics.cost_micros,
-                           metrics.conversions
-                    FROM campaign
-                    WHERE segments.date DURING LAST_7_DAYS
-                    ORDER BY metrics.impressions DESC
-                """,
-            ):
-                count += 1
-                m = r.metrics
-                print(
-                    f"  {r.campaign.name} ({r.campaign.status.name})\n"
-                    f"    Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f} | "
-                    f"Conv: {m.conversions:.1f}"
-                )
-            if count == 0:
-                print("  No data for last 7 days.")
-        except Exception as exc:
-            print(f"7-day performance error: {exc}")
-
-        # Ad group performance
-        try:
-            print("\n--- AD GROUP PERFORMANCE (All Time) ---")
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT ad_group.name, ad_group.status, campaign.name,
-                           ad_group.cpc_bid_micros, metrics.impressions,
-                           metrics.clicks, metrics.cost_micros, metrics.conversions
-                    FROM ad_group ORDER BY metrics.impressions DESC
-                """,
-            ):
-                ag = r.ad_group
-                m = r.metrics
-                print(
-                    f"  {ag.name} ({ag.status.name}) in '{r.campaign.name}'\n"
-                    f"    Bid: HK${_micros(ag.cpc_bid_micros):.2f} | "
-                    f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f} | "
-                    f"Conv: {m.conversions:.1f}"
-                )
-        except Exception as exc:
-            print(f"Ad group error: {exc}")
-
-        # Keyword performance
-        try:
-            print("\n--- KEYWORD PERFORMANCE (All Time, Top 30) ---")
-            kw_count = 0
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT ad_group_criterion.keyword.text,
-                           ad_group_criterion.keyword.match_type,
-                           ad_group_criterion.status,
-                           ad_group_criterion.quality_info.quality_score,
-                           metrics.impressions, metrics.clicks, metrics.ctr,
-                           metrics.average_cpc, metrics.cost_micros,
-                           metrics.conversions
-                    FROM keyword_view
-                    ORDER BY metrics.impressions DESC LIMIT 30
-                """,
-            ):
-                kw_count += 1
-                kw = r.ad_group_criterion.keyword
-                qi = r.ad_group_criterion.quality_info
-                m = r.metrics
-                qs = qi.quality_score if qi.quality_score else "N/A"
-                print(
-                    f'  "{kw.text}" ({kw.match_type.name}) | QS: {qs} | '
-                    f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f}"
-                )
-            if kw_count == 0:
-                print("  No keyword data.")
-        except Exception as exc:
-            print(f"Keyword error: {exc}")
-
-        # Ad approval status and performance
-        try:
-            print("\n--- AD PERFORMANCE & APPROVAL STATUS ---")
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT ad_group_ad.ad.id, ad_group_ad.ad.type,
-                           ad_group_ad.ad.final_urls, ad_group_ad.status,
-                           ad_group_ad.policy_summary.approval_status,
-                           campaign.name, ad_group.name,
-                           metrics.impressions, metrics.clicks,
-                           metrics.cost_micros, metrics.conversions
-                    FROM ad_group_ad
-                    ORDER BY metrics.impressions DESC LIMIT 10
-                """,
-            ):
-                ad = r.ad_group_ad.ad
-                ps = r.ad_group_ad.policy_summary
-                m = r.metrics
-                urls = list(ad.final_urls) if ad.final_urls else []
-                approval = (
-                    ps.approval_status.name if ps and ps.approval_status else "UNKNOWN"
-                )
-                print(
-                    f"  Ad {ad.id} ({ad.type.name}) | "
-                    f"{r.ad_group_ad.status.name} | Approval: {approval}\n"
-                    f"    {r.campaign.name} > {r.ad_group.name}"
-                )
-                if urls:
-                    print(f"    URL: {urls[0]}")
-                print(
-                    f"    Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f}"
-                )
-        except Exception as exc:
-            print(f"Ad performance error: {exc}")
-
-        # Conversion actions
-        try:
-            print("\n--- CONVERSION ACTIONS ---")
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT conversion_action.id, conversion_action.name,
-                           conversion_action.status, conversion_action.type,
-                           conversion_action.category
-                    FROM conversion_action ORDER BY conversion_action.id
-                """,
-            ):
-                ca = r.conversion_action
-                print(
-                    f"  {ca.name} | {ca.status.name} | "
-                    f"{ca.type.name} | {ca.category.name}"
-                )
-        except Exception as exc:
-            print(f"Conversion actions error: {exc}")
-
-        # Search terms (last 14 days) — surface wasted spend + negatives candidates
-        try:
-            print("\n--- SEARCH TERMS (Last 14 Days, Top 50) ---")
-            st_count = 0
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT search_term_view.search_term,
-                           search_term_view.status,
-                           segments.search_term_match_type,
-                           metrics.impressions, metrics.clicks, metrics.ctr,
-                           metrics.average_cpc, metrics.cost_micros,
-                           metrics.conversions
-                    FROM search_term_view
-                    WHERE segments.date DURING LAST_14_DAYS
-                    ORDER BY metrics.impressions DESC
-                    LIMIT 50
-                """,
-            ):
-                st_count += 1
-                m = r.metrics
-                st = r.search_term_view
-                mt = r.segments.search_term_match_type
-                print(
-                    f'  "{st.search_term}" ({mt.name}) | {st.status.name} | '
-                    f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"CTR: {m.ctr:.2%} | CPC: HK${_micros(m.average_cpc):.2f} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f} | "
-                    f"Conv: {m.conversions:.1f}"
-                )
-            if st_count == 0:
-                print("  No search term data.")
-        except Exception as exc:
-            print(f"Search terms error: {exc}")
-
-        # Daily performance (last 14 days)
-        try:
-            print("\n--- DAILY PERFORMANCE (Last 14 Days) ---")
-            day_count = 0
-            for r in svc.search(
-                customer_id=cid,
-                query="""
-                    SELECT segments.date, campaign.name,
-                           metrics.impressions, metrics.clicks,
-                           metrics.cost_micros, metrics.conversions
-                    FROM campaign
-                    WHERE segments.date DURING LAST_14_DAYS
-                    ORDER BY segments.date DESC
-                """,
-            ):
-                day_count += 1
-                m = r.metrics
-                print(
-                    f"  {r.segments.date} | {r.campaign.name} | "
-                    f"Imp: {m.impressions:,} | Clicks: {m.clicks:,} | "
-                    f"Cost: HK${_micros(m.cost_micros):.2f} | "
-                    f"Conv: {m.conversions:.1f}"
-                )
-            if day_count == 0:
-                print("  No daily data.")
-        except Exception as exc:
-            print(f"Daily performance error: {exc}")
+        client_outcomes = outcomes[index * len(sections) : (index + 1) * len(sections)]
+        for position, ((heading, _q, _r, printer, label), (rows, error)) in enumerate(
+            zip(sections, client_outcomes)
+        ):
+            if heading:
+                print(f"\n--- {heading} ---")
+            if error is not None:
+                print(f"{label}: {error}")
+                if position == 0:
+                    break
+                continue
+            printer(rows)
 
     print(f"\n{'=' * 60}")
     print("GOOGLE ADS ASSESSMENT COMPLETE")
@@ -391,11 +471,13 @@ def _parse_args():
         help="Optional path to tee stdout into (plaintext). Useful for "
         "auto-capturing raw output into marketing/generated-reports/.",
     )
+    add_runner_args(parser)
     return parser.parse_args()
 
 
 def _run_main():
     args = _parse_args()
+    runner = runner_from_args(args, min_interval=GOOGLE_ADS_MIN_INTERVAL_SECONDS)
     if args.out:
         out_dir = os.path.dirname(os.path.abspath(args.out))
         if out_dir:
@@ -403,9 +485,9 @@ def _run_main():
         with open(args.out, "w", encoding="utf-8") as fh:
             tee = _Tee(sys.stdout, fh)
             with contextlib.redirect_stdout(tee):
-                main()
+                main(runner)
     else:
-        main()
+        main(runner)
 
 
 if __name__ == "__main__":
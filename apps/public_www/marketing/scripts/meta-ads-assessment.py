@@ -8,9 +8,10 @@ Required environment variables:
     EVOLVESPROUTS_META_AD_ACCOUNT_ID             Ad account ID (act_...)
 
 Usage:
-    python3 meta-ads-assessment.py [--out PATH]
+    python3 meta-ads-assessment.py [--out PATH] [--cache-mode MODE] [--as-of DATE]
 
-`--out` mirrors stdout to the given file (plaintext).
+`--out` mirrors stdout to the given file (plaintext). Graph API calls run
+concurrently and are cached on disk (see `report_runner.py`).
 """
 
 import argparse
@@ -22,7 +23,11 @@ from datetime import datetime, timedelta, timezone
 
 import requests
 
+from report_runner import add_runner_args, runner_from_args
+
 BASE_URL = "https://graph.facebook.com/v21.0"
+# Spread calls out; Graph API throttling is scored per ad account.
+META_MIN_INTERVAL_SECONDS = 0.25
 
 # https://developers.facebook.com/docs/marketing-api/reference/ad-account/#fields
 # Values observed in the wild that are not in the public enum are labelled
@@ -65,6 +70,10 @@ def _auth_headers():
     return {"Authorization": f"Bearer {token}"}
 
 
+class _ApiError(Exception):
+    """Non-200 Graph API response (never cached)."""
+
+
 def _get(endpoint, params=None):
     if params is None:
         params = {}
@@ -83,9 +92,29 @@ def _get(endpoint, params=None):
         error_msg = error_body.get("error", {}).get(
             "message", f"HTTP {resp.status_code}"
         )
-        print(f"API Error for {endpoint}: {error_msg}")
-        return None
-    return resp.json()
+        raise _ApiError(error_msg)
+    return resp.text
+
+
+def _fetch_all(runner, calls):
+    """Fetch ``(endpoint, params, date_range)`` calls concurrently.
+
+    Returns ``(decoded_json, error)`` per call so each section prints its own
+    API error in order.
+    """
+
+    def job(endpoint, params, date_range):
+        payload = runner.fetch(
+            "meta",
+            {"endpoint": endpoint, "params": params},
+            date_range,
+            lambda: _get(endpoint, params),
+        )
+        return json.loads(payload)
+
+    return runner.run_all(
+        [lambda call=call: job(*call) for call in calls],
+    )
 
 
 def _fmt_actions(actions):
@@ -98,222 +127,259 @@ def _fmt_costs(costs):
     )
 
 
-def main():
+def _print_account(data):
+    raw_status = data.get("account_status")
+    status = ACCOUNT_STATUS_MAP.get(raw_status, f"UNKNOWN ({raw_status})")
+    warn = ""
+    if raw_status not in (1, None):
+        warn = "  !! account is not ACTIVE — delivery may be blocked.\n"
+    print(
+        f"  {data.get('name')} | {status} | {data.get('currency')}\n"
+        f"  Spent: {data.get('amount_spent')} | Balance: {data.get('balance')}"
+    )
+    if warn:
+        print(warn.rstrip())
+
+
+def _print_campaigns(data):
+    if "data" not in data:
+        return
+    now_utc = datetime.now(timezone.utc)
+    for camp in data["data"]:
+        daily = (
+            float(camp.get("daily_budget", 0)) / 100
+            if camp.get("daily_budget")
+            else None
+        )
+        stale_warning = ""
+        stop_time_raw = camp.get("stop_time")
+        if camp.get("status") == "ACTIVE" and stop_time_raw:
+            try:
+                stop_time_dt = datetime.fromisoformat(stop_time_raw)
+                if stop_time_dt.tzinfo is None:
+                    stop_time_dt = stop_time_dt.replace(tzinfo=timezone.utc)
+                if stop_time_dt < now_utc:
+                    stale_warning = (
+                        "    !! ACTIVE but stop_time is in the past — "
+                        "consider archiving to keep reports clean."
+                    )
+            except (ValueError, TypeError):
+                pass
+        print(f"  {camp.get('name')}")
+        print(f"    ID: {camp['id']} | {camp.get('status')} | {camp.get('objective')}")
+        if daily:
+            print(f"    Budget: HK${daily:.2f}/day")
+        print(f"    {camp.get('start_time', 'N/A')} to {camp.get('stop_time', 'N/A')}")
+        if stale_warning:
+            print(stale_warning)
+
+
+def _print_adsets(data):
+    if "data" not in data:
+        return
+    for adset in data["data"]:
+        daily = (
+            float(adset.get("daily_budget", 0)) / 100
+            if adset.get("daily_budget")
+            else None
+        )
+        print(f"  {adset.get('name')}")
+        print(
+            f"    {adset.get('status')} | Opt: {adset.get('optimization_goal')} | "
+            f"Billing: {adset.get('billing_event')}"
+        )
+        if daily:
+            print(f"    Budget: HK${daily:.2f}/day")
+        t = adset.get("targeting", {})
+        if t:
+            geo = t.get("geo_locations", {})
+            countries = geo.get("countries", []) if geo else []
+            gender_map = {1: "Male", 2: "Female"}
+            genders = [gender_map.get(g, g) for g in t.get("genders", [])]
+            print(
+                f"    Geo: {countries} | Age: {t.get('age_min')}-"
+                f"{t.get('age_max')} | Gender: {genders}"
+            )
+
+
+def _print_campaign_insights(data):
+    if "data" not in data:
+        return
+    if not data["data"]:
+        print("  No data.")
+    for row in data["data"]:
+        spend = float(row.get("spend", 0))
+        print(f"\n  {row.get('campaign_name')}")
+        print(
+            f"    Imp: {int(row.get('impressions', 0)):,} | "
+            f"Reach: {int(row.get('reach', 0)):,} | "
+            f"Freq: {row.get('frequency', 'N/A')}"
+        )
+        print(
+            f"    Clicks: {int(row.get('clicks', 0)):,} "
+            f"(Unique: {row.get('unique_clicks', 'N/A')}) | "
+            f"CTR: {row.get('ctr', 'N/A')}%"
+        )
+        print(
+            f"    CPC: HK${float(row.get('cpc', 0)):.2f} | "
+            f"CPM: HK${float(row.get('cpm', 0)):.2f} | "
+            f"Spend: HK${spend:.2f}"
+        )
+        actions = row.get("actions", [])
+        if actions:
+            print(f"    Actions: {_fmt_actions(actions)}")
+        cpat = row.get("cost_per_action_type", [])
+        if cpat:
+            print(f"    Cost/Action: {_fmt_costs(cpat)}")
+
+
+def _print_ad_insights(data):
+    if "data" not in data:
+        return
+    if not data["data"]:
+        print("  No data.")
+    for row in data["data"]:
+        spend = float(row.get("spend", 0))
+        print(f"\n  {row.get('ad_name')}")
+        print(
+            f"    Imp: {int(row.get('impressions', 0)):,} | "
+            f"Reach: {int(row.get('reach', 0)):,} | "
+            f"Clicks: {int(row.get('clicks', 0)):,} | "
+            f"CTR: {row.get('ctr', 'N/A')}% | Spend: HK${spend:.2f}"
+        )
+        actions = row.get("actions", [])
+        if actions:
+            print(f"    Actions: {_fmt_actions(actions)}")
+
+
+def _print_daily(data):
+    if "data" not in data:
+        return
+    if not data["data"]:
+        print("  No data.")
+    for row in data["data"]:
+        spend = float(row.get("spend", 0))
+        actions = row.get("actions", [])
+        act_str = ""
+        if actions:
+            act_str = " | " + _fmt_actions(actions[:5])
+        print(
+            f"  {row.get('date_start')} | "
+            f"Imp: {int(row.get('impressions', 0)):,} | "
+            f"Reach: {int(row.get('reach', 0)):,} | "
+            f"Clicks: {int(row.get('clicks', 0)):,} | "
+            f"CTR: {row.get('ctr', 'N/A')}% | "
+            f"CPM: HK${float(row.get('cpm', 0)):.2f} | "
+            f"Spend: HK${spend:.2f}{act_str}"
+        )
+
+
+def main(runner):
     acct = os.environ.get("EVOLVESPROUTS_META_AD_ACCOUNT_ID", "")
     if not acct:
         sys.exit("EVOLVESPROUTS_META_AD_ACCOUNT_ID not set")
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    d30 = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    d14 = (datetime.now() - timedelta(days=14)).strftime("%Y-%m-%d")
+    today = runner.as_of.isoformat()
+    d30 = (runner.as_of - timedelta(days=30)).isoformat()
+    d14 = (runner.as_of - timedelta(days=14)).isoformat()
+    as_of = (today, today)
 
     print(f"Ad Account: {acct}")
     print(f"Date: {today}\n")
 
-    # Account info
-    print("--- AD ACCOUNT INFO ---")
-    data = _get(
-        acct,
-        {
-            "fields": "name,account_id,account_status,currency,timezone_name,"
-            "amount_spent,balance,spend_cap,created_time"
-        },
-    )
-    if data:
-        raw_status = data.get("account_status")
-        status = ACCOUNT_STATUS_MAP.get(raw_status, f"UNKNOWN ({raw_status})")
-        warn = ""
-        if raw_status not in (1, None):
-            warn = "  !! account is not ACTIVE — delivery may be blocked.\n"
-        print(
-            f"  {data.get('name')} | {status} | {data.get('currency')}\n"
-            f"  Spent: {data.get('amount_spent')} | Balance: {data.get('balance')}"
-        )
-        if warn:
-            print(warn.rstrip())
-    print()
-
-    # Campaigns
-    print("--- CAMPAIGNS ---")
-    data = _get(
-        f"{acct}/campaigns",
-        {
-            "fields": "name,status,objective,daily_budget,lifetime_budget,"
-            "start_time,stop_time,buying_type,bid_strategy",
-            "limit": 50,
-        },
-    )
-    if data and "data" in data:
-        now_utc = datetime.now(timezone.utc)
-        for camp in data["data"]:
-            daily = (
-                float(camp.get("daily_budget", 0)) / 100
-                if camp.get("daily_budget")
-                else None
-            )
-            stale_warning = ""
-            stop_time_raw = camp.get("stop_time")
-            if camp.get("status") == "ACTIVE" and stop_time_raw:
-                try:
-                    stop_time_dt = datetime.fromisoformat(stop_time_raw)
-                    if stop_time_dt.tzinfo is None:
-                        stop_time_dt = stop_time_dt.replace(tzinfo=timezone.utc)
-                    if stop_time_dt < now_utc:
-                        stale_warning = (
-                            "    !! ACTIVE but stop_time is in the past — "
-                            "consider archiving to keep reports clean."
-                        )
-                except (ValueError, TypeError):
-                    pass
-            print(f"  {camp.get('name')}")
-            print(
-                f"    ID: {camp['id']} | {camp.get('status')} | {camp.get('objective')}"
-            )
-            if daily:
-                print(f"    Budget: HK${daily:.2f}/day")
-            print(
-                f"    {camp.get('start_time', 'N/A')} to {camp.get('stop_time', 'N/A')}"
-            )
-            if stale_warning:
-                print(stale_warning)
-    print()
-
-    # Ad sets
-    print("--- AD SETS ---")
-    data = _get(
-        f"{acct}/adsets",
-        {
-            "fields": "name,status,optimization_goal,billing_event,"
-            "daily_budget,targeting",
-            "limit": 50,
-        },
-    )
-    if data and "data" in data:
-        for adset in data["data"]:
-            daily = (
-                float(adset.get("daily_budget", 0)) / 100
-                if adset.get("daily_budget")
-                else None
-            )
-            print(f"  {adset.get('name')}")
-            print(
-                f"    {adset.get('status')} | Opt: {adset.get('optimization_goal')} | "
-                f"Billing: {adset.get('billing_event')}"
-            )
-            if daily:
-                print(f"    Budget: HK${daily:.2f}/day")
-            t = adset.get("targeting", {})
-            if t:
-                geo = t.get("geo_locations", {})
-                countries = geo.get("countries", []) if geo else []
-                gender_map = {1: "Male", 2: "Female"}
-                genders = [gender_map.get(g, g) for g in t.get("genders", [])]
-                print(
-                    f"    Geo: {countries} | Age: {t.get('age_min')}-"
-                    f"{t.get('age_max')} | Gender: {genders}"
-                )
-    print()
-
-    # Campaign insights (30 days)
-    print("--- CAMPAIGN INSIGHTS (Last 30 Days) ---")
-    data = _get(
-        f"{acct}/insights",
-        {
-            "fields": "campaign_name,impressions,reach,clicks,cpc,cpm,ctr,"
-            "spend,actions,cost_per_action_type,frequency,unique_clicks",
-            "time_range": json.dumps({"since": d30, "until": today}),
-            "level": "campaign",
-            "limit": 50,
-        },
-    )
-    if data and "data" in data:
-        if not data["data"]:
-            print("  No data.")
-        for row in data["data"]:
-            spend = float(row.get("spend", 0))
-            print(f"\n  {row.get('campaign_name')}")
-            print(
-                f"    Imp: {int(row.get('impressions', 0)):,} | "
-                f"Reach: {int(row.get('reach', 0)):,} | "
-                f"Freq: {row.get('frequency', 'N/A')}"
-            )
-            print(
-                f"    Clicks: {int(row.get('clicks', 0)):,} "
-                f"(Unique: {row.get('unique_clicks', 'N/A')}) | "
-                f"CTR: {row.get('ctr', 'N/A')}%"
-            )
-            print(
-                f"    CPC: HK${float(row.get('cpc', 0)):.2f} | "
-                f"CPM: HK${float(row.get('cpm', 0)):.2f} | "
-                f"Spend: HK${spend:.2f}"
-            )
-            actions = row.get("actions", [])
-            if actions:
-                print(f"    Actions: {_fmt_actions(actions)}")
-            cpat = row.get("cost_per_action_type", [])
-            if cpat:
-                print(f"    Cost/Action: {_fmt_costs(cpat)}")
-    print()
-
-    # Ad-level insights
-    print("--- AD-LEVEL INSIGHTS (Last 30 Days) ---")
-    data = _get(
-        f"{acct}/insights",
-        {
-            "fields": "ad_name,ad_id,impressions,reach,clicks,cpc,cpm,ctr,"
-            "spend,actions",
-            "time_range": json.dumps({"since": d30, "until": today}),
-            "level": "ad",
-            "limit": 50,
-        },
-    )
-    if data and "data" in data:
-        if not data["data"]:
-            print("  No data.")
-        for row in data["data"]:
-            spend = float(row.get("spend", 0))
-            print(f"\n  {row.get('ad_name')}")
-            print(
-                f"    Imp: {int(row.get('impressions', 0)):,} | "
-                f"Reach: {int(row.get('reach', 0)):,} | "
-                f"Clicks: {int(row.get('clicks', 0)):,} | "
-                f"CTR: {row.get('ctr', 'N/A')}% | Spend: HK${spend:.2f}"
-            )
-            actions = row.get("actions", [])
-            if actions:
-                print(f"    Actions: {_fmt_actions(actions)}")
-    print()
-
-    # Daily breakdown (14 days)
-    print("--- DAILY BREAKDOWN (Last 14 Days) ---")
-    data = _get(
-        f"{acct}/insights",
-        {
-            "fields": "impressions,reach,clicks,spend,actions,ctr,cpc,cpm",
-            "time_range": json.dumps({"since": d14, "until": today}),
-            "time_increment": 1,
-            "limit": 30,
-        },
-    )
-    if data and "data" in data:
-        if not data["data"]:
-            print("  No data.")
-        for row in data["data"]:
-            spend = float(row.get("spend", 0))
-            actions = row.get("actions", [])
-            act_str = ""
-            if actions:
-                act_str = " | " + _fmt_actions(actions[:5])
-            print(
-                f"  {row.get('date_start')} | "
-                f"Imp: {int(row.get('impressions', 0)):,} | "
-                f"Reach: {int(row.get('reach', 0)):,} | "
-                f"Clicks: {int(row.get('clicks', 0)):,} | "
-                f"CTR: {row.get('ctr', 'N/A')}% | "
-                f"CPM: HK${float(row.get('cpm', 0)):.2f} | "
-                f"Spend: HK${spend:.2f}{act_str}"
-            )
-    print()
+    sections = [
+        (
+            "AD ACCOUNT INFO",
+            (
+                acct,
+                {
+                    "fields": "name,account_id,account_status,currency,"
+                    "timezone_name,amount_spent,balance,spend_cap,created_time"
+                },
+                as_of,
+            ),
+            _print_account,
+        ),
+        (
+            "CAMPAIGNS",
+            (
+                f"{acct}/campaigns",
+                {
+                    "fields": "name,status,objective,daily_budget,lifetime_budget,"
+                    "start_time,stop_time,buying_type,bid_strategy",
+                    "limit": 50,
+                },
+                as_of,
+            ),
+            _print_campaigns,
+        ),
+        (
+            "AD SETS",
+            (
+                f"{acct}/adsets",
+                {
+                    "fields": "name,status,optimization_goal,billing_event,"
+                    "daily_budget,targeting",
+                    "limit": 50,
+                },
+                as_of,
+            ),
+            _print_adsets,
+        ),
+        (
+            "CAMPAIGN INSIGHTS (Last 30 Days)",
+            (
+                f"{acct}/insights",
+                {
+                    "fields": "campaign_name,impressions,reach,clicks,cpc,cpm,ctr,"
+                    "spend,actions,cost_per_action_type,frequency,unique_clicks",
+                    "time_range": json.dumps({"since": d30, "until": today}),
+                    "level": "campaign",
+                    "limit": 50,
+                },
+                (d30, today),
+            ),
+            _print_campaign_insights,
+        ),
+        (
+            "AD-LEVEL INSIGHTS (Last 30 Days)",
+            (
+                f"{acct}/insights",
+                {
+                    "fields": "ad_name,ad_id,impressions,reach,clicks,cpc,cpm,ctr,"
+                    "spend,actions",
+                    "time_range": json.dumps({"since": d30, "until": today}),
+                    "level": "ad",
+                    "limit": 50,
+                },
+                (d30, today),
+            ),
+            _print_ad_insights,
+        ),
+        (
+            "DAILY BREAKDOWN (Last 14 Days)",
+            (
+                f"{acct}/insights",
+                {
+                    "fields": "impressions,reach,clicks,spend,actions,ctr,cpc,cpm",
+                    "time_range": json.dumps({"since": d14, "until": today}),
+                    "time_increment": 1,
+                    "limit": 30,
+                },
+                (d14, today),
+            ),
+            _print_daily,
+        ),
+    ]
+    outcomes = _fetch_all(runner, [call for _heading, call, _printer in sections])
+
+    for (heading, call, printer), (data, error) in zip(sections, outcomes):
+        print(f"--- {heading} ---")
+        if error is not None:
+            print(f"API Error for {call[0]}: {error}")
+        elif data:
+            printer(data)
+        print()
 
     print("--- META ADS ASSESSMENT COMPLETE ---")
 
@@ -325,11 +391,13 @@ def _parse_args():
         help="Optional path to tee stdout into (plaintext). Useful for "
         "auto-capturing raw output into marketing/generated-reports/.",
     )
+    add_runner_args(parser)
     return parser.parse_args()
 
 
 def _run_main():
     args = _parse_args()
+    runner = runner_from_args(args, min_interval=META_MIN_INTERVAL_SECONDS)
     if args.out:
         out_dir = os.path.dirname(os.path.abspath(args.out))
         if out_dir:
@@ -337,9 +405,9 @@ def _run_main():
         with open(args.out, "w", encoding="utf-8") as fh:
             tee = _Tee(sys.stdout, fh)
             with contextlib.redirect_stdout(tee):
-                main()
+                main(runner)
     else:
-        main()
+        main(runner)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+"""Shared report runner for the assessment scripts.
+
+Each assessment issues a dozen or more read-only report calls. The runner
+fetches them concurrently (bounded workers plus a minimum spacing between
+network calls so platform quotas are respected) and keeps every response on
+disk, keyed by the request and its resolved date range, so a rerun on the same
+day re-renders from disk instead of hitting the APIs again.
+
+Cache modes (``--cache-mode``):
+    use     read cached responses, fetch and store misses (default)
+    record  always fetch and overwrite the cache
+    replay  never touch the network; a missing response is an error
+    off     always fetch, never read or write the cache
+
+``--as-of YYYY-MM-DD`` pins "today" so cached fixtures recorded on that date
+can be replayed offline, e.g. in tests or when re-rendering an old report.
+
+Payloads are stored as JSON text; callers convert to and from the client
+library types (``Message.to_json`` / ``Message.from_json`` for the Google
+clients, plain ``json`` for Meta).
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+
+CACHE_MODES = ("use", "record", "replay", "off")
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "generated-reports",
+    "cache",
+)
+DEFAULT_MAX_WORKERS = 4
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no cached response exists for a request."""
+
+
+class ResponseCache:
+    """On-disk JSON response cache, one file per (namespace, request, range)."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, mode="use"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.directory = directory
+        self.mode = mode
+
+    def path(self, namespace, request, date_range):
+        key = json.dumps(
+            {"request": request, "date_range": date_range},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, namespace, f"{digest}.json")
+
+    def fetch(self, namespace, request, date_range, loader):
+        """Return the payload text for a request, calling ``loader`` on a miss."""
+        if self.mode == "off":
+            return loader()
+        path = self.path(namespace, request, date_range)
+        if self.mode in ("use", "replay") and os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                return json.load(fh)["payload"]
+        if self.mode == "replay":
+            raise ReplayMissError(f"No cached {namespace} response for {request!r}")
+        payload = loader()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"request": request, "date_range": date_range, "payload": payload},
+                fh,
+                default=str,
+            )
+        os.replace(tmp_path, path)
+        return payload
+
+
+class RateLimiter:
+    """Space network calls at least ``min_interval`` seconds apart."""
+
+    def __init__(self, min_interval, clock=time.monotonic, sleep=time.sleep):
+        self._min_interval = min_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_at = None
+
+    def wait(self):
+        with self._lock:
+            now = self._clock()
+            if self._next_at is not None and now < self._next_at:
+                self._sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self._min_interval
+
+
+class ReportRunner:
+    """Cached, rate-limited and concurrent report fetching."""
+
+    def __init__(
+        self,
+        cache,
+        *,
+        max_workers=DEFAULT_MAX_WORKERS,
+        min_interval=0.0,
+        as_of=None,
+    ):
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(min_interval)
+        self.as_of = as_of or date.today()
+
+    def fetch(self, namespace, request, date_range, loader):
+        """Cached payload text; rate limiting applies to real calls only."""
+
+        def limited_loader():
+            self.limiter.wait()
+            return loader()
+
+        return self.cache.fetch(namespace, request, date_range, limited_loader)
+
+    def run_all(self, jobs):
+        """Run zero-argument callables concurrently.
+
+        Returns ``(result, error)`` pairs in job order so callers can print
+        sections in their usual order with per-section errors.
+        """
+        outcomes = [None] * len(jobs)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(len(jobs), 1))
+        ) as pool:
+            futures = {pool.submit(job): index for index, job in enumerate(jobs)}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    outcomes[futures[future]] = (future.result(), None)
+                except Exception as exc:
+                    outcomes[futures[future]] = (None, exc)
+        return outcomes
+
+
+def add_runner_args(parser):
+    """Add the shared ``--cache-*``, ``--as-of`` and ``--max-workers`` flags."""
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        default="use",
+        help="Response cache mode (default: use).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Response cache directory (default: generated-reports/cache).",
+    )
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        help="Treat this YYYY-MM-DD as today (for replaying recorded responses).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Concurrent API requests (default: 4).",
+    )
+
+
+def runner_from_args(args, *, min_interval=0.0):
+    """Build a ``ReportRunner`` from parsed ``add_runner_args`` flags."""
+    return ReportRunner(
+        ResponseCache(args.cache_dir, args.cache_mode),
+        max_workers=args.max_workers,
+        min_interval=min_interval,
+        as_of=args.as_of,
+    )
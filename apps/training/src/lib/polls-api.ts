@@ -49,6 +49,8 @@ export interface PollQuestionResults {
 export interface PollControlState {
   pollSlug: string;
   enabledQuestionIds: string[];
+  /** Bumped on every facilitator write; pass to ``fetchPollControlStateSince``. */
+  version?: number;
   questionOptions?: Record<string, PublishedQuestionOptions>;
   updatedAt?: string;
 }
@@ -108,7 +110,8 @@ export async function fetchPollQuestionResults(
     headers: {
       'x-api-key': config.apiKey,
     },
-    cache: 'no-store',
+    // Revalidate with the stored ETag; unchanged results come back as 304.
+    cache: 'no-cache',
   });
 
   if (!response.ok) {
@@ -125,6 +128,33 @@ export async function fetchPollControlState(pollSlug: string): Promise<PollContr
   }
 
   const endpointPath = `${config.baseUrl}/v1/polls/${encodeURIComponent(pollSlug)}/control`;
+  const response = await fetch(endpointPath, {
+    method: 'GET',
+    headers: {
+      'x-api-key': config.apiKey,
+    },
+    cache: 'no-cache',
+  });
+
+  if (!response.ok) {
+    throw new PollApiError('Failed to load poll control state', response.status);
+  }
+
+  return (await response.json()) as PollControlState;
+}
+
+/** Control state newer than ``sinceVersion``, or ``null`` when nothing changed (204). */
+export async function fetchPollControlStateSince(
+  pollSlug: string,
+  sinceVersion: number,
+): Promise<PollControlState | null> {
+  const config = resolvePollApiConfig();
+  if (!config) {
+    throw new PollApiError('Poll API is not configured', 0);
+  }
+
+  const params = new URLSearchParams({ sinceVersion: String(sinceVersion) });
+  const endpointPath = `${config.baseUrl}/v1/polls/${encodeURIComponent(pollSlug)}/control?${params.toString()}`;
   const response = await fetch(endpointPath, {
     method: 'GET',
     headers: {
@@ -133,6 +163,9 @@ export async function fetchPollControlState(pollSlug: string): Promise<PollContr
     cache: 'no-store',
   });
 
+  if (response.status === 204) {
+    return null;
+  }
   if (!response.ok) {
     throw new PollApiError('Failed to load poll control state', response.status);
   }
@@ -6,9 +6,11 @@ import type { PollQuestion } from '@/content/poll-types';
 import { buildQuestionOptionsMap } from '@/lib/poll-question-options';
 import {
   fetchPollControlState,
+  fetchPollControlStateSince,
   persistPollControlState,
   PollApiError,
 } from '@/lib/polls-api';
+import type { PollControlState } from '@/lib/polls-api';
 
 const CONTROL_POLL_MS = 2500;
 
@@ -41,6 +43,7 @@ export function usePollControlState({
   const [isLoading, setIsLoading] = useState(true);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
   const enabledRef = useRef(enabledQuestionIds);
+  const versionRef = useRef<number | null>(null);
   const questionOptions = useRef(buildQuestionOptionsMap(questions));
 
   useEffect(() => {
@@ -51,14 +54,15 @@ export function usePollControlState({
     enabledRef.current = enabledQuestionIds;
   }, [enabledQuestionIds]);
 
-  const applyState = useCallback((ids: string[]) => {
-    setEnabledQuestionIds(new Set(ids));
+  const applyState = useCallback((state: PollControlState) => {
+    versionRef.current = typeof state.version === 'number' ? state.version : null;
+    setEnabledQuestionIds(new Set(state.enabledQuestionIds));
   }, []);
 
   const refetch = useCallback(async () => {
     try {
       const state = await fetchPollControlState(pollSlug);
-      applyState(state.enabledQuestionIds);
+      applyState(state);
       setErrorMessage(null);
     } catch {
       setErrorMessage('load');
@@ -69,12 +73,20 @@ export function usePollControlState({
 
   useEffect(() => {
     let cancelled = false;
+    versionRef.current = null;
 
     async function load(): Promise<void> {
       try {
-        const state = await fetchPollControlState(pollSlug);
+        // Once a version is known, only changed state carries a payload.
+        const since = versionRef.current;
+        const state =
+          since === null
+            ? await fetchPollControlState(pollSlug)
+            : await fetchPollControlStateSince(pollSlug, since);
         if (!cancelled) {
-          applyState(state.enabledQuestionIds);
+          if (state) {
+            applyState(state);
+          }
           setErrorMessage(null);
         }
       } catch {
@@ -126,7 +138,7 @@ export function usePollControlState({
           enabledQuestionIds: nextIds,
           questionOptions: questionOptions.current,
         });
-        applyState(state.enabledQuestionIds);
+        applyState(state);
       } catch (error) {
         setEnabledQuestionIds(previous);
         if (error instanceof PollApiError && error.statusCode === 0) {
@@ -3,6 +3,7 @@ import { afterEach, describe, expect, it, vi } from 'vitest';
 import {
   buildPersistBody,
   fetchPollControlState,
+  fetchPollControlStateSince,
   fetchPollQuestionResults,
   fetchPollSessionAnswers,
   persistPollAnswer,
@@ -148,6 +149,20 @@ describe('poll control API', () => {
     );
   });
 
+  it('returns null when control state is unchanged since a version', async () => {
+    vi.stubEnv('NEXT_PUBLIC_API_BASE_URL', '/www');
+    vi.stubEnv('NEXT_PUBLIC_TRAINING_API_KEY', 'poll-key');
+    const fetchMock = vi.fn().mockResolvedValue({ ok: true, status: 204 });
+    vi.stubGlobal('fetch', fetchMock);
+
+    const state = await fetchPollControlStateSince('workshop-food-jun-26', 3);
+    expect(state).toBeNull();
+    expect(fetchMock).toHaveBeenCalledWith(
+      '/www/v1/polls/workshop-food-jun-26/control?sinceVersion=3',
+      expect.objectContaining({ method: 'GET' }),
+    );
+  });
+
   it('persists control state', async () => {
     vi.stubEnv('NEXT_PUBLIC_API_BASE_URL', '/www');
     vi.stubEnv('NEXT_PUBLIC_TRAINING_API_KEY', 'poll-key');
@@ -0,0 +1,51 @@
+"""Add legacy_import_checkpoints for resumable multi-entity legacy imports.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: new table only.
+2. N/A — table populated only by the import Lambda.
+3. N/A.
+4. N/A (no seed rows required).
+5. N/A.
+6. FK/cascade: none.
+
+Result: No seed updates required.
+
+Revision id: ``0072_legacy_import_checkpoints`` (30 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0072_legacy_import_checkpoints"
+down_revision: Union[str, None] = "0071_partner_legal_name"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legacy_import_checkpoints",
+        sa.Column("run_key", sa.Text(), nullable=False),
+        sa.Column("entity", sa.Text(), nullable=False),
+        sa.Column(
+            "inserted",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "completed_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("run_key", "entity"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("legacy_import_checkpoints")
@@ -0,0 +1,104 @@
+"""Add ``public_calendar_feed_snapshots`` and triggers that mark it stale.
+
+The public calendar handler serves the serialized event list from this table and
+filters it in memory; statement-level triggers on every table the feed serializer
+reads flip ``stale`` so the next request rebuilds the snapshot.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: new table plus triggers; existing seed inserts only mark the
+   (stale-by-default) snapshot row stale again.
+2. N/A.
+3. N/A.
+4. The ``public_calendar`` row is inserted here (``stale = true``); no seed rows.
+5. N/A.
+6. FK/cascade: none.
+
+Result: No seed updates required.
+
+Revision id: ``0073_public_calendar_feed`` (25 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0073_public_calendar_feed"
+down_revision: Union[str, None] = "0072_legacy_import_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+#: Tables read by ``list_public_offerings`` / ``_serialize_public_event``.
+_FEED_SOURCE_TABLES = (
+    "services",
+    "event_details",
+    "service_instances",
+    "instance_session_slots",
+    "training_instance_details",
+    "event_ticket_tiers",
+    "service_instance_tags",
+    "service_instance_organizations",
+    "tags",
+    "organizations",
+    "locations",
+    "enrollments",
+)
+
+
+def _trigger_name(table: str) -> str:
+    return f"{table}_public_feed_stale"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "public_calendar_feed_snapshots",
+        sa.Column("feed_key", sa.Text(), nullable=False),
+        sa.Column(
+            "payload",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("etag", sa.Text(), nullable=True),
+        sa.Column(
+            "stale",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("true"),
+        ),
+        sa.Column("built_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("feed_key"),
+    )
+    op.execute(
+        "INSERT INTO public_calendar_feed_snapshots (feed_key) "
+        "VALUES ('public_calendar');"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION mark_public_calendar_feed_stale()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE public_calendar_feed_snapshots SET stale = true WHERE NOT stale;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in _FEED_SOURCE_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {_trigger_name(table)}
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION mark_public_calendar_feed_stale();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in _FEED_SOURCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS mark_public_calendar_feed_stale();")
+    op.drop_table("public_calendar_feed_snapshots")
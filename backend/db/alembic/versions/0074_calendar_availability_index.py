@@ -0,0 +1,151 @@
+"""Add ``calendar_availability_indexes`` and triggers that keep it current.
+
+``GET /v1/calendar/availability`` answers from a per-purpose free-slot bitmap.
+Row triggers on ``calendar_manual_blocks`` and ``instance_session_slots`` widen the
+row's dirty date range (UTC dates padded by one day so any wall timezone is
+covered); statement triggers on eligibility changes to ``services`` /
+``service_instances`` and ``TRUNCATE`` on the row-trigger tables mark the bitmap
+stale for a full rebuild.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: new table plus triggers; seed inserts only widen the dirty range of
+   the (stale-by-default) index rows.
+2. N/A.
+3. N/A.
+4. The ``consultation_booking`` and ``intro_call_booking`` rows are inserted here
+   (``stale = true``); no seed rows.
+5. N/A.
+6. FK/cascade: none.
+
+Result: No seed updates required.
+
+Revision id: ``0074_calendar_availability_index`` (32 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0074_calendar_availability_index"
+down_revision: Union[str, None] = "0073_public_calendar_feed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PURPOSES = ("consultation_booking", "intro_call_booking")
+#: Busy-time rows whose changed dates are recorded in the dirty range.
+_DIRTY_TABLES = ("calendar_manual_blocks", "instance_session_slots")
+#: Changes that alter which session slots count as busy. New services / instances
+#: have no slots yet; their slot inserts are picked up by the row triggers.
+_STALE_EVENTS = {
+    "services": "UPDATE OF status, service_type OR DELETE OR TRUNCATE",
+    "service_instances": "UPDATE OF status, slug, service_id OR DELETE OR TRUNCATE",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calendar_availability_indexes",
+        sa.Column("purpose", sa.Text(), nullable=False),
+        sa.Column("wall_time_zone", sa.Text(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column(
+            "bitmap",
+            sa.LargeBinary(),
+            nullable=False,
+            server_default=sa.text("''::bytea"),
+        ),
+        sa.Column("dirty_from", sa.Date(), nullable=True),
+        sa.Column("dirty_to", sa.Date(), nullable=True),
+        sa.Column(
+            "stale",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("true"),
+        ),
+        sa.Column("built_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("purpose"),
+    )
+    values = ", ".join(f"('{purpose}')" for purpose in _PURPOSES)
+    op.execute(f"INSERT INTO calendar_availability_indexes (purpose) VALUES {values};")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION mark_calendar_availability_dirty()
+        RETURNS trigger AS $$
+        DECLARE
+            lo date;
+            hi date;
+        BEGIN
+            IF TG_TABLE_NAME = 'calendar_manual_blocks' THEN
+                IF TG_OP <> 'INSERT' THEN
+                    lo := OLD.block_date;
+                    hi := OLD.block_date;
+                END IF;
+                IF TG_OP <> 'DELETE' THEN
+                    lo := LEAST(lo, NEW.block_date);
+                    hi := GREATEST(hi, NEW.block_date);
+                END IF;
+            ELSE
+                IF TG_OP <> 'INSERT' THEN
+                    lo := (OLD.starts_at AT TIME ZONE 'UTC')::date;
+                    hi := (OLD.ends_at AT TIME ZONE 'UTC')::date;
+                END IF;
+                IF TG_OP <> 'DELETE' THEN
+                    lo := LEAST(lo, (NEW.starts_at AT TIME ZONE 'UTC')::date);
+                    hi := GREATEST(hi, (NEW.ends_at AT TIME ZONE 'UTC')::date);
+                END IF;
+            END IF;
+            UPDATE calendar_availability_indexes
+               SET dirty_from = LEAST(dirty_from, lo - 1),
+                   dirty_to = GREATEST(dirty_to, hi + 1);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION mark_calendar_availability_stale()
+        RETURNS trigger AS $$
+        BEGIN
+            UPDATE calendar_availability_indexes SET stale = true WHERE NOT stale;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in _DIRTY_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_availability_dirty
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION mark_calendar_availability_dirty();
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_availability_stale
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION mark_calendar_availability_stale();
+            """
+        )
+    for table, events in _STALE_EVENTS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_availability_stale
+            AFTER {events} ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION mark_calendar_availability_stale();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in _DIRTY_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_availability_dirty ON {table};")
+    for table in (*_DIRTY_TABLES, *_STALE_EVENTS):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_availability_stale ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS mark_calendar_availability_dirty();")
+    op.execute("DROP FUNCTION IF EXISTS mark_calendar_availability_stale();")
+    op.drop_table("calendar_availability_indexes")
@@ -0,0 +1,211 @@
+"""Add daily sales lead analytics rollups and the triggers that keep them current.
+
+``sales_lead_daily_rollups`` / ``sales_lead_stage_daily_rollups`` are bucketed by
+the lead's UTC creation day. Row triggers on ``sales_leads``,
+``sales_lead_events`` and ``contacts.source`` upsert the affected creation days into
+``sales_lead_rollup_dirty_days``; the admin analytics endpoint recomputes only
+those days before reading. Existing lead days are marked dirty here as the
+backfill (or run ``backend/scripts/rebuild_sales_lead_rollups.py``).
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: new tables plus triggers; seed lead inserts only mark days dirty.
+2. N/A.
+3. N/A.
+4. No seed rows; rollups are derived data.
+5. N/A.
+6. FK/cascade: none (lead deletes mark their day dirty via the trigger).
+
+Result: No seed updates required.
+
+Revision id: ``0075_sales_lead_daily_rollups`` (29 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0075_sales_lead_daily_rollups"
+down_revision: Union[str, None] = "0074_calendar_availability_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _funnel_stage() -> postgresql.ENUM:
+    return postgresql.ENUM(name="funnel_stage", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_lead_daily_rollups",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("funnel_stage", _funnel_stage(), nullable=False),
+        sa.Column("source", sa.Text(), nullable=True),
+        sa.Column("assigned_to", sa.String(length=128), nullable=True),
+        sa.Column("lead_count", sa.Integer(), nullable=False),
+        sa.Column("converted_timed_count", sa.Integer(), nullable=False),
+        sa.Column("convert_seconds", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "sales_lead_daily_rollups_day_idx",
+        "sales_lead_daily_rollups",
+        ["day"],
+    )
+    op.create_table(
+        "sales_lead_stage_daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("stage", _funnel_stage(), nullable=False),
+        sa.Column("reached_leads", sa.Integer(), nullable=False),
+        sa.Column("stage_intervals", sa.Integer(), nullable=False),
+        sa.Column("stage_seconds", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "stage"),
+    )
+    op.create_table(
+        "sales_lead_rollup_dirty_days",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "marked_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+    # DO UPDATE (not DO NOTHING) takes a row lock, so a writer racing a rollup
+    # refresh that has claimed the same day waits and re-marks it afterwards.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION mark_sales_lead_rollup_day(created timestamptz)
+        RETURNS void AS $$
+            INSERT INTO sales_lead_rollup_dirty_days (day)
+            VALUES ((created AT TIME ZONE 'UTC')::date)
+            ON CONFLICT (day) DO UPDATE SET marked_at = now();
+        $$ LANGUAGE sql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sales_leads_rollup_dirty()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM mark_sales_lead_rollup_day(OLD.created_at);
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM mark_sales_lead_rollup_day(NEW.created_at);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sales_lead_events_rollup_dirty()
+        RETURNS trigger AS $$
+        DECLARE
+            lead_created timestamptz;
+        BEGIN
+            SELECT created_at INTO lead_created FROM sales_leads
+             WHERE id = CASE WHEN TG_OP = 'DELETE' THEN OLD.lead_id
+                             ELSE NEW.lead_id END;
+            IF lead_created IS NOT NULL THEN
+                PERFORM mark_sales_lead_rollup_day(lead_created);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION contacts_source_rollup_dirty()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM mark_sales_lead_rollup_day(created_at)
+               FROM sales_leads WHERE contact_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sales_lead_rollups_truncate()
+        RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM sales_lead_daily_rollups;
+            DELETE FROM sales_lead_stage_daily_rollups;
+            DELETE FROM sales_lead_rollup_dirty_days;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER sales_leads_rollup_dirty
+        AFTER INSERT OR UPDATE OR DELETE ON sales_leads
+        FOR EACH ROW EXECUTE FUNCTION sales_leads_rollup_dirty();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER sales_leads_rollup_truncate
+        AFTER TRUNCATE ON sales_leads
+        FOR EACH STATEMENT EXECUTE FUNCTION sales_lead_rollups_truncate();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER sales_lead_events_rollup_dirty
+        AFTER INSERT OR UPDATE OR DELETE ON sales_lead_events
+        FOR EACH ROW EXECUTE FUNCTION sales_lead_events_rollup_dirty();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER contacts_source_rollup_dirty
+        AFTER UPDATE OF source ON contacts
+        FOR EACH ROW WHEN (OLD.source IS DISTINCT FROM NEW.source)
+        EXECUTE FUNCTION contacts_source_rollup_dirty();
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO sales_lead_rollup_dirty_days (day)
+        SELECT DISTINCT (created_at AT TIME ZONE 'UTC')::date FROM sales_leads
+        ON CONFLICT (day) DO NOTHING;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS contacts_source_rollup_dirty ON contacts;")
+    op.execute(
+        "DROP TRIGGER IF EXISTS sales_lead_events_rollup_dirty ON sales_lead_events;"
+    )
+    op.execute("DROP TRIGGER IF EXISTS sales_leads_rollup_truncate ON sales_leads;")
+    op.execute("DROP TRIGGER IF EXISTS sales_leads_rollup_dirty ON sales_leads;")
+    op.execute("DROP FUNCTION IF EXISTS sales_lead_rollups_truncate();")
+    op.execute("DROP FUNCTION IF EXISTS contacts_source_rollup_dirty();")
+    op.execute("DROP FUNCTION IF EXISTS sales_lead_events_rollup_dirty();")
+    op.execute("DROP FUNCTION IF EXISTS sales_leads_rollup_dirty();")
+    op.execute("DROP FUNCTION IF EXISTS mark_sales_lead_rollup_day(timestamptz);")
+    op.drop_table("sales_lead_rollup_dirty_days")
+    op.drop_table("sales_lead_stage_daily_rollups")
+    op.drop_index(
+        "sales_lead_daily_rollups_day_idx", table_name="sales_lead_daily_rollups"
+    )
+    op.drop_table("sales_lead_daily_rollups")
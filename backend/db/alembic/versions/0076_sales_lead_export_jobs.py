@@ -0,0 +1,80 @@
+"""Add sales_lead_export_jobs for streamed admin lead CSV exports.
+
+Tracks queued exports that the lead export worker streams to gzip'd CSV objects
+under ``exports/sales-leads/`` in the assets bucket.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: no seed inserts into this table.
+2. NOT NULL columns: job rows are app-created only.
+3. N/A.
+4. No seed rows for operational job queue.
+5. Job status strings are application-defined; no enum overlap with seed.
+6. No FKs.
+
+Result: No seed updates required.
+
+Revision id: ``0076_sales_lead_export_jobs`` (27 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0076_sales_lead_export_jobs"
+down_revision: Union[str, None] = "0075_sales_lead_daily_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_lead_export_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("created_by", sa.Text(), nullable=False),
+        sa.Column("filters", postgresql.JSONB(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=True),
+        sa.Column(
+            "exported_count",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column("s3_key", sa.Text(), nullable=True),
+        sa.Column("byte_size", sa.BigInteger(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+    )
+    op.create_index(
+        "ix_sales_lead_export_jobs_created_by",
+        "sales_lead_export_jobs",
+        ["created_by"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_sales_lead_export_jobs_created_by",
+        table_name="sales_lead_export_jobs",
+    )
+    op.drop_table("sales_lead_export_jobs")
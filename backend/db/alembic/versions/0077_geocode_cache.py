@@ -0,0 +1,55 @@
+"""Add geocode_cache for Nominatim answers keyed by normalized address text.
+
+Admin location geocoding and the legacy venue warm-up script read this table
+before calling Nominatim (1 request/second usage policy). Rows with NULL
+``lat``/``lng`` remember "no results" until ``expires_at``.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: no seed inserts into this table.
+2. NOT NULL columns: cache rows are app-created only.
+3. N/A.
+4. No seed rows for a derived cache.
+5. N/A.
+6. No FKs.
+
+Result: No seed updates required.
+
+Revision id: ``0077_geocode_cache`` (18 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0077_geocode_cache"
+down_revision: Union[str, None] = "0076_sales_lead_export_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "geocode_cache",
+        sa.Column("query_text", sa.Text(), nullable=False),
+        sa.Column("country_codes", sa.String(length=64), nullable=False),
+        sa.Column("lat", sa.Numeric(9, 6), nullable=True),
+        sa.Column("lng", sa.Numeric(9, 6), nullable=True),
+        sa.Column("display_name", sa.Text(), nullable=True),
+        sa.Column(
+            "fetched_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("query_text", "country_codes"),
+    )
+    op.create_index("ix_geocode_cache_expires_at", "geocode_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_geocode_cache_expires_at", table_name="geocode_cache")
+    op.drop_table("geocode_cache")
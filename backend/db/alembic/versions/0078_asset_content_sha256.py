@@ -0,0 +1,50 @@
+"""Add assets.content_sha256 for content-addressed inbound invoice attachments.
+
+The inbound invoice processor hashes each attachment and reuses the asset with
+the same digest instead of uploading a second copy when an invoice is forwarded
+again. The partial unique index keeps one asset per digest; NULL for assets
+uploaded through admin flows.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: no seed inserts into ``assets``.
+2. NOT NULL columns: none added; the column is nullable.
+3. N/A.
+4. No seed rows; admin-uploaded assets keep a NULL digest.
+5. N/A.
+6. No FKs.
+
+Result: No seed updates required.
+
+Revision id: ``0078_asset_content_sha256`` (25 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0078_asset_content_sha256"
+down_revision: Union[str, None] = "0077_geocode_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "assets",
+        sa.Column("content_sha256", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        "assets_content_sha256_unique_idx",
+        "assets",
+        ["content_sha256"],
+        unique=True,
+        postgresql_where=sa.text("content_sha256 IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("assets_content_sha256_unique_idx", table_name="assets")
+    op.drop_column("assets", "content_sha256")
@@ -0,0 +1,55 @@
+"""Add cache_versions for invalidating per-container in-memory caches.
+
+Admin share-link writes bump the ``asset_share_links`` row; the public share
+routes compare it before serving tokens from their Lambda-local cache.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: no seed inserts into this table.
+2. NOT NULL columns: all have server defaults except ``name``.
+3. N/A.
+4. The ``asset_share_links`` row is created here; bumps also upsert it.
+5. Scope names are application-defined; no enum overlap with seed.
+6. No FKs.
+
+Result: No seed updates required.
+
+Revision id: ``0079_cache_versions`` (19 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0079_cache_versions"
+down_revision: Union[str, None] = "0078_asset_content_sha256"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cache_versions",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.execute(
+        "INSERT INTO cache_versions (name, version) VALUES ('asset_share_links', 0)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
@@ -0,0 +1,48 @@
+"""Add ``public_calendar_feed_snapshots.truncated``.
+
+The snapshot keeps at most ``_FEED_SNAPSHOT_LIMIT`` rows. When the source query
+had more, filtered public calendar requests fall back to the SQL-filtered query
+instead of filtering an incomplete snapshot in memory.
+
+Seed-data assessment (``backend/db/seed/seed_data.sql``):
+1. Compatible: no seed inserts into ``public_calendar_feed_snapshots``.
+2. NOT NULL columns: ``truncated`` has a server default (``false``).
+3. N/A.
+4. The existing ``public_calendar`` row gets ``false``; the next rebuild sets it.
+5. N/A.
+6. No FKs.
+
+Result: No seed updates required.
+
+Revision id: ``0080_public_feed_truncated`` (26 chars, <= 32).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0080_public_feed_truncated"
+down_revision: Union[str, None] = "0079_cache_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "public_calendar_feed_snapshots",
+        sa.Column(
+            "truncated",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+    # Rebuild with the new flag on the next request.
+    op.execute("UPDATE public_calendar_feed_snapshots SET stale = true;")
+
+
+def downgrade() -> None:
+    op.drop_column("public_calendar_feed_snapshots", "truncated")
@@ -25,6 +25,25 @@ import { DatabaseConstruct, PythonLambdaFactory, STANDARD_LOG_RETENTION } from "
 import { MessagingNestedStack } from "./messaging-stack";
 import { sesVerifiedAddressAndDomainIdentityArns } from "./ses-identity-arns";
 
+/**
+ * The REST API marks every media type as binary (see binaryMediaTypes), so the
+ * MOCK integrations behind CORS preflights fail ("Unable to transform request")
+ * unless they convert the payload back to text.
+ */
+class CorsPreflightTextContentHandling implements cdk.IAspect {
+  public visit(node: IConstruct): void {
+    if (!(node instanceof apigateway.CfnMethod) || node.httpMethod !== "OPTIONS") {
+      return;
+    }
+    const integration = node.integration as
+      | apigateway.CfnMethod.IntegrationProperty
+      | undefined;
+    if (integration?.type === "MOCK") {
+      node.addPropertyOverride("Integration.ContentHandling", "CONVERT_TO_TEXT");
+    }
+  }
+}
+
 class CdkInternalLambdaCheckovSuppression implements cdk.IAspect {
   public visit(node: IConstruct): void {
     const cfnType = (node as cdk.CfnResource).cfnResourceType;
@@ -1547,6 +1566,20 @@ export class ApiStack extends cdk.Stack {
           expiration: cdk.Duration.days(7),
           abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
         },
+        {
+          id: "ExpireCompletionCertificateBatchZips",
+          enabled: true,
+          prefix: "completion-certificates/batch/",
+          expiration: cdk.Duration.days(7),
+          abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
+        },
+        {
+          id: "ExpireSalesLeadExports",
+          enabled: true,
+          prefix: "exports/sales-leads/",
+          expiration: cdk.Duration.days(7),
+          abortIncompleteMultipartUploadAfter: cdk.Duration.days(1),
+        },
       ],
       cors: [
         {
@@ -1771,6 +1804,8 @@ export class ApiStack extends cdk.Stack {
         SES_SENDER_EMAIL: sesSenderEmail.valueAsString,
         SALES_RECAP_DISPLAY_TIMEZONE: salesRecapDisplayTimezone.valueAsString,
         DEFAULT_PHONE_REGION: defaultPhoneRegion.valueAsString,
+        // Keep 1 in 10 INFO lines from the public calendar feed and poll hits.
+        LOG_SAMPLE_RATES: "app.api.public_events=0.1,app.api.public_polls=0.1",
       },
     });
     database.grantAdminUserSecretRead(adminFunction);
@@ -2033,6 +2068,13 @@ export class ApiStack extends cdk.Stack {
       "BULK_EXPENSE_IMPORT_QUEUE_URL",
       messaging.bulkExpenseImportQueue.queueUrl
     );
+    database.grantAdminUserSecretRead(messaging.salesLeadExportFunction);
+    database.grantConnect(messaging.salesLeadExportFunction, "evolvesprouts_admin");
+    messaging.salesLeadExportQueue.grantSendMessages(adminFunction);
+    adminFunction.addEnvironment(
+      "SALES_LEAD_EXPORT_QUEUE_URL",
+      messaging.salesLeadExportQueue.queueUrl
+    );
 
     adminFunction.addToRolePolicy(
       new iam.PolicyStatement({
@@ -2765,6 +2807,10 @@ export class ApiStack extends cdk.Stack {
     // Never use Cors.ALL_ORIGINS in production - it allows any website to make requests
     const api = new apigateway.RestApi(this, "EvolvesproutsApi", {
       restApiName: name("api"),
+      // Lets json_response return gzip/br bodies (isBase64Encoded) when the client
+      // sends Accept-Encoding. Request bodies then arrive base64-encoded too; the
+      // shared body parsers decode them (see parse_body in admin_request.py).
+      binaryMediaTypes: ["*/*"],
       defaultCorsPreflightOptions: {
         allowOrigins: corsAllowedOrigins,
         allowMethods: ["GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"],
@@ -2798,6 +2844,7 @@ export class ApiStack extends cdk.Stack {
         tracingEnabled: true,
       },
     });
+    cdk.Aspects.of(api).add(new CorsPreflightTextContentHandling());
     api.deploymentStage.node.addDependency(apiAccessLogGroupRetention);
     api.deploymentStage.node.addDependency(apiAccessLogGroupKey);
 
@@ -2930,6 +2977,73 @@ export class ApiStack extends cdk.Stack {
       })
     );
 
+    // -------------------------------------------------------------------------
+    // Capacity status sweep
+    // One set-based UPDATE flips FULL/OPEN for every capped instance so status
+    // stays correct even when enrollments change outside the admin API.
+    // -------------------------------------------------------------------------
+
+    const capacityReconcileFunction = createPythonFunction(
+      "CapacityReconcileFunction",
+      {
+        handler: "lambda/capacity_reconcile/handler.lambda_handler",
+        memorySize: 256,
+        timeout: cdk.Duration.seconds(60),
+        reservedConcurrentExecutions: 1,
+        environment: {
+          DATABASE_SECRET_ARN: database.adminUserSecret.secretArn,
+          DATABASE_NAME: "evolvesprouts",
+          DATABASE_USERNAME: "evolvesprouts_admin",
+          DATABASE_PROXY_ENDPOINT: database.proxy.endpoint,
+          DATABASE_IAM_AUTH: "true",
+        },
+      }
+    );
+    database.grantAdminUserSecretRead(capacityReconcileFunction);
+    database.grantConnect(capacityReconcileFunction, "evolvesprouts_admin");
+    capacityReconcileFunction.node.addDependency(database.cluster);
+
+    const capacityReconcileRule = new cdk.aws_events.Rule(
+      this,
+      "CapacityReconcileSchedule",
+      {
+        ruleName: name("capacity-reconcile"),
+        description: "Reconcile service instance FULL/OPEN status from enrollments",
+        schedule: cdk.aws_events.Schedule.rate(cdk.Duration.minutes(15)),
+      }
+    );
+    capacityReconcileRule.addTarget(
+      new cdk.aws_events_targets.LambdaFunction(capacityReconcileFunction, {
+        retryAttempts: 2,
+      })
+    );
+
+    // -------------------------------------------------------------------------
+    // Lambda warm-up
+    // `{"warmup": true}` makes the admin Lambda and the authorizers run their
+    // init work (imports, DB connection, secrets, JWKS, signing key) and return
+    // a per-phase timing report instead of serving a request.
+    // -------------------------------------------------------------------------
+
+    const warmupRule = new cdk.aws_events.Rule(this, "ApiLambdaWarmupSchedule", {
+      ruleName: name("api-lambda-warmup"),
+      description: "Keep API Lambdas and authorizers initialized",
+      schedule: cdk.aws_events.Schedule.rate(cdk.Duration.minutes(5)),
+    });
+    for (const warmupTarget of [
+      adminFunction,
+      adminGroupAuthorizerFunction,
+      userAuthorizerFunction,
+      deviceAttestationFunction,
+    ]) {
+      warmupRule.addTarget(
+        new cdk.aws_events_targets.LambdaFunction(warmupTarget, {
+          event: cdk.aws_events.RuleTargetInput.fromObject({ warmup: true }),
+          retryAttempts: 0,
+        })
+      );
+    }
+
     // ---------------------------------------------------------------------
     // API Routes
     // CI: scripts/check-cdk-admin-api-routes.mjs parses this section using
@@ -3475,6 +3589,10 @@ export class ApiStack extends cdk.Stack {
       value: messaging.bulkExpenseImportDLQ.queueUrl,
       description: "SQS dead letter queue URL for failed bulk expense import jobs",
     });
+    new cdk.CfnOutput(this, "SalesLeadExportQueueUrl", {
+      value: messaging.salesLeadExportQueue.queueUrl,
+      description: "SQS queue URL for async admin lead CSV exports",
+    });
     new cdk.CfnOutput(this, "EventbriteSyncTopicArn", {
       value: eventbriteSync.topic.topicArn,
       description: "SNS topic ARN for Eventbrite sync events",
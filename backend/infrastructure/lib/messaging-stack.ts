@@ -85,6 +85,10 @@ export class MessagingNestedStack extends cdk.NestedStack {
   public readonly bulkExpenseImportQueue: sqs.Queue;
   public readonly bulkExpenseImportFunction: lambda.Function;
 
+  public readonly salesLeadExportDLQ: sqs.Queue;
+  public readonly salesLeadExportQueue: sqs.Queue;
+  public readonly salesLeadExportFunction: lambda.Function;
+
   public constructor(scope: Construct, id: string, props: MessagingNestedStackProps) {
     super(scope, id, props);
 
@@ -175,7 +179,9 @@ export class MessagingNestedStack extends cdk.NestedStack {
 
     this.mediaQueue = new sqs.Queue(this, "MediaQueue", {
       queueName: name("media-queue"),
-      visibilityTimeout: cdk.Duration.seconds(60),
+      // >= 6x the processor timeout so batched records are not redelivered
+      // while a slow batch is still running.
+      visibilityTimeout: cdk.Duration.seconds(360),
       deadLetterQueue: {
         queue: this.mediaDLQ,
         maxReceiveCount: 3,
@@ -195,7 +201,7 @@ export class MessagingNestedStack extends cdk.NestedStack {
 
     this.mediaRequestProcessor = createPythonFunction("MediaRequestProcessor", {
         handler: "lambda/media_processor/handler.lambda_handler",
-        timeout: cdk.Duration.seconds(30),
+        timeout: cdk.Duration.seconds(60),
         manageLogGroup: false,
         environment: {
           DATABASE_SECRET_ARN: props.databaseSecretArn,
@@ -294,7 +300,8 @@ export class MessagingNestedStack extends cdk.NestedStack {
 
     this.mediaRequestProcessor.addEventSource(
       new lambdaEventSources.SqsEventSource(this.mediaQueue, {
-        batchSize: 1,
+        batchSize: 10,
+        maxBatchingWindow: cdk.Duration.seconds(2),
         reportBatchItemFailures: true,
       })
     );
@@ -537,5 +544,81 @@ export class MessagingNestedStack extends cdk.NestedStack {
       evaluationPeriods: 1,
       treatMissingData: cdk.aws_cloudwatch.TreatMissingData.NOT_BREACHING,
     });
+
+    // -------------------------------------------------------------------------
+    // Admin sales lead CSV export (direct SQS; streams gzip'd CSV to S3)
+    // -------------------------------------------------------------------------
+
+    this.salesLeadExportDLQ = new sqs.Queue(this, "SalesLeadExportDLQ", {
+      queueName: name("sales-lead-export-dlq"),
+      retentionPeriod: cdk.Duration.days(14),
+      encryption: sqs.QueueEncryption.KMS,
+      encryptionMasterKey: props.sqsEncryptionKey,
+    });
+
+    this.salesLeadExportQueue = new sqs.Queue(this, "SalesLeadExportQueue", {
+      queueName: name("sales-lead-export-queue"),
+      visibilityTimeout: cdk.Duration.seconds(1080),
+      deadLetterQueue: {
+        queue: this.salesLeadExportDLQ,
+        maxReceiveCount: 3,
+      },
+      encryption: sqs.QueueEncryption.KMS,
+      encryptionMasterKey: props.sqsEncryptionKey,
+    });
+
+    this.salesLeadExportFunction = createPythonFunction("SalesLeadExportFunction", {
+      handler: "lambda/sales_lead_export/handler.lambda_handler",
+      timeout: cdk.Duration.seconds(900),
+      manageLogGroup: false,
+      reservedConcurrentExecutions: -1,
+      environment: {
+        DATABASE_SECRET_ARN: props.databaseSecretArn,
+        DATABASE_NAME: "evolvesprouts",
+        DATABASE_USERNAME: "evolvesprouts_admin",
+        DATABASE_PROXY_ENDPOINT: props.databaseProxyEndpoint,
+        DATABASE_IAM_AUTH: "true",
+        ASSETS_BUCKET_NAME: props.assetsBucketName,
+      },
+    });
+
+    this.salesLeadExportFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        actions: ["secretsmanager:GetSecretValue", "secretsmanager:DescribeSecret"],
+        resources: [props.databaseSecretArn],
+      })
+    );
+    if (props.databaseSecretKmsKeyArn) {
+      this.salesLeadExportFunction.addToRolePolicy(
+        new iam.PolicyStatement({
+          actions: ["kms:Decrypt"],
+          resources: [props.databaseSecretKmsKeyArn],
+        })
+      );
+    }
+    this.salesLeadExportFunction.addToRolePolicy(
+      new iam.PolicyStatement({
+        actions: ["s3:PutObject", "s3:AbortMultipartUpload"],
+        resources: [`${props.assetsBucketArn}/exports/sales-leads/*`],
+      })
+    );
+
+    this.salesLeadExportFunction.addEventSource(
+      new lambdaEventSources.SqsEventSource(this.salesLeadExportQueue, {
+        batchSize: 1,
+        reportBatchItemFailures: true,
+      })
+    );
+
+    new cdk.aws_cloudwatch.Alarm(this, "SalesLeadExportDLQAlarm", {
+      alarmName: name("sales-lead-export-dlq-alarm"),
+      alarmDescription: "Lead export messages failed processing and landed in DLQ",
+      metric: this.salesLeadExportDLQ.metricApproximateNumberOfMessagesVisible({
+        period: cdk.Duration.minutes(5),
+      }),
+      threshold: 1,
+      evaluationPeriods: 1,
+      treatMissingData: cdk.aws_cloudwatch.TreatMissingData.NOT_BREACHING,
+    });
   }
 }
@@ -200,6 +200,24 @@ function assertCognitoClientAllowlistWiring(template: Template): void {
   }
 }
 
+function assertCorsPreflightsConvertBinaryPayloadsToText(template: Template): void {
+  const methods = template.findResources("AWS::ApiGateway::Method", {
+    Properties: { HttpMethod: "OPTIONS" },
+  });
+  const entries = Object.entries(methods);
+  if (entries.length === 0) {
+    throw new Error("Expected CORS preflight OPTIONS methods on the REST API");
+  }
+  for (const [logicalId, resource] of entries) {
+    const integration = resource.Properties?.Integration ?? {};
+    if (integration.Type === "MOCK" && integration.ContentHandling !== "CONVERT_TO_TEXT") {
+      throw new Error(
+        `OPTIONS method ${logicalId} must set ContentHandling=CONVERT_TO_TEXT (binaryMediaTypes is */*)`,
+      );
+    }
+  }
+}
+
 function main(): void {
   const template = synthApiTemplate();
   assertStageHasNoApiGatewayCacheCluster(template);
@@ -208,6 +226,7 @@ function main(): void {
   assertPollResponsesTableUsesCustomerManagedKms(template);
   assertPollResponsesTableHasExpiresAtTtl(template);
   assertCognitoClientAllowlistWiring(template);
+  assertCorsPreflightsConvertBinaryPayloadsToText(template);
 
   console.log("api-stack API Gateway stage cache assertions passed.");
 }
@@ -81,7 +81,7 @@ def _get_current_api_key_id(
                 if key.get("name", "").startswith(key_prefix):
                     return key.get("id")
     except ClientError as exc:
-        logger.warning(f"Error listing usage plan keys: {exc}")
+        logger.warning("Error listing usage plan keys: %s", exc)
 
     return None
 
@@ -276,7 +276,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     new_key_value = _generate_api_key()
     new_key_name = f"{key_prefix}-{int(time.time())}"
 
-    logger.info(f"Creating new API key: {new_key_name}")
+    logger.info("Creating new API key: %s", new_key_name)
 
     try:
         # Create new API key
@@ -299,7 +299,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             rotation_date,
         )
 
-        logger.info(f"New API key created and stored: {new_key_id}")
+        logger.info("New API key created and stored: %s", new_key_id)
 
         # Handle old key cleanup
         if old_key_id and old_key_id != new_key_id:
@@ -307,16 +307,16 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 # Disable old key immediately (it will still work during grace period
                 # because it's still in the usage plan)
                 _disable_api_key(apigw_client, old_key_id)
-                logger.info(f"Disabled old API key: {old_key_id}")
+                logger.info("Disabled old API key: %s", old_key_id)
 
                 # Delete old key (after it's disabled, it can be deleted)
                 # In a production system, you might want to schedule this
                 # deletion after the grace period instead
                 _delete_api_key(apigw_client, old_key_id)
-                logger.info(f"Deleted old API key: {old_key_id}")
+                logger.info("Deleted old API key: %s", old_key_id)
             except ClientError as exc:
                 # Old key might already be deleted
-                logger.warning(f"Error cleaning up old key {old_key_id}: {exc}")
+                logger.warning("Error cleaning up old key %s: %s", old_key_id, exc)
 
         return {
             "statusCode": 200,
@@ -331,7 +331,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         }
 
     except ClientError as exc:
-        logger.exception(f"Failed to rotate API key: {exc}")
+        logger.exception("Failed to rotate API key")
         return {
             "statusCode": 500,
             "body": json.dumps(
@@ -23,11 +23,15 @@ from app.auth.authorizer_utils import (
     extract_organization_ids,
     verify_cognito_authorizer_claims,
 )
+from app.auth.jwt_validator import prime_jwks
 from app.utils.logging import configure_logging, get_logger
+from app.utils.warmup import is_warmup_event, run_warmup
 
 configure_logging()
 logger = get_logger(__name__)
 
+_WARMUP_PHASES = (("jwks", prime_jwks),)
+
 
 def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     """Authorize requests based on Cognito group membership.
@@ -45,6 +49,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     Returns:
         IAM policy document allowing or denying the request
     """
+    if is_warmup_event(event):
+        return run_warmup(_WARMUP_PHASES)
+
     method_arn = event.get("methodArn", "")
 
     # Get configuration
@@ -82,8 +89,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
 
     if matching_groups:
         logger.info(
-            f"Access granted for user {user_sub[:8]}*** "
-            f"(groups: {', '.join(matching_groups)})"
+            "Access granted for user %s*** (groups: %s)",
+            user_sub[:8],
+            ", ".join(matching_groups),
         )
         return build_iam_policy(
             "Allow",
@@ -99,8 +107,10 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         )
 
     logger.warning(
-        f"Access denied for user {user_sub[:8]}*** "
-        f"(user groups: {user_groups}, required: {allowed_groups})"
+        "Access denied for user %s*** (user groups: %s, required: %s)",
+        user_sub[:8],
+        user_groups,
+        allowed_groups,
     )
     return build_iam_policy(
         "Deny",
@@ -20,11 +20,15 @@ from app.auth.authorizer_utils import (
     build_iam_policy,
     verified_cognito_context_from_event,
 )
+from app.auth.jwt_validator import prime_jwks
 from app.utils.logging import configure_logging, get_logger
+from app.utils.warmup import is_warmup_event, run_warmup
 
 configure_logging()
 logger = get_logger(__name__)
 
+_WARMUP_PHASES = (("jwks", prime_jwks),)
+
 
 def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     """Authorize requests for any authenticated Cognito user.
@@ -42,6 +46,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     Returns:
         IAM policy document allowing or denying the request
     """
+    if is_warmup_event(event):
+        return run_warmup(_WARMUP_PHASES)
+
     method_arn = event.get("methodArn", "")
     verified = verified_cognito_context_from_event(
         event,
@@ -52,8 +59,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         return verified.policy
 
     logger.info(
-        f"Access granted for authenticated user {verified.user_sub[:8]}*** "
-        f"(groups: {', '.join(verified.groups) if verified.groups else 'none'})"
+        "Access granted for authenticated user %s*** (groups: %s)",
+        verified.user_sub[:8],
+        ", ".join(verified.groups) if verified.groups else "none",
     )
     return build_iam_policy(
         "Allow",
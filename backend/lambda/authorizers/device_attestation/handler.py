@@ -14,12 +14,19 @@ from __future__ import annotations
 import os
 
 from app.auth.authorizer_utils import build_iam_policy, get_header_case_insensitive
-from app.auth.attestation import is_attestation_enabled, verify_attestation_token
+from app.auth.attestation import (
+    is_attestation_enabled,
+    prime_attestation_jwks,
+    verify_attestation_token,
+)
 from app.utils.logging import configure_logging, get_logger
+from app.utils.warmup import is_warmup_event, run_warmup
 
 configure_logging()
 logger = get_logger(__name__)
 
+_WARMUP_PHASES = (("attestation_jwks", prime_attestation_jwks),)
+
 
 def _is_fail_closed() -> bool:
     """Return True if fail-closed mode is enabled (production default)."""
@@ -28,6 +35,8 @@ def _is_fail_closed() -> bool:
 
 def lambda_handler(event, _context):
     """Authorize requests based on device attestation token."""
+    if is_warmup_event(event):
+        return run_warmup(_WARMUP_PHASES)
 
     headers = event.get("headers") or {}
     method_arn = event.get("methodArn", "")
@@ -88,7 +97,7 @@ def lambda_handler(event, _context):
             )
 
         principal = decoded.get("sub", "device")
-        logger.info(f"Device attestation verified for principal: {principal[:8]}***")
+        logger.info("Device attestation verified for principal: %s***", principal[:8])
         return build_iam_policy(
             "Allow",
             method_arn,
@@ -99,7 +108,7 @@ def lambda_handler(event, _context):
 
     except Exception as exc:
         # SECURITY: Don't expose detailed error messages to clients
-        logger.warning(f"Device attestation failed: {type(exc).__name__}")
+        logger.warning("Device attestation failed: %s", type(exc).__name__)
         return build_iam_policy(
             "Deny",
             method_arn,
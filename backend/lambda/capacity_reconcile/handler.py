@@ -0,0 +1,39 @@
+"""Scheduled sweep that keeps service instance FULL/OPEN status in line with enrollments.
+
+Admin and enrollment writes reconcile the instances they touch; this catches
+anything else (direct SQL fixes, imports, enrollment status changes made
+elsewhere) with one set-based ``UPDATE`` over every capped instance.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.db.audit import set_audit_context
+from app.db.engine import get_engine
+from app.db.repositories import ServiceInstanceRepository
+from app.utils.logging import configure_logging, get_logger
+
+configure_logging()
+logger = get_logger(__name__)
+
+_SYSTEM_ACTOR = "system"
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """Reconcile capacity status for all capped instances (EventBridge schedule)."""
+    request_id = str(getattr(context, "aws_request_id", "") or "capacity-reconcile")
+    with Session(get_engine()) as session:
+        set_audit_context(session, user_id=_SYSTEM_ACTOR, request_id=request_id)
+        changed = ServiceInstanceRepository(session).reconcile_capacity_status()
+        session.commit()
+
+    by_status = Counter(status.value for status in changed.values())
+    logger.info(
+        "Reconciled instance capacity status",
+        extra={"changed": len(changed), "by_status": dict(by_status)},
+    )
+    return {"changed": len(changed), "by_status": dict(by_status)}
@@ -1,4 +1,4 @@
-"""Lambda: download legacy CRM SQL dump from S3 and run the selected entity importer."""
+"""Lambda: download legacy CRM SQL dump from S3 and run one or all entity importers."""
 
 from __future__ import annotations
 
@@ -13,8 +13,15 @@ from sqlalchemy.orm import Session
 from app.db.engine import get_engine
 from app.imports import entities  # noqa: F401 — register importers
 from app.imports.base import ImportStats
+from app.imports.base import LegacyImporter
+from app.imports.base import load_dump_source
+from app.imports.base import load_dump_source_for
 from app.imports.base import parse_skip_legacy_keys_csv
 from app.imports.base import resolve_importer_context
+from app.imports.base import supports_bulk_apply
+from app.imports.mysqldump_stream import DumpSource
+from app.imports.orchestrator import ImportAllResult
+from app.imports.orchestrator import run_import_all
 from app.imports.registry import get
 from app.imports.registry import known_entities
 from app.services.aws_clients import get_s3_client
@@ -25,9 +32,20 @@ configure_logging()
 logger = get_logger(__name__)
 
 _ALLOWED_EVENT_KEYS = frozenset(
-    {"entity", "s3_bucket", "s3_key", "dry_run", "skip_legacy_keys"},
+    {
+        "entity",
+        "s3_bucket",
+        "s3_key",
+        "dry_run",
+        "skip_legacy_keys",
+        "bulk_chunk_size",
+        "run_key",
+    },
 )
 
+#: ``entity`` value that runs every registered importer in dependency order.
+IMPORT_ALL_ENTITY = "all"
+
 
 def _env_bucket() -> str:
     return os.environ.get("IMPORT_DUMP_BUCKET_NAME", "").strip()
@@ -55,16 +73,29 @@ def _validate_event(event: Mapping[str, Any]) -> dict[str, Any]:
     key = event.get("s3_key")
     dry_run = event.get("dry_run")
     skip_legacy_keys = event.get("skip_legacy_keys")
+    bulk_chunk_size = event.get("bulk_chunk_size")
     if not isinstance(entity, str) or not entity.strip():
         msg = "entity must be a non-empty string"
         raise ValueError(msg)
     entity = entity.strip()
-    try:
-        get(entity)
-    except KeyError as exc:
-        known = ", ".join(known_entities()) or "(none)"
-        msg = f"Unknown entity {entity!r}; known entities: {known}"
-        raise ValueError(msg) from exc
+    run_key = event.get("run_key")
+    importer: LegacyImporter | None = None
+    if entity != IMPORT_ALL_ENTITY:
+        try:
+            importer = get(entity)
+        except KeyError as exc:
+            known = ", ".join(known_entities()) or "(none)"
+            msg = f"Unknown entity {entity!r}; known entities: {known}"
+            raise ValueError(msg) from exc
+        if run_key is not None:
+            msg = f"run_key is only valid with entity {IMPORT_ALL_ENTITY!r}"
+            raise ValueError(msg)
+    elif skip_legacy_keys:
+        msg = f"skip_legacy_keys is not supported with entity {IMPORT_ALL_ENTITY!r}"
+        raise ValueError(msg)
+    if run_key is not None and (not isinstance(run_key, str) or not run_key.strip()):
+        msg = "run_key must be a non-empty string or omitted"
+        raise ValueError(msg)
     if not isinstance(bucket, str) or not bucket.strip():
         msg = "s3_bucket must be a non-empty string"
         raise ValueError(msg)
@@ -77,6 +108,17 @@ def _validate_event(event: Mapping[str, Any]) -> dict[str, Any]:
     if skip_legacy_keys is not None and not isinstance(skip_legacy_keys, str):
         msg = "skip_legacy_keys must be a string or omitted"
         raise ValueError(msg)
+    if bulk_chunk_size is not None:
+        if (
+            isinstance(bulk_chunk_size, bool)
+            or not isinstance(bulk_chunk_size, int)
+            or bulk_chunk_size <= 0
+        ):
+            msg = "bulk_chunk_size must be a positive integer or omitted"
+            raise ValueError(msg)
+        if importer is not None and not supports_bulk_apply(importer):
+            msg = f"Entity {entity!r} does not support bulk_chunk_size"
+            raise ValueError(msg)
     expected = _env_bucket()
     if not expected:
         msg = "IMPORT_DUMP_BUCKET_NAME is not configured"
@@ -92,10 +134,40 @@ def _validate_event(event: Mapping[str, Any]) -> dict[str, Any]:
         "skip_legacy_keys": skip_legacy_keys.strip()
         if isinstance(skip_legacy_keys, str)
         else "",
+        "bulk_chunk_size": bulk_chunk_size,
+        "run_key": run_key.strip() if isinstance(run_key, str) else None,
     }
 
 
-def _download_dump(bucket: str, key: str, request_id: str) -> str:
+def _min_remaining_ms() -> int:
+    raw = os.environ.get("IMPORT_ALL_MIN_REMAINING_MS", "120000").strip()
+    try:
+        return int(raw)
+    except ValueError as exc:
+        msg = "IMPORT_ALL_MIN_REMAINING_MS must be a non-negative integer"
+        raise RuntimeError(msg) from exc
+
+
+def _default_run_key(bucket: str, key: str) -> str:
+    """``s3_key`` pinned to the object's version (or ETag when unversioned).
+
+    Re-uploading a new dump under the same key yields a new run key, so its
+    import does not resume from the previous dump's checkpoints.
+    """
+    head = get_s3_client().head_object(Bucket=bucket, Key=key)
+    version = head.get("VersionId")
+    if version and version != "null":
+        return f"{key}@{version}"
+    etag = str(head.get("ETag") or "").strip('"')
+    return f"{key}@{etag}" if etag else key
+
+
+def _download_dump(
+    bucket: str,
+    key: str,
+    request_id: str,
+    importer: LegacyImporter | list[LegacyImporter],
+) -> DumpSource:
     cap = _max_bytes()
     s3 = get_s3_client()
     head = s3.head_object(Bucket=bucket, Key=key)
@@ -113,7 +185,9 @@ def _download_dump(bucket: str, key: str, request_id: str) -> str:
     path = Path(tmp_path)
     try:
         s3.download_file(bucket, key, str(path))
-        return path.read_text(encoding="utf-8", errors="replace")
+        if isinstance(importer, list):
+            return load_dump_source_for(importer, path)
+        return load_dump_source(importer, path)
     finally:
         try:
             path.unlink(missing_ok=True)
@@ -157,15 +231,92 @@ def _stats_to_json(
     return out
 
 
+def _is_noop_resume(result: ImportAllResult) -> bool:
+    """True when every entity was already checkpointed, i.e. nothing ran."""
+    return not result.dry_run and not result.completed and not result.pending
+
+
+def _import_all_to_json(result: ImportAllResult) -> dict[str, Any]:
+    return {
+        "entity": IMPORT_ALL_ENTITY,
+        "run_key": result.run_key,
+        "dry_run": result.dry_run,
+        "finished": result.finished,
+        "completed": [
+            _stats_to_json(stats, preview_allowed=False, include_preview=False)
+            for stats in result.completed
+        ],
+        "already_completed": result.already_completed,
+        "pending": result.pending,
+        "noop_resume": _is_noop_resume(result),
+    }
+
+
+def _import_all(payload: Mapping[str, Any], context: Any) -> dict[str, Any]:
+    importers = [get(entity) for entity in known_entities()]
+    req_id = getattr(context, "aws_request_id", None) or "local"
+    run_key = payload["run_key"] or _default_run_key(
+        payload["s3_bucket"], payload["s3_key"]
+    )
+    source = _download_dump(
+        payload["s3_bucket"],
+        payload["s3_key"],
+        str(req_id),
+        importers,
+    )
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    min_remaining = _min_remaining_ms()
+
+    def _should_continue() -> bool:
+        return remaining is None or remaining() > min_remaining
+
+    engine = get_engine(use_cache=False)
+    with Session(engine) as session:
+        result = run_import_all(
+            session,
+            importers,
+            source,
+            run_key=run_key,
+            dry_run=payload["dry_run"],
+            bulk_chunk_size=payload["bulk_chunk_size"],
+            should_continue=_should_continue,
+        )
+    if _is_noop_resume(result):
+        logger.warning(
+            "Import-all run_key=%s was already complete; nothing was imported. "
+            "Pass a new run_key to import this dump again.",
+            result.run_key,
+        )
+    logger.info(
+        "Import-all invocation complete run_key=%s completed=%s "
+        "already_completed=%s pending=%s dry_run=%s",
+        result.run_key,
+        ",".join(stats.entity for stats in result.completed),
+        ",".join(result.already_completed),
+        ",".join(result.pending),
+        result.dry_run,
+    )
+    return _import_all_to_json(result)
+
+
 def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
-    """Direct invoke: ``{entity, s3_bucket, s3_key, dry_run[, skip_legacy_keys]}``."""
+    """Direct invoke: ``{entity, s3_bucket, s3_key, dry_run[, skip_legacy_keys]}``.
+
+    Optional ``bulk_chunk_size`` switches supported importers to bulk apply mode.
+    ``entity: "all"`` runs every importer in dependency order (optional ``run_key``
+    names the checkpointed run; defaults to ``s3_key`` plus the object's version
+    or ETag, so a new dump under the same key starts a new run).
+    """
     payload = _validate_event(event)
+    if payload["entity"] == IMPORT_ALL_ENTITY:
+        return _import_all(payload, context)
     importer = get(payload["entity"])
     req_id = getattr(context, "aws_request_id", None) or "local"
     sql_text = _download_dump(
         payload["s3_bucket"],
         payload["s3_key"],
         str(req_id),
+        importer,
     )
     rows = importer.parse(sql_text)
 
@@ -180,6 +331,7 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
             dry_run=payload["dry_run"],
             skip_legacy_keys=skip_keys,
             source_sql_text=sql_text,
+            bulk_chunk_size=payload["bulk_chunk_size"],
         )
         stats = importer.apply(session, rows, ctx, dry_run=payload["dry_run"])
 
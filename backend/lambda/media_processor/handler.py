@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import contextvars
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
@@ -60,11 +63,19 @@ _EVENT_TYPE = "media_request.submitted"
 _SYSTEM_ACTOR = "system"
 _DEFAULT_MEDIA_NAME = "Free Guide"
 _MAX_RESOURCE_KEY_LENGTH = 64
+_DEFAULT_MAX_PARALLEL_GROUPS = 4
 
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
-    """Process media request messages delivered through SQS."""
+    """Process media request messages delivered through SQS.
+
+    Records are grouped by email so one contact is never written concurrently;
+    repeated requests for the same resource within a group are coalesced.
+    Asset, tag and share-link lookups are preloaded once per batch, and the
+    groups run on a small thread pool. Failures stay per record.
+    """
     batch = SqsBatchProcessor(logger=logger)
+    pending: list[tuple[dict[str, Any], dict[str, Any]]] = []
 
     for record in event.get("Records", []):
         with batch.record(record, failure_message="Failed to process media message"):
@@ -76,9 +87,16 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 )
                 batch.skipped += 1
                 continue
+            pending.append((record, message))
 
-            was_processed = _process_message(message)
-            if was_processed:
+    groups, coalesced = _group_media_messages(pending)
+    batch.skipped += coalesced
+    cache = _preload_media_batch([message for _record, message in pending])
+    for record, outcome in _run_media_groups(groups, cache=cache):
+        with batch.record(record, failure_message="Failed to process media message"):
+            if isinstance(outcome, Exception):
+                raise outcome
+            if outcome:
                 batch.processed += 1
             else:
                 batch.skipped += 1
@@ -90,12 +108,138 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "processed": batch.processed,
             "skipped": batch.skipped,
             "failed": len(batch.failures),
+            "coalesced": coalesced,
         },
     )
     return result
 
 
-def _process_message(message: dict[str, Any]) -> bool:
+@dataclass
+class _MediaBatchCache:
+    """Per-batch lookups shared by every record in one SQS invocation."""
+
+    resources: dict[str | None, tuple[str, UUID, str, str]] = field(
+        default_factory=dict
+    )
+    errors: dict[str | None, Exception] = field(default_factory=dict)
+    tag_ids: dict[str, UUID] = field(default_factory=dict)
+    download_urls: dict[UUID, str | None] = field(default_factory=dict)
+
+    def resource_for(self, message: dict[str, Any]) -> tuple[str, UUID, str, str]:
+        requested = _normalize_resource_key(message.get("resource_key"))
+        if requested in self.errors:
+            raise self.errors[requested]
+        return self.resources[requested]
+
+
+def _group_media_messages(
+    pending: list[tuple[dict[str, Any], dict[str, Any]]],
+) -> tuple[list[list[tuple[dict[str, Any], dict[str, Any]]]], int]:
+    """Group messages by email and drop repeats of the same resource request."""
+    groups: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+    seen: set[tuple[str, str | None]] = set()
+    coalesced = 0
+    for index, (record, message) in enumerate(pending):
+        try:
+            email = _required_email(message.get("email"))
+        except ValueError:
+            groups[f"invalid:{index}"] = [(record, message)]
+            continue
+        request_key = (email, _normalize_resource_key(message.get("resource_key")))
+        if request_key in seen:
+            coalesced += 1
+            logger.info(
+                "Coalesced duplicate media request in batch",
+                extra={"lead_email": mask_email(email), "resource_key": request_key[1]},
+            )
+            continue
+        seen.add(request_key)
+        groups.setdefault(email, []).append((record, message))
+    return list(groups.values()), coalesced
+
+
+def _preload_media_batch(messages: list[dict[str, Any]]) -> _MediaBatchCache | None:
+    """Resolve assets, tags and share links once for every resource in the batch.
+
+    Returns ``None`` when preloading fails so records fall back to their own
+    lookups (and fail individually if the database is unavailable).
+    """
+    if not messages:
+        return None
+    cache = _MediaBatchCache()
+    requested_keys = {
+        _normalize_resource_key(message.get("resource_key")) for message in messages
+    }
+    try:
+        with Session(get_engine()) as session:
+            for requested in requested_keys:
+                try:
+                    resource = _resolve_media_resource(
+                        session=session, message={"resource_key": requested}
+                    )
+                except RuntimeError as exc:
+                    cache.errors[requested] = exc
+                    continue
+                cache.resources[requested] = resource
+                _resource_key, asset_id, tag_name, _media_name = resource
+                if tag_name not in cache.tag_ids:
+                    cache.tag_ids[tag_name] = _get_or_create_tag_id(
+                        session=session, tag_name=tag_name
+                    )
+                if asset_id not in cache.download_urls:
+                    cache.download_urls[asset_id] = _ensure_share_link_url_for_asset(
+                        session=session, asset_id=asset_id
+                    )
+            session.commit()
+    except Exception:
+        logger.exception("Failed to preload media batch; using per-record lookups")
+        return None
+    return cache
+
+
+def _run_media_groups(
+    groups: list[list[tuple[dict[str, Any], dict[str, Any]]]],
+    *,
+    cache: _MediaBatchCache | None,
+) -> list[tuple[dict[str, Any], bool | Exception]]:
+    """Process groups concurrently (bounded); records within a group in order."""
+    if not groups:
+        return []
+    workers = min(_max_parallel_groups(), len(groups))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, _process_group, group, cache
+            )
+            for group in groups
+        ]
+    return [outcome for future in futures for outcome in future.result()]
+
+
+def _process_group(
+    group: list[tuple[dict[str, Any], dict[str, Any]]],
+    cache: _MediaBatchCache | None,
+) -> list[tuple[dict[str, Any], bool | Exception]]:
+    outcomes: list[tuple[dict[str, Any], bool | Exception]] = []
+    for record, message in group:
+        try:
+            outcomes.append((record, _process_message(message, cache=cache)))
+        except Exception as exc:
+            outcomes.append((record, exc))
+    return outcomes
+
+
+def _max_parallel_groups() -> int:
+    raw = os.getenv("MEDIA_PROCESSOR_MAX_PARALLEL", "").strip()
+    try:
+        return max(1, int(raw)) if raw else _DEFAULT_MAX_PARALLEL_GROUPS
+    except ValueError:
+        return _DEFAULT_MAX_PARALLEL_GROUPS
+
+
+def _process_message(
+    message: dict[str, Any], *, cache: _MediaBatchCache | None = None
+) -> bool:
     first_name = _required_text(message.get("first_name"), field="first_name")
     email = _required_email(message.get("email"))
     submitted_at = _normalize_submitted_at(message.get("submitted_at"))
@@ -104,8 +248,10 @@ def _process_message(message: dict[str, Any]) -> bool:
     locale = _normalize_email_locale(message.get("locale"))
 
     with Session(get_engine()) as session:
-        resource_key, asset_id, tag_name, media_name = _resolve_media_resource(
-            session=session, message=message
+        resource_key, asset_id, tag_name, media_name = (
+            cache.resource_for(message)
+            if cache is not None
+            else _resolve_media_resource(session=session, message=message)
         )
         contact_repo = ContactRepository(session)
         sales_lead_repo = SalesLeadRepository(session)
@@ -124,13 +270,12 @@ def _process_message(message: dict[str, Any]) -> bool:
             asset_id,
         )
         if existing_lead is not None:
-            _ensure_contact_tag(
+            download_url = _tag_contact_and_get_download_url(
                 session=session,
                 contact_id=contact.id,
                 tag_name=tag_name,
-            )
-            download_url = _ensure_share_link_url_for_asset(
-                session=session, asset_id=asset_id
+                asset_id=asset_id,
+                cache=cache,
             )
             _send_user_download_email(
                 first_name=first_name,
@@ -202,13 +347,12 @@ def _process_message(message: dict[str, Any]) -> bool:
             created_by=_SYSTEM_ACTOR,
         )
 
-        _ensure_contact_tag(
+        download_url = _tag_contact_and_get_download_url(
             session=session,
             contact_id=contact.id,
             tag_name=tag_name,
-        )
-        download_url = _ensure_share_link_url_for_asset(
-            session=session, asset_id=asset_id
+            asset_id=asset_id,
+            cache=cache,
         )
         _send_user_download_email(
             first_name=first_name,
@@ -451,7 +595,32 @@ def _create_sales_lead_event(
     session.flush()
 
 
+def _tag_contact_and_get_download_url(
+    *,
+    session: Session,
+    contact_id: UUID,
+    tag_name: str,
+    asset_id: UUID,
+    cache: _MediaBatchCache | None,
+) -> str | None:
+    """Link the resource tag and return the share URL, using batch lookups."""
+    if cache is None or tag_name not in cache.tag_ids:
+        _ensure_contact_tag(session=session, contact_id=contact_id, tag_name=tag_name)
+    else:
+        _ensure_contact_tag_link(
+            session=session, contact_id=contact_id, tag_id=cache.tag_ids[tag_name]
+        )
+    if cache is not None and asset_id in cache.download_urls:
+        return cache.download_urls[asset_id]
+    return _ensure_share_link_url_for_asset(session=session, asset_id=asset_id)
+
+
 def _ensure_contact_tag(*, session: Session, contact_id: UUID, tag_name: str) -> None:
+    tag_id = _get_or_create_tag_id(session=session, tag_name=tag_name)
+    _ensure_contact_tag_link(session=session, contact_id=contact_id, tag_id=tag_id)
+
+
+def _get_or_create_tag_id(*, session: Session, tag_name: str) -> UUID:
     normalized_tag_name = _required_text(tag_name, field="tag_name")
 
     tag = session.execute(
@@ -465,12 +634,17 @@ def _ensure_contact_tag(*, session: Session, contact_id: UUID, tag_name: str) ->
         session.add(tag)
         session.flush()
         session.refresh(tag)
+    return tag.id
 
+
+def _ensure_contact_tag_link(
+    *, session: Session, contact_id: UUID, tag_id: UUID
+) -> None:
     existing_link = session.execute(
         select(ContactTag).where(
             and_(
                 ContactTag.contact_id == contact_id,
-                ContactTag.tag_id == tag.id,
+                ContactTag.tag_id == tag_id,
             )
         )
     ).scalar_one_or_none()
@@ -478,7 +652,7 @@ def _ensure_contact_tag(*, session: Session, contact_id: UUID, tag_name: str) ->
         session.add(
             ContactTag(
                 contact_id=contact_id,
-                tag_id=tag.id,
+                tag_id=tag_id,
             )
         )
         session.flush()
@@ -103,7 +103,7 @@ def _sync_active_countries(database_url: str) -> None:
         logger.info("ACTIVE_COUNTRY_CODES is empty, skipping country sync")
         return
 
-    logger.info(f"Syncing active countries to: {codes}")
+    logger.info("Syncing active countries to: %s", codes)
 
     with _psycopg_connect(database_url) as connection:
         with connection.cursor() as cursor:
@@ -135,7 +135,7 @@ def _sync_active_countries(database_url: str) -> None:
             rows = cursor.fetchall()
             for code, name, active in rows:
                 status = "ACTIVE" if active else "inactive"
-                logger.info(f"  Country {code} ({name}): {status}")
+                logger.info("  Country %s (%s): %s", code, name, status)
 
         connection.commit()
 
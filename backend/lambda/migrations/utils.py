@@ -36,7 +36,7 @@ def _run_with_retry(func: Any, *args: Any) -> None:
             raise
         raise RuntimeError(safe_message) from exc
 
-    logger.info(f"Operation {func_name} completed successfully")
+    logger.info("Operation %s completed successfully", func_name)
 
 
 def _sanitize_error_message(msg: str) -> str:
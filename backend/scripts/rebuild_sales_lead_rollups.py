@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Recompute every daily sales lead analytics rollup from ``sales_leads``.
+
+Migration ``0075_sales_lead_daily_rollups`` already marks every existing lead
+creation day dirty, so the admin analytics endpoint backfills on its first load.
+Use this script instead to backfill ahead of time, or to repair the rollups after
+changes made with the row triggers disabled. Work is committed per 31-day chunk.
+
+Local development only: refuses to connect unless ``ATTESTATION_FAIL_CLOSED``
+is set to a falsey value (same gate as other local scripts) and you pass
+``--execute``. Without ``--execute``, prints usage and exits 0.
+
+Usage::
+
+    python backend/scripts/rebuild_sales_lead_rollups.py
+    ATTESTATION_FAIL_CLOSED=false python backend/scripts/rebuild_sales_lead_rollups.py --execute
+
+Requires ``DATABASE_URL`` (or the same env vars as ``app.db.connection``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+# Import after path setup
+_BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, _BACKEND_ROOT)
+
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.engine import get_engine  # noqa: E402
+from app.services.sales_lead_analytics import (  # noqa: E402
+    rebuild_sales_lead_rollups,
+)
+
+
+def _fail_closed_enabled() -> bool:
+    raw = os.getenv("ATTESTATION_FAIL_CLOSED", "true").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Connect to Aurora and rebuild the rollups (requires local dev gate).",
+    )
+    args = parser.parse_args()
+
+    if not args.execute:
+        print(
+            "Dry run: no database connection.\n"
+            "Pass --execute with ATTESTATION_FAIL_CLOSED=false (local dev only) "
+            "to rebuild the sales lead rollups.\n"
+            "Example:\n"
+            "  ATTESTATION_FAIL_CLOSED=false python backend/scripts/rebuild_sales_lead_rollups.py --execute",
+            file=sys.stderr,
+        )
+        return
+
+    if _fail_closed_enabled():
+        print(
+            "Refusing to connect while ATTESTATION_FAIL_CLOSED is enabled. "
+            "Set ATTESTATION_FAIL_CLOSED=false for trusted local development only.",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+
+    with Session(get_engine(use_cache=False)) as session:
+        days = rebuild_sales_lead_rollups(session)
+    print(f"Rebuilt sales lead rollups for {days} day(s).", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
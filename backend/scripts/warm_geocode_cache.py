@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Fill ``geocode_cache`` for locations created by the legacy ``venues`` import.
+
+Geocodes each imported venue address (with the same country-code filter as
+``POST /v1/admin/locations/geocode``) at most once per ``--interval`` seconds,
+per the Nominatim usage policy. Addresses that already have a fresh cache row
+are skipped without a request, so the script can be re-run after each import.
+
+Local development only: refuses to connect unless ``ATTESTATION_FAIL_CLOSED``
+is set to a falsey value (same gate as other local scripts) and you pass
+``--execute``. Without ``--execute``, prints usage and exits 0.
+
+Usage::
+
+    python backend/scripts/warm_geocode_cache.py
+    ATTESTATION_FAIL_CLOSED=false python backend/scripts/warm_geocode_cache.py --execute
+
+Requires ``DATABASE_URL`` (or the same env vars as ``app.db.connection``) plus
+``AWS_PROXY_FUNCTION_ARN``, ``NOMINATIM_USER_AGENT`` and ``NOMINATIM_REFERER``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from dataclasses import asdict
+
+# Import after path setup
+_BACKEND_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.insert(0, _BACKEND_ROOT)
+
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.engine import get_engine  # noqa: E402
+from app.services.geocode_cache import (  # noqa: E402
+    NOMINATIM_MIN_INTERVAL_SECONDS,
+    legacy_venue_addresses,
+    warm_geocode_cache,
+)
+
+
+def _fail_closed_enabled() -> bool:
+    raw = os.getenv("ATTESTATION_FAIL_CLOSED", "true").strip().lower()
+    return raw in ("1", "true", "yes", "on")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Connect to Aurora and geocode venues (requires local dev gate).",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=NOMINATIM_MIN_INTERVAL_SECONDS,
+        help="Minimum seconds between Nominatim requests (never below 1).",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only consider the first N imported venue addresses.",
+    )
+    args = parser.parse_args()
+
+    if not args.execute:
+        print(
+            "Dry run: no database connection.\n"
+            "Pass --execute with ATTESTATION_FAIL_CLOSED=false (local dev only) "
+            "to geocode legacy venue addresses into geocode_cache.\n"
+            "Example:\n"
+            "  ATTESTATION_FAIL_CLOSED=false python backend/scripts/warm_geocode_cache.py --execute",
+            file=sys.stderr,
+        )
+        return
+
+    if _fail_closed_enabled():
+        print(
+            "Refusing to connect while ATTESTATION_FAIL_CLOSED is enabled. "
+            "Set ATTESTATION_FAIL_CLOSED=false for trusted local development only.",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+
+    with Session(get_engine(use_cache=False)) as session:
+        addresses = legacy_venue_addresses(session)
+        if args.limit is not None:
+            addresses = addresses[: args.limit]
+        stats = warm_geocode_cache(
+            session,
+            addresses,
+            min_interval_seconds=max(args.interval, NOMINATIM_MIN_INTERVAL_SECONDS),
+        )
+    print(
+        f"Geocode cache warm-up over {len(addresses)} address(es): {asdict(stats)}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
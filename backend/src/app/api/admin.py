@@ -49,15 +49,23 @@ from app.api.public_forms import handle_public_forms_request
 from app.api.public_polls import handle_public_polls_request
 from app.api.public_reservation_payments import handle_public_reservation_payment_intent
 from app.api.public_reservations import _handle_public_reservation
+from app.auth.jwt_validator import prime_jwks
+from app.db.connection import get_database_url
+from app.db.engine import warm_engine
 from app.exceptions import AppError, ValidationError
+from app.services.cloudfront_signing import prime_signer
+from app.services.pdf_render_engine import preload as preload_pdf_assets
 from app.utils import json_response
 from app.utils.logging import (
     clear_request_context,
     configure_logging,
+    flush_logs,
     get_logger,
+    log_query_summary,
     set_request_context,
 )
 from app.utils.responses import api_gateway_http_method, validate_content_type
+from app.utils.warmup import import_modules, is_warmup_event, run_warmup
 
 configure_logging()
 logger = get_logger(__name__)
@@ -289,8 +297,32 @@ _ROUTES: tuple[
 )
 
 
+# Route modules are imported above at init; these load on first use.
+_WARMUP_PHASES = (
+    (
+        "imports",
+        import_modules(
+            "app.api.admin_billing_payment_create",
+            "app.api.admin_billing_payment_update",
+            "phonenumbers",
+            "pycountry",
+        ),
+    ),
+    ("database_url", get_database_url),
+    ("database_connect", warm_engine),
+    ("jwks", prime_jwks),
+    ("cloudfront_signer", prime_signer),
+    ("pdf_assets", preload_pdf_assets),
+)
+
+
 def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
     """Handle requests routed to the admin Lambda."""
+    if is_warmup_event(event):
+        try:
+            return run_warmup(_WARMUP_PHASES)
+        finally:
+            flush_logs()
     request_id = event.get("requestContext", {}).get("requestId", "")
     set_request_context(req_id=request_id)
     try:
@@ -301,11 +333,13 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
             if _requires_json_content_type(path, method):
                 validate_content_type(event)
         except ValidationError as exc:
-            logger.warning(f"Content-Type validation failed: {exc.message}")
+            logger.warning("Content-Type validation failed: %s", exc.message)
             return json_response(exc.status_code, exc.to_dict(), event=event)
 
         logger.info(
-            f"Admin request: {method} {path}",
+            "Admin request: %s %s",
+            method,
+            path,
             extra={
                 "path": path,
                 "method": method,
@@ -318,7 +352,13 @@ def lambda_handler(event: Mapping[str, Any], context: Any) -> dict[str, Any]:
 
         return json_response(404, {"error": "Not found"}, event=event)
     finally:
+        log_query_summary(
+            logger,
+            method=api_gateway_http_method(event),
+            path=event.get("path", ""),
+        )
         clear_request_context()
+        flush_logs()
 
 
 def _safe_handler(
@@ -329,10 +369,10 @@ def _safe_handler(
     try:
         return handler()
     except AppError as exc:
-        logger.warning(f"Application error: {exc.message}")
+        logger.warning("Application error: %s", exc.message)
         return json_response(exc.status_code, exc.to_dict(), event=event)
     except ValueError as exc:
-        logger.warning(f"Value error: {exc}")
+        logger.warning("Value error: %s", exc)
         return json_response(400, {"error": str(exc)}, event=event)
     except Exception:  # pragma: no cover
         logger.exception("Unexpected error in handler")
@@ -32,6 +32,12 @@ from app.db.engine import get_engine
 from app.db.models import CompletionCertificate, Contact, Service, ServiceInstance
 from app.db.models.enums import CompletionCertificateStatus
 from app.exceptions import NotFoundError, ValidationError
+from app.services.completion_certificate_batch import (
+    MAX_BATCH_CONTACTS,
+    build_certificate_zip,
+    issue_certificate_batch,
+    upload_certificate_zip,
+)
 from app.services.completion_certificate_common import (
     create_issued_certificate,
     load_certificate_for_pdf,
@@ -78,6 +84,11 @@ def handle_admin_completion_certificates_request(
             return _preview_certificate(event)
         return json_response(405, {"error": "Method not allowed"}, event=event)
 
+    if len(parts) == 3 and parts[2] == "batch":
+        if method == "POST":
+            return _issue_certificate_batch(event, actor_sub=identity.user_sub)
+        return json_response(405, {"error": "Method not allowed"}, event=event)
+
     if len(parts) == 2:
         if method == "GET":
             return _list_certificates(event)
@@ -106,8 +117,8 @@ def handle_admin_completion_certificates_request(
     return json_response(404, {"error": "Not found"}, event=event)
 
 
-def _parse_issue_payload(body: Mapping[str, Any]) -> dict[str, Any]:
-    contact_id = _parse_required_uuid(body.get("contact_id"), field="contact_id")
+def _parse_issue_terms(body: Mapping[str, Any]) -> dict[str, Any]:
+    """Fields shared by single and batch issue requests (everything but contacts)."""
     service_id = _parse_required_uuid(body.get("service_id"), field="service_id")
     instance_id = _parse_required_uuid(body.get("instance_id"), field="instance_id")
     participation_raw = body.get("participation_date")
@@ -135,7 +146,6 @@ def _parse_issue_payload(body: Mapping[str, Any]) -> dict[str, Any]:
         field="partner_organization_id",
     )
     return {
-        "contact_id": contact_id,
         "service_id": service_id,
         "instance_id": instance_id,
         "participation_date": participation_date,
@@ -144,6 +154,38 @@ def _parse_issue_payload(body: Mapping[str, Any]) -> dict[str, Any]:
     }
 
 
+def _parse_issue_payload(body: Mapping[str, Any]) -> dict[str, Any]:
+    contact_id = _parse_required_uuid(body.get("contact_id"), field="contact_id")
+    return {"contact_id": contact_id, **_parse_issue_terms(body)}
+
+
+def _parse_batch_issue_payload(body: Mapping[str, Any]) -> dict[str, Any]:
+    raw_contact_ids = body.get("contact_ids")
+    if not isinstance(raw_contact_ids, list) or not raw_contact_ids:
+        raise ValidationError(
+            "contact_ids must be a non-empty list", field="contact_ids"
+        )
+    contact_ids = list(
+        dict.fromkeys(
+            _parse_required_uuid(value, field=f"contact_ids[{index}]")
+            for index, value in enumerate(raw_contact_ids)
+        )
+    )
+    if len(contact_ids) > MAX_BATCH_CONTACTS:
+        raise ValidationError(
+            f"contact_ids accepts at most {MAX_BATCH_CONTACTS} contacts",
+            field="contact_ids",
+        )
+    include_zip = body.get("include_zip", False)
+    if not isinstance(include_zip, bool):
+        raise ValidationError("include_zip must be a boolean", field="include_zip")
+    return {
+        "contact_ids": contact_ids,
+        "include_zip": include_zip,
+        **_parse_issue_terms(body),
+    }
+
+
 def _preview_certificate(event: Mapping[str, Any]) -> dict[str, Any]:
     body = parse_body(event)
     payload = _parse_issue_payload(body)
@@ -197,6 +239,87 @@ def _issue_certificate(event: Mapping[str, Any], *, actor_sub: str) -> dict[str,
     return json_response(201, {"certificate": serialized}, event=event)
 
 
+def _issue_certificate_batch(
+    event: Mapping[str, Any], *, actor_sub: str
+) -> dict[str, Any]:
+    body = parse_body(event)
+    payload = _parse_batch_issue_payload(body)
+    request_id = event.get("requestContext", {}).get("requestId")
+    with Session(get_engine()) as session:
+        set_audit_context(session, user_id=actor_sub, request_id=request_id)
+        result = issue_certificate_batch(
+            session,
+            contact_ids=payload["contact_ids"],
+            service_id=payload["service_id"],
+            instance_id=payload["instance_id"],
+            participation_date=payload["participation_date"],
+            program_title_override=payload["program_title_override"],
+            partner_organization_id=payload["partner_organization_id"],
+            actor_sub=actor_sub,
+        )
+        session.commit()
+        issued = [o.certificate for o in result.outcomes if o.certificate is not None]
+        if issued:
+            # Reload the committed rows (and their contacts) in two queries
+            # instead of one lazy refresh per certificate while serializing.
+            session.execute(
+                select(CompletionCertificate).where(
+                    CompletionCertificate.id.in_([cert.id for cert in issued])
+                )
+            ).all()
+            session.execute(
+                select(Contact).where(
+                    Contact.id.in_([cert.contact_id for cert in issued])
+                )
+            ).all()
+        results: list[dict[str, Any]] = []
+        for outcome in result.outcomes:
+            if outcome.certificate is None:
+                results.append(
+                    {
+                        "contact_id": str(outcome.contact_id),
+                        "status": "failed",
+                        "error": outcome.error,
+                        "field": outcome.field,
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "contact_id": str(outcome.contact_id),
+                        "status": "issued",
+                        "certificate": serialize_completion_certificate(
+                            session, outcome.certificate
+                        ),
+                    }
+                )
+        zip_entries = [(cert, result.pdfs[cert.contact_id]) for cert in issued]
+
+    zip_download: dict[str, Any] | None = None
+    if payload["include_zip"] and zip_entries:
+        zip_key = upload_certificate_zip(build_certificate_zip(zip_entries))
+        download = generate_download_url(
+            s3_key=zip_key,
+            cache_bust_key=str(time.time_ns()),
+            expires_at=datetime.now(UTC) + _CERTIFICATE_DOWNLOAD_LINK_EXPIRY,
+        )
+        zip_download = {
+            "downloadUrl": download["download_url"],
+            "expiresAt": download["expires_at"],
+        }
+    return json_response(
+        200,
+        {
+            "results": results,
+            "issued_count": len(zip_entries),
+            "failed_count": len(results) - len(zip_entries),
+            "zip": zip_download,
+        },
+        headers=signed_link_no_cache_headers() if zip_download else None,
+        event=event,
+    )
+
+
 def _list_certificates(event: Mapping[str, Any]) -> dict[str, Any]:
     limit = parse_limit(event, default=_DEFAULT_LIMIT)
     cursor_ts, cursor_id = parse_created_cursor(query_param(event, "cursor"))
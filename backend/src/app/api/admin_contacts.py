@@ -35,6 +35,7 @@ from app.api.admin_entities_helpers import (
 from app.api.admin_entities_serializers import (
     serialize_contact_picker_row,
     serialize_contact_summary,
+    serialize_contact_summary_row,
 )
 from app.api.admin_request import (
     encode_cursor,
@@ -217,7 +218,7 @@ def _list_contacts(event: Mapping[str, Any]) -> dict[str, Any]:
 
     with Session(get_engine()) as session:
         repository = ContactRepository(session)
-        rows = repository.list_for_admin(
+        rows = repository.list_summaries_for_admin(
             limit=limit + 1,
             cursor=cursor,
             query=query,
@@ -227,28 +228,21 @@ def _list_contacts(event: Mapping[str, Any]) -> dict[str, Any]:
         has_more = len(rows) > limit
         page_rows = rows[:limit]
         next_cursor = (
-            encode_cursor(page_rows[-1].id) if has_more and page_rows else None
+            encode_cursor(page_rows[-1]["id"]) if has_more and page_rows else None
         )
-        total_count = repository.count_for_admin(
-            query=query, active=active, contact_type=contact_type
-        )
-        note_counts = repository.count_standalone_notes_for_contacts(
-            [r.id for r in page_rows]
-        )
-        cert_contact_ids = contact_ids_with_issued_certificates(
-            session, [r.id for r in page_rows]
+        # Every projection row carries the filtered total; an empty page (cursor
+        # past the end) still needs the separate count.
+        total_count = (
+            rows[0]["total_count"]
+            if rows
+            else repository.count_for_admin(
+                query=query, active=active, contact_type=contact_type
+            )
         )
         return json_response(
             200,
             {
-                "items": [
-                    serialize_contact_summary(
-                        r,
-                        standalone_note_count=note_counts.get(r.id, 0),
-                        has_completion_certificate=r.id in cert_contact_ids,
-                    )
-                    for r in page_rows
-                ],
+                "items": [serialize_contact_summary_row(r) for r in page_rows],
                 "next_cursor": next_cursor,
                 "total_count": total_count,
             },
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from app.api.admin_entities_helpers import serialize_tag_ref
@@ -14,6 +15,7 @@ from app.db.models import (
     OrganizationMember,
 )
 from app.utils.logging import get_logger
+from app.utils.phone import format_phone_e164
 
 logger = get_logger(__name__)
 
@@ -145,6 +147,67 @@ def serialize_contact_summary(
     }
 
 
+def serialize_contact_summary_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    """``serialize_contact_summary`` shape from a ``list_summaries_for_admin`` row."""
+    tags = sorted(row["tags"], key=lambda t: t["name"].lower())
+    return {
+        "id": str(row["id"]),
+        "email": row["email"],
+        "instagram_handle": row["instagram_handle"],
+        "first_name": row["first_name"],
+        "last_name": row["last_name"],
+        "phone_region": row["phone_region"],
+        "phone_national_number": row["phone_national_number"],
+        "phone_e164": format_phone_e164(
+            row["phone_region"], row["phone_national_number"]
+        ),
+        "contact_type": row["contact_type"].value,
+        "relationship_type": row["relationship_type"].value,
+        "date_of_birth": row["date_of_birth"].isoformat()
+        if row["date_of_birth"]
+        else None,
+        "location_id": str(row["location_id"]) if row["location_id"] else None,
+        "location_summary": row["location_summary"],
+        "family_location_summary": row["family_location_summary"],
+        "organization_location_summary": row["organization_location_summary"],
+        "source": row["source"].value,
+        "source_detail": row["source_detail"],
+        "referral_contact_id": _referral_contact_id_from_metadata(
+            row["source_metadata"]
+        ),
+        "mailchimp_status": row["mailchimp_status"].value,
+        "active": row["archived_at"] is None,
+        "archived_at": row["archived_at"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "tag_ids": [t["id"] for t in tags],
+        "tags": tags,
+        "family_ids": sorted(set(row["family_ids"])),
+        "organization_ids": sorted(set(row["organization_ids"])),
+        "standalone_note_count": int(row["standalone_note_count"]),
+        "has_completion_certificate": bool(row["has_completion_certificate"]),
+    }
+
+
+def _member_summary_row(member: Mapping[str, Any]) -> dict[str, Any]:
+    parts = [member["first_name"] or "", member["last_name"] or ""]
+    label = " ".join(p for p in parts if p).strip() or (member["email"] or "")
+    return {
+        "id": member["id"],
+        "contact_id": member["contact_id"],
+        "contact_label": label,
+        "role": member["role"],
+        "is_primary_contact": member["is_primary_contact"],
+    }
+
+
+def _member_summary_rows(members: list[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(
+        (_member_summary_row(m) for m in members),
+        key=lambda m: m["contact_label"].lower(),
+    )
+
+
 def serialize_family_member_row(member: FamilyMember) -> dict[str, Any]:
     c = member.contact
     label = ""
@@ -187,6 +250,25 @@ def serialize_family_summary(family: Family) -> dict[str, Any]:
     }
 
 
+def serialize_family_summary_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    """``serialize_family_summary`` shape from a ``list_summaries_for_admin`` row."""
+    tags = sorted(row["tags"], key=lambda t: t["name"].lower())
+    return {
+        "id": str(row["id"]),
+        "family_name": row["family_name"],
+        "relationship_type": row["relationship_type"].value,
+        "location_id": str(row["location_id"]) if row["location_id"] else None,
+        "location_summary": row["location_summary"],
+        "active": row["archived_at"] is None,
+        "archived_at": row["archived_at"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "tag_ids": [t["id"] for t in tags],
+        "tags": tags,
+        "members": _member_summary_rows(row["members"]),
+    }
+
+
 def serialize_organization_member_row(member: OrganizationMember) -> dict[str, Any]:
     c = member.contact
     label = ""
@@ -231,3 +313,26 @@ def serialize_organization_summary(org: Organization) -> dict[str, Any]:
         "tags": tags,
         "members": members,
     }
+
+
+def serialize_organization_summary_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    """``serialize_organization_summary`` shape from a projection row."""
+    tags = sorted(row["tags"], key=lambda t: t["name"].lower())
+    return {
+        "id": str(row["id"]),
+        "name": row["name"],
+        "organization_type": row["organization_type"].value,
+        "relationship_type": row["relationship_type"].value,
+        "partner_key": row["partner_key"],
+        "legal_name": row["legal_name"],
+        "website": row["website"],
+        "location_id": str(row["location_id"]) if row["location_id"] else None,
+        "location_summary": row["location_summary"],
+        "active": row["archived_at"] is None,
+        "archived_at": row["archived_at"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "tag_ids": [t["id"] for t in tags],
+        "tags": tags,
+        "members": _member_summary_rows(row["members"]),
+    }
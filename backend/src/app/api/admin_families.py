@@ -22,7 +22,10 @@ from app.api.admin_entities_helpers import (
     parse_optional_bool_body,
     replace_family_tags,
 )
-from app.api.admin_entities_serializers import serialize_family_summary
+from app.api.admin_entities_serializers import (
+    serialize_family_summary,
+    serialize_family_summary_row,
+)
 from app.api.admin_request import (
     encode_cursor,
     parse_body,
@@ -131,7 +134,7 @@ def _list_families(event: Mapping[str, Any]) -> dict[str, Any]:
 
     with Session(get_engine()) as session:
         repository = FamilyRepository(session)
-        rows = repository.list_for_admin(
+        rows = repository.list_summaries_for_admin(
             limit=limit + 1,
             cursor=cursor,
             query=query,
@@ -140,13 +143,17 @@ def _list_families(event: Mapping[str, Any]) -> dict[str, Any]:
         has_more = len(rows) > limit
         page_rows = rows[:limit]
         next_cursor = (
-            encode_cursor(page_rows[-1].id) if has_more and page_rows else None
+            encode_cursor(page_rows[-1]["id"]) if has_more and page_rows else None
+        )
+        total_count = (
+            rows[0]["total_count"]
+            if rows
+            else repository.count_for_admin(query=query, active=active)
         )
-        total_count = repository.count_for_admin(query=query, active=active)
         return json_response(
             200,
             {
-                "items": [serialize_family_summary(r) for r in page_rows],
+                "items": [serialize_family_summary_row(r) for r in page_rows],
                 "next_cursor": next_cursor,
                 "total_count": total_count,
             },
@@ -22,6 +22,7 @@ from app.api.admin_leads_common import (
     serialize_lead_summary,
     serialize_note,
 )
+from app.api.admin_leads_export import create_lead_export_job, get_lead_export_job
 from app.api.admin_request import parse_body, parse_uuid, query_param
 from app.api.admin_validators import MAX_DESCRIPTION_LENGTH, validate_string_length
 from app.api.assets.assets_common import extract_identity, split_route_parts
@@ -35,6 +36,8 @@ from app.db.repositories import (
     SalesLeadRepository,
 )
 from app.exceptions import NotFoundError, ValidationError
+from app.services.sales_lead_analytics import get_sales_lead_analytics
+from app.services.sales_lead_export import LEAD_EXPORT_HEADER
 from app.utils import json_response
 from app.utils.responses import get_cors_headers, get_security_headers
 
@@ -70,6 +73,17 @@ def handle_admin_leads_request(
             return json_response(405, {"error": "Method not allowed"}, event=event)
         return _export_leads(event)
 
+    if parts[2] == "export-jobs":
+        if len(parts) == 3 and method == "POST":
+            return create_lead_export_job(event, actor_sub=identity.user_sub)
+        if len(parts) == 4 and method == "GET":
+            return get_lead_export_job(
+                event, job_id=parse_uuid(parts[3]), actor_sub=identity.user_sub
+            )
+        if len(parts) > 4:
+            return json_response(404, {"error": "Not found"}, event=event)
+        return json_response(405, {"error": "Method not allowed"}, event=event)
+
     lead_id = parse_uuid(parts[2])
     if len(parts) == 3:
         if method == "GET":
@@ -355,7 +369,7 @@ def _get_analytics(event: Mapping[str, Any]) -> dict[str, Any]:
 
     with Session(get_engine()) as session:
         repository = SalesLeadRepository(session)
-        base = repository.get_analytics(date_from=date_from, date_to=date_to)
+        base = get_sales_lead_analytics(session, date_from=date_from, date_to=date_to)
         now = datetime.now(UTC)
         week_start = datetime.combine(
             (now - timedelta(days=now.weekday())).date(),
@@ -398,23 +412,7 @@ def _export_leads(event: Mapping[str, Any]) -> dict[str, Any]:
         repository = SalesLeadRepository(session)
         output = io.StringIO()
         writer = csv.writer(output)
-        writer.writerow(
-            [
-                "ID",
-                "First Name",
-                "Last Name",
-                "Email",
-                "Phone E.164",
-                "Source",
-                "Lead Type",
-                "Stage",
-                "Assigned To",
-                "Created",
-                "Last Activity",
-                "Days In Stage",
-                "Tags",
-            ]
-        )
+        writer.writerow(LEAD_EXPORT_HEADER)
         cursor_created_at: datetime | None = None
         cursor_id: UUID | None = None
         while True:
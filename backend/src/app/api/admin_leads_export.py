@@ -0,0 +1,133 @@
+"""Admin lead export jobs: queue a streamed S3 export and poll it for a link."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.api.admin_leads_common import parse_lead_filters, request_id
+from app.api.assets.assets_common import (
+    generate_download_url,
+    signed_link_no_cache_headers,
+)
+from app.db.audit import set_audit_context
+from app.db.engine import get_engine
+from app.db.models import SalesLeadExportJob, SalesLeadExportJobStatus
+from app.db.repositories import SalesLeadExportJobRepository
+from app.exceptions import NotFoundError, ValidationError
+from app.services.cloudfront_signing import bucket_expiry
+from app.services.sales_lead_export import dump_export_filters
+from app.services.sales_lead_export_events import enqueue_sales_lead_export_job
+from app.utils import json_response
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_EXPORT_DOWNLOAD_LINK_EXPIRY = timedelta(hours=1)
+#: Polls within one bucket get the same expiry, hence the same memoized URL.
+_EXPORT_DOWNLOAD_LINK_BUCKET_SECONDS = 5 * 60
+
+
+def serialize_lead_export_job(job: SalesLeadExportJob) -> dict[str, Any]:
+    """Job status payload; includes a signed download link once succeeded."""
+    total = job.total_count
+    exported = job.exported_count or 0
+    payload: dict[str, Any] = {
+        "id": str(job.id),
+        "status": job.status.value,
+        "total_count": total,
+        "exported_count": exported,
+        "progress": (
+            1.0
+            if job.status == SalesLeadExportJobStatus.SUCCEEDED
+            else (min(exported / total, 1.0) if total else None)
+        ),
+        "error_message": job.error_message,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "download_url": None,
+        "download_expires_at": None,
+    }
+    if job.status == SalesLeadExportJobStatus.SUCCEEDED and job.s3_key:
+        download = generate_download_url(
+            s3_key=job.s3_key,
+            expires_at=bucket_expiry(
+                datetime.now(UTC) + _EXPORT_DOWNLOAD_LINK_EXPIRY,
+                bucket_seconds=_EXPORT_DOWNLOAD_LINK_BUCKET_SECONDS,
+            ),
+        )
+        payload["download_url"] = download["download_url"]
+        payload["download_expires_at"] = download["expires_at"]
+    return payload
+
+
+def create_lead_export_job(
+    event: Mapping[str, Any], *, actor_sub: str
+) -> dict[str, Any]:
+    """Queue an export of the leads matching the list filters (returns 202)."""
+    filters = dump_export_filters(parse_lead_filters(event))
+    with Session(get_engine()) as session:
+        set_audit_context(session, user_id=actor_sub, request_id=request_id(event))
+        job = SalesLeadExportJob(
+            created_by=actor_sub,
+            filters=filters,
+            status=SalesLeadExportJobStatus.PENDING,
+        )
+        session.add(job)
+        session.flush()
+        job_id = job.id
+        session.commit()
+
+    try:
+        enqueue_sales_lead_export_job(job_id)
+    except ValidationError:
+        with Session(get_engine()) as session:
+            stale = session.get(SalesLeadExportJob, job_id)
+            if stale is not None:
+                session.delete(stale)
+                session.commit()
+        raise
+    except Exception:
+        logger.exception(
+            "Failed to enqueue lead export job", extra={"job_id": str(job_id)}
+        )
+        with Session(get_engine()) as session:
+            job_repo = SalesLeadExportJobRepository(session)
+            failed = job_repo.get_by_id(job_id)
+            if failed is not None:
+                job_repo.mark_failed(failed, "Could not queue export; try again.")
+                session.commit()
+        raise ValidationError(
+            "Export could not be queued; try again shortly.",
+            field="configuration",
+        ) from None
+
+    with Session(get_engine()) as session:
+        job = SalesLeadExportJobRepository(session).get_by_id(job_id)
+        if job is None:
+            raise NotFoundError("SalesLeadExportJob", str(job_id))
+        return json_response(
+            202, {"export_job": serialize_lead_export_job(job)}, event=event
+        )
+
+
+def get_lead_export_job(
+    event: Mapping[str, Any], *, job_id: UUID, actor_sub: str
+) -> dict[str, Any]:
+    """Poll an export job created by the same admin."""
+    with Session(get_engine()) as session:
+        job = SalesLeadExportJobRepository(session).get_for_actor(
+            job_id, actor_sub=actor_sub
+        )
+        if job is None:
+            raise NotFoundError("SalesLeadExportJob", str(job_id))
+        return json_response(
+            200,
+            {"export_job": serialize_lead_export_job(job)},
+            headers=signed_link_no_cache_headers(),
+            event=event,
+        )
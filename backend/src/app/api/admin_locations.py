@@ -29,7 +29,13 @@ from app.db.engine import get_engine
 from app.db.models import Location
 from app.db.repositories import GeographicAreaRepository, LocationRepository
 from app.exceptions import NotFoundError, ValidationError
-from app.services.nominatim_geocode import geocode_address_with_context
+from app.services.geocode_cache import (
+    cached_geocode,
+    country_codes_for_area,
+    fetch_geocode,
+    store_geocode,
+)
+from app.services.nominatim_geocode import GeocodeNoResultsError
 from app.utils import json_response
 
 
@@ -82,28 +88,30 @@ def _geocode_location(event: Mapping[str, Any]) -> dict[str, Any]:
         raise ValidationError("area_id is required", field="area_id")
     area_id = parse_uuid(str(area_id_raw))
 
+    # The provider call can take up to 15 s; keep it outside any session so
+    # a slow geocoder does not pin a database connection.
     with Session(get_engine()) as session:
-        geo_repo = GeographicAreaRepository(session)
-        area = geo_repo.get_by_id(area_id)
+        area = GeographicAreaRepository(session).get_by_id(area_id)
         if area is None:
             raise ValidationError("area_id not found", field="area_id")
+        country_iso_codes = country_codes_for_area(session, area_id)
+        result = cached_geocode(
+            session, address=address, country_iso_codes=country_iso_codes
+        )
 
-        ancestors = geo_repo.get_ancestors(area_id)
-        country_iso_codes: list[str] = []
-        root = ancestors[0] if ancestors else None
-        if root and root.code:
-            country_iso_codes.append(str(root.code))
-        if root is not None:
-            sovereign_code = geo_repo.get_sovereign_country_iso_code(
-                cast(UUID, root.id),
+    if result is None:
+        result = fetch_geocode(address=address, country_iso_codes=country_iso_codes)
+        with Session(get_engine()) as session:
+            store_geocode(
+                session,
+                address=address,
+                country_iso_codes=country_iso_codes,
+                result=result,
             )
-            if sovereign_code:
-                country_iso_codes.append(str(sovereign_code))
+        if result is None:
+            raise GeocodeNoResultsError()
 
-    lat, lng, display_name = geocode_address_with_context(
-        address=address,
-        country_iso_codes=country_iso_codes,
-    )
+    lat, lng, display_name = result
     payload: dict[str, Any] = {"lat": lat, "lng": lng}
     if display_name:
         payload["display_name"] = display_name
@@ -23,7 +23,10 @@ from app.api.admin_entities_helpers import (
     parse_optional_bool_body,
     replace_organization_tags,
 )
-from app.api.admin_entities_serializers import serialize_organization_summary
+from app.api.admin_entities_serializers import (
+    serialize_organization_summary,
+    serialize_organization_summary_row,
+)
 from app.api.admin_request import (
     encode_cursor,
     parse_body,
@@ -261,7 +264,7 @@ def _list_organizations(event: Mapping[str, Any]) -> dict[str, Any]:
 
     with Session(get_engine()) as session:
         repository = OrganizationRepository(session)
-        rows = repository.list_organizations(
+        rows = repository.list_organization_summaries(
             limit=limit + 1,
             cursor=cursor,
             query=query,
@@ -273,17 +276,21 @@ def _list_organizations(event: Mapping[str, Any]) -> dict[str, Any]:
         has_more = len(rows) > limit
         page_rows = rows[:limit]
         next_cursor = (
-            encode_cursor(page_rows[-1].id) if has_more and page_rows else None
+            encode_cursor(page_rows[-1]["id"]) if has_more and page_rows else None
         )
-        total_count = repository.count_organizations(
-            query=query,
-            active=active,
-            relationship_types=relationship_types,
+        total_count = (
+            rows[0]["total_count"]
+            if rows
+            else repository.count_organizations(
+                query=query,
+                active=active,
+                relationship_types=relationship_types,
+            )
         )
         return json_response(
             200,
             {
-                "items": [serialize_organization_summary(r) for r in page_rows],
+                "items": [serialize_organization_summary_row(r) for r in page_rows],
                 "next_cursor": next_cursor,
                 "total_count": total_count,
             },
@@ -0,0 +1,136 @@
+"""Keyed merge of session slots and ticket tiers for admin instance updates.
+
+Instance saves send the full slot / tier lists. Replacing the collections
+(``clear()`` + re-append) deletes and re-inserts every child row on each save,
+which doubles the audit trail, drops slot ``purpose_service_id`` values the
+payload does not carry, nulls ``enrollments.ticket_tier_id`` and changes the
+tier ids ``eventbrite_ticket_class_map`` is keyed by. These helpers match
+payload entries to existing rows instead and only touch rows that changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from app.db.models import EventTicketTier, InstanceSessionSlot, ServiceInstance
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SLOT_FIELDS = ("location_id", "starts_at", "ends_at", "sort_order")
+_TIER_FIELDS = (
+    "name",
+    "description",
+    "price",
+    "currency",
+    "max_quantity",
+    "sort_order",
+)
+
+_Row = TypeVar("_Row", InstanceSessionSlot, EventTicketTier)
+
+
+@dataclass(frozen=True)
+class ChildRowChanges:
+    """Row-level outcome of one collection merge."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
+def merge_session_slots(
+    instance: ServiceInstance,
+    slots: Sequence[Mapping[str, Any]],
+) -> ChildRowChanges:
+    """Make ``instance.session_slots`` match ``slots`` with minimal row changes."""
+    return _merge_rows(
+        instance.session_slots,
+        slots,
+        fields=_SLOT_FIELDS,
+        build=lambda data: InstanceSessionSlot(
+            **{field: data.get(field) for field in _SLOT_FIELDS}
+        ),
+    )
+
+
+def merge_ticket_tiers(
+    instance: ServiceInstance,
+    tiers: Sequence[Mapping[str, Any]],
+) -> ChildRowChanges:
+    """Make ``instance.ticket_tiers`` match ``tiers`` with minimal row changes."""
+    return _merge_rows(
+        instance.ticket_tiers,
+        tiers,
+        fields=_TIER_FIELDS,
+        build=lambda data: EventTicketTier(
+            **{field: data.get(field) for field in _TIER_FIELDS}
+        ),
+    )
+
+
+def _merge_rows(
+    collection: list[_Row],
+    desired: Sequence[Mapping[str, Any]],
+    *,
+    fields: tuple[str, ...],
+    build: Callable[[Mapping[str, Any]], _Row],
+) -> ChildRowChanges:
+    """Match ``desired`` entries to rows by ``id``, then by ``sort_order``.
+
+    Matched rows get only their differing fields assigned (so the flush issues
+    an UPDATE for real changes only); unmatched rows are removed from the
+    collection (deleted via ``delete-orphan``) and unmatched entries appended.
+    """
+    rows_by_id = {row.id: row for row in collection if row.id is not None}
+    pairs: list[tuple[_Row, Mapping[str, Any]]] = []
+    claimed: set[int] = set()
+    pending: list[Mapping[str, Any]] = []
+    for data in desired:
+        row = rows_by_id.get(data.get("id"))
+        if row is not None and id(row) not in claimed:
+            claimed.add(id(row))
+            pairs.append((row, data))
+        else:
+            pending.append(data)
+
+    rows_by_sort_order: dict[int, list[_Row]] = {}
+    for row in sorted(collection, key=lambda r: (r.sort_order, str(r.id))):
+        if id(row) not in claimed:
+            rows_by_sort_order.setdefault(row.sort_order, []).append(row)
+    new_entries: list[Mapping[str, Any]] = []
+    for data in pending:
+        candidates = rows_by_sort_order.get(data.get("sort_order"))
+        if candidates:
+            row = candidates.pop(0)
+            claimed.add(id(row))
+            pairs.append((row, data))
+        else:
+            new_entries.append(data)
+
+    stale = [row for row in collection if id(row) not in claimed]
+    for row in stale:
+        collection.remove(row)
+
+    updated = 0
+    for row, data in pairs:
+        changed = False
+        for field in fields:
+            value = data.get(field)
+            if getattr(row, field) != value:
+                setattr(row, field, value)
+                changed = True
+        updated += changed
+
+    for data in new_entries:
+        collection.append(build(data))
+
+    return ChildRowChanges(
+        inserted=len(new_entries),
+        updated=updated,
+        deleted=len(stale),
+        unchanged=len(pairs) - updated,
+    )
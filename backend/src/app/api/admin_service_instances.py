@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import asdict
 from typing import Any
 from uuid import UUID
 
@@ -11,6 +12,10 @@ from sqlalchemy.orm import Session
 
 from app.api.admin_enrollments import handle_admin_enrollments_request
 from app.api.admin_request import parse_body, parse_uuid
+from app.api.admin_service_instance_children import (
+    merge_session_slots,
+    merge_ticket_tiers,
+)
 from app.api.admin_service_instance_partners import (
     reconcile_instance_partner_organizations,
     validate_partner_organization_ids,
@@ -116,6 +121,7 @@ def _resolve_event_ticket_tiers_for_persist(
         name = tier.get("name") or category_name
         resolved.append(
             {
+                "id": tier.get("id"),
                 "name": name,
                 "description": tier.get("description"),
                 "price": price,
@@ -614,16 +620,11 @@ def _update_instance(
         if "external_url" in payload:
             instance.external_url = payload["external_url"]
         if "session_slots" in payload:
-            instance.session_slots.clear()
-            for item in payload["session_slots"]:
-                instance.session_slots.append(
-                    InstanceSessionSlot(
-                        location_id=item["location_id"],
-                        starts_at=item["starts_at"],
-                        ends_at=item["ends_at"],
-                        sort_order=item["sort_order"],
-                    )
-                )
+            slot_changes = merge_session_slots(instance, payload["session_slots"])
+            logger.info(
+                "Merged instance session slots",
+                extra={"instance_id": str(instance.id), **asdict(slot_changes)},
+            )
         if "type_details" in payload:
             type_details_raw = payload["type_details"]
             if service.service_type == ServiceType.EVENT:
@@ -757,33 +758,12 @@ def _apply_instance_type_details(
             raise ValidationError(
                 "event_ticket_tiers must be an array", field="event_ticket_tiers"
             )
-        tiers_data: list[dict[str, Any]] = list(raw_tiers)
-        tiers_sorted = sorted(tiers_data, key=lambda d: d["sort_order"])
-        existing_sorted = sorted(
-            instance.ticket_tiers,
-            key=lambda t: (t.sort_order, str(t.id)),
+        tiers_sorted = sorted(raw_tiers, key=lambda d: d["sort_order"])
+        tier_changes = merge_ticket_tiers(instance, tiers_sorted)
+        logger.info(
+            "Merged instance ticket tiers",
+            extra={"instance_id": str(instance.id), **asdict(tier_changes)},
         )
-        if existing_sorted and len(tiers_sorted) == len(existing_sorted):
-            for tier_row, data in zip(existing_sorted, tiers_sorted, strict=True):
-                tier_row.name = data["name"]
-                tier_row.description = data.get("description")
-                tier_row.price = data["price"]
-                tier_row.currency = data["currency"]
-                tier_row.max_quantity = data.get("max_quantity")
-                tier_row.sort_order = data["sort_order"]
-        else:
-            instance.ticket_tiers.clear()
-            for data in tiers_sorted:
-                instance.ticket_tiers.append(
-                    EventTicketTier(
-                        name=data["name"],
-                        description=data.get("description"),
-                        price=data["price"],
-                        currency=data["currency"],
-                        max_quantity=data.get("max_quantity"),
-                        sort_order=data["sort_order"],
-                    )
-                )
         instance.training_details = None
         return
 
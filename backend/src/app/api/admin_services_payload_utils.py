@@ -232,6 +232,9 @@ def parse_instance_type_details(
             name_raw = parse_optional_text(entry.get("name"), max_length=100)
             tiers.append(
                 {
+                    "id": parse_optional_uuid(
+                        entry.get("id"), f"event_ticket_tiers[{idx}].id"
+                    ),
                     "name": (name_raw or "").strip(),
                     "description": parse_optional_text(
                         entry.get("description"), max_length=MAX_DESCRIPTION_LENGTH
@@ -304,6 +307,7 @@ def parse_session_slots(value: Any) -> list[dict[str, Any]]:
             )
         slots.append(
             {
+                "id": parse_optional_uuid(entry.get("id"), f"session_slots[{idx}].id"),
                 "location_id": parse_optional_uuid(
                     entry.get("location_id"), "location_id"
                 ),
@@ -8,7 +8,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
-from app.api.admin_request import parse_uuid
+from app.api.admin_request import parse_uuid, query_param
 from app.api.assets.admin_assets_content_replace import (
     complete_asset_content_replace,
     init_asset_content_replace,
@@ -24,6 +24,7 @@ from app.api.assets.assets_common import (
     build_s3_key,
     delete_s3_object,
     extract_identity,
+    generate_list_download_urls,
     generate_upload_url,
     paginate_response,
     parse_admin_asset_list_filters,
@@ -35,6 +36,7 @@ from app.api.assets.assets_common import (
     parse_update_asset_payload,
     serialize_asset,
     serialize_grant,
+    signed_link_no_cache_headers,
     split_route_parts,
 )
 from app.db.audit import set_audit_context
@@ -163,15 +165,39 @@ def _list_assets(event: Mapping[str, Any]) -> dict[str, Any]:
             tag_name=canonical_tag,
             load_tags=True,
         )
+        if not _include_download_urls(event):
+            return paginate_response(
+                items=assets,
+                limit=limit,
+                event=event,
+                serializer=serialize_asset,
+                extra_fields={"linked_tag_names": linked_tag_names},
+            )
+
+        urls, expires_at = generate_list_download_urls(
+            [asset.s3_key for asset in assets[:limit]]
+        )
         return paginate_response(
             items=assets,
             limit=limit,
             event=event,
-            serializer=serialize_asset,
-            extra_fields={"linked_tag_names": linked_tag_names},
+            serializer=lambda asset: {
+                **serialize_asset(asset),
+                "download_url": urls.get(asset.s3_key),
+            },
+            extra_fields={
+                "linked_tag_names": linked_tag_names,
+                "download_expires_at": expires_at,
+            },
+            headers=signed_link_no_cache_headers(),
         )
 
 
+def _include_download_urls(event: Mapping[str, Any]) -> bool:
+    raw = query_param(event, "include_download_urls")
+    return raw is not None and raw.strip().lower() in {"true", "1", "yes"}
+
+
 def _create_asset(event: Mapping[str, Any], created_by: str) -> dict[str, Any]:
     payload = parse_create_asset_payload(event)
     request_id = _request_id(event)
@@ -35,7 +35,10 @@ from app.services.asset_expense_tagging import (
     EXPENSE_ATTACHMENT_TAG_NAME,
 )
 from app.services.aws_clients import get_s3_client
-from app.services.cloudfront_signing import generate_signed_download_url
+from app.services.cloudfront_signing import (
+    bucket_expiry,
+    generate_signed_download_url,
+)
 from app.utils import require_env
 from sqlalchemy import inspect
 
@@ -47,6 +50,9 @@ __all__ = [
 ]
 
 _MAX_FILE_NAME_LENGTH = 255
+_ASSET_KEY_PREFIX = "assets/"
+_LIST_DOWNLOAD_URL_TTL_SECONDS = 15 * 60
+_LIST_DOWNLOAD_URL_BUCKET_SECONDS = 5 * 60
 # Admin presigned PUT uploads (create + replace): reject completes larger than this (bytes).
 _MAX_ASSET_PRESIGNED_UPLOAD_BYTES = 52_428_800  # 50 MiB
 _ADMIN_ASSET_REPLACE_CONTENT_TYPE = "application/pdf"
@@ -393,7 +399,7 @@ def paginate_response(
 def build_s3_key(asset_id: UUID, file_name: str) -> str:
     """Build canonical S3 object key for a new asset."""
     sanitized = sanitize_file_name(file_name)
-    return f"assets/{asset_id}/{uuid4()}-{sanitized}"
+    return f"{_ASSET_KEY_PREFIX}{asset_id}/{uuid4()}-{sanitized}"
 
 
 def file_name_from_pending_asset_content_key(s3_key: str) -> str:
@@ -479,10 +485,13 @@ def generate_download_url(
     cache_bust_key: str | None = None,
     expires_at: datetime | None = None,
 ) -> dict[str, Any]:
-    """Generate a CloudFront-signed GET URL for download."""
+    """Generate a CloudFront-signed GET URL for download.
+
+    The default expiry is rounded up to the signing expiry bucket so repeated
+    requests for the same object reuse one memoized signature.
+    """
     if expires_at is None:
-        expiry_days = _download_link_expiry_days()
-        expires_at = datetime.now(UTC) + timedelta(days=expiry_days)
+        expires_at = default_download_expires_at()
     url = generate_signed_download_url(
         s3_key=s3_key,
         expires_at=expires_at,
@@ -494,6 +503,35 @@ def generate_download_url(
     }
 
 
+def generate_list_download_urls(
+    s3_keys: Sequence[str],
+) -> tuple[dict[str, str], str]:
+    """Sign a short-lived download URL per key for an admin list page.
+
+    Listing links expire after ``_LIST_DOWNLOAD_URL_TTL_SECONDS`` (rounded up to
+    ``_LIST_DOWNLOAD_URL_BUCKET_SECONDS``), not the long share-link default, so
+    a leaked URL from a list page stops working quickly. Within a bucket the
+    memoized signatures are reused across page loads.
+
+    Returns the URL per key and the shared expiry timestamp.
+    """
+    expires_at = bucket_expiry(
+        datetime.now(UTC) + timedelta(seconds=_LIST_DOWNLOAD_URL_TTL_SECONDS),
+        bucket_seconds=_LIST_DOWNLOAD_URL_BUCKET_SECONDS,
+    )
+    urls = {
+        s3_key: generate_signed_download_url(s3_key=s3_key, expires_at=expires_at)
+        for s3_key in s3_keys
+    }
+    return urls, expires_at.isoformat()
+
+
+def default_download_expires_at() -> datetime:
+    """Default link expiry (``ASSET_DOWNLOAD_LINK_EXPIRY_DAYS``), bucketed."""
+    expiry_days = _download_link_expiry_days()
+    return bucket_expiry(datetime.now(UTC) + timedelta(days=expiry_days))
+
+
 def signed_link_no_cache_headers() -> dict[str, str]:
     """Return headers that force revalidation for signed-link responses."""
     return {
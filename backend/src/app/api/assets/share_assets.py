@@ -20,7 +20,7 @@ from app.api.assets.share_links import (
 )
 from app.db.models import AssetVisibility
 from app.db.engine import get_engine
-from app.db.repositories.asset import AssetRepository
+from app.services.share_link_cache import resolve_share_link_target
 from app.utils import json_response
 
 
@@ -66,34 +66,28 @@ def _resolve_share_token(
         return json_response(404, {"error": "Not found"}, event=event)
 
     with Session(get_engine()) as session:
-        repository = AssetRepository(session)
-        share_link = repository.get_share_link_by_token(token=share_token)
-        if share_link is None:
-            return json_response(404, {"error": "Not found"}, event=event)
-        if require_source_domain:
-            source_domain = extract_request_source_domain(event)
-            allowed_domains = set(share_link.allowed_domains or [])
-            if not source_domain or source_domain not in allowed_domains:
-                return json_response(403, {"error": "Forbidden"}, event=event)
-
-        asset = repository.get_by_id(share_link.asset_id)
-        if asset is None:
-            return json_response(404, {"error": "Not found"}, event=event)
-        if (
-            asset.visibility == AssetVisibility.RESTRICTED
-            and not _is_restricted_share_request_authenticated(event)
-        ):
-            return json_response(401, {"error": "Unauthorized"}, event=event)
-
-        download = generate_download_url(s3_key=asset.s3_key)
-        response_headers = signed_link_no_cache_headers()
-        response_headers["Location"] = download["download_url"]
-        return json_response(
-            302,
-            {},
-            headers=response_headers,
-            event=event,
-        )
+        target = resolve_share_link_target(session, share_token)
+    if target is None:
+        return json_response(404, {"error": "Not found"}, event=event)
+    if require_source_domain:
+        source_domain = extract_request_source_domain(event)
+        if not source_domain or source_domain not in target.allowed_domains:
+            return json_response(403, {"error": "Forbidden"}, event=event)
+    if (
+        target.visibility == AssetVisibility.RESTRICTED
+        and not _is_restricted_share_request_authenticated(event)
+    ):
+        return json_response(401, {"error": "Unauthorized"}, event=event)
+
+    download = generate_download_url(s3_key=target.s3_key)
+    response_headers = signed_link_no_cache_headers()
+    response_headers["Location"] = download["download_url"]
+    return json_response(
+        302,
+        {},
+        headers=response_headers,
+        event=event,
+    )
 
 
 def _is_restricted_share_request_authenticated(event: Mapping[str, Any]) -> bool:
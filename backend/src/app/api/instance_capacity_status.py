@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Any
 
+from sqlalchemy.orm.attributes import set_committed_value
+
 from app.db.models import ServiceInstance
-from app.db.models.enums import InstanceStatus
 from app.db.repositories import ServiceInstanceRepository
 
 
@@ -16,29 +17,21 @@ def bulk_reconcile_instance_capacity_status(
 
     Only considers instances with ``max_capacity`` set. Only transitions among
     ``scheduled``, ``open``, and ``full``; leaves other statuses unchanged.
-    Persists with ``session.flush()`` when any row changes (caller may ``commit()``).
+    Runs one set-based ``UPDATE`` (see
+    :meth:`ServiceInstanceRepository.reconcile_capacity_status`) and mirrors the
+    new statuses onto ``instances`` without marking them dirty (caller may
+    ``commit()``).
     """
-    if not instances:
-        return
-    if not any(getattr(row, "max_capacity", None) is not None for row in instances):
+    capped = [
+        row for row in instances if getattr(row, "max_capacity", None) is not None
+    ]
+    if not capped:
         return
     if not hasattr(session, "execute"):
         return
     repository = ServiceInstanceRepository(session)
-    ids = [row.id for row in instances]
-    counts = repository.get_enrollment_counts_for_instances(ids)
-    changed = False
-    for instance in instances:
-        cap = instance.max_capacity
-        if cap is None:
-            continue
-        used = counts.get(instance.id, 0)
-        if used >= cap:
-            if instance.status in (InstanceStatus.OPEN, InstanceStatus.SCHEDULED):
-                instance.status = InstanceStatus.FULL
-                changed = True
-        elif instance.status == InstanceStatus.FULL:
-            instance.status = InstanceStatus.OPEN
-            changed = True
-    if changed:
-        session.flush()
+    changed = repository.reconcile_capacity_status([row.id for row in capped])
+    for instance in capped:
+        status = changed.get(instance.id)
+        if status is not None:
+            set_committed_value(instance, "status", status)
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.db.engine import get_engine
 from app.exceptions import ValidationError
+from app.services.calendar_availability_index import load_available_slots
 from app.services.public_calendar_availability import (
     parse_availability_request,
     serialize_availability_response,
@@ -43,7 +44,7 @@ def handle_public_calendar_availability(
 
     now = datetime.now(tz=UTC)
     with Session(get_engine()) as session:
-        slots = spec.compute(session, from_date, to_date, now)
+        slots = load_available_slots(session, spec, from_date, to_date, now)
 
     body = serialize_availability_response(
         spec=spec,
@@ -24,10 +24,21 @@ from app.db.models import Service, ServiceInstance
 from app.db.models.enums import InstanceStatus, ServiceType
 from app.db.models.service_instance import InstanceSessionSlot
 from app.db.repositories.service_instance import ServiceInstanceRepository
+from app.services.public_calendar_feed import (
+    FEED_RESPONSE_LIMIT,
+    FeedSnapshot,
+    feed_etag,
+    filter_feed_snapshot,
+    load_feed_snapshot,
+)
 
 if TYPE_CHECKING:
     from app.db.models.location import Location
-from app.utils import public_cacheable_json_response
+from app.utils import (
+    public_cacheable_json_response,
+    public_not_modified_response,
+    request_etag_matches,
+)
 from app.utils.logging import get_logger
 from app.utils.maps import build_google_maps_directions_url
 from app.utils.public_slug import PUBLIC_INSTANCE_SLUG_PATTERN
@@ -42,6 +53,7 @@ _LEGACY_MBA_SERVICE_SLUG = (
 _SERVICE_KEY_PATTERN = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
 _PUBLIC_INSTANCE_SLUG_MAX_LEN = 128  # matches service_instances.slug varchar(128)
 _SERVICE_KEY_MAX_LEN = 80  # matches services.service_key varchar(80)
+_FEED_SNAPSHOT_LIMIT = 1000  # unfiltered rows kept in the shared feed snapshot
 
 
 def handle_public_events(
@@ -77,18 +89,43 @@ def handle_public_events(
         },
     )
 
+    now = datetime.now(UTC)
     with Session(get_engine()) as session:
         repository = ServiceInstanceRepository(session)
-        items = _fetch_public_offerings(
-            repository,
-            now=datetime.now(UTC),
-            service_types=service_types,
-            slug=slug,
-            service_key=service_key,
-        )
+        snapshot: FeedSnapshot | None = None
+        # Slug / service key lookups stay in SQL: the snapshot is capped, so a
+        # match may lie beyond it. A type filter uses the snapshot when complete.
+        if slug is None and service_key is None:
+            snapshot = load_feed_snapshot(
+                session,
+                now=now,
+                build=lambda: _fetch_public_offerings(
+                    repository, now=now, limit=_FEED_SNAPSHOT_LIMIT
+                ),
+            )
+            if snapshot.truncated and service_types is not None:
+                snapshot = None
+        if snapshot is None:
+            events, _ = _fetch_public_offerings(
+                repository,
+                now=now,
+                limit=FEED_RESPONSE_LIMIT,
+                service_types=service_types,
+                slug=slug,
+                service_key=service_key,
+            )
+            snapshot = FeedSnapshot(etag=feed_etag(events), built_at=now, events=events)
+    etag, items = filter_feed_snapshot(
+        snapshot,
+        service_types=service_types,
+        slug=slug,
+        service_key=service_key,
+    )
+    if request_etag_matches(event, etag):
+        return public_not_modified_response(etag=etag, event=event)
     # Keep a temporary alias for older consumers while "events" is canonical.
     return public_cacheable_json_response(
-        200, {"events": items, "items": items}, event=event
+        200, {"events": items, "items": items}, event=event, etag=etag
     )
 
 
@@ -150,17 +187,24 @@ def _fetch_public_offerings(
     repository: ServiceInstanceRepository,
     *,
     now: datetime,
-    service_types: set[ServiceType] | None,
-    slug: str | None,
-    service_key: str | None,
-) -> list[dict[str, Any]]:
+    limit: int,
+    service_types: set[ServiceType] | None = None,
+    slug: str | None = None,
+    service_key: str | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Serialize up to ``limit`` feed rows; also return whether more rows matched.
+
+    Unfiltered, this is the snapshot source; filtered, the SQL fallback.
+    """
     rows = repository.list_public_offerings(
-        limit=100,
+        limit=limit + 1,
         now=now,
         service_types=service_types,
         slug=slug,
         service_key=service_key,
     )
+    truncated = len(rows) > limit
+    rows = rows[:limit]
     capacity_instance_ids = [row.id for row in rows if row.max_capacity is not None]
     enrollment_counts = repository.get_enrollment_counts_for_instances(
         capacity_instance_ids
@@ -178,7 +222,7 @@ def _fetch_public_offerings(
         out.append(
             _serialize_public_event(instance, enrollment_counts=enrollment_counts)
         )
-    return out
+    return out, truncated
 
 
 def _resolve_primary_location(
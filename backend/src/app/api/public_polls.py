@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from typing import Any
 from collections.abc import Mapping
@@ -10,17 +12,24 @@ from urllib.parse import parse_qs, urlparse
 from app.api.admin_request import parse_body
 from app.api.validators import validate_email
 from app.exceptions import ConflictError, RateLimitError, ValidationError
+from app.services.poll_control_cache import (
+    get_cached_poll_control_state,
+    remember_poll_control_state,
+)
 from app.services.poll_responses_store import (
     aggregate_poll_question_results,
-    check_poll_write_rate_limit,
-    get_poll_answer_item,
-    get_poll_control_state,
     list_poll_answers_for_session,
+    load_poll_answer_context,
     poll_answer_payload_unchanged,
+    put_poll_answer_rate_limited,
     put_poll_control_state,
-    upsert_poll_answer,
 )
-from app.utils import json_response
+from app.utils import (
+    get_cors_headers,
+    get_security_headers,
+    json_response,
+    request_etag_matches,
+)
 from app.utils.logging import get_logger
 from app.utils.public_slug import PUBLIC_INSTANCE_SLUG_PATTERN
 
@@ -52,6 +61,10 @@ _AGGREGATABLE_TYPES = (
 )
 _MAX_SELECTED_OPTIONS = 20
 
+# Control and results are re-polled every few seconds: browsers may keep them
+# but must revalidate (ETag / If-None-Match); shared caches must not store them.
+_POLL_CACHE_CONTROL = "private, no-cache"
+
 
 def handle_public_polls_request(
     event: Mapping[str, Any],
@@ -161,7 +174,42 @@ def _handle_get_poll_question_results(
         question_id=question_id,
         question_type=question_type,
     )
-    return json_response(200, result, event=event)
+    return _revalidatable_response(result, event=event)
+
+
+def _payload_etag(payload: Mapping[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _revalidatable_response(
+    payload: Mapping[str, Any],
+    *,
+    event: Mapping[str, Any],
+) -> dict[str, Any]:
+    """200 with an ``ETag``, or an empty 304 when ``If-None-Match`` matches it."""
+    etag = _payload_etag(payload)
+    if request_etag_matches(event, etag):
+        return _empty_poll_response(304, etag=etag, event=event)
+    return json_response(
+        200,
+        payload,
+        headers={"Cache-Control": _POLL_CACHE_CONTROL, "ETag": etag},
+        event=event,
+    )
+
+
+def _empty_poll_response(
+    status_code: int,
+    *,
+    etag: str,
+    event: Mapping[str, Any],
+) -> dict[str, Any]:
+    headers = get_security_headers()
+    headers.update(get_cors_headers(event))
+    headers["Cache-Control"] = _POLL_CACHE_CONTROL
+    headers["ETag"] = etag
+    return {"statusCode": status_code, "headers": headers, "body": ""}
 
 
 def _read_query_param(event: Mapping[str, Any], name: str) -> Any:
@@ -194,8 +242,28 @@ def _handle_get_poll_control(
     *,
     poll_slug: str,
 ) -> dict[str, Any]:
-    result = get_poll_control_state(poll_slug=poll_slug)
-    return json_response(200, result, event=event)
+    try:
+        since_version = _parse_since_version(_read_query_param(event, "sinceVersion"))
+    except ValidationError as exc:
+        return json_response(exc.status_code, exc.to_dict(), event=event)
+
+    result = get_cached_poll_control_state(poll_slug)
+    if since_version is not None and result.get("version", 0) <= since_version:
+        # Nothing newer than the caller's copy: no payload.
+        return _empty_poll_response(204, etag=_payload_etag(result), event=event)
+    return _revalidatable_response(result, event=event)
+
+
+def _parse_since_version(value: Any) -> int | None:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    try:
+        parsed = int(str(value).strip())
+    except ValueError:
+        raise ValidationError("sinceVersion must be a non-negative integer") from None
+    if parsed < 0:
+        raise ValidationError("sinceVersion must be a non-negative integer")
+    return parsed
 
 
 def _handle_put_poll_control(
@@ -213,11 +281,15 @@ def _handle_put_poll_control(
     except ValidationError as exc:
         return json_response(exc.status_code, exc.to_dict(), event=event)
 
-    result = put_poll_control_state(
-        poll_slug=poll_slug,
-        enabled_question_ids=control_payload["enabled_question_ids"],
-        question_options=control_payload.get("question_options"),
-    )
+    try:
+        result = put_poll_control_state(
+            poll_slug=poll_slug,
+            enabled_question_ids=control_payload["enabled_question_ids"],
+            question_options=control_payload.get("question_options"),
+        )
+    except ConflictError as exc:
+        return json_response(exc.status_code, exc.to_dict(), event=event)
+    remember_poll_control_state(poll_slug, result)
     logger.info(
         "Updated poll control state",
         extra={
@@ -369,10 +441,14 @@ def _handle_put_poll_answer(
     except ValidationError as exc:
         return json_response(exc.status_code, exc.to_dict(), event=event)
 
-    control = get_poll_control_state(poll_slug=poll_slug)
+    question_id = normalized["question_id"]
+    control, existing_answer = load_poll_answer_context(
+        poll_slug=poll_slug,
+        session_id=normalized["session_id"],
+        question_id=question_id,
+    )
     enabled_raw = control.get("enabledQuestionIds")
     enabled_ids = enabled_raw if isinstance(enabled_raw, list) else []
-    question_id = normalized["question_id"]
     if not enabled_ids:
         error = ConflictError("poll_not_accepting_answers")
         return json_response(error.status_code, error.to_dict(), event=event)
@@ -388,11 +464,6 @@ def _handle_put_poll_answer(
     except ConflictError as exc:
         return json_response(exc.status_code, exc.to_dict(), event=event)
 
-    existing_answer = get_poll_answer_item(
-        poll_slug=poll_slug,
-        session_id=normalized["session_id"],
-        question_id=normalized["question_id"],
-    )
     if (
         existing_answer is not None
         and isinstance(existing_answer.get("updatedAt"), str)
@@ -417,14 +488,12 @@ def _handle_put_poll_answer(
         )
 
     try:
-        check_poll_write_rate_limit(
-            poll_slug=poll_slug,
-            session_id=normalized["session_id"],
+        result = put_poll_answer_rate_limited(
+            **normalized, existing_item=existing_answer
         )
     except RateLimitError as exc:
         return json_response(exc.status_code, exc.to_dict(), event=event)
 
-    result = upsert_poll_answer(**normalized, existing_item=existing_answer)
     logger.info(
         "Persisted poll answer",
         extra={
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 from collections.abc import Mapping, Sequence
 
@@ -36,6 +37,21 @@ def is_attestation_enabled() -> bool:
     return bool(load_attestation_config().jwks_url)
 
 
+@cache
+def _jwk_client(jwks_url: str) -> jwt.PyJWKClient:
+    # One client per container so its JWK set cache survives warm invocations.
+    return jwt.PyJWKClient(jwks_url)
+
+
+def prime_attestation_jwks() -> bool:
+    """Fetch the attestation JWKS (warm-up); ``False`` when attestation is off."""
+    config = load_attestation_config()
+    if not config.jwks_url:
+        return False
+    _jwk_client(config.jwks_url).get_signing_keys()
+    return True
+
+
 def verify_attestation_token(token: str) -> Mapping[str, Any]:
     config = load_attestation_config()
     if not config.jwks_url:
@@ -44,7 +60,7 @@ def verify_attestation_token(token: str) -> Mapping[str, Any]:
     if not config.audience or not config.issuer:
         raise ValueError("Attestation audience/issuer must be configured.")
 
-    jwk_client = jwt.PyJWKClient(config.jwks_url)
+    jwk_client = _jwk_client(config.jwks_url)
     signing_key = jwk_client.get_signing_key_from_jwt(token)
     return jwt.decode(
         token,
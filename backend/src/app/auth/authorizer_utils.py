@@ -173,14 +173,16 @@ def verified_cognito_context_from_event(
                 claims=None,
                 policy=deny_missing_token(method_arn),
             )
-        logger.warning(f"JWT validation failed: {exc.message} (reason: {exc.reason})")
+        logger.warning(
+            "JWT validation failed: %s (reason: %s)", exc.message, exc.reason
+        )
         return VerifiedCognitoContext(
             claims=None,
             policy=deny_invalid_token(method_arn, exc.reason),
         )
     except Exception as exc:
         # SECURITY: Do not expose internal error details in the authorizer context.
-        logger.warning(f"Token validation failed: {type(exc).__name__}")
+        logger.warning("Token validation failed: %s", type(exc).__name__)
         return VerifiedCognitoContext(
             claims=None,
             policy=deny_invalid_token(method_arn),
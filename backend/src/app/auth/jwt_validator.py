@@ -190,6 +190,19 @@ def _get_jwks_client(user_pool_id: str, region: str) -> PyJWKClient:
     return client
 
 
+def prime_jwks() -> bool:
+    """Fetch the configured user pool's JWKS into the client cache.
+
+    Used by Lambda warm-up invocations so the first real request does not pay
+    for the JWKS download. Returns ``False`` when ``COGNITO_USER_POOL_ID`` is
+    not configured.
+    """
+    if not os.getenv("COGNITO_USER_POOL_ID"):
+        return False
+    _get_jwks_client(_get_user_pool_id(), _get_region()).get_signing_keys()
+    return True
+
+
 def _extract_user_pool_from_issuer(issuer: str) -> tuple[str, str]:
     """Extract region and user pool ID from Cognito issuer URL.
 
@@ -276,13 +289,13 @@ def decode_and_verify_token(
         jwks_client = _get_jwks_client(user_pool_id, region)
         signing_key = jwks_client.get_signing_key_from_jwt(token)
     except PyJWKClientError as exc:
-        logger.warning(f"Failed to get signing key: {exc}")
+        logger.warning("Failed to get signing key: %s", exc)
         raise JWTValidationError(
             "Could not retrieve signing key",
             reason="invalid_token",
         ) from exc
     except Exception as exc:
-        logger.warning(f"Unexpected error getting signing key: {exc}")
+        logger.warning("Unexpected error getting signing key: %s", exc)
         raise JWTValidationError(
             "Error retrieving signing key",
             reason="invalid_token",
@@ -331,7 +344,7 @@ def decode_and_verify_token(
             reason="invalid_token",
         ) from exc
     except Exception as exc:
-        logger.warning(f"Unexpected error during token verification: {exc}")
+        logger.warning("Unexpected error during token verification: %s", exc)
         raise JWTValidationError(
             "Token verification failed",
             reason="invalid_token",
@@ -10,11 +10,12 @@ import os
 from typing import Any
 
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import NullPool
 
 from app.db.connection import get_database_url, use_iam_auth
+from app.db.query_stats import instrument_engine
 
 # Module-level engine cache for connection reuse across Lambda invocations
 _ENGINE_CACHE: dict[str, Engine] = {}
@@ -57,6 +58,7 @@ def get_engine(
         connect_args=_get_connect_args(),
         **pool_settings,
     )
+    instrument_engine(engine)
 
     if use_cache:
         _ENGINE_CACHE[cache_key] = engine
@@ -64,6 +66,17 @@ def get_engine(
     return engine
 
 
+def warm_engine() -> None:
+    """Open and validate one connection (Lambda warm-up).
+
+    With password auth the connection goes back to the cached engine's pool;
+    with IAM auth (``NullPool``) this still pays the DNS/TLS handshake and
+    primes the secret and RDS client caches ahead of the first request.
+    """
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
 def clear_engine_cache() -> None:
     """Clear the engine cache.
 
@@ -1,6 +1,8 @@
 """SQLAlchemy models."""
 
 from app.db.models.asset import Asset, AssetAccessGrant, AssetShareLink
+from app.db.models.cache_version import CacheVersion
+from app.db.models.calendar_availability_index import CalendarAvailabilityIndex
 from app.db.models.calendar_manual_block import CalendarManualBlock
 from app.db.models.audit_log import AuditLog
 from app.db.models.bulk_expense_import_job import (
@@ -52,13 +54,25 @@ from app.db.models.enums import (
     TrainingPricingUnit,
 )
 from app.db.models.family import Family, FamilyMember
+from app.db.models.geocode_cache import GeocodeCacheEntry
 from app.db.models.geographic_area import GeographicArea
+from app.db.models.legacy_import_checkpoint import LegacyImportCheckpoint
 from app.db.models.legacy_import_ref import LegacyImportRef
 from app.db.models.location import Location
 from app.db.models.note import Note
 from app.db.models.organization import Organization, OrganizationMember
 from app.db.models.payment_allocation import DocumentCounter, PaymentAllocation
+from app.db.models.public_calendar_feed_snapshot import PublicCalendarFeedSnapshot
 from app.db.models.sales_lead import SalesLead, SalesLeadEvent
+from app.db.models.sales_lead_export_job import (
+    SalesLeadExportJob,
+    SalesLeadExportJobStatus,
+)
+from app.db.models.sales_lead_rollup import (
+    SalesLeadDailyRollup,
+    SalesLeadRollupDirtyDay,
+    SalesLeadStageDailyRollup,
+)
 from app.db.models.service import (
     ConsultationDetails,
     EventDetails,
@@ -92,6 +106,8 @@ __all__ = [
     "BillingPaymentStatus",
     "BulkExpenseImportJob",
     "BulkExpenseImportJobStatus",
+    "CacheVersion",
+    "CalendarAvailabilityIndex",
     "CalendarManualBlock",
     "ConsultationDetails",
     "ConsultationFormat",
@@ -124,6 +140,7 @@ __all__ = [
     "FamilyRole",
     "FamilyTag",
     "FunnelStage",
+    "GeocodeCacheEntry",
     "GeographicArea",
     "InboundEmail",
     "InboundEmailStatus",
@@ -131,6 +148,7 @@ __all__ = [
     "InstanceStatus",
     "LeadEventType",
     "LeadType",
+    "LegacyImportCheckpoint",
     "LegacyImportRef",
     "Location",
     "MailchimpSyncStatus",
@@ -141,9 +159,15 @@ __all__ = [
     "OrganizationTag",
     "OrganizationType",
     "PaymentAllocation",
+    "PublicCalendarFeedSnapshot",
     "RelationshipType",
     "SalesLead",
+    "SalesLeadDailyRollup",
     "SalesLeadEvent",
+    "SalesLeadExportJob",
+    "SalesLeadExportJobStatus",
+    "SalesLeadRollupDirtyDay",
+    "SalesLeadStageDailyRollup",
     "Service",
     "ServiceAsset",
     "ServiceDeliveryMode",
@@ -42,6 +42,12 @@ class Asset(Base):
             unique=True,
             postgresql_where=text("resource_key IS NOT NULL"),
         ),
+        Index(
+            "assets_content_sha256_unique_idx",
+            "content_sha256",
+            unique=True,
+            postgresql_where=text("content_sha256 IS NOT NULL"),
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -65,6 +71,7 @@ class Asset(Base):
     resource_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
     content_type: Mapped[str | None] = mapped_column(String(127), nullable=True)
     content_language: Mapped[str | None] = mapped_column(String(35), nullable=True)
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     visibility: Mapped[AssetVisibility] = mapped_column(
         Enum(
             AssetVisibility,
@@ -0,0 +1,30 @@
+"""Version stamps that let Lambda containers drop in-memory caches."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+# Scope bumped whenever a share link or its asset changes.
+SHARE_LINK_CACHE_SCOPE = "asset_share_links"
+
+
+class CacheVersion(Base):
+    """Monotonic counter per cache scope; writers bump, readers compare."""
+
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(
+        BigInteger(), nullable=False, server_default=text("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
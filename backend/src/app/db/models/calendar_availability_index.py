@@ -0,0 +1,44 @@
+"""Precomputed per-purpose availability bitmap (one row per booking purpose)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Boolean, Date, LargeBinary, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+
+class CalendarAvailabilityIndex(Base):
+    """Free-slot bitset per local day for ``GET /v1/calendar/availability``.
+
+    ``bitmap`` holds a fixed number of bytes per day starting at ``start_date``; bit
+    ``i`` of a day is set when that day's ``i``-th candidate slot is free of busy
+    time (lead time is applied at read). Row triggers on ``calendar_manual_blocks``
+    and ``instance_session_slots`` widen ``dirty_from``/``dirty_to``; statement
+    triggers on ``services`` / ``service_instances`` set ``stale``.
+    """
+
+    __tablename__ = "calendar_availability_indexes"
+
+    purpose: Mapped[str] = mapped_column(Text(), primary_key=True)
+    wall_time_zone: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    start_date: Mapped[date | None] = mapped_column(Date(), nullable=True)
+    bitmap: Mapped[bytes] = mapped_column(
+        LargeBinary(),
+        nullable=False,
+        server_default=text("''::bytea"),
+    )
+    dirty_from: Mapped[date | None] = mapped_column(Date(), nullable=True)
+    dirty_to: Mapped[date | None] = mapped_column(Date(), nullable=True)
+    stale: Mapped[bool] = mapped_column(
+        Boolean(),
+        nullable=False,
+        server_default=text("true"),
+    )
+    built_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
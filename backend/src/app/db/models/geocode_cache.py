@@ -0,0 +1,34 @@
+"""Cached Nominatim geocoding results keyed by normalized query text."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import Index, Numeric, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+
+class GeocodeCacheEntry(Base):
+    """One geocoder answer; ``lat``/``lng`` are NULL when nothing was found."""
+
+    __tablename__ = "geocode_cache"
+    __table_args__ = (Index("ix_geocode_cache_expires_at", "expires_at"),)
+
+    query_text: Mapped[str] = mapped_column(Text(), primary_key=True)
+    country_codes: Mapped[str] = mapped_column(String(64), primary_key=True)
+    lat: Mapped[Decimal | None] = mapped_column(Numeric(9, 6), nullable=True)
+    lng: Mapped[Decimal | None] = mapped_column(Numeric(9, 6), nullable=True)
+    display_name: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
@@ -0,0 +1,27 @@
+"""Per-entity progress of a multi-entity legacy CRM import run (resume point)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timezone
+
+from sqlalchemy import Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+
+class LegacyImportCheckpoint(Base):
+    """One row per entity finished by an import-all run (``run_key``)."""
+
+    __tablename__ = "legacy_import_checkpoints"
+
+    run_key: Mapped[str] = mapped_column(Text(), primary_key=True)
+    entity: Mapped[str] = mapped_column(Text(), primary_key=True)
+    inserted: Mapped[int] = mapped_column(Integer(), nullable=False, default=0)
+    completed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
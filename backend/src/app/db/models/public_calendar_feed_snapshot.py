@@ -0,0 +1,47 @@
+"""Precomputed public calendar feed (serialized events, rebuilt on change)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Boolean, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+
+class PublicCalendarFeedSnapshot(Base):
+    """Serialized ``GET /v1/calendar/public`` event list for one feed key.
+
+    Database triggers on the instance / slot / enrollment tables (and the rows the
+    serializer reads) set ``stale`` so the next request rebuilds the snapshot.
+    """
+
+    __tablename__ = "public_calendar_feed_snapshots"
+
+    feed_key: Mapped[str] = mapped_column(Text(), primary_key=True)
+    #: Public feed event dicts in feed order (output of ``_serialize_public_event``).
+    payload: Mapped[list[Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        server_default=text("'[]'::jsonb"),
+    )
+    etag: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    stale: Mapped[bool] = mapped_column(
+        Boolean(),
+        nullable=False,
+        server_default=text("true"),
+    )
+    built_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
+    #: The source query returned more rows than the snapshot keeps.
+    truncated: Mapped[bool] = mapped_column(
+        Boolean(),
+        nullable=False,
+        server_default=text("false"),
+    )
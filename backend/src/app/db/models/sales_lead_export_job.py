@@ -0,0 +1,75 @@
+"""Background CSV export jobs for admin sales leads."""
+
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Integer, Text, text
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+
+
+class SalesLeadExportJobStatus(str, enum.Enum):
+    """Worker lifecycle for a lead export job."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+def _export_job_status_values(enum_cls: object) -> list[str]:
+    del enum_cls
+    return [member.value for member in SalesLeadExportJobStatus]
+
+
+class SalesLeadExportJob(Base):
+    """Queued export of the filtered lead list to a gzip'd CSV object in S3."""
+
+    __tablename__ = "sales_lead_export_jobs"
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    created_by: Mapped[str] = mapped_column(Text(), nullable=False)
+    #: Lead list filters as JSON (enum values and ISO datetimes), see
+    #: ``app.services.sales_lead_export.dump_export_filters``.
+    filters: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[SalesLeadExportJobStatus] = mapped_column(
+        SAEnum(
+            SalesLeadExportJobStatus,
+            native_enum=False,
+            length=32,
+            values_callable=_export_job_status_values,
+        ),
+        nullable=False,
+    )
+    #: Matching leads counted when the worker started (progress denominator).
+    total_count: Mapped[int | None] = mapped_column(Integer(), nullable=True)
+    exported_count: Mapped[int] = mapped_column(
+        Integer(), nullable=False, server_default=text("0")
+    )
+    s3_key: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    #: Compressed object size in bytes.
+    byte_size: Mapped[int | None] = mapped_column(BigInteger(), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("timezone('utc', now())"),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("timezone('utc', now())"),
+    )
@@ -0,0 +1,75 @@
+"""Daily sales lead analytics rollups (bucketed by lead creation day, UTC)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import Date, Enum, Float, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TIMESTAMP
+
+from app.db.base import Base
+from app.db.models.enums import FunnelStage
+from app.db.models.sales_lead import _enum_values
+
+
+def _funnel_stage_column() -> Enum:
+    return Enum(
+        FunnelStage,
+        name="funnel_stage",
+        values_callable=_enum_values,
+        create_type=False,
+    )
+
+
+class SalesLeadDailyRollup(Base):
+    """Lead counts per creation day, current funnel stage, source and assignee."""
+
+    __tablename__ = "sales_lead_daily_rollups"
+    __table_args__ = (Index("sales_lead_daily_rollups_day_idx", "day"),)
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    day: Mapped[date] = mapped_column(Date(), nullable=False)
+    funnel_stage: Mapped[FunnelStage] = mapped_column(
+        _funnel_stage_column(), nullable=False
+    )
+    #: ``contacts.source`` value; ``NULL`` when the lead has no contact source.
+    source: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    assigned_to: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lead_count: Mapped[int] = mapped_column(Integer(), nullable=False)
+    #: Leads with ``converted_at`` set, and the sum of their time to convert.
+    converted_timed_count: Mapped[int] = mapped_column(Integer(), nullable=False)
+    convert_seconds: Mapped[float] = mapped_column(Float(), nullable=False)
+
+
+class SalesLeadStageDailyRollup(Base):
+    """Per creation day and stage: leads that reached it and time spent in it."""
+
+    __tablename__ = "sales_lead_stage_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    stage: Mapped[FunnelStage] = mapped_column(_funnel_stage_column(), primary_key=True)
+    #: Distinct leads with a created / stage_changed event into ``stage``.
+    reached_leads: Mapped[int] = mapped_column(Integer(), nullable=False)
+    #: Stage events leaving ``stage`` after an earlier stage event, and their gaps.
+    stage_intervals: Mapped[int] = mapped_column(Integer(), nullable=False)
+    stage_seconds: Mapped[float] = mapped_column(Float(), nullable=False)
+
+
+class SalesLeadRollupDirtyDay(Base):
+    """Lead creation days whose rollups must be recomputed (set by table triggers)."""
+
+    __tablename__ = "sales_lead_rollup_dirty_days"
+
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    marked_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=text("now()"),
+    )
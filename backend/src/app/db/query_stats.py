@@ -0,0 +1,80 @@
+"""SQLAlchemy cursor hooks feeding the per-request ``QueryStats``.
+
+``get_engine`` instruments every engine it creates. Each statement executed
+while a request context is active (``set_request_context``) adds its duration,
+the rows a SELECT returned and its normalized shape to
+``app.utils.logging.query_stats``; ``log_query_summary`` turns that into one
+``SQL summary`` line per request. Outside a request the hooks only time the
+cursor call.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.logging import query_stats
+
+_START_KEY = "query_stats_started"
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded ``IN`` lists (``IN (%(id_1)s, %(id_2)s)``) and literals differ per
+# call for what is the same statement.
+_BIND_LIST = re.compile(
+    r"\(\s*(?:%\(\w+\)s|\?|\$\d+)(?:\s*,\s*(?:%\(\w+\)s|\?|\$\d+))*\s*\)"
+)
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize ``statement`` so repeats with different parameters compare equal."""
+    shape = _STRING.sub("?", statement)
+    shape = _BIND_LIST.sub("(?)", shape)
+    shape = _NUMBER.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Attach the statement hooks to ``engine`` (idempotent); returns ``engine``."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _before_cursor_execute(
+    conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    _parameters: Any,
+    _context: Any,
+    _executemany: bool,
+) -> None:
+    started = conn.info[_START_KEY].pop()
+    stats = query_stats.get()
+    if stats is None:
+        return
+    # ``rowcount`` is the result size for buffered SELECTs; DML row counts are
+    # "rows affected", not fetched.
+    rows = max(cursor.rowcount, 0) if cursor.description is not None else 0
+    stats.record(
+        statement_shape(statement),
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+        rows=rows,
+    )
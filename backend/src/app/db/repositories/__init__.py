@@ -7,17 +7,27 @@ making business logic independent of the persistence layer.
 from app.db.repositories.base import BaseRepository
 from app.db.repositories.asset import AssetRepository
 from app.db.repositories.bulk_expense_import_job import BulkExpenseImportJobRepository
+from app.db.repositories.cache_version import CacheVersionRepository
+from app.db.repositories.calendar_availability_index import (
+    CalendarAvailabilityIndexRepository,
+)
 from app.db.repositories.contact import ContactRepository
 from app.db.repositories.note import NoteRepository
 from app.db.repositories.discount_code import DiscountCodeRepository
 from app.db.repositories.enrollment import EnrollmentRepository
 from app.db.repositories.expense import ExpenseRepository
 from app.db.repositories.family import FamilyRepository
+from app.db.repositories.geocode_cache import GeocodeCacheRepository
 from app.db.repositories.geographic_area import GeographicAreaRepository
 from app.db.repositories.inbound_email import InboundEmailRepository
 from app.db.repositories.location import LocationRepository
 from app.db.repositories.organization import OrganizationRepository
+from app.db.repositories.public_calendar_feed_snapshot import (
+    PublicCalendarFeedSnapshotRepository,
+)
 from app.db.repositories.sales_lead import SalesLeadRepository
+from app.db.repositories.sales_lead_export_job import SalesLeadExportJobRepository
+from app.db.repositories.sales_lead_rollup import SalesLeadRollupRepository
 from app.db.repositories.service import ServiceRepository
 from app.db.repositories.service_instance import ServiceInstanceRepository
 
@@ -25,17 +35,23 @@ __all__ = [
     "BaseRepository",
     "AssetRepository",
     "BulkExpenseImportJobRepository",
+    "CacheVersionRepository",
+    "CalendarAvailabilityIndexRepository",
     "ContactRepository",
     "NoteRepository",
     "DiscountCodeRepository",
     "EnrollmentRepository",
     "ExpenseRepository",
     "FamilyRepository",
+    "GeocodeCacheRepository",
     "GeographicAreaRepository",
     "InboundEmailRepository",
     "LocationRepository",
     "OrganizationRepository",
+    "PublicCalendarFeedSnapshotRepository",
     "SalesLeadRepository",
+    "SalesLeadExportJobRepository",
+    "SalesLeadRollupRepository",
     "ServiceRepository",
     "ServiceInstanceRepository",
 ]
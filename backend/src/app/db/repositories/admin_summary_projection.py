@@ -0,0 +1,123 @@
+"""SQL building blocks for the single-query admin CRM list projections.
+
+The admin contacts, families and organizations lists used to load ORM rows with
+chained ``selectinload`` options (one round trip per relationship level) and
+then count the page in a separate query. The projections built from these
+helpers return one row per entity with the related data already aggregated
+into JSON columns (``json_agg`` in ``LATERAL`` subqueries, single objects in
+correlated scalar subqueries), so a list page is one statement. PostgreSQL only.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Text, cast, func, literal_column, null, select
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Lateral
+
+from app.db.models import Contact, GeographicArea, Location, Tag
+
+#: ``'[]'::json`` fallback for aggregates over no rows (``json_agg`` yields NULL).
+EMPTY_JSON_ARRAY = literal_column("'[]'::json", type_=JSON)
+
+
+def json_array_agg(element: ColumnElement[Any]) -> ColumnElement[Any]:
+    """``json_agg(element)``, or an empty array when there are no rows."""
+    return func.coalesce(func.json_agg(element), EMPTY_JSON_ARRAY, type_=JSON)
+
+
+def location_venue_object(location: Any, area: Any) -> ColumnElement[Any]:
+    """JSON object matching ``serialize_location_venue`` for aliased rows."""
+    return func.json_build_object(
+        "id",
+        cast(location.id, Text),
+        "name",
+        location.name,
+        "area_id",
+        cast(location.area_id, Text),
+        "area_name",
+        func.coalesce(area.name, ""),
+        "address",
+        location.address,
+        "lat",
+        location.lat,
+        "lng",
+        location.lng,
+        type_=JSON,
+    )
+
+
+def location_venue_json(location_id: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Venue summary for ``location_id`` (NULL when unset or missing)."""
+    location = aliased(Location)
+    area = aliased(GeographicArea)
+    return (
+        select(location_venue_object(location, area))
+        .select_from(location)
+        .outerjoin(area, area.id == location.area_id)
+        .where(location.id == location_id)
+        .scalar_subquery()
+    )
+
+
+def tag_refs_lateral(
+    link: Any, owner_match: ColumnElement[bool], *, name: str
+) -> Lateral:
+    """``tags`` column: ``serialize_tag_ref`` objects for one owner's tag links."""
+    return (
+        select(
+            json_array_agg(
+                func.json_build_object(
+                    "id", cast(Tag.id, Text), "name", Tag.name, "color", Tag.color
+                )
+            ).label("tags")
+        )
+        .select_from(link)
+        .join(Tag, Tag.id == link.tag_id)
+        .where(owner_match)
+        .lateral(name)
+    )
+
+
+def member_rows_lateral(
+    member: Any, owner_match: ColumnElement[bool], *, name: str
+) -> Lateral:
+    """``members`` column: membership rows plus the contact's label fields."""
+    return (
+        select(
+            json_array_agg(
+                func.json_build_object(
+                    "id",
+                    cast(member.id, Text),
+                    "contact_id",
+                    cast(member.contact_id, Text),
+                    "first_name",
+                    Contact.first_name,
+                    "last_name",
+                    Contact.last_name,
+                    "email",
+                    Contact.email,
+                    "role",
+                    member.role,
+                    "is_primary_contact",
+                    member.is_primary_contact,
+                )
+            ).label("members")
+        )
+        .select_from(member)
+        .outerjoin(Contact, Contact.id == member.contact_id)
+        .where(owner_match)
+        .lateral(name)
+    )
+
+
+def empty_relationship_columns() -> list[ColumnElement[Any]]:
+    """``tags`` / ``members`` / ``location_summary`` for lists that skip them."""
+    return [
+        EMPTY_JSON_ARRAY.label("tags"),
+        EMPTY_JSON_ARRAY.label("members"),
+        null().label("location_summary"),
+    ]
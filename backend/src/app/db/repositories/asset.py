@@ -22,7 +22,9 @@ from app.db.models import (
     AssetVisibility,
     Tag,
 )
+from app.db.models.cache_version import SHARE_LINK_CACHE_SCOPE
 from app.db.repositories.base import BaseRepository
+from app.db.repositories.cache_version import CacheVersionRepository
 from app.exceptions import ValidationError
 from app.services.asset_expense_tagging import CLIENT_DOCUMENT_TAG_NAME
 
@@ -250,6 +252,7 @@ class AssetRepository(BaseRepository[Asset]):
         content_language: str | None,
         visibility: AssetVisibility,
         created_by: str,
+        content_sha256: str | None = None,
     ) -> Asset:
         """Create and persist an asset."""
         entity = Asset(
@@ -264,6 +267,7 @@ class AssetRepository(BaseRepository[Asset]):
             content_language=content_language,
             visibility=visibility,
             created_by=created_by,
+            content_sha256=content_sha256,
         )
         return self.create(entity)
 
@@ -325,12 +329,20 @@ class AssetRepository(BaseRepository[Asset]):
             asset.content_type = content_type
         if update_content_language:
             asset.content_language = content_language
+        if visibility is not None or s3_key is not None:
+            self._bump_share_link_cache_version()
         if visibility is not None:
             asset.visibility = visibility
         if s3_key is not None:
             asset.s3_key = s3_key
+            asset.content_sha256 = None
         return self.update(asset)
 
+    def delete(self, entity: Asset) -> None:
+        """Delete an asset (its share link cascades) and invalidate share caches."""
+        super().delete(entity)
+        self._bump_share_link_cache_version()
+
     def find_by_resource_key(self, resource_key: str) -> Asset | None:
         """Return an asset by normalized media resource key."""
         normalized_key = resource_key.strip().lower()
@@ -342,6 +354,11 @@ class AssetRepository(BaseRepository[Asset]):
         )
         return self._session.execute(statement).scalar_one_or_none()
 
+    def find_by_content_sha256(self, content_sha256: str) -> Asset | None:
+        """Return the asset stored for a SHA-256 content digest, if any."""
+        statement = select(Asset).where(Asset.content_sha256 == content_sha256)
+        return self._session.execute(statement).scalar_one_or_none()
+
     def list_grants(self, *, asset_id: UUID) -> Sequence[AssetAccessGrant]:
         """List all grants for an asset."""
         statement = (
@@ -423,6 +440,20 @@ class AssetRepository(BaseRepository[Asset]):
         statement = select(AssetShareLink).where(AssetShareLink.share_token == token)
         return self._session.execute(statement).scalar_one_or_none()
 
+    def get_share_target_by_token(
+        self, *, token: str
+    ) -> tuple[str, AssetVisibility, list[str]] | None:
+        """Return ``(s3_key, visibility, allowed_domains)`` for a token in one query."""
+        statement = (
+            select(Asset.s3_key, Asset.visibility, AssetShareLink.allowed_domains)
+            .join(Asset, Asset.id == AssetShareLink.asset_id)
+            .where(AssetShareLink.share_token == token)
+        )
+        row = self._session.execute(statement).one_or_none()
+        if row is None:
+            return None
+        return row.s3_key, row.visibility, list(row.allowed_domains or [])
+
     def create_share_link(
         self,
         *,
@@ -455,6 +486,7 @@ class AssetRepository(BaseRepository[Asset]):
         if allowed_domains is not None:
             share_link.allowed_domains = list(allowed_domains)
         share_link.updated_at = datetime.now(UTC)
+        self._bump_share_link_cache_version()
         self._session.flush()
         self._session.refresh(share_link)
         return share_link
@@ -468,6 +500,7 @@ class AssetRepository(BaseRepository[Asset]):
         """Update allowed source domains for an existing share link."""
         share_link.allowed_domains = list(allowed_domains)
         share_link.updated_at = datetime.now(UTC)
+        self._bump_share_link_cache_version()
         self._session.flush()
         self._session.refresh(share_link)
         return share_link
@@ -475,8 +508,13 @@ class AssetRepository(BaseRepository[Asset]):
     def revoke_share_link(self, share_link: AssetShareLink) -> None:
         """Delete a share link."""
         self._session.delete(share_link)
+        self._bump_share_link_cache_version()
         self._session.flush()
 
+    def _bump_share_link_cache_version(self) -> None:
+        """Tell every container's share-token cache to drop its entries."""
+        CacheVersionRepository(self._session).bump(SHARE_LINK_CACHE_SCOPE)
+
 
 def _build_grant_filter(
     *,
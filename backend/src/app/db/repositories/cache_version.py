@@ -0,0 +1,40 @@
+"""Repository for cache version stamps."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.cache_version import CacheVersion
+
+
+class CacheVersionRepository:
+    """Read and bump ``cache_versions`` rows."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository.
+
+        Args:
+            session: SQLAlchemy session for database operations.
+        """
+        self._session = session
+
+    def get_version(self, name: str) -> int:
+        """Return the current version for ``name`` (0 when never bumped)."""
+        statement = select(CacheVersion.version).where(CacheVersion.name == name)
+        return int(self._session.execute(statement).scalar_one_or_none() or 0)
+
+    def bump(self, name: str) -> None:
+        """Increment the version in the caller's transaction."""
+        result = self._session.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == name)
+            .values(version=CacheVersion.version + 1, updated_at=datetime.now(UTC))
+        )
+        if result.rowcount == 0:
+            self._session.add(
+                CacheVersion(name=name, version=1, updated_at=datetime.now(UTC))
+            )
+            self._session.flush()
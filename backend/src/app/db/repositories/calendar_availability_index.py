@@ -0,0 +1,42 @@
+"""Repository for the precomputed calendar availability bitmaps."""
+
+from __future__ import annotations
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.calendar_availability_index import CalendarAvailabilityIndex
+
+
+class CalendarAvailabilityIndexRepository:
+    """Read/write ``calendar_availability_indexes`` rows by ``purpose``."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def get(self, purpose: str) -> CalendarAvailabilityIndex | None:
+        statement = select(CalendarAvailabilityIndex).where(
+            CalendarAvailabilityIndex.purpose == purpose
+        )
+        return self._session.execute(statement).scalar_one_or_none()
+
+    def lock_for_refresh(self, purpose: str) -> CalendarAvailabilityIndex | None:
+        """Row-lock the index for a rebuild; ``None`` when another caller holds it.
+
+        ``SKIP LOCKED`` keeps concurrent readers from queueing behind one rebuild;
+        they fall back to computing availability directly instead.
+        """
+        statement = (
+            select(CalendarAvailabilityIndex)
+            .where(CalendarAvailabilityIndex.purpose == purpose)
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        return self._session.execute(statement).scalar_one_or_none()
+
+    def mark_stale(self, purpose: str) -> None:
+        self._session.execute(
+            update(CalendarAvailabilityIndex)
+            .where(CalendarAvailabilityIndex.purpose == purpose)
+            .values(stale=True)
+        )
@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
+from typing import Any
 from uuid import UUID
 
 import phonenumbers
 from phonenumbers.phonenumberutil import NumberParseException
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import RowMapping, Text, and_, cast, exists, func, or_, select, true
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from app.db.models.note import Note
+from app.db.models.completion_certificate import CompletionCertificate
 from app.db.models.contact import Contact
 from app.db.models.family import Family, FamilyMember
+from app.db.models.geographic_area import GeographicArea
 from app.db.models.location import Location
 from app.db.models.organization import Organization, OrganizationMember
 from app.db.models.tag import ContactTag
 from app.db.models.enums import (
+    CompletionCertificateStatus,
     ContactSource,
     ContactType,
     MailchimpSyncStatus,
     RelationshipType,
 )
+from app.db.repositories.admin_summary_projection import (
+    json_array_agg,
+    location_venue_json,
+    location_venue_object,
+    tag_refs_lateral,
+)
 from app.db.repositories.base import BaseRepository
 
 _SOURCE_PRIORITY: dict[ContactSource, int] = {
@@ -38,6 +48,28 @@ _SOURCE_PRIORITY: dict[ContactSource, int] = {
     ContactSource.MANUAL: 100,
 }
 
+#: Contact columns selected by ``list_summaries_for_admin``.
+_SUMMARY_COLUMNS = (
+    "id",
+    "email",
+    "instagram_handle",
+    "first_name",
+    "last_name",
+    "phone_region",
+    "phone_national_number",
+    "contact_type",
+    "relationship_type",
+    "date_of_birth",
+    "location_id",
+    "source",
+    "source_detail",
+    "source_metadata",
+    "mailchimp_status",
+    "archived_at",
+    "created_at",
+    "updated_at",
+)
+
 
 def _normalize_email(email: str) -> str:
     return email.strip().lower()
@@ -219,7 +251,37 @@ class ContactRepository(BaseRepository[Contact]):
 
         return existing_contact, False
 
-    def list_for_admin(
+    @staticmethod
+    def _admin_list_conditions(
+        *,
+        query: str | None,
+        active: bool | None,
+        contact_type: ContactType | None,
+    ) -> list[Any]:
+        """WHERE clauses shared by the admin list page and its total count."""
+        from app.db.repositories.organization import _escape_like_pattern
+
+        conditions: list[Any] = []
+        if query:
+            escaped = _escape_like_pattern(query.strip())
+            pattern = f"%{escaped}%"
+            phone_preds = _phone_search_predicates(query.strip())
+            text_preds = [
+                Contact.first_name.ilike(pattern, escape="\\"),
+                Contact.last_name.ilike(pattern, escape="\\"),
+                Contact.email.ilike(pattern, escape="\\"),
+                Contact.instagram_handle.ilike(pattern, escape="\\"),
+            ]
+            conditions.append(or_(*text_preds, *phone_preds))
+        if active is True:
+            conditions.append(Contact.archived_at.is_(None))
+        if active is False:
+            conditions.append(Contact.archived_at.is_not(None))
+        if contact_type is not None:
+            conditions.append(Contact.contact_type == contact_type)
+        return conditions
+
+    def list_summaries_for_admin(
         self,
         *,
         limit: int,
@@ -227,21 +289,100 @@ class ContactRepository(BaseRepository[Contact]):
         query: str | None = None,
         active: bool | None = None,
         contact_type: ContactType | None = None,
-    ) -> list[Contact]:
-        """List contacts with optional text search and active (non-archived) filter."""
-        from app.db.repositories.organization import _escape_like_pattern
-
-        statement = select(Contact).options(
-            selectinload(Contact.contact_tags).selectinload(ContactTag.tag),
-            selectinload(Contact.family_members)
-            .selectinload(FamilyMember.family)
-            .selectinload(Family.location)
-            .selectinload(Location.area),
-            selectinload(Contact.organization_members)
-            .selectinload(OrganizationMember.organization)
-            .selectinload(Organization.location)
-            .selectinload(Location.area),
-            selectinload(Contact.location).selectinload(Location.area),
+    ) -> list[RowMapping]:
+        """One-statement admin list page for ``serialize_contact_summary_row``.
+
+        Each row carries the contact columns, JSON ``tags`` / ``family_ids`` /
+        ``organization_ids`` / location summaries, ``standalone_note_count``,
+        ``has_completion_certificate`` and the filtered ``total_count``.
+        """
+        conditions = self._admin_list_conditions(
+            query=query, active=active, contact_type=contact_type
+        )
+        tags = tag_refs_lateral(
+            ContactTag, ContactTag.contact_id == Contact.id, name="contact_tag_refs"
+        )
+        family_ids = (
+            select(
+                json_array_agg(cast(FamilyMember.family_id, Text)).label("family_ids")
+            )
+            .where(FamilyMember.contact_id == Contact.id)
+            .lateral("contact_family_ids")
+        )
+        organization_ids = (
+            select(
+                json_array_agg(cast(OrganizationMember.organization_id, Text)).label(
+                    "organization_ids"
+                )
+            )
+            .where(OrganizationMember.contact_id == Contact.id)
+            .lateral("contact_organization_ids")
+        )
+        family_location = aliased(Location)
+        family_area = aliased(GeographicArea)
+        family_location_summary = (
+            select(location_venue_object(family_location, family_area))
+            .select_from(FamilyMember)
+            .join(Family, Family.id == FamilyMember.family_id)
+            .join(family_location, family_location.id == Family.location_id)
+            .outerjoin(family_area, family_area.id == family_location.area_id)
+            .where(FamilyMember.contact_id == Contact.id)
+            .order_by(cast(Family.id, Text))
+            .limit(1)
+            .scalar_subquery()
+        )
+        organization_location = aliased(Location)
+        organization_area = aliased(GeographicArea)
+        organization_location_summary = (
+            select(location_venue_object(organization_location, organization_area))
+            .select_from(OrganizationMember)
+            .join(Organization, Organization.id == OrganizationMember.organization_id)
+            .join(
+                organization_location,
+                organization_location.id == Organization.location_id,
+            )
+            .outerjoin(
+                organization_area,
+                organization_area.id == organization_location.area_id,
+            )
+            .where(OrganizationMember.contact_id == Contact.id)
+            .order_by(cast(Organization.id, Text))
+            .limit(1)
+            .scalar_subquery()
+        )
+        standalone_note_count = (
+            select(func.count(Note.id))
+            .where(Note.contact_id == Contact.id, Note.lead_id.is_(None))
+            .scalar_subquery()
+        )
+        has_completion_certificate = exists().where(
+            CompletionCertificate.contact_id == Contact.id,
+            CompletionCertificate.status == CompletionCertificateStatus.ISSUED,
+        )
+        total_count = (
+            select(func.count(Contact.id))
+            .where(*conditions)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        statement = (
+            select(
+                *(getattr(Contact, name) for name in _SUMMARY_COLUMNS),
+                tags.c.tags,
+                family_ids.c.family_ids,
+                organization_ids.c.organization_ids,
+                location_venue_json(Contact.location_id).label("location_summary"),
+                family_location_summary.label("family_location_summary"),
+                organization_location_summary.label("organization_location_summary"),
+                standalone_note_count.label("standalone_note_count"),
+                has_completion_certificate.label("has_completion_certificate"),
+                total_count.label("total_count"),
+            )
+            .select_from(Contact)
+            .join(tags, true())
+            .join(family_ids, true())
+            .join(organization_ids, true())
+            .where(*conditions)
         )
         if cursor is not None:
             cursor_created_at = (
@@ -256,31 +397,11 @@ class ContactRepository(BaseRepository[Contact]):
                     ),
                 )
             )
-        if query:
-            escaped = _escape_like_pattern(query.strip())
-            pattern = f"%{escaped}%"
-            phone_preds = _phone_search_predicates(query.strip())
-            text_preds = [
-                Contact.first_name.ilike(pattern, escape="\\"),
-                Contact.last_name.ilike(pattern, escape="\\"),
-                Contact.email.ilike(pattern, escape="\\"),
-                Contact.instagram_handle.ilike(pattern, escape="\\"),
-            ]
-            if phone_preds:
-                statement = statement.where(or_(*text_preds, *phone_preds))
-            else:
-                statement = statement.where(or_(*text_preds))
-        if active is True:
-            statement = statement.where(Contact.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Contact.archived_at.is_not(None))
-        if contact_type is not None:
-            statement = statement.where(Contact.contact_type == contact_type)
         statement = statement.order_by(
             Contact.created_at.desc(),
             Contact.id.desc(),
         ).limit(limit)
-        return list(self._session.execute(statement).scalars().all())
+        return list(self._session.execute(statement).mappings().all())
 
     def search_for_admin_picker(
         self,
@@ -324,29 +445,11 @@ class ContactRepository(BaseRepository[Contact]):
         active: bool | None = None,
         contact_type: ContactType | None = None,
     ) -> int:
-        from app.db.repositories.organization import _escape_like_pattern
-
-        statement = select(func.count(Contact.id))
-        if query:
-            escaped = _escape_like_pattern(query.strip())
-            pattern = f"%{escaped}%"
-            phone_preds = _phone_search_predicates(query.strip())
-            text_preds = [
-                Contact.first_name.ilike(pattern, escape="\\"),
-                Contact.last_name.ilike(pattern, escape="\\"),
-                Contact.email.ilike(pattern, escape="\\"),
-                Contact.instagram_handle.ilike(pattern, escape="\\"),
-            ]
-            if phone_preds:
-                statement = statement.where(or_(*text_preds, *phone_preds))
-            else:
-                statement = statement.where(or_(*text_preds))
-        if active is True:
-            statement = statement.where(Contact.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Contact.archived_at.is_not(None))
-        if contact_type is not None:
-            statement = statement.where(Contact.contact_type == contact_type)
+        statement = select(func.count(Contact.id)).where(
+            *self._admin_list_conditions(
+                query=query, active=active, contact_type=contact_type
+            )
+        )
         count = self._session.execute(statement).scalar_one_or_none()
         return int(count or 0)
 
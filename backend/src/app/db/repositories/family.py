@@ -5,11 +5,16 @@ from __future__ import annotations
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, exists, func, or_, select
+from sqlalchemy import RowMapping, and_, exists, func, or_, select, true
 from sqlalchemy.orm import Session, selectinload
 
 from app.db.models import Contact, Family, FamilyMember, Location
 from app.db.models.tag import FamilyTag
+from app.db.repositories.admin_summary_projection import (
+    location_venue_json,
+    member_rows_lateral,
+    tag_refs_lateral,
+)
 from app.db.repositories.base import BaseRepository
 from app.db.repositories.organization import _escape_like_pattern
 
@@ -44,18 +49,66 @@ class FamilyRepository(BaseRepository[Family]):
         )
         return or_(Family.family_name.ilike(pattern, escape="\\"), member_match)
 
-    def list_for_admin(
+    @staticmethod
+    def _admin_list_conditions(
+        *,
+        query: str | None,
+        active: bool | None,
+    ) -> list[Any]:
+        """WHERE clauses shared by the admin list page and its total count."""
+        conditions: list[Any] = []
+        if query:
+            conditions.append(FamilyRepository._admin_list_query_filter(query))
+        if active is True:
+            conditions.append(Family.archived_at.is_(None))
+        if active is False:
+            conditions.append(Family.archived_at.is_not(None))
+        return conditions
+
+    def list_summaries_for_admin(
         self,
         *,
         limit: int,
         cursor: UUID | None = None,
         query: str | None = None,
         active: bool | None = None,
-    ) -> list[Family]:
-        statement = select(Family).options(
-            selectinload(Family.family_tags).selectinload(FamilyTag.tag),
-            selectinload(Family.family_members).selectinload(FamilyMember.contact),
-            selectinload(Family.location).selectinload(Location.area),
+    ) -> list[RowMapping]:
+        """One-statement admin list page for ``serialize_family_summary_row``.
+
+        Each row carries the family columns, JSON ``tags`` / ``members`` /
+        ``location_summary`` and the filtered ``total_count``.
+        """
+        conditions = self._admin_list_conditions(query=query, active=active)
+        tags = tag_refs_lateral(
+            FamilyTag, FamilyTag.family_id == Family.id, name="family_tag_refs"
+        )
+        members = member_rows_lateral(
+            FamilyMember, FamilyMember.family_id == Family.id, name="family_member_rows"
+        )
+        total_count = (
+            select(func.count(Family.id))
+            .where(*conditions)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        statement = (
+            select(
+                Family.id,
+                Family.family_name,
+                Family.relationship_type,
+                Family.location_id,
+                Family.archived_at,
+                Family.created_at,
+                Family.updated_at,
+                tags.c.tags,
+                members.c.members,
+                location_venue_json(Family.location_id).label("location_summary"),
+                total_count.label("total_count"),
+            )
+            .select_from(Family)
+            .join(tags, true())
+            .join(members, true())
+            .where(*conditions)
         )
         if cursor is not None:
             cursor_created_at = (
@@ -70,19 +123,11 @@ class FamilyRepository(BaseRepository[Family]):
                     ),
                 )
             )
-        if query:
-            statement = statement.where(
-                FamilyRepository._admin_list_query_filter(query)
-            )
-        if active is True:
-            statement = statement.where(Family.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Family.archived_at.is_not(None))
         statement = statement.order_by(
             Family.created_at.desc(),
             Family.id.desc(),
         ).limit(limit)
-        return list(self._session.execute(statement).scalars().unique().all())
+        return list(self._session.execute(statement).mappings().all())
 
     def count_for_admin(
         self,
@@ -90,15 +135,9 @@ class FamilyRepository(BaseRepository[Family]):
         query: str | None = None,
         active: bool | None = None,
     ) -> int:
-        statement = select(func.count(Family.id))
-        if query:
-            statement = statement.where(
-                FamilyRepository._admin_list_query_filter(query)
-            )
-        if active is True:
-            statement = statement.where(Family.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Family.archived_at.is_not(None))
+        statement = select(func.count(Family.id)).where(
+            *self._admin_list_conditions(query=query, active=active)
+        )
         count = self._session.execute(statement).scalar_one_or_none()
         return int(count or 0)
 
@@ -0,0 +1,81 @@
+"""Repository for cached geocoding results."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import GeocodeCacheEntry
+
+
+class GeocodeCacheRepository:
+    """Lookups and writes for ``geocode_cache``."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository.
+
+        Args:
+            session: SQLAlchemy session for database operations.
+        """
+        self._session = session
+
+    def get_fresh(
+        self,
+        query_text: str,
+        country_codes: str,
+        *,
+        now: datetime,
+    ) -> GeocodeCacheEntry | None:
+        """Return the cached answer for a normalized query unless it has expired."""
+        return self._session.execute(
+            select(GeocodeCacheEntry).where(
+                GeocodeCacheEntry.query_text == query_text,
+                GeocodeCacheEntry.country_codes == country_codes,
+                GeocodeCacheEntry.expires_at > now,
+            )
+        ).scalar_one_or_none()
+
+    def store(
+        self,
+        query_text: str,
+        country_codes: str,
+        *,
+        lat: float | None,
+        lng: float | None,
+        display_name: str | None,
+        fetched_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        """Insert or replace the answer for a normalized query.
+
+        A single ``INSERT ... ON CONFLICT DO UPDATE`` so two requests caching the
+        same query concurrently cannot both take the insert path.
+        """
+        insert_stmt = pg_insert(GeocodeCacheEntry).values(
+            query_text=query_text,
+            country_codes=country_codes,
+            lat=Decimal(str(lat)) if lat is not None else None,
+            lng=Decimal(str(lng)) if lng is not None else None,
+            display_name=display_name,
+            fetched_at=fetched_at,
+            expires_at=expires_at,
+        )
+        self._session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[
+                    GeocodeCacheEntry.query_text,
+                    GeocodeCacheEntry.country_codes,
+                ],
+                set_={
+                    "lat": insert_stmt.excluded.lat,
+                    "lng": insert_stmt.excluded.lng,
+                    "display_name": insert_stmt.excluded.display_name,
+                    "fetched_at": insert_stmt.excluded.fetched_at,
+                    "expires_at": insert_stmt.excluded.expires_at,
+                },
+            )
+        )
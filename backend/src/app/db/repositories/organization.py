@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
-from typing import Literal
+from typing import Any, Literal
 from uuid import UUID
 
-from sqlalchemy import and_, func, literal, or_, select
+from sqlalchemy import RowMapping, Select, and_, func, literal, or_, select, true
 from sqlalchemy.orm import Session, noload, selectinload
 
 from app.db.models import Location, Organization, RelationshipType
 from app.db.models.organization import OrganizationMember
 from app.db.models.tag import OrganizationTag
+from app.db.repositories.admin_summary_projection import (
+    empty_relationship_columns,
+    location_venue_json,
+    member_rows_lateral,
+    tag_refs_lateral,
+)
 from app.db.repositories.base import BaseRepository
 
 
@@ -106,48 +112,46 @@ class OrganizationRepository(BaseRepository[Organization]):
     def __init__(self, session: Session):
         super().__init__(session, Organization)
 
-    def list_organizations(
-        self,
+    @staticmethod
+    def _list_conditions(
         *,
-        limit: int,
-        cursor: UUID | None = None,
-        query: str | None = None,
-        active: bool | None = None,
-        relationship_types: Sequence[RelationshipType] | None = None,
-        include_relationships: bool = True,
-        list_order: OrganizationListOrder = "created_desc",
-    ) -> list[Organization]:
-        """List organizations with optional relationship-type filter.
+        query: str | None,
+        active: bool | None,
+        relationship_types: Sequence[RelationshipType] | None,
+    ) -> list[Any]:
+        """WHERE clauses shared by list pages and their total count.
 
         When ``relationship_types`` is omitted, vendor and partner rows are excluded
-        (Contacts default). Pass ``relationship_types=(RelationshipType.PARTNER,)``
-        for Services, ``relationship_types=(RelationshipType.VENDOR,)`` for Finance.
+        (Contacts default).
         """
-        statement = select(Organization)
+        conditions: list[Any] = []
         if relationship_types is not None:
-            statement = statement.where(
+            conditions.append(
                 Organization.relationship_type.in_(tuple(relationship_types))
             )
         else:
-            statement = statement.where(
+            conditions.append(
                 Organization.relationship_type.in_(_CRM_DEFAULT_RELATIONSHIP_TYPES)
             )
-        if include_relationships:
-            statement = statement.options(
-                selectinload(Organization.organization_tags).selectinload(
-                    OrganizationTag.tag
-                ),
-                selectinload(Organization.organization_members).selectinload(
-                    OrganizationMember.contact
-                ),
-                selectinload(Organization.location).selectinload(Location.area),
-            )
-        else:
-            statement = statement.options(
-                noload(Organization.organization_tags),
-                noload(Organization.organization_members),
-                noload(Organization.location),
-            )
+        if query:
+            escaped = _escape_like_pattern(query.strip())
+            pattern = f"%{escaped}%"
+            conditions.append(Organization.name.ilike(pattern, escape="\\"))
+        if active is True:
+            conditions.append(Organization.archived_at.is_(None))
+        if active is False:
+            conditions.append(Organization.archived_at.is_not(None))
+        return conditions
+
+    @staticmethod
+    def _paginate(
+        statement: Select[Any],
+        *,
+        limit: int,
+        cursor: UUID | None,
+        list_order: OrganizationListOrder,
+    ) -> Select[Any]:
+        """Apply keyset cursor, ``list_order`` and ``limit`` to a list statement."""
         name_sort_key = func.lower(func.trim(Organization.name))
         if cursor is not None:
             if list_order == "name_asc":
@@ -179,14 +183,6 @@ class OrganizationRepository(BaseRepository[Organization]):
                         ),
                     )
                 )
-        if query:
-            escaped = _escape_like_pattern(query.strip())
-            pattern = f"%{escaped}%"
-            statement = statement.where(Organization.name.ilike(pattern, escape="\\"))
-        if active is True:
-            statement = statement.where(Organization.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Organization.archived_at.is_not(None))
         if list_order == "name_asc":
             statement = statement.order_by(
                 name_sort_key.asc(),
@@ -197,33 +193,138 @@ class OrganizationRepository(BaseRepository[Organization]):
                 Organization.created_at.desc(),
                 Organization.id.desc(),
             )
-        statement = statement.limit(limit)
+        return statement.limit(limit)
+
+    def list_organizations(
+        self,
+        *,
+        limit: int,
+        cursor: UUID | None = None,
+        query: str | None = None,
+        active: bool | None = None,
+        relationship_types: Sequence[RelationshipType] | None = None,
+        include_relationships: bool = True,
+        list_order: OrganizationListOrder = "created_desc",
+    ) -> list[Organization]:
+        """List organizations with optional relationship-type filter.
+
+        When ``relationship_types`` is omitted, vendor and partner rows are excluded
+        (Contacts default). Pass ``relationship_types=(RelationshipType.PARTNER,)``
+        for Services, ``relationship_types=(RelationshipType.VENDOR,)`` for Finance.
+        """
+        statement = select(Organization).where(
+            *self._list_conditions(
+                query=query, active=active, relationship_types=relationship_types
+            )
+        )
+        if include_relationships:
+            statement = statement.options(
+                selectinload(Organization.organization_tags).selectinload(
+                    OrganizationTag.tag
+                ),
+                selectinload(Organization.organization_members).selectinload(
+                    OrganizationMember.contact
+                ),
+                selectinload(Organization.location).selectinload(Location.area),
+            )
+        else:
+            statement = statement.options(
+                noload(Organization.organization_tags),
+                noload(Organization.organization_members),
+                noload(Organization.location),
+            )
+        statement = self._paginate(
+            statement, limit=limit, cursor=cursor, list_order=list_order
+        )
         return list(self._session.execute(statement).scalars().unique().all())
 
-    def count_organizations(
+    def list_organization_summaries(
         self,
         *,
+        limit: int,
+        cursor: UUID | None = None,
         query: str | None = None,
         active: bool | None = None,
         relationship_types: Sequence[RelationshipType] | None = None,
-    ) -> int:
-        statement = select(func.count(Organization.id))
-        if relationship_types is not None:
-            statement = statement.where(
-                Organization.relationship_type.in_(tuple(relationship_types))
+        include_relationships: bool = True,
+        list_order: OrganizationListOrder = "created_desc",
+    ) -> list[RowMapping]:
+        """One-statement list page for ``serialize_organization_summary_row``.
+
+        Same filters and ordering as ``list_organizations``. Each row carries the
+        organization columns, JSON ``tags`` / ``members`` / ``location_summary``
+        (empty when ``include_relationships`` is false) and the filtered
+        ``total_count``.
+        """
+        conditions = self._list_conditions(
+            query=query, active=active, relationship_types=relationship_types
+        )
+        total_count = (
+            select(func.count(Organization.id))
+            .where(*conditions)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        columns: list[Any] = [
+            Organization.id,
+            Organization.name,
+            Organization.organization_type,
+            Organization.relationship_type,
+            Organization.partner_key,
+            Organization.legal_name,
+            Organization.website,
+            Organization.location_id,
+            Organization.archived_at,
+            Organization.created_at,
+            Organization.updated_at,
+            total_count.label("total_count"),
+        ]
+        if include_relationships:
+            tags = tag_refs_lateral(
+                OrganizationTag,
+                OrganizationTag.organization_id == Organization.id,
+                name="organization_tag_refs",
+            )
+            members = member_rows_lateral(
+                OrganizationMember,
+                OrganizationMember.organization_id == Organization.id,
+                name="organization_member_rows",
+            )
+            statement = (
+                select(
+                    *columns,
+                    tags.c.tags,
+                    members.c.members,
+                    location_venue_json(Organization.location_id).label(
+                        "location_summary"
+                    ),
+                )
+                .select_from(Organization)
+                .join(tags, true())
+                .join(members, true())
             )
         else:
-            statement = statement.where(
-                Organization.relationship_type.in_(_CRM_DEFAULT_RELATIONSHIP_TYPES)
+            statement = select(*columns, *empty_relationship_columns())
+        statement = self._paginate(
+            statement.where(*conditions),
+            limit=limit,
+            cursor=cursor,
+            list_order=list_order,
+        )
+        return list(self._session.execute(statement).mappings().all())
+
+    def count_organizations(
+        self,
+        *,
+        query: str | None = None,
+        active: bool | None = None,
+        relationship_types: Sequence[RelationshipType] | None = None,
+    ) -> int:
+        statement = select(func.count(Organization.id)).where(
+            *self._list_conditions(
+                query=query, active=active, relationship_types=relationship_types
             )
-        if query:
-            escaped = _escape_like_pattern(query.strip())
-            pattern = f"%{escaped}%"
-            statement = statement.where(Organization.name.ilike(pattern, escape="\\"))
-        if active is True:
-            statement = statement.where(Organization.archived_at.is_(None))
-        if active is False:
-            statement = statement.where(Organization.archived_at.is_not(None))
+        )
         count = self._session.execute(statement).scalar_one_or_none()
         return int(count or 0)
 
@@ -0,0 +1,89 @@
+"""Repository for the precomputed public calendar feed snapshot."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.public_calendar_feed_snapshot import PublicCalendarFeedSnapshot
+
+
+class PublicCalendarFeedSnapshotRepository:
+    """Read/write ``public_calendar_feed_snapshots`` rows by ``feed_key``."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def get_state(
+        self, feed_key: str
+    ) -> Row[tuple[str | None, bool, datetime | None, bool]] | None:
+        """Return ``(etag, stale, built_at, truncated)`` without loading the payload."""
+        statement = select(
+            PublicCalendarFeedSnapshot.etag,
+            PublicCalendarFeedSnapshot.stale,
+            PublicCalendarFeedSnapshot.built_at,
+            PublicCalendarFeedSnapshot.truncated,
+        ).where(PublicCalendarFeedSnapshot.feed_key == feed_key)
+        return self._session.execute(statement).first()
+
+    def try_lock(self, feed_key: str) -> bool:
+        """Lock the snapshot row for this transaction without waiting.
+
+        Returns ``False`` when another transaction holds it, e.g. a writer whose
+        stale-marking trigger updated the row and has not committed yet.
+        """
+        statement = (
+            select(PublicCalendarFeedSnapshot.feed_key)
+            .where(PublicCalendarFeedSnapshot.feed_key == feed_key)
+            .with_for_update(skip_locked=True)
+        )
+        return self._session.execute(statement).first() is not None
+
+    def get_payload(self, feed_key: str) -> list[Any]:
+        statement = select(PublicCalendarFeedSnapshot.payload).where(
+            PublicCalendarFeedSnapshot.feed_key == feed_key
+        )
+        payload = self._session.execute(statement).scalar_one_or_none()
+        return list(payload or [])
+
+    def clear_stale(self, feed_key: str) -> None:
+        """Mark the snapshot fresh *before* a rebuild reads source rows.
+
+        Writes committed while the rebuild runs set ``stale`` again via the table
+        triggers, so they are never lost to the rebuild's own write.
+        """
+        self._session.execute(
+            update(PublicCalendarFeedSnapshot)
+            .where(PublicCalendarFeedSnapshot.feed_key == feed_key)
+            .values(stale=False)
+        )
+
+    def save(
+        self,
+        feed_key: str,
+        *,
+        payload: list[Any],
+        etag: str,
+        built_at: datetime,
+        truncated: bool = False,
+    ) -> None:
+        """Store a rebuilt payload (``stale`` is left as the triggers set it)."""
+        result = self._session.execute(
+            update(PublicCalendarFeedSnapshot)
+            .where(PublicCalendarFeedSnapshot.feed_key == feed_key)
+            .values(payload=payload, etag=etag, built_at=built_at, truncated=truncated)
+        )
+        if result.rowcount == 0:
+            self._session.add(
+                PublicCalendarFeedSnapshot(
+                    feed_key=feed_key,
+                    payload=payload,
+                    etag=etag,
+                    stale=False,
+                    built_at=built_at,
+                    truncated=truncated,
+                )
+            )
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import Row, and_, func, or_, select
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql.elements import ColumnElement
 
 from app.db.models.contact import Contact
 from app.db.models.enums import ContactSource, FunnelStage, LeadEventType, LeadType
 from app.db.models.sales_lead import SalesLead, SalesLeadEvent
+from app.db.models.tag import ContactTag, Tag
 from app.db.repositories.base import BaseRepository
 
 FilterCondition = ColumnElement[bool]
 
+#: Joins tag names in ``stream_export_rows`` (cannot appear in a tag name).
+EXPORT_TAG_SEPARATOR = "\x1f"
+
 
 def _escape_like_pattern(pattern: str) -> str:
     """Escape LIKE pattern special characters."""
@@ -264,216 +269,87 @@ class SalesLeadRepository(BaseRepository[SalesLead]):
         count = self._session.execute(statement).scalar_one_or_none()
         return int(count or 0)
 
-    def get_analytics(
+    def stream_export_rows(
         self,
         *,
+        batch_size: int,
+        stage: Sequence[FunnelStage] | None = None,
+        source: Sequence[ContactSource] | None = None,
+        lead_type: Sequence[LeadType] | None = None,
+        assigned_to: str | None = None,
+        unassigned: bool = False,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> dict[str, object]:
-        """Return aggregate sales lead analytics for dashboard widgets."""
-        conditions: list[FilterCondition] = []
-        if date_from is not None:
-            conditions.append(SalesLead.created_at >= date_from)
-        if date_to is not None:
-            conditions.append(SalesLead.created_at <= date_to)
-        scoped_lead_ids_subquery = select(SalesLead.id).where(*conditions).subquery()
-
-        stage_counts_raw = self._session.execute(
-            select(SalesLead.funnel_stage, func.count(SalesLead.id))
-            .where(*conditions)
-            .group_by(SalesLead.funnel_stage)
-        ).all()
-        stage_counts = {
-            FunnelStage.NEW.value: 0,
-            FunnelStage.CONTACTED.value: 0,
-            FunnelStage.ENGAGED.value: 0,
-            FunnelStage.QUALIFIED.value: 0,
-            FunnelStage.CONVERTED.value: 0,
-            FunnelStage.LOST.value: 0,
-        }
-        for stage, count in stage_counts_raw:
-            stage_counts[stage.value] = int(count)
-
-        total = sum(stage_counts.values())
-        denominator = max(total - stage_counts[FunnelStage.LOST.value], 1)
-        conversion_rate = stage_counts[FunnelStage.CONVERTED.value] / denominator
-
-        avg_days_to_convert_result = self._session.execute(
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        SalesLead.converted_at - SalesLead.created_at,  # type: ignore[operator]
-                    )
-                )
-            )
-            .where(*conditions)
-            .where(SalesLead.converted_at.is_not(None))
-        ).scalar_one_or_none()
-        avg_days_to_convert = (
-            float(avg_days_to_convert_result) / 86400.0
-            if avg_days_to_convert_result is not None
-            else None
+        search: str | None = None,
+    ) -> Iterator[Row[Any]]:
+        """Yield export columns for matching leads, newest first, via a server cursor.
+
+        Selects plain columns only (no ORM identity map); last activity, stage entry
+        and tag names come from correlated subqueries. Tag names are joined with
+        ``EXPORT_TAG_SEPARATOR``. The session must stay open while iterating.
+        """
+        conditions, _ = self._build_filter_conditions(
+            stage=stage,
+            source=source,
+            lead_type=lead_type,
+            assigned_to=assigned_to,
+            unassigned=unassigned,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
         )
-
-        source_counts_raw = self._session.execute(
-            select(Contact.source, func.count(SalesLead.id))
-            .select_from(SalesLead)
-            .join(Contact, SalesLead.contact_id == Contact.id, isouter=True)
-            .where(*conditions)
-            .group_by(Contact.source)
-        ).all()
-        source_breakdown = {
-            source.value if source is not None else "unknown": int(count)
-            for source, count in source_counts_raw
-        }
-
-        week_bucket = func.date_trunc("week", SalesLead.created_at).label("week_bucket")
-        leads_over_time_grouped = (
-            select(
-                week_bucket,
-                func.count(SalesLead.id).label("lead_count"),
+        last_event_at = (
+            select(func.max(SalesLeadEvent.created_at))
+            .where(SalesLeadEvent.lead_id == SalesLead.id)
+            .correlate(SalesLead)
+            .scalar_subquery()
+        )
+        stage_entered_at = (
+            select(func.max(SalesLeadEvent.created_at))
+            .where(
+                SalesLeadEvent.lead_id == SalesLead.id,
+                SalesLeadEvent.event_type == LeadEventType.STAGE_CHANGED,
+                SalesLeadEvent.to_stage == SalesLead.funnel_stage,
             )
-            .where(*conditions)
-            .group_by(week_bucket)
-            .subquery()
+            .correlate(SalesLead)
+            .scalar_subquery()
         )
-        leads_over_time_raw = self._session.execute(
-            select(
-                func.to_char(leads_over_time_grouped.c.week_bucket, "IYYY-IW"),
-                leads_over_time_grouped.c.lead_count,
-            ).order_by(leads_over_time_grouped.c.week_bucket.asc())
-        ).all()
-        leads_over_time = [
-            {"period": period, "count": int(count)}
-            for period, count in leads_over_time_raw
-        ]
-
-        assignee_stats_raw = self._session.execute(
+        tag_names = (
+            select(func.aggregate_strings(Tag.name, EXPORT_TAG_SEPARATOR))
+            .select_from(ContactTag)
+            .join(Tag, Tag.id == ContactTag.tag_id)
+            .where(ContactTag.contact_id == SalesLead.contact_id)
+            .correlate(SalesLead)
+            .scalar_subquery()
+        )
+        statement = (
             select(
+                SalesLead.id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.email,
+                Contact.phone_region,
+                Contact.phone_national_number,
+                Contact.source,
+                SalesLead.lead_type,
+                SalesLead.funnel_stage,
                 SalesLead.assigned_to,
-                func.count(SalesLead.id),
-                func.sum(
-                    case(
-                        (SalesLead.funnel_stage == FunnelStage.CONVERTED, 1),
-                        else_=0,
-                    )
+                SalesLead.created_at,
+                func.coalesce(
+                    last_event_at, SalesLead.updated_at, SalesLead.created_at
+                ).label("last_activity_at"),
+                func.coalesce(stage_entered_at, SalesLead.created_at).label(
+                    "stage_entered_at"
                 ),
+                tag_names.label("tag_names"),
             )
+            .select_from(SalesLead)
+            .join(Contact, SalesLead.contact_id == Contact.id, isouter=True)
             .where(*conditions)
-            .group_by(SalesLead.assigned_to)
-        ).all()
-        assignee_stats: list[dict[str, object]] = []
-        for assigned_to, assigned_total, converted_total in assignee_stats_raw:
-            total_int = int(assigned_total or 0)
-            converted_int = int(converted_total or 0)
-            assignee_stats.append(
-                {
-                    "assigned_to": assigned_to,
-                    "total": total_int,
-                    "converted": converted_int,
-                    "conversion_rate": (converted_int / total_int)
-                    if total_int
-                    else 0.0,
-                }
-            )
-
-        reached_stage_counts_raw = self._session.execute(
-            select(
-                SalesLeadEvent.to_stage,
-                func.count(func.distinct(SalesLeadEvent.lead_id)),
-            )
-            .where(
-                SalesLeadEvent.event_type.in_(
-                    [LeadEventType.CREATED, LeadEventType.STAGE_CHANGED]
-                ),
-                SalesLeadEvent.to_stage.is_not(None),
-                SalesLeadEvent.lead_id.in_(select(scoped_lead_ids_subquery.c.id)),
-            )
-            .group_by(SalesLeadEvent.to_stage)
-        ).all()
-        reached_stage_counts: dict[str, int] = {}
-        for to_stage, reached_count in reached_stage_counts_raw:
-            if to_stage is None:
-                continue
-            reached_stage_counts[to_stage.value] = int(reached_count or 0)
-
-        new_reached = reached_stage_counts.get(FunnelStage.NEW.value, 0)
-        contacted_reached = reached_stage_counts.get(FunnelStage.CONTACTED.value, 0)
-        engaged_reached = reached_stage_counts.get(FunnelStage.ENGAGED.value, 0)
-        qualified_reached = reached_stage_counts.get(FunnelStage.QUALIFIED.value, 0)
-        converted_reached = reached_stage_counts.get(FunnelStage.CONVERTED.value, 0)
-        stage_conversion_rates = {
-            "new_to_contacted": (contacted_reached / new_reached)
-            if new_reached
-            else 0.0,
-            "contacted_to_engaged": (
-                engaged_reached / contacted_reached if contacted_reached else 0.0
-            ),
-            "engaged_to_qualified": (
-                qualified_reached / engaged_reached if engaged_reached else 0.0
-            ),
-            "qualified_to_converted": (
-                converted_reached / qualified_reached if qualified_reached else 0.0
-            ),
-        }
-
-        lead_stage_timeline_subquery = (
-            select(
-                SalesLeadEvent.lead_id.label("lead_id"),
-                SalesLeadEvent.created_at.label("created_at"),
-                SalesLeadEvent.from_stage.label("from_stage"),
-                func.lag(SalesLeadEvent.created_at)
-                .over(
-                    partition_by=SalesLeadEvent.lead_id,
-                    order_by=SalesLeadEvent.created_at,
-                )
-                .label("previous_created_at"),
-            )
-            .where(
-                SalesLeadEvent.event_type.in_(
-                    [LeadEventType.CREATED, LeadEventType.STAGE_CHANGED]
-                ),
-                SalesLeadEvent.lead_id.in_(select(scoped_lead_ids_subquery.c.id)),
-            )
-            .subquery()
+            .order_by(SalesLead.created_at.desc(), SalesLead.id.desc())
+            .execution_options(stream_results=True, yield_per=batch_size)
         )
-        avg_days_in_stage_raw = self._session.execute(
-            select(
-                lead_stage_timeline_subquery.c.from_stage,
-                (
-                    func.avg(
-                        func.extract(
-                            "epoch",
-                            lead_stage_timeline_subquery.c.created_at
-                            - lead_stage_timeline_subquery.c.previous_created_at,  # type: ignore[operator]
-                        )
-                    )
-                    / 86400.0
-                ).label("avg_days"),
-            )
-            .where(
-                lead_stage_timeline_subquery.c.from_stage.is_not(None),
-                lead_stage_timeline_subquery.c.previous_created_at.is_not(None),
-            )
-            .group_by(lead_stage_timeline_subquery.c.from_stage)
-        ).all()
-        avg_days_in_stage: dict[str, float] = {}
-        for from_stage, avg_days in avg_days_in_stage_raw:
-            if from_stage is None or avg_days is None:
-                continue
-            avg_days_in_stage[from_stage.value] = float(avg_days)
-
-        return {
-            "funnel": stage_counts,
-            "conversion_rate": conversion_rate,
-            "avg_days_to_convert": avg_days_to_convert,
-            "source_breakdown": source_breakdown,
-            "stage_conversion_rates": stage_conversion_rates,
-            "avg_days_in_stage": avg_days_in_stage,
-            "leads_over_time": leads_over_time,
-            "assignee_stats": assignee_stats,
-        }
+        yield from self._session.execute(statement)
 
     def _resolve_sort_column(self, *, sort: str):
         if sort == "updated_at":
@@ -0,0 +1,70 @@
+"""Repository for sales lead export jobs."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.sales_lead_export_job import (
+    SalesLeadExportJob,
+    SalesLeadExportJobStatus,
+)
+from app.db.repositories.base import BaseRepository
+
+
+class SalesLeadExportJobRepository(BaseRepository[SalesLeadExportJob]):
+    def __init__(self, session: Session):
+        super().__init__(session, SalesLeadExportJob)
+
+    def get_for_actor(
+        self, job_id: UUID, *, actor_sub: str
+    ) -> SalesLeadExportJob | None:
+        stmt = select(SalesLeadExportJob).where(
+            SalesLeadExportJob.id == job_id,
+            SalesLeadExportJob.created_by == actor_sub,
+        )
+        return self._session.execute(stmt).scalar_one_or_none()
+
+    def mark_processing(self, job: SalesLeadExportJob, *, total_count: int) -> None:
+        job.status = SalesLeadExportJobStatus.PROCESSING
+        job.total_count = total_count
+        job.exported_count = 0
+        job.error_message = None
+        job.updated_at = datetime.now(UTC)
+        self.update(job)
+
+    def record_progress(self, job_id: UUID, *, exported_count: int) -> None:
+        """Store rows written so far (also refreshes ``updated_at`` as a heartbeat)."""
+        self._session.execute(
+            update(SalesLeadExportJob)
+            .where(
+                SalesLeadExportJob.id == job_id,
+                SalesLeadExportJob.status == SalesLeadExportJobStatus.PROCESSING,
+            )
+            .values(exported_count=exported_count, updated_at=datetime.now(UTC))
+        )
+
+    def mark_succeeded(
+        self,
+        job: SalesLeadExportJob,
+        *,
+        s3_key: str,
+        exported_count: int,
+        byte_size: int,
+    ) -> None:
+        job.status = SalesLeadExportJobStatus.SUCCEEDED
+        job.s3_key = s3_key
+        job.exported_count = exported_count
+        job.byte_size = byte_size
+        job.error_message = None
+        job.updated_at = datetime.now(UTC)
+        self.update(job)
+
+    def mark_failed(self, job: SalesLeadExportJob, message: str) -> None:
+        job.status = SalesLeadExportJobStatus.FAILED
+        job.error_message = message[:8000]
+        job.updated_at = datetime.now(UTC)
+        self.update(job)
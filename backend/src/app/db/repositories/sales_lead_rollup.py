@@ -0,0 +1,143 @@
+"""Repository for the daily sales lead analytics rollups."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import Row, delete, func, or_, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.models.contact import Contact
+from app.db.models.enums import ContactSource, FunnelStage, LeadEventType
+from app.db.models.sales_lead import SalesLead, SalesLeadEvent
+from app.db.models.sales_lead_rollup import (
+    SalesLeadDailyRollup,
+    SalesLeadRollupDirtyDay,
+    SalesLeadStageDailyRollup,
+)
+
+_STAGE_EVENT_TYPES = (LeadEventType.CREATED, LeadEventType.STAGE_CHANGED)
+
+
+class SalesLeadRollupRepository:
+    """Read/write daily rollups and the lead rows they are computed from."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def claim_dirty_days(self) -> list[date]:
+        """Delete and return every dirty day (row locks held until commit).
+
+        Writers upsert ``sales_lead_rollup_dirty_days`` from triggers, so a write
+        racing this claim either blocks until the recompute commits (and marks the
+        day dirty again) or is already visible to the recompute.
+        """
+        statement = delete(SalesLeadRollupDirtyDay).returning(
+            SalesLeadRollupDirtyDay.day
+        )
+        return sorted(self._session.execute(statement).scalars().all())
+
+    def created_day_bounds(self) -> tuple[datetime | None, datetime | None]:
+        """Earliest and latest ``sales_leads.created_at``."""
+        row = self._session.execute(
+            select(func.min(SalesLead.created_at), func.max(SalesLead.created_at))
+        ).one()
+        return row[0], row[1]
+
+    def lead_facts(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+    ) -> Sequence[
+        Row[
+            tuple[
+                UUID,
+                datetime,
+                FunnelStage,
+                ContactSource | None,
+                str | None,
+                datetime | None,
+            ]
+        ]
+    ]:
+        """Per-lead columns the rollups aggregate (no ORM objects)."""
+        statement = (
+            select(
+                SalesLead.id,
+                SalesLead.created_at,
+                SalesLead.funnel_stage,
+                Contact.source,
+                SalesLead.assigned_to,
+                SalesLead.converted_at,
+            )
+            .select_from(SalesLead)
+            .join(Contact, SalesLead.contact_id == Contact.id, isouter=True)
+            .where(*conditions)
+        )
+        return self._session.execute(statement).all()
+
+    def stage_events(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+    ) -> Sequence[Row[tuple[UUID, FunnelStage | None, FunnelStage | None, datetime]]]:
+        """Created / stage-changed events of matching leads, per lead in time order."""
+        statement = (
+            select(
+                SalesLeadEvent.lead_id,
+                SalesLeadEvent.from_stage,
+                SalesLeadEvent.to_stage,
+                SalesLeadEvent.created_at,
+            )
+            .where(
+                SalesLeadEvent.event_type.in_(_STAGE_EVENT_TYPES),
+                SalesLeadEvent.lead_id.in_(select(SalesLead.id).where(*conditions)),
+            )
+            .order_by(SalesLeadEvent.lead_id, SalesLeadEvent.created_at)
+        )
+        return self._session.execute(statement).all()
+
+    def replace_days(
+        self,
+        days: Sequence[date],
+        *,
+        daily: Sequence[SalesLeadDailyRollup],
+        stages: Sequence[SalesLeadStageDailyRollup],
+    ) -> None:
+        """Swap the rollups of ``days`` for freshly computed rows."""
+        day_list = list(days)
+        self._session.execute(
+            delete(SalesLeadDailyRollup).where(SalesLeadDailyRollup.day.in_(day_list))
+        )
+        self._session.execute(
+            delete(SalesLeadStageDailyRollup).where(
+                SalesLeadStageDailyRollup.day.in_(day_list)
+            )
+        )
+        self._session.add_all([*daily, *stages])
+        self._session.flush()
+
+    def delete_outside(self, first: date | None, last: date | None) -> None:
+        """Drop rollups for days outside ``[first, last]`` (all when either is None)."""
+        for model in (SalesLeadDailyRollup, SalesLeadStageDailyRollup):
+            statement = delete(model)
+            if first is not None and last is not None:
+                statement = statement.where(or_(model.day < first, model.day > last))
+            self._session.execute(statement)
+
+    def list_rollups(
+        self,
+        first: date | None,
+        last: date | None,
+    ) -> tuple[list[SalesLeadDailyRollup], list[SalesLeadStageDailyRollup]]:
+        """Rollup rows for ``[first, last]`` (``None`` leaves that side open)."""
+        out: list[list] = []
+        for model in (SalesLeadDailyRollup, SalesLeadStageDailyRollup):
+            statement = select(model)
+            if first is not None:
+                statement = statement.where(model.day >= first)
+            if last is not None:
+                statement = statement.where(model.day <= last)
+            out.append(list(self._session.execute(statement).scalars().all()))
+        return out[0], out[1]
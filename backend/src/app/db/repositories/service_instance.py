@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, cast, func, literal, or_, select, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql import ColumnElement
 
@@ -468,6 +469,68 @@ class ServiceInstanceRepository(BaseRepository[ServiceInstance]):
         rows = self._session.execute(statement).all()
         return {row[0]: int(row[1]) for row in rows}
 
+    def reconcile_capacity_status(
+        self, instance_ids: Sequence[UUID] | None = None
+    ) -> dict[UUID, InstanceStatus]:
+        """Flip FULL/OPEN from enrollment counts in one ``UPDATE ... FROM``.
+
+        Considers capped instances in ``instance_ids`` (all capped instances when
+        ``None``). Sets ``full`` on ``scheduled``/``open`` rows with no seats left
+        and ``open`` on ``full`` rows with seats free; other statuses are left
+        alone. Returns the new status of each changed row. Loaded ORM objects
+        are not refreshed; callers holding them apply the returned statuses.
+        """
+        if instance_ids is not None and not instance_ids:
+            return {}
+        counts = (
+            select(
+                ServiceInstance.id.label("instance_id"),
+                func.count(Enrollment.id).label("used"),
+            )
+            .select_from(ServiceInstance)
+            .outerjoin(
+                Enrollment,
+                and_(
+                    Enrollment.instance_id == ServiceInstance.id,
+                    Enrollment.status.in_(CAPACITY_ENROLLMENT_STATUSES),
+                ),
+            )
+            .where(ServiceInstance.max_capacity.is_not(None))
+            .group_by(ServiceInstance.id)
+        )
+        if instance_ids is not None:
+            counts = counts.where(ServiceInstance.id.in_(list(instance_ids)))
+        counts_subquery = counts.subquery()
+        at_capacity = counts_subquery.c.used >= ServiceInstance.max_capacity
+        statement = (
+            update(ServiceInstance)
+            .where(ServiceInstance.id == counts_subquery.c.instance_id)
+            .where(
+                or_(
+                    and_(
+                        at_capacity,
+                        ServiceInstance.status.in_(
+                            [InstanceStatus.SCHEDULED, InstanceStatus.OPEN]
+                        ),
+                    ),
+                    and_(~at_capacity, ServiceInstance.status == InstanceStatus.FULL),
+                )
+            )
+            .values(
+                status=cast(
+                    case(
+                        (at_capacity, literal(InstanceStatus.FULL.value)),
+                        else_=literal(InstanceStatus.OPEN.value),
+                    ),
+                    ServiceInstance.status.type,
+                )
+            )
+            .returning(ServiceInstance.id, ServiceInstance.status)
+            .execution_options(synchronize_session=False)
+        )
+        rows = self._session.execute(statement).all()
+        return {row[0]: InstanceStatus(row[1]) for row in rows}
+
     def get_waitlist_count(self, instance_id: UUID) -> int:
         """Return waitlist count for an instance."""
         statement = (
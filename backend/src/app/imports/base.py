@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from collections.abc import MutableMapping
 from collections.abc import Sequence
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import replace
+from pathlib import Path
 from typing import Any
 from typing import ClassVar
 from typing import Protocol
@@ -15,6 +17,8 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.imports.mysqldump_stream import DumpSource
+from app.imports.mysqldump_stream import scan_dump_file
 from app.utils.logging import mask_email
 from app.utils.logging import mask_pii
 
@@ -59,13 +63,16 @@ class ImporterContext:
     district_map: Mapping[int, str] | None = None
     #: Legacy row keys (string form of PK, e.g. venue id) to skip for this run.
     skip_legacy_keys: frozenset[str] = field(default_factory=frozenset)
-    #: Full mysqldump text (optional; used by importers that need a second parse pass).
-    source_sql_text: str | None = None
+    #: Full mysqldump text or a streamed :class:`ScannedDump` (optional; used by
+    #: importers that need a second parse pass).
+    source_sql_text: DumpSource | None = None
     #: Existing ``lower(email)`` / ``lower(instagram_handle)`` → contact id (contacts importer).
     email_to_contact_id: Mapping[str, UUID] = field(default_factory=dict)
     instagram_to_contact_id: Mapping[str, UUID] = field(default_factory=dict)
     #: ``event_instances`` importer: ``str(service.id)`` → service_key for instance slug preview.
     event_service_key_by_uuid: Mapping[str, str] = field(default_factory=dict)
+    #: Rows per multi-row ``INSERT`` in bulk apply mode; ``None`` keeps per-row flushes.
+    bulk_chunk_size: int | None = None
 
 
 @dataclass
@@ -108,9 +115,13 @@ class LegacyImporter(Protocol):
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    #: True when ``apply`` honours ``ImporterContext.bulk_chunk_size`` (see ``app.imports.bulk``).
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = False
+    #: Legacy dump tables read by ``parse``/``apply``; lets callers stream-scan only these.
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ()
 
-    def parse(self, sql_text: str) -> Sequence[Any]:
-        """Parse mysqldump text into row records."""
+    def parse(self, sql_text: DumpSource) -> Sequence[Any]:
+        """Parse mysqldump text (or a streamed scan) into row records."""
         ...
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -152,14 +163,21 @@ def check_dependencies(
     session: Session,
     *,
     dry_run: bool,
+    ref_maps: Mapping[str, Mapping[str, UUID]] | None = None,
 ) -> None:
-    """Raise ``DependencyNotMet`` for missing parent refs in non-dry-run mode."""
+    """Raise ``DependencyNotMet`` for missing parent refs in non-dry-run mode.
+
+    Dependencies already loaded into ``ref_maps`` are checked in memory.
+    """
     if dry_run:
         return
     from app.imports import refs
 
     for dep in importer.DEPENDS_ON:
-        if refs.has_mapping(session, dep):
+        if ref_maps is not None and dep in ref_maps:
+            if ref_maps[dep]:
+                continue
+        elif refs.has_mapping(session, dep):
             continue
         if dep in _OPTIONAL_LEGACY_IMPORT_DEPS:
             continue
@@ -169,21 +187,71 @@ def check_dependencies(
         )
 
 
+def supports_bulk_apply(importer: LegacyImporter) -> bool:
+    """Return True when the importer implements bulk apply mode."""
+    return bool(getattr(importer, "SUPPORTS_BULK_APPLY", False))
+
+
+def load_dump_source(importer: LegacyImporter, path: Path) -> DumpSource:
+    """Load ``path`` for ``importer``: one streamed scan of its ``SOURCE_TABLES``.
+
+    Importers that do not declare ``SOURCE_TABLES`` get the full dump text.
+    """
+    return load_dump_source_for((importer,), path)
+
+
+def load_dump_source_for(
+    importers: Sequence[LegacyImporter],
+    path: Path,
+) -> DumpSource:
+    """One streamed scan of the union of ``importers``' ``SOURCE_TABLES``.
+
+    Falls back to the full dump text when any importer does not declare its tables.
+    """
+    tables: list[str] = []
+    for importer in importers:
+        declared = tuple(getattr(importer, "SOURCE_TABLES", ()))
+        if not declared:
+            return path.read_text(encoding="utf-8", errors="replace")
+        tables.extend(t for t in declared if t not in tables)
+    return scan_dump_file(path, tuple(tables))
+
+
 def resolve_importer_context(
     importer: LegacyImporter,
     session: Session,
     *,
     dry_run: bool,
     skip_legacy_keys: frozenset[str] | None = None,
-    source_sql_text: str | None = None,
+    source_sql_text: DumpSource | None = None,
+    bulk_chunk_size: int | None = None,
+    ref_maps: MutableMapping[str, Mapping[str, UUID]] | None = None,
 ) -> ImporterContext:
-    """Resolve importer context and attach dependency ref maps."""
-    check_dependencies(importer, session, dry_run=dry_run)
+    """Resolve importer context and attach dependency ref maps.
+
+    When ``ref_maps`` is given (multi-entity runs), dependency maps are taken from it
+    and any map loaded from ``legacy_import_refs`` is stored back for later entities.
+    """
+    if bulk_chunk_size is not None:
+        if bulk_chunk_size <= 0:
+            msg = "bulk_chunk_size must be a positive integer"
+            raise ValueError(msg)
+        if not supports_bulk_apply(importer):
+            msg = f"Importer {importer.ENTITY!r} does not support bulk apply"
+            raise ValueError(msg)
+    check_dependencies(importer, session, dry_run=dry_run, ref_maps=ref_maps)
 
     from app.imports import refs
 
     base_ctx = importer.resolve_context(session, dry_run=dry_run)
-    refs_by = {dep: refs.load_mapping(session, dep) for dep in importer.DEPENDS_ON}
+    refs_by: dict[str, Mapping[str, UUID]] = {}
+    for dep in importer.DEPENDS_ON:
+        if ref_maps is not None and dep in ref_maps:
+            refs_by[dep] = ref_maps[dep]
+            continue
+        refs_by[dep] = refs.load_mapping(session, dep)
+        if ref_maps is not None:
+            ref_maps[dep] = refs_by[dep]
     merged_skip = frozenset(base_ctx.skip_legacy_keys)
     if skip_legacy_keys:
         merged_skip |= skip_legacy_keys
@@ -204,4 +272,5 @@ def resolve_importer_context(
         source_sql_text=sql_text,
         email_to_contact_id=merged_email,
         instagram_to_contact_id=merged_insta,
+        bulk_chunk_size=bulk_chunk_size,
     )
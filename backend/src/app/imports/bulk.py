@@ -0,0 +1,156 @@
+"""Row writers used by legacy importers (per-row flush or chunked bulk inserts)."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.imports import refs
+
+#: Default rows per multi-row ``INSERT`` when bulk apply is requested.
+DEFAULT_BULK_CHUNK_SIZE = 1000
+
+
+@cache
+def _table_order(metadata: MetaData) -> dict[Table, int]:
+    return {table: i for i, table in enumerate(metadata.sorted_tables)}
+
+
+def _flush_rank(model: type[Any]) -> int:
+    """Position of ``model``'s table in FK dependency order (parents first)."""
+    table = model.__table__
+    return _table_order(table.metadata).get(table, -1)
+
+
+class ImportWriter(Protocol):
+    """Write target rows and ``legacy_import_refs`` for one importer run."""
+
+    def insert(self, model: type[Any], values: Mapping[str, Any]) -> UUID:
+        """Insert one row and return its primary key."""
+        ...
+
+    def add(self, model: type[Any], values: Mapping[str, Any]) -> None:
+        """Insert one row whose primary key the caller does not need."""
+        ...
+
+    def record_ref(self, entity: str, legacy_key: str, new_id: UUID) -> None:
+        """Record ``legacy_key → new_id`` (idempotent)."""
+        ...
+
+    def finish(self) -> None:
+        """Write anything still buffered (before the caller commits)."""
+        ...
+
+
+class RowWriter:
+    """Default writer: ``session.add`` + ``flush`` per row so the DB assigns IDs."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def insert(self, model: type[Any], values: Mapping[str, Any]) -> UUID:
+        obj = model(**values)
+        self._session.add(obj)
+        self._session.flush()
+        oid = obj.id
+        return oid if isinstance(oid, UUID) else UUID(str(oid))
+
+    def add(self, model: type[Any], values: Mapping[str, Any]) -> None:
+        self._session.add(model(**values))
+
+    def record_ref(self, entity: str, legacy_key: str, new_id: UUID) -> None:
+        refs.record_mapping(self._session, entity, legacy_key, new_id)
+
+    def finish(self) -> None:
+        return None
+
+
+class BulkWriter:
+    """Buffer rows with client-side UUIDs and write them in multi-row ``INSERT``s.
+
+    Buffers are flushed in foreign-key dependency order (``MetaData.sorted_tables``,
+    so parents before children regardless of which model was buffered first), then
+    ref mappings, whenever the buffered total reaches ``chunk_size`` and on
+    :meth:`finish`.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size <= 0:
+            msg = "chunk_size must be positive"
+            raise ValueError(msg)
+        self._session = session
+        self._chunk_size = chunk_size
+        self._rows: dict[type[Any], list[dict[str, Any]]] = {}
+        self._refs: dict[str, dict[str, UUID]] = {}
+        self._buffered = 0
+
+    def insert(self, model: type[Any], values: Mapping[str, Any]) -> UUID:
+        row = dict(values)
+        new_id = row.get("id")
+        if new_id is None:
+            new_id = uuid.uuid4()
+            row["id"] = new_id
+        self._buffer(model, row)
+        return new_id if isinstance(new_id, UUID) else UUID(str(new_id))
+
+    def add(self, model: type[Any], values: Mapping[str, Any]) -> None:
+        self.insert(model, values)
+
+    def record_ref(self, entity: str, legacy_key: str, new_id: UUID) -> None:
+        by_key = self._refs.setdefault(entity, {})
+        if legacy_key in by_key:
+            return
+        by_key[legacy_key] = new_id
+        self._buffered += 1
+        self._maybe_flush()
+
+    def finish(self) -> None:
+        self._flush()
+
+    def _buffer(self, model: type[Any], row: dict[str, Any]) -> None:
+        self._rows.setdefault(model, []).append(row)
+        self._buffered += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self._buffered >= self._chunk_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        for model in sorted(self._rows, key=_flush_rank):
+            rows = self._rows[model]
+            for start in range(0, len(rows), self._chunk_size):
+                chunk = rows[start : start + self._chunk_size]
+                self._session.execute(insert(model).values(chunk))
+            rows.clear()
+        for entity, mappings in self._refs.items():
+            if mappings:
+                refs.record_mappings(
+                    self._session,
+                    entity,
+                    mappings,
+                    chunk_size=self._chunk_size,
+                )
+                mappings.clear()
+        self._buffered = 0
+
+
+def make_writer(session: Session, *, bulk_chunk_size: int | None) -> ImportWriter:
+    """Return a :class:`BulkWriter` when ``bulk_chunk_size`` is set, else :class:`RowWriter`."""
+    if bulk_chunk_size:
+        return BulkWriter(session, chunk_size=bulk_chunk_size)
+    return RowWriter(session)
@@ -14,10 +14,12 @@ from app.db.models.enums import DiscountType
 from app.db.models.enums import EnrollmentStatus
 from app.db.models.enums import EventCategory
 from app.db.models.enums import ServiceDeliveryMode
-from app.imports import mysqldump
-from app.imports.entities._mysqldump_rows import iter_row_dicts
 from app.imports.entities._legacy_family_common import _parse_dt
 from app.imports.entities._legacy_family_common import _parse_int
+from app.imports.entities._mysqldump_rows import create_table_columns
+from app.imports.entities._mysqldump_rows import insert_rows
+from app.imports.entities._mysqldump_rows import iter_row_dicts
+from app.imports.mysqldump_stream import DumpSource
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -582,15 +584,13 @@ def _legacy_event_title(rd: dict[str, str | None]) -> str | None:
     return None
 
 
-def parse_legacy_venue_id_to_name(sql_text: str) -> dict[int, str]:
+def parse_legacy_venue_id_to_name(sql_text: DumpSource) -> dict[int, str]:
     """Map legacy venue id → trimmed name for delivery-mode heuristics."""
-    stmt = mysqldump.extract_insert_statement(sql_text, "venue")
-    if stmt is None:
+    found = insert_rows(sql_text, "venue")
+    if found is None:
         return {}
-    rest = mysqldump.extract_values_sql_fragment(stmt)
     out: dict[int, str] = {}
-    for g in mysqldump.iter_groups(rest):
-        fields = mysqldump.split_fields(g)
+    for fields in found[1]:
         if len(fields) < 2:
             continue
         try:
@@ -603,7 +603,7 @@ def parse_legacy_venue_id_to_name(sql_text: str) -> dict[int, str]:
     return out
 
 
-def parse_legacy_labels(sql_text: str) -> list[LegacyLabel]:
+def parse_legacy_labels(sql_text: DumpSource) -> list[LegacyLabel]:
     rows: list[LegacyLabel] = []
     for rd in iter_row_dicts(
         sql_text,
@@ -627,7 +627,7 @@ def parse_legacy_labels(sql_text: str) -> list[LegacyLabel]:
     return rows
 
 
-def parse_legacy_events(sql_text: str) -> list[LegacyEvent]:
+def parse_legacy_events(sql_text: DumpSource) -> list[LegacyEvent]:
     venue_names = parse_legacy_venue_id_to_name(sql_text)
     rows: list[LegacyEvent] = []
     for rd in iter_row_dicts(
@@ -658,7 +658,7 @@ def parse_legacy_events(sql_text: str) -> list[LegacyEvent]:
     return rows
 
 
-def parse_legacy_event_dates(sql_text: str) -> list[LegacyEventDate]:
+def parse_legacy_event_dates(sql_text: DumpSource) -> list[LegacyEventDate]:
     rows: list[LegacyEventDate] = []
     for rd in iter_row_dicts(
         sql_text,
@@ -687,8 +687,8 @@ def parse_legacy_event_dates(sql_text: str) -> list[LegacyEventDate]:
     return rows
 
 
-def _event_label_positional_from_create(sql_text: str) -> dict[int, str]:
-    cols = mysqldump.parse_create_table_column_names(sql_text, "event_label")
+def _event_label_positional_from_create(sql_text: DumpSource) -> dict[int, str]:
+    cols = create_table_columns(sql_text, "event_label")
     if cols is None:
         return _EVENT_LABEL_POS_EVENT_FIRST
     lower = [c.lower() for c in cols]
@@ -701,7 +701,7 @@ def _event_label_positional_from_create(sql_text: str) -> dict[int, str]:
     return _EVENT_LABEL_POS_EVENT_FIRST
 
 
-def parse_legacy_event_labels(sql_text: str) -> list[LegacyEventLabel]:
+def parse_legacy_event_labels(sql_text: DumpSource) -> list[LegacyEventLabel]:
     pos = _event_label_positional_from_create(sql_text)
     rows: list[LegacyEventLabel] = []
     for rd in iter_row_dicts(sql_text, "event_label", positional=pos):
@@ -720,7 +720,7 @@ def parse_legacy_event_labels(sql_text: str) -> list[LegacyEventLabel]:
     return rows
 
 
-def parse_legacy_registrations(sql_text: str) -> list[LegacyRegistration]:
+def parse_legacy_registrations(sql_text: DumpSource) -> list[LegacyRegistration]:
     rows: list[LegacyRegistration] = []
     for rd in iter_row_dicts(
         sql_text,
@@ -754,7 +754,7 @@ def parse_legacy_registrations(sql_text: str) -> list[LegacyRegistration]:
     return rows
 
 
-def parse_legacy_discounts(sql_text: str) -> list[LegacyDiscount]:
+def parse_legacy_discounts(sql_text: DumpSource) -> list[LegacyDiscount]:
     rows: list[LegacyDiscount] = []
     for rd in iter_row_dicts(
         sql_text,
@@ -6,9 +6,10 @@ from dataclasses import dataclass
 from datetime import date
 from datetime import datetime
 
-from app.imports import mysqldump
+from app.imports.entities._mysqldump_rows import insert_rows
 from app.imports.entities._mysqldump_rows import iter_row_dicts
 from app.imports.entities.venues import parse_legacy_districts
+from app.imports.mysqldump_stream import DumpSource
 
 
 @dataclass(frozen=True)
@@ -194,7 +195,7 @@ def _table_iter_kwargs(table: str) -> tuple[dict[int, str], tuple[dict[int, str]
 
 
 def _iter_row_dicts(
-    sql_text: str,
+    sql_text: DumpSource,
     table: str,
 ) -> list[dict[str, str | None]]:
     pos, fallbacks = _table_iter_kwargs(table)
@@ -206,7 +207,7 @@ def _iter_row_dicts(
     )
 
 
-def parse_legacy_family_rows(sql_text: str) -> list[LegacyFamilyRow]:
+def parse_legacy_family_rows(sql_text: DumpSource) -> list[LegacyFamilyRow]:
     districts = parse_legacy_districts(sql_text)
     rows: list[LegacyFamilyRow] = []
     for rd in _iter_row_dicts(sql_text, "family"):
@@ -233,7 +234,7 @@ def parse_legacy_family_rows(sql_text: str) -> list[LegacyFamilyRow]:
 
 
 def eligible_household_legacy_family_ids(
-    sql_text: str,
+    sql_text: DumpSource,
     *,
     min_active_persons: int = 2,
 ) -> frozenset[int]:
@@ -253,7 +254,7 @@ def eligible_household_legacy_family_ids(
     return frozenset(fid for fid, n in counts.items() if n >= min_active_persons)
 
 
-def legacy_family_id_to_person_kinds(sql_text: str) -> dict[int, set[str]]:
+def legacy_family_id_to_person_kinds(sql_text: DumpSource) -> dict[int, set[str]]:
     """Read-only scan of ``person`` rows: map legacy family id → distinct kinds."""
     out: dict[int, set[str]] = {}
     for rd in _iter_row_dicts(sql_text, "person"):
@@ -268,7 +269,7 @@ def legacy_family_id_to_person_kinds(sql_text: str) -> dict[int, set[str]]:
     return out
 
 
-def parse_legacy_person_rows(sql_text: str) -> list[LegacyPersonRow]:
+def parse_legacy_person_rows(sql_text: DumpSource) -> list[LegacyPersonRow]:
     rows: list[LegacyPersonRow] = []
     for rd in _iter_row_dicts(sql_text, "person"):
         lid = _parse_int(rd.get("id"))
@@ -308,8 +309,8 @@ def parse_legacy_person_rows(sql_text: str) -> list[LegacyPersonRow]:
     return rows
 
 
-def parse_legacy_country_dial_codes(sql_text: str) -> dict[int, str]:
-    if mysqldump.extract_insert_statement(sql_text, "country") is None:
+def parse_legacy_country_dial_codes(sql_text: DumpSource) -> dict[int, str]:
+    if insert_rows(sql_text, "country") is None:
         return {}
     out: dict[int, str] = {}
     for rd in _iter_row_dicts(sql_text, "country"):
@@ -321,7 +322,7 @@ def parse_legacy_country_dial_codes(sql_text: str) -> dict[int, str]:
     return out
 
 
-def parse_legacy_notes(sql_text: str) -> list[LegacyNoteRow]:
+def parse_legacy_notes(sql_text: DumpSource) -> list[LegacyNoteRow]:
     rows: list[LegacyNoteRow] = []
     for rd in _iter_row_dicts(sql_text, "note"):
         lid = _parse_int(rd.get("id"))
@@ -338,10 +339,9 @@ def parse_legacy_notes(sql_text: str) -> list[LegacyNoteRow]:
     return rows
 
 
-def parse_legacy_person_notes(sql_text: str) -> list[tuple[int, int]]:
+def parse_legacy_person_notes(sql_text: DumpSource) -> list[tuple[int, int]]:
     """Return (note_id, person_id) pairs from ``person_note``."""
-    stmt = mysqldump.extract_insert_statement(sql_text, "person_note")
-    if stmt is None:
+    if insert_rows(sql_text, "person_note") is None:
         return []
     pairs: list[tuple[int, int]] = []
     for rd in _iter_row_dicts(sql_text, "person_note"):
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.db.models import GeographicArea
 from app.db.models import Location
+from app.imports.bulk import ImportWriter
 
 
 def hk_country_id(session: Session) -> UUID:
@@ -80,22 +81,22 @@ def parse_lat_lng(
 
 
 def create_location_from_legacy_address(
-    session: Session,
+    writer: ImportWriter,
     *,
     area_id: UUID,
     name: str | None,
     address: str | None,
     latitude: str | None,
     longitude: str | None,
-) -> Location:
+) -> UUID:
     lat, lng = parse_lat_lng(latitude, longitude)
-    loc = Location(
-        area_id=area_id,
-        name=name,
-        address=address,
-        lat=lat,
-        lng=lng,
+    return writer.insert(
+        Location,
+        {
+            "area_id": area_id,
+            "name": name,
+            "address": address,
+            "lat": lat,
+            "lng": lng,
+        },
     )
-    session.add(loc)
-    session.flush()
-    return loc
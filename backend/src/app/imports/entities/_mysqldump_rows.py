@@ -1,25 +1,35 @@
-"""Shared mysqldump row iteration for legacy entity parsers."""
+"""Shared mysqldump row iteration for legacy entity parsers.
+
+Parsers accept a :data:`DumpSource`: either the full dump text (tokenized on demand
+per table) or a :class:`~app.imports.mysqldump_stream.ScannedDump` produced by one
+streaming pass over the dump file. Both read every ``INSERT`` for a table.
+"""
 
 from __future__ import annotations
 
+import io
 from collections.abc import Sequence
 
 from app.imports import mysqldump
+from app.imports.mysqldump_stream import DumpSource
+from app.imports.mysqldump_stream import ScannedDump
+from app.imports.mysqldump_stream import scan_dump
+
+Fields = Sequence[str | None]
 
 
 def _resolve_column_names(
-    sql_text: str,
+    sql_text: DumpSource,
     table: str,
-    stmt: str,
-    fields: list[str | None],
+    insert_cols: list[str] | None,
+    fields: Fields,
     positional: dict[int, str],
     *,
     positional_fallbacks: Sequence[dict[int, str]] = (),
 ) -> list[str] | None:
-    insert_cols = mysqldump.parse_insert_column_names(stmt)
     if insert_cols is not None and len(insert_cols) == len(fields):
         return insert_cols
-    create_cols = mysqldump.parse_create_table_column_names(sql_text, table)
+    create_cols = create_table_columns(sql_text, table)
     if create_cols is not None and len(create_cols) == len(fields):
         return create_cols
     if len(fields) == len(positional):
@@ -31,10 +41,10 @@ def _resolve_column_names(
 
 
 def _row_dict(
-    sql_text: str,
+    sql_text: DumpSource,
     table: str,
-    stmt: str,
-    fields: list[str | None],
+    insert_cols: list[str] | None,
+    fields: Fields,
     positional: dict[int, str],
     *,
     positional_fallbacks: Sequence[dict[int, str]] = (),
@@ -42,44 +52,76 @@ def _row_dict(
     names = _resolve_column_names(
         sql_text,
         table,
-        stmt,
+        insert_cols,
         fields,
         positional,
         positional_fallbacks=positional_fallbacks,
     )
     if names is not None and len(names) == len(fields):
         return {names[i]: fields[i] for i in range(len(fields))}
-    return mysqldump.row_dict_from_fields(None, fields, positional_fallback=positional)
+    return mysqldump.row_dict_from_fields(
+        None,
+        list(fields),
+        positional_fallback=positional,
+    )
 
 
-def _extract_insert(sql_text: str, table: str) -> str:
-    stmt = mysqldump.extract_insert_statement(sql_text, table)
-    if stmt is None:
+def create_table_columns(sql_text: DumpSource, table: str) -> list[str] | None:
+    """Column names from the dump's ``CREATE TABLE`` for ``table``, if present."""
+    if isinstance(sql_text, ScannedDump):
+        entry = sql_text.table(table)
+        return entry.create_columns if entry is not None else None
+    return mysqldump.parse_create_table_column_names(sql_text, table)
+
+
+def insert_rows(
+    sql_text: DumpSource,
+    table: str,
+) -> tuple[list[str] | None, list[Fields]] | None:
+    """``(insert_columns, rows)`` for ``table``, or ``None`` when it has no ``INSERT``.
+
+    Rows from every ``INSERT`` for the table are returned in dump order; column
+    names come from the first statement that lists them.
+    """
+    scanned = (
+        sql_text
+        if isinstance(sql_text, ScannedDump)
+        else scan_dump(io.StringIO(sql_text), (table,))
+    )
+    entry = scanned.table(table)
+    if entry is None or not entry.has_insert:
+        return None
+    return entry.insert_columns, list(entry.rows)
+
+
+def require_insert_rows(
+    sql_text: DumpSource,
+    table: str,
+) -> tuple[list[str] | None, list[Fields]]:
+    """Like :func:`insert_rows` but raise ``ValueError`` when the table is missing."""
+    found = insert_rows(sql_text, table)
+    if found is None:
         msg = f"Could not find INSERT INTO `{table}` in dump."
         raise ValueError(msg)
-    return stmt
+    return found
 
 
 def iter_row_dicts(
-    sql_text: str,
+    sql_text: DumpSource,
     table: str,
     *,
     positional: dict[int, str],
     positional_fallbacks: Sequence[dict[int, str]] = (),
 ) -> list[dict[str, str | None]]:
-    stmt = _extract_insert(sql_text, table)
-    values_sql = mysqldump.extract_values_sql_fragment(stmt)
-    out: list[dict[str, str | None]] = []
-    for g in mysqldump.iter_groups(values_sql):
-        fields = mysqldump.split_fields(g)
-        out.append(
-            _row_dict(
-                sql_text,
-                table,
-                stmt,
-                fields,
-                positional,
-                positional_fallbacks=positional_fallbacks,
-            ),
+    insert_cols, rows = require_insert_rows(sql_text, table)
+    return [
+        _row_dict(
+            sql_text,
+            table,
+            insert_cols,
+            fields,
+            positional,
+            positional_fallbacks=positional_fallbacks,
         )
-    return out
+        for fields in rows
+    ]
@@ -8,9 +8,9 @@ from typing import Any
 from typing import ClassVar
 from uuid import UUID
 
+from sqlalchemy import exists
 from sqlalchemy import func
 from sqlalchemy import select
-from sqlalchemy import exists
 from sqlalchemy.orm import Session
 
 from app.db.models import Contact
@@ -22,15 +22,17 @@ from app.db.models.enums import FamilyRole
 from app.db.models.enums import MailchimpSyncStatus
 from app.db.models.enums import OrganizationRole
 from app.db.models.enums import RelationshipType
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
 from app.imports.base import preview_line_email
+from app.imports.bulk import ImportWriter
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_family_common import LegacyPersonRow
 from app.imports.entities._legacy_family_common import parse_legacy_country_dial_codes
 from app.imports.entities._legacy_family_common import parse_legacy_person_rows
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -176,6 +178,36 @@ def _membership_exists(
     return bool(session.execute(q).scalar())
 
 
+def _add_membership(
+    writer: ImportWriter,
+    p: LegacyPersonRow,
+    *,
+    contact_id: UUID,
+    parent_uuid: UUID,
+    org_mode: bool,
+) -> None:
+    if org_mode:
+        writer.add(
+            OrganizationMember,
+            {
+                "organization_id": parent_uuid,
+                "contact_id": contact_id,
+                "role": _org_role(p.kind),
+                "is_primary_contact": False,
+                "title": _title_trim(p.occupation),
+            },
+        )
+    else:
+        writer.add(
+            FamilyMember,
+            {
+                "family_id": parent_uuid,
+                "contact_id": contact_id,
+                "role": _family_role(p.kind),
+            },
+        )
+
+
 def _title_trim(occupation: str | None, max_len: int = 150) -> str | None:
     if occupation is None:
         return None
@@ -191,10 +223,12 @@ class ContactsImporter:
     ENTITY: ClassVar[str] = "contacts"
     #: ``organizations`` is optional (tenant may have zero imported orgs); refs still loaded when present.
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ("families", "organizations")
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("person", "country")
     PII: ClassVar[bool] = True
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyPersonRow]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyPersonRow]:
         return parse_legacy_person_rows(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -311,6 +345,10 @@ class ContactsImporter:
         )
         email_map = dict(ctx.email_to_contact_id)
         insta_map = dict(ctx.instagram_to_contact_id)
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        #: (contact_id, parent_id) memberships written this run (bulk rows are not
+        #: visible to ``_membership_exists`` until the writer flushes).
+        planned_memberships: set[tuple[UUID, UUID]] = set()
 
         for p in rows:
             if not isinstance(p, LegacyPersonRow):
@@ -403,37 +441,30 @@ class ContactsImporter:
                         )
                     stats.reused_existing_contact += 1
                     continue
-                refs.record_mapping(session, self.ENTITY, str(p.legacy_id), reuse_id)
+                writer.record_ref(self.ENTITY, str(p.legacy_id), reuse_id)
                 if wants_membership:
                     if parent_uuid is None:
                         raise RuntimeError(
                             "contacts importer: wants_membership but parent_uuid is None"
                         )
                     membership_parent: UUID = parent_uuid
-                    if not _membership_exists(
+                    if (
+                        reuse_id,
+                        membership_parent,
+                    ) not in planned_memberships and not _membership_exists(
                         session,
                         contact_id=reuse_id,
                         parent_uuid=membership_parent,
                         org_mode=org_mode,
                     ):
-                        if org_mode:
-                            session.add(
-                                OrganizationMember(
-                                    organization_id=membership_parent,
-                                    contact_id=reuse_id,
-                                    role=_org_role(p.kind),
-                                    is_primary_contact=False,
-                                    title=_title_trim(p.occupation),
-                                ),
-                            )
-                        else:
-                            session.add(
-                                FamilyMember(
-                                    family_id=membership_parent,
-                                    contact_id=reuse_id,
-                                    role=_family_role(p.kind),
-                                ),
-                            )
+                        _add_membership(
+                            writer,
+                            p,
+                            contact_id=reuse_id,
+                            parent_uuid=membership_parent,
+                            org_mode=org_mode,
+                        )
+                        planned_memberships.add((reuse_id, membership_parent))
                 elif fam_key is not None and parent_uuid is None:
                     skipped_membership_no_parent_ref += 1
                 stats.reused_existing_contact += 1
@@ -521,48 +552,37 @@ class ContactsImporter:
                 stats.inserted += 1
                 continue
 
-            contact = Contact(
-                email=email_store,
-                instagram_handle=insta_store,
-                first_name=fn,
-                last_name=ln,
-                phone_region=phone_region,
-                phone_national_number=phone_national,
-                contact_type=_map_contact_type(p.kind),
-                relationship_type=rel,
-                date_of_birth=p.date_of_birth,
-                location_id=None,
-                source=src,
-                source_detail=_source_detail(p.occupation, p.company),
-                source_metadata=meta,
-                mailchimp_status=mc_status,
+            contact_uuid = writer.insert(
+                Contact,
+                {
+                    "email": email_store,
+                    "instagram_handle": insta_store,
+                    "first_name": fn,
+                    "last_name": ln,
+                    "phone_region": phone_region,
+                    "phone_national_number": phone_national,
+                    "contact_type": _map_contact_type(p.kind),
+                    "relationship_type": rel,
+                    "date_of_birth": p.date_of_birth,
+                    "location_id": None,
+                    "source": src,
+                    "source_detail": _source_detail(p.occupation, p.company),
+                    "source_metadata": meta,
+                    "mailchimp_status": mc_status,
+                },
             )
-            session.add(contact)
-            session.flush()
-            cid = contact.id
-            contact_uuid = cid if isinstance(cid, UUID) else UUID(str(cid))
 
-            if wants_membership:
-                if org_mode:
-                    session.add(
-                        OrganizationMember(
-                            organization_id=parent_uuid,
-                            contact_id=contact_uuid,
-                            role=_org_role(p.kind),
-                            is_primary_contact=False,
-                            title=_title_trim(p.occupation),
-                        ),
-                    )
-                else:
-                    session.add(
-                        FamilyMember(
-                            family_id=parent_uuid,
-                            contact_id=contact_uuid,
-                            role=_family_role(p.kind),
-                        ),
-                    )
+            if wants_membership and parent_uuid is not None:
+                _add_membership(
+                    writer,
+                    p,
+                    contact_id=contact_uuid,
+                    parent_uuid=parent_uuid,
+                    org_mode=org_mode,
+                )
+                planned_memberships.add((contact_uuid, parent_uuid))
 
-            refs.record_mapping(session, self.ENTITY, str(p.legacy_id), contact_uuid)
+            writer.record_ref(self.ENTITY, str(p.legacy_id), contact_uuid)
             if email_key:
                 email_map[email_key] = contact_uuid
             if insta_key:
@@ -582,6 +602,7 @@ class ContactsImporter:
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         stats.diagnostics = {
@@ -597,9 +618,7 @@ class ContactsImporter:
             return ""
         fn = _clean_name_part(row.first_name) or ""
         return (
-            "Would insert: "
-            f"name={preview_line(self, fn)!r} | "
-            f"legacy_id={row.legacy_id}"
+            f"Would insert: name={preview_line(self, fn)!r} | legacy_id={row.legacy_id}"
         )
 
 
@@ -608,7 +627,7 @@ def apply_contacts(
     people: Sequence[LegacyPersonRow],
     *,
     dry_run: bool,
-    sql_text: str,
+    sql_text: DumpSource,
     skip_legacy_keys: frozenset[str] | None = None,
 ) -> ImportStats:
     importer = ContactsImporter()
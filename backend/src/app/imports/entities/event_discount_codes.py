@@ -14,16 +14,18 @@ from sqlalchemy.orm import Session
 
 from app.db.models import DiscountCode
 from app.db.models.enums import DiscountType
-from app.imports.base import ImportStats
+from app.imports import refs
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LEGACY_IMPORT_CREATED_BY
 from app.imports.entities._legacy_event_common import LegacyDiscount
 from app.imports.entities._legacy_event_common import _map_discount_type
 from app.imports.entities._legacy_event_common import _parse_dt_utc_assumed
 from app.imports.entities._legacy_event_common import parse_legacy_discounts
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -42,10 +44,12 @@ class EventDiscountCodesImporter:
     #: Refs for scoped rows are loaded opportunistically in ``apply`` so global codes
     #: can import before ``event_services`` / ``event_instances`` exist.
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("discount",)
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyDiscount]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyDiscount]:
         return parse_legacy_discounts(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -88,6 +92,9 @@ class EventDiscountCodesImporter:
                 else {}
             )
         )
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # Codes written this run; bulk mode has not inserted them yet.
+        planned: dict[str, UUID] = {}
 
         for d in rows:
             if not isinstance(d, LegacyDiscount):
@@ -154,33 +161,34 @@ class EventDiscountCodesImporter:
                 stats.inserted += 1
                 continue
 
-            existing = self._existing_by_code(session, code)
+            existing = planned.get(code) or self._existing_by_code(session, code)
             if existing is not None:
-                refs.record_mapping(session, self.ENTITY, str(d.legacy_id), existing)
+                writer.record_ref(self.ENTITY, str(d.legacy_id), existing)
                 stats.inserted += 1
                 continue
 
-            dc = DiscountCode(
-                code=code,
-                description=None,
-                discount_type=dtype,
-                discount_value=val,
-                currency=None,
-                valid_from=vf,
-                valid_until=vt,
-                service_id=svc_uuid,
-                instance_id=inst_uuid,
-                max_uses=d.max_uses,
-                created_by=LEGACY_IMPORT_CREATED_BY,
+            new_uuid = writer.insert(
+                DiscountCode,
+                {
+                    "code": code,
+                    "description": None,
+                    "discount_type": dtype,
+                    "discount_value": val,
+                    "currency": None,
+                    "valid_from": vf,
+                    "valid_until": vt,
+                    "service_id": svc_uuid,
+                    "instance_id": inst_uuid,
+                    "max_uses": d.max_uses,
+                    "created_by": LEGACY_IMPORT_CREATED_BY,
+                },
             )
-            session.add(dc)
-            session.flush()
-            did = dc.id
-            new_uuid = did if isinstance(did, UUID) else UUID(str(did))
-            refs.record_mapping(session, self.ENTITY, str(d.legacy_id), new_uuid)
+            writer.record_ref(self.ENTITY, str(d.legacy_id), new_uuid)
+            planned[code] = new_uuid
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         return stats
 
@@ -14,17 +14,19 @@ from sqlalchemy.orm import Session
 
 from app.db.models import Enrollment
 from app.db.models.enums import EnrollmentStatus
-from app.imports.base import ImportStats
+from app.imports import refs
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LEGACY_IMPORT_CREATED_BY
 from app.imports.entities._legacy_event_common import LegacyRegistration
 from app.imports.entities._legacy_event_common import _map_enrollment_status
 from app.imports.entities._legacy_event_common import _normalize_currency
 from app.imports.entities._legacy_event_common import _parse_dt
 from app.imports.entities._legacy_event_common import parse_legacy_registrations
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -47,10 +49,12 @@ class EventEnrollmentsImporter:
         "families",
         "organizations",
     )
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("registration",)
     PII: ClassVar[bool] = True
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyRegistration]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyRegistration]:
         return parse_legacy_registrations(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -104,6 +108,10 @@ class EventEnrollmentsImporter:
         disc_refs = ctx.refs_by_entity.get("event_discount_codes", {})
         if not disc_refs and refs.has_mapping(session, "event_discount_codes"):
             disc_refs = refs.load_mapping(session, "event_discount_codes")
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # (instance, party) → enrollment written this run; bulk mode has not
+        # inserted them yet, so the DB lookup alone would miss in-run repeats.
+        planned: dict[tuple[UUID, UUID | None, UUID | None, UUID | None], UUID] = {}
 
         for reg in rows:
             if not isinstance(reg, LegacyRegistration):
@@ -159,7 +167,9 @@ class EventEnrollmentsImporter:
             if reg.discount_id is not None:
                 discount_uuid = disc_refs.get(str(reg.discount_id))
 
-            existing_id = self._find_existing_enrollment(
+            # At most one of contact / family / org is set (first mapped wins).
+            party_key = (inst_uuid, contact_uuid, family_uuid, org_uuid)
+            existing_id = planned.get(party_key) or self._find_existing_enrollment(
                 session,
                 instance_id=inst_uuid,
                 contact_id=contact_uuid,
@@ -185,38 +195,35 @@ class EventEnrollmentsImporter:
                 continue
 
             if existing_id is not None:
-                refs.record_mapping(
-                    session,
-                    self.ENTITY,
-                    str(reg.legacy_id),
-                    existing_id,
-                )
+                writer.record_ref(self.ENTITY, str(reg.legacy_id), existing_id)
                 stats.reused_existing_enrollment += 1
                 continue
 
-            en = Enrollment(
-                instance_id=inst_uuid,
-                contact_id=contact_uuid,
-                family_id=family_uuid,
-                organization_id=org_uuid,
-                ticket_tier_id=None,
-                discount_code_id=discount_uuid,
-                status=status,
-                amount_paid=amount,
-                currency=currency,
-                enrolled_at=enrolled_at,
-                cancelled_at=cancelled_at,
-                notes=(str(reg.notes).strip() if reg.notes else None) or None,
-                created_by=LEGACY_IMPORT_CREATED_BY,
+            notes = (str(reg.notes).strip() if reg.notes else None) or None
+            en_uuid = writer.insert(
+                Enrollment,
+                {
+                    "instance_id": inst_uuid,
+                    "contact_id": contact_uuid,
+                    "family_id": family_uuid,
+                    "organization_id": org_uuid,
+                    "ticket_tier_id": None,
+                    "discount_code_id": discount_uuid,
+                    "status": status,
+                    "amount_paid": amount,
+                    "currency": currency,
+                    "enrolled_at": enrolled_at,
+                    "cancelled_at": cancelled_at,
+                    "notes": notes,
+                    "created_by": LEGACY_IMPORT_CREATED_BY,
+                },
             )
-            session.add(en)
-            session.flush()
-            eid = en.id
-            en_uuid = eid if isinstance(eid, UUID) else UUID(str(eid))
-            refs.record_mapping(session, self.ENTITY, str(reg.legacy_id), en_uuid)
+            writer.record_ref(self.ENTITY, str(reg.legacy_id), en_uuid)
+            planned[party_key] = en_uuid
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         return stats
 
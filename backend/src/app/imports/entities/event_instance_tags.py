@@ -13,13 +13,15 @@ from sqlalchemy.orm import Session
 
 from app.db.models import ServiceInstance
 from app.db.models import ServiceInstanceTag
-from app.imports.base import ImportStats
+from app.imports import refs
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LegacyEventLabel
 from app.imports.entities._legacy_event_common import parse_legacy_event_labels
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 
 
 class EventInstanceTagsImporter:
@@ -29,10 +31,12 @@ class EventInstanceTagsImporter:
         "labels",
         "event_services",
     )
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("event_label",)
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyEventLabel]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyEventLabel]:
         return parse_legacy_event_labels(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -53,6 +57,9 @@ class EventInstanceTagsImporter:
         if not svc_refs and refs.has_mapping(session, "event_services"):
             svc_refs = refs.load_mapping(session, "event_services")
         label_refs = ctx.refs_by_entity.get("labels", {})
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # Links written this run; bulk mode has not inserted them yet.
+        planned: set[tuple[UUID, UUID]] = set()
 
         for jl in rows:
             if not isinstance(jl, LegacyEventLabel):
@@ -89,7 +96,7 @@ class EventInstanceTagsImporter:
                 continue
 
             for inst_uuid in instance_ids:
-                already = session.execute(
+                already = (inst_uuid, tag_uuid) in planned or session.execute(
                     select(
                         exists().where(
                             ServiceInstanceTag.service_instance_id == inst_uuid,
@@ -101,15 +108,15 @@ class EventInstanceTagsImporter:
                     stats.skipped_duplicate += 1
                     continue
 
-                session.add(
-                    ServiceInstanceTag(
-                        service_instance_id=inst_uuid,
-                        tag_id=tag_uuid,
-                    ),
+                writer.add(
+                    ServiceInstanceTag,
+                    {"service_instance_id": inst_uuid, "tag_id": tag_uuid},
                 )
+                planned.add((inst_uuid, tag_uuid))
                 stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         return stats
 
@@ -18,19 +18,26 @@ from app.db.models import ServiceInstance
 from app.db.models import ServiceInstancePartnerOrganization
 from app.db.models.enums import EventbriteSyncStatus
 from app.db.models.enums import InstanceStatus
-from app.imports.base import ImportStats
+from app.imports import refs
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LEGACY_IMPORT_CREATED_BY
 from app.imports.entities._legacy_event_common import LegacyEventDate
 from app.imports.entities._legacy_event_common import _parse_dt
 from app.imports.entities._legacy_event_common import parse_legacy_event_dates
 from app.imports.entities._legacy_event_common import parse_legacy_events
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 
 
-def _allocate_instance_slug(session: Session, base: str) -> str | None:
+def _allocate_instance_slug(
+    session: Session,
+    base: str,
+    taken: set[str] | None = None,
+) -> str | None:
+    """First free ``base``/``base-N`` slug; ``taken`` holds slugs not yet flushed."""
     if not base or len(base) > 128:
         return None
     for n in range(10):
@@ -42,7 +49,9 @@ def _allocate_instance_slug(session: Session, base: str) -> str | None:
             .where(ServiceInstance.slug == candidate)
             .limit(1),
         ).first()
-        if exists_row is None:
+        if exists_row is None and (taken is None or candidate not in taken):
+            if taken is not None:
+                taken.add(candidate)
             return candidate
     return None
 
@@ -54,10 +63,12 @@ class EventInstancesImporter:
         "venues",
         "organizations",
     )
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("event_date", "event", "venue")
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyEventDate]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyEventDate]:
         return parse_legacy_event_dates(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -115,6 +126,9 @@ class EventInstancesImporter:
                     event_org[ev.legacy_id] = ev.organization_id
 
         now = datetime.now(UTC)
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # Slugs allocated this run; bulk mode has not written them yet.
+        taken_slugs: set[str] = set()
 
         for ed in rows:
             if not isinstance(ed, LegacyEventDate):
@@ -169,7 +183,7 @@ class EventInstancesImporter:
                 if dry_run:
                     slug_out = base
                 else:
-                    slug_out = _allocate_instance_slug(session, base)
+                    slug_out = _allocate_instance_slug(session, base, taken_slugs)
 
             legacy_org_id = event_org.get(ed.event_id)
             partner_org_uuid: UUID | None = None
@@ -189,54 +203,58 @@ class EventInstancesImporter:
                 stats.inserted += 1
                 continue
 
-            inst = ServiceInstance(
-                service_id=svc_uuid,
-                title=None,
-                slug=slug_out,
-                description=None,
-                cover_image_s3_key=None,
-                status=status,
-                delivery_mode=None,
-                location_id=loc_uuid,
-                max_capacity=max_cap,
-                waitlist_enabled=False,
-                instructor_id=None,
-                cohort=None,
-                notes=(str(ed.notes).strip() if ed.notes else None) or None,
-                external_url=(str(ed.external_url).strip() if ed.external_url else None)
-                or None,
-                created_by=LEGACY_IMPORT_CREATED_BY,
-                eventbrite_sync_status=EventbriteSyncStatus.PENDING,
+            notes = (str(ed.notes).strip() if ed.notes else None) or None
+            external_url = (
+                str(ed.external_url).strip() if ed.external_url else None
+            ) or None
+            inst_uuid = writer.insert(
+                ServiceInstance,
+                {
+                    "service_id": svc_uuid,
+                    "title": None,
+                    "slug": slug_out,
+                    "description": None,
+                    "cover_image_s3_key": None,
+                    "status": status,
+                    "delivery_mode": None,
+                    "location_id": loc_uuid,
+                    "max_capacity": max_cap,
+                    "waitlist_enabled": False,
+                    "instructor_id": None,
+                    "cohort": None,
+                    "notes": notes,
+                    "external_url": external_url,
+                    "created_by": LEGACY_IMPORT_CREATED_BY,
+                    "eventbrite_sync_status": EventbriteSyncStatus.PENDING,
+                },
             )
-            session.add(inst)
-            session.flush()
-            iid = inst.id
-            inst_uuid = iid if isinstance(iid, UUID) else UUID(str(iid))
-
-            session.add(
-                InstanceSessionSlot(
-                    instance_id=inst_uuid,
-                    starts_at=ed.starts_at,
-                    ends_at=ed.ends_at,
-                    location_id=loc_uuid,
-                    sort_order=0,
-                ),
+            writer.add(
+                InstanceSessionSlot,
+                {
+                    "instance_id": inst_uuid,
+                    "starts_at": ed.starts_at,
+                    "ends_at": ed.ends_at,
+                    "location_id": loc_uuid,
+                    "sort_order": 0,
+                },
             )
 
             if partner_org_uuid is not None:
-                session.add(
-                    ServiceInstancePartnerOrganization(
-                        service_instance_id=inst_uuid,
-                        organization_id=partner_org_uuid,
-                        sort_order=0,
-                    ),
+                writer.add(
+                    ServiceInstancePartnerOrganization,
+                    {
+                        "service_instance_id": inst_uuid,
+                        "organization_id": partner_org_uuid,
+                        "sort_order": 0,
+                    },
                 )
                 stats.partner_org_links_inserted += 1
 
-            refs.record_mapping(session, self.ENTITY, str(ed.legacy_id), inst_uuid)
+            writer.record_ref(self.ENTITY, str(ed.legacy_id), inst_uuid)
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         stats.diagnostics = {
             "partner_org_links_inserted": stats.partner_org_links_inserted,
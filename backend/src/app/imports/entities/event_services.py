@@ -15,9 +15,10 @@ from app.db.models import EventDetails
 from app.db.models import Service
 from app.db.models.enums import ServiceStatus
 from app.db.models.enums import ServiceType
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LEGACY_IMPORT_CREATED_BY
 from app.imports.entities._legacy_event_common import LegacyEvent
 from app.imports.entities._legacy_event_common import _infer_delivery_mode
@@ -25,15 +26,20 @@ from app.imports.entities._legacy_event_common import _map_event_category
 from app.imports.entities._legacy_event_common import _normalize_currency
 from app.imports.entities._legacy_event_common import _slugify_event_title
 from app.imports.entities._legacy_event_common import parse_legacy_events
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 
 
 def _service_key_fits(key: str) -> bool:
     return 0 < len(key) <= 80
 
 
-def _allocate_service_key(session: Session, base: str) -> str | None:
+def _allocate_service_key(
+    session: Session,
+    base: str,
+    taken: set[str] | None = None,
+) -> str | None:
+    """First free ``base``/``base-N`` key; ``taken`` holds keys not yet flushed."""
     if not _service_key_fits(base):
         return None
     for n in range(10):
@@ -45,7 +51,9 @@ def _allocate_service_key(session: Session, base: str) -> str | None:
             .select_from(Service)
             .where(Service.service_key == candidate),
         ).scalar_one()
-        if int(cnt or 0) == 0:
+        if int(cnt or 0) == 0 and (taken is None or candidate not in taken):
+            if taken is not None:
+                taken.add(candidate)
             return candidate
     return None
 
@@ -53,10 +61,12 @@ def _allocate_service_key(session: Session, base: str) -> str | None:
 class EventServicesImporter:
     ENTITY: ClassVar[str] = "event_services"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ("venues", "organizations", "labels")
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("event", "venue")
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyEvent]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyEvent]:
         return parse_legacy_events(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -72,6 +82,9 @@ class EventServicesImporter:
         dry_run: bool,
     ) -> ImportStats:
         stats = ImportStats(entity=self.ENTITY, dry_run=dry_run)
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # Keys allocated this run; bulk mode has not written them yet.
+        taken_keys: set[str] = set()
 
         for ev in rows:
             if not isinstance(ev, LegacyEvent):
@@ -109,36 +122,42 @@ class EventServicesImporter:
                 continue
 
             key_base = _slugify_event_title(title)
-            service_key = _allocate_service_key(session, key_base) if key_base else None
-
-            svc = Service(
-                service_type=ServiceType.EVENT,
-                title=title,
-                service_key=service_key,
-                description=str(ev.description).strip() if ev.description else None,
-                cover_image_s3_key=None,
-                delivery_mode=delivery,
-                status=ServiceStatus.DRAFT,
-                booking_system=None,
-                created_by=LEGACY_IMPORT_CREATED_BY,
+            service_key = (
+                _allocate_service_key(session, key_base, taken_keys)
+                if key_base
+                else None
+            )
+
+            svc_uuid = writer.insert(
+                Service,
+                {
+                    "service_type": ServiceType.EVENT,
+                    "title": title,
+                    "service_key": service_key,
+                    "description": str(ev.description).strip()
+                    if ev.description
+                    else None,
+                    "cover_image_s3_key": None,
+                    "delivery_mode": delivery,
+                    "status": ServiceStatus.DRAFT,
+                    "booking_system": None,
+                    "created_by": LEGACY_IMPORT_CREATED_BY,
+                },
             )
-            session.add(svc)
-            session.flush()
-            sid = svc.id
-            svc_uuid = sid if isinstance(sid, UUID) else UUID(str(sid))
-
-            session.add(
-                EventDetails(
-                    service_id=svc_uuid,
-                    event_category=cat,
-                    default_price=ev.default_price,
-                    default_currency=currency,
-                ),
+            writer.add(
+                EventDetails,
+                {
+                    "service_id": svc_uuid,
+                    "event_category": cat,
+                    "default_price": ev.default_price,
+                    "default_currency": currency,
+                },
             )
-            refs.record_mapping(session, self.ENTITY, str(ev.legacy_id), svc_uuid)
+            writer.record_ref(self.ENTITY, str(ev.legacy_id), svc_uuid)
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         return stats
 
@@ -12,9 +12,10 @@ from sqlalchemy.orm import Session
 
 from app.db.models import Family
 from app.db.models.enums import RelationshipType
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_family_common import LegacyFamilyRow
 from app.imports.entities._legacy_family_common import (
     eligible_household_legacy_family_ids,
@@ -25,8 +26,8 @@ from app.imports.entities._locations_common import district_area_map
 from app.imports.entities._locations_common import hk_country_id
 from app.imports.entities._locations_common import joined_address
 from app.imports.entities._locations_common import usable_legacy_address
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -42,10 +43,12 @@ class FamiliesImporter:
 
     ENTITY: ClassVar[str] = "families"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("district", "family", "person")
     PII: ClassVar[bool] = True
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyFamilyRow]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyFamilyRow]:
         rows = parse_legacy_family_rows(sql_text)
         eligible = eligible_household_legacy_family_ids(sql_text)
         return [
@@ -110,6 +113,7 @@ class FamiliesImporter:
     ) -> ImportStats:
         stats = ImportStats(entity=self.ENTITY, dry_run=dry_run)
         area_by_name = ctx.area_by_name
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
 
         eligible: frozenset[int]
         if ctx.source_sql_text:
@@ -151,16 +155,14 @@ class FamiliesImporter:
                     )
                 else:
                     if not dry_run:
-                        loc = create_location_from_legacy_address(
-                            session,
+                        location_id = create_location_from_legacy_address(
+                            writer,
                             area_id=area_id,
                             name=row.name,
                             address=addr,
                             latitude=row.latitude,
                             longitude=row.longitude,
                         )
-                        nid = loc.id
-                        location_id = nid if isinstance(nid, UUID) else UUID(str(nid))
 
             if dry_run:
                 if len(stats.preview) < self.PREVIEW_MAX_ROWS:
@@ -177,16 +179,15 @@ class FamiliesImporter:
                 stats.inserted += 1
                 continue
 
-            fam = Family(
-                family_name=row.name or "",
-                relationship_type=RelationshipType.PROSPECT,
-                location_id=location_id,
+            fam_uuid = writer.insert(
+                Family,
+                {
+                    "family_name": row.name or "",
+                    "relationship_type": RelationshipType.PROSPECT,
+                    "location_id": location_id,
+                },
             )
-            session.add(fam)
-            session.flush()
-            fid = fam.id
-            fam_uuid = fid if isinstance(fid, UUID) else UUID(str(fid))
-            refs.record_mapping(session, self.ENTITY, str(row.legacy_id), fam_uuid)
+            writer.record_ref(self.ENTITY, str(row.legacy_id), fam_uuid)
             if len(stats.row_details) < self.PREVIEW_MAX_ROWS:
                 stats.row_details.append(
                     self._row_detail(
@@ -199,6 +200,7 @@ class FamiliesImporter:
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         return stats
@@ -219,7 +221,7 @@ def apply_families(
     *,
     dry_run: bool,
     skip_legacy_keys: frozenset[str] | None = None,
-    source_sql_text: str | None = None,
+    source_sql_text: DumpSource | None = None,
 ) -> ImportStats:
     importer = FamiliesImporter()
     ctx = importer.resolve_context(session, dry_run=dry_run)
@@ -12,23 +12,26 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.models import Tag
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_event_common import LEGACY_IMPORT_CREATED_BY
 from app.imports.entities._legacy_event_common import LegacyLabel
 from app.imports.entities._legacy_event_common import parse_legacy_labels
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 
 
 class LabelsImporter:
     ENTITY: ClassVar[str] = "labels"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("label",)
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyLabel]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyLabel]:
         return parse_legacy_labels(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -50,6 +53,7 @@ class LabelsImporter:
             if ln:
                 lower_to_id[str(ln)] = tid if isinstance(tid, UUID) else UUID(str(tid))
         planned_lower: set[str] = set()
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
 
         for row in rows:
             if not isinstance(row, LegacyLabel):
@@ -92,29 +96,24 @@ class LabelsImporter:
                 continue
 
             if existing is not None:
-                refs.record_mapping(
-                    session,
-                    self.ENTITY,
-                    str(row.legacy_id),
-                    existing,
-                )
+                writer.record_ref(self.ENTITY, str(row.legacy_id), existing)
                 continue
 
-            tag = Tag(
-                name=name,
-                color=None,
-                description=desc,
-                created_by=LEGACY_IMPORT_CREATED_BY,
+            tag_uuid = writer.insert(
+                Tag,
+                {
+                    "name": name,
+                    "color": None,
+                    "description": desc,
+                    "created_by": LEGACY_IMPORT_CREATED_BY,
+                },
             )
-            session.add(tag)
-            session.flush()
-            tid = tag.id
-            tag_uuid = tid if isinstance(tid, UUID) else UUID(str(tid))
             lower_to_id[lk] = tag_uuid
-            refs.record_mapping(session, self.ENTITY, str(row.legacy_id), tag_uuid)
+            writer.record_ref(self.ENTITY, str(row.legacy_id), tag_uuid)
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
         return stats
 
@@ -24,14 +24,16 @@ from app.db.models import FamilyMember
 from app.db.models import Organization
 from app.db.models import OrganizationMember
 from app.imports import refs
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_family_common import LegacyPersonRow
 from app.imports.entities._legacy_family_common import parse_legacy_person_rows
 from app.imports.entities.contacts import _family_role
 from app.imports.entities.contacts import _org_role
 from app.imports.entities.contacts import _title_trim
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
 from app.utils.logging import get_logger
 
@@ -100,10 +102,12 @@ class LinkContactMembershipsImporter:
     #: ``contacts`` must be present in ``legacy_import_refs`` (required precondition);
     #: ``families`` / ``organizations`` are optional dependency entities (empty tenant OK).
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ("contacts", "families", "organizations")
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("person",)
     PII: ClassVar[bool] = True
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyPersonRow]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyPersonRow]:
         return parse_legacy_person_rows(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -208,6 +212,11 @@ class LinkContactMembershipsImporter:
             stale_org_refs,
         )
 
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
+        # Links written this run; bulk mode has not inserted them yet.
+        planned_family: set[tuple[UUID, UUID]] = set()
+        planned_org: set[tuple[UUID, UUID]] = set()
+
         family_inserted = 0
         org_inserted = 0
         family_existing = 0
@@ -251,7 +260,8 @@ class LinkContactMembershipsImporter:
                 continue
 
             if family_uuid is not None:
-                if _family_membership_exists(
+                family_link = (family_uuid, contact_uuid)
+                if family_link in planned_family or _family_membership_exists(
                     session,
                     family_id=family_uuid,
                     contact_id=contact_uuid,
@@ -270,13 +280,15 @@ class LinkContactMembershipsImporter:
                         )
                     continue
                 if not dry_run:
-                    session.add(
-                        FamilyMember(
-                            family_id=family_uuid,
-                            contact_id=contact_uuid,
-                            role=_family_role(p.kind),
-                        ),
+                    writer.add(
+                        FamilyMember,
+                        {
+                            "family_id": family_uuid,
+                            "contact_id": contact_uuid,
+                            "role": _family_role(p.kind),
+                        },
                     )
+                    planned_family.add(family_link)
                 family_inserted += 1
                 stats.inserted += 1
                 if len(stats.preview) < self.PREVIEW_MAX_ROWS:
@@ -299,7 +311,8 @@ class LinkContactMembershipsImporter:
                     "link_contact_memberships: org_uuid unexpectedly None "
                     "after parent mapping resolution",
                 )
-            if _organization_membership_exists(
+            org_link = (org_uuid, contact_uuid)
+            if org_link in planned_org or _organization_membership_exists(
                 session,
                 organization_id=org_uuid,
                 contact_id=contact_uuid,
@@ -318,15 +331,17 @@ class LinkContactMembershipsImporter:
                     )
                 continue
             if not dry_run:
-                session.add(
-                    OrganizationMember(
-                        organization_id=org_uuid,
-                        contact_id=contact_uuid,
-                        role=_org_role(p.kind),
-                        is_primary_contact=False,
-                        title=_title_trim(p.occupation),
-                    ),
+                writer.add(
+                    OrganizationMember,
+                    {
+                        "organization_id": org_uuid,
+                        "contact_id": contact_uuid,
+                        "role": _org_role(p.kind),
+                        "is_primary_contact": False,
+                        "title": _title_trim(p.occupation),
+                    },
                 )
+                planned_org.add(org_link)
             org_inserted += 1
             stats.inserted += 1
             if len(stats.preview) < self.PREVIEW_MAX_ROWS:
@@ -344,6 +359,7 @@ class LinkContactMembershipsImporter:
                 )
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         stats.diagnostics = {
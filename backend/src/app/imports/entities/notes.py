@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import replace
-from datetime import UTC, datetime
+from datetime import UTC
+from datetime import datetime
 from typing import Any
 from typing import ClassVar
 from uuid import UUID
@@ -12,15 +13,16 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.db.models.note import Note
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_family_common import LegacyNoteRow
 from app.imports.entities._legacy_family_common import note_id_to_person_ids
 from app.imports.entities._legacy_family_common import parse_legacy_notes
 from app.imports.entities._legacy_family_common import parse_legacy_person_notes
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 
 LEGACY_NOTE_CREATED_BY = "legacy-import"
 
@@ -30,10 +32,12 @@ class NotesImporter:
 
     ENTITY: ClassVar[str] = "notes"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ("contacts",)
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("note", "person_note")
     PII: ClassVar[bool] = True
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyNoteRow]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyNoteRow]:
         return parse_legacy_notes(sql_text)
 
     def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
@@ -110,6 +114,7 @@ class NotesImporter:
     ) -> ImportStats:
         stats = ImportStats(entity=self.ENTITY, dry_run=dry_run)
         contact_refs = ctx.refs_by_entity.get("contacts", {})
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
         if ctx.source_sql_text is None:
             person_map: dict[int, list[int]] = {}
         else:
@@ -158,25 +163,24 @@ class NotesImporter:
             note_ids_out: list[UUID] = []
             first_id: UUID | None = None
             for cid in resolved:
-                note = Note(
-                    contact_id=cid,
-                    lead_id=None,
-                    content=n.content,
-                    created_by=LEGACY_NOTE_CREATED_BY,
-                    created_at=created_at,
-                    updated_at=updated_at,
-                    took_at=n.took_at,
+                note_uuid = writer.insert(
+                    Note,
+                    {
+                        "contact_id": cid,
+                        "lead_id": None,
+                        "content": n.content,
+                        "created_by": LEGACY_NOTE_CREATED_BY,
+                        "created_at": created_at,
+                        "updated_at": updated_at,
+                        "took_at": n.took_at,
+                    },
                 )
-                session.add(note)
-                session.flush()
-                nid = note.id
-                note_uuid = nid if isinstance(nid, UUID) else UUID(str(nid))
                 note_ids_out.append(note_uuid)
                 if first_id is None:
                     first_id = note_uuid
 
             if first_id is not None:
-                refs.record_mapping(session, self.ENTITY, str(n.legacy_id), first_id)
+                writer.record_ref(self.ENTITY, str(n.legacy_id), first_id)
             if len(stats.row_details) < self.PREVIEW_MAX_ROWS:
                 stats.row_details.append(
                     self._row_detail(
@@ -189,6 +193,7 @@ class NotesImporter:
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         return stats
@@ -208,7 +213,7 @@ def apply_notes(
     note_rows: Sequence[LegacyNoteRow],
     *,
     dry_run: bool,
-    sql_text: str,
+    sql_text: DumpSource,
     skip_legacy_keys: frozenset[str] | None = None,
 ) -> ImportStats:
     """Run the notes importer with contact refs loaded from ``legacy_import_refs``.
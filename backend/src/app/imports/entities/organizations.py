@@ -14,9 +14,10 @@ from sqlalchemy.orm import Session
 from app.db.models import Organization
 from app.db.models.enums import OrganizationType
 from app.db.models.enums import RelationshipType
-from app.imports.base import ImportStats
 from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
 from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._legacy_family_common import LegacyFamilyRow
 from app.imports.entities._legacy_family_common import legacy_family_id_to_person_kinds
 from app.imports.entities._legacy_family_common import parse_legacy_family_rows
@@ -25,8 +26,8 @@ from app.imports.entities._locations_common import district_area_map
 from app.imports.entities._locations_common import hk_country_id
 from app.imports.entities._locations_common import joined_address
 from app.imports.entities._locations_common import usable_legacy_address
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -113,10 +114,12 @@ class OrganizationsImporter:
 
     ENTITY: ClassVar[str] = "organizations"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("district", "family", "person")
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyFamilyRow]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyFamilyRow]:
         rows = parse_legacy_family_rows(sql_text)
         return [r for r in rows if (r.kind or "").strip().lower() == "company"]
 
@@ -181,6 +184,7 @@ class OrganizationsImporter:
     ) -> ImportStats:
         stats = ImportStats(entity=self.ENTITY, dry_run=dry_run)
         area_by_name = ctx.area_by_name
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
         partner_map: dict[int, set[str]] = {}
         if ctx.source_sql_text is not None:
             partner_map = legacy_family_id_to_person_kinds(ctx.source_sql_text)
@@ -223,16 +227,14 @@ class OrganizationsImporter:
                         dname,
                     )
                 elif not dry_run:
-                    loc = create_location_from_legacy_address(
-                        session,
+                    location_id = create_location_from_legacy_address(
+                        writer,
                         area_id=area_id,
                         name=row.name,
                         address=addr,
                         latitude=row.latitude,
                         longitude=row.longitude,
                     )
-                    nid = loc.id
-                    location_id = nid if isinstance(nid, UUID) else UUID(str(nid))
 
             if dry_run:
                 if len(stats.preview) < self.PREVIEW_MAX_ROWS:
@@ -251,18 +253,17 @@ class OrganizationsImporter:
                 stats.inserted += 1
                 continue
 
-            org = Organization(
-                name=row.name or "",
-                organization_type=org_type,
-                relationship_type=rel,
-                website=None,
-                location_id=location_id,
+            org_uuid = writer.insert(
+                Organization,
+                {
+                    "name": row.name or "",
+                    "organization_type": org_type,
+                    "relationship_type": rel,
+                    "website": None,
+                    "location_id": location_id,
+                },
             )
-            session.add(org)
-            session.flush()
-            oid = org.id
-            org_uuid = oid if isinstance(oid, UUID) else UUID(str(oid))
-            refs.record_mapping(session, self.ENTITY, str(row.legacy_id), org_uuid)
+            writer.record_ref(self.ENTITY, str(row.legacy_id), org_uuid)
             if len(stats.row_details) < self.PREVIEW_MAX_ROWS:
                 stats.row_details.append(
                     self._row_detail(
@@ -277,6 +278,7 @@ class OrganizationsImporter:
             stats.inserted += 1
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         return stats
@@ -297,7 +299,7 @@ def apply_organizations(
     org_rows: Sequence[LegacyFamilyRow],
     *,
     dry_run: bool,
-    sql_text: str,
+    sql_text: DumpSource,
     skip_legacy_keys: frozenset[str] | None = None,
 ) -> ImportStats:
     importer = OrganizationsImporter()
@@ -14,16 +14,17 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.models import Location
-from app.imports import mysqldump
+from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
+from app.imports.base import preview_line
+from app.imports.bulk import make_writer
 from app.imports.entities._locations_common import (
     district_area_map as _district_area_map_fn,
 )
 from app.imports.entities._locations_common import hk_country_id as _hk_country_id_fn
-from app.imports.base import ImportStats
-from app.imports.base import ImporterContext
-from app.imports.base import preview_line
+from app.imports.entities._mysqldump_rows import require_insert_rows
+from app.imports.mysqldump_stream import DumpSource
 from app.imports.registry import register
-from app.imports import refs
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -40,16 +41,10 @@ class LegacyVenue:
     district_label: str | None = None
 
 
-def _parse_legacy_districts(sql_text: str) -> dict[int, str]:
-    stmt = mysqldump.extract_insert_statement(sql_text, "district")
-    if stmt is None:
-        msg = "Could not find INSERT INTO `district` in dump."
-        raise ValueError(msg)
-    rest = mysqldump.extract_values_sql_fragment(stmt)
-    groups = mysqldump.iter_groups(rest)
+def _parse_legacy_districts(sql_text: DumpSource) -> dict[int, str]:
+    _cols, groups = require_insert_rows(sql_text, "district")
     out: dict[int, str] = {}
-    for g in groups:
-        fields = mysqldump.split_fields(g)
+    for fields in groups:
         if len(fields) < 2:
             continue
         did = int(str(fields[0]))
@@ -59,22 +54,16 @@ def _parse_legacy_districts(sql_text: str) -> dict[int, str]:
 
 
 def _parse_legacy_venues(
-    sql_text: str,
+    sql_text: DumpSource,
     *,
     districts: Mapping[int, str] | None = None,
 ) -> list[LegacyVenue]:
     district_map: Mapping[int, str] = (
         districts if districts is not None else _parse_legacy_districts(sql_text)
     )
-    stmt = mysqldump.extract_insert_statement(sql_text, "venue")
-    if stmt is None:
-        msg = "Could not find INSERT INTO `venue` in dump."
-        raise ValueError(msg)
-    rest = mysqldump.extract_values_sql_fragment(stmt)
-    groups = mysqldump.iter_groups(rest)
+    _cols, groups = require_insert_rows(sql_text, "venue")
     rows: list[LegacyVenue] = []
-    for g in groups:
-        fields = mysqldump.split_fields(g)
+    for fields in groups:
         if len(fields) < 5:
             continue
         legacy_id = int(str(fields[0]))
@@ -109,10 +98,12 @@ class VenueImporter:
 
     ENTITY: ClassVar[str] = "venues"
     DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("district", "venue")
     PII: ClassVar[bool] = False
     PREVIEW_MAX_ROWS: ClassVar[int] = 50
+    SUPPORTS_BULK_APPLY: ClassVar[bool] = True
 
-    def parse(self, sql_text: str) -> Sequence[LegacyVenue]:
+    def parse(self, sql_text: DumpSource) -> Sequence[LegacyVenue]:
         districts = _parse_legacy_districts(sql_text)
         return _parse_legacy_venues(sql_text, districts=districts)
 
@@ -192,6 +183,7 @@ class VenueImporter:
         stats = ImportStats(entity=self.ENTITY, dry_run=dry_run)
         area_by_name = ctx.area_by_name
         existing_keys = set(ctx.existing_keys)
+        writer = make_writer(session, bulk_chunk_size=ctx.bulk_chunk_size)
 
         for v in rows:
             if not isinstance(v, LegacyVenue):
@@ -238,24 +230,19 @@ class VenueImporter:
                 existing_keys.add(key)
                 continue
 
-            new_location = Location(
-                area_id=area_id,
-                name=name,
-                address=address,
-                lat=None,
-                lng=None,
-            )
-            session.add(new_location)
-            # Flush so Location.id is available for legacy_import_refs (same transaction).
-            session.flush()
-            nid = new_location.id
-            new_uuid = nid if isinstance(nid, UUID) else UUID(str(nid))
-            refs.record_mapping(
-                session,
-                self.ENTITY,
-                str(v.legacy_id),
-                new_uuid,
+            # Row mode flushes so Location.id is available for legacy_import_refs;
+            # bulk mode pre-generates the UUID and writes both tables in chunks.
+            new_uuid = writer.insert(
+                Location,
+                {
+                    "area_id": area_id,
+                    "name": name,
+                    "address": address,
+                    "lat": None,
+                    "lng": None,
+                },
             )
+            writer.record_ref(self.ENTITY, str(v.legacy_id), new_uuid)
             if len(stats.row_details) < self.PREVIEW_MAX_ROWS:
                 stats.row_details.append(
                     self._row_detail(
@@ -269,6 +256,7 @@ class VenueImporter:
             existing_keys.add(key)
 
         if not dry_run:
+            writer.finish()
             session.commit()
 
         return stats
@@ -286,12 +274,12 @@ class VenueImporter:
 
 
 # Public aliases for tests and tooling (same signatures as pre-registry module).
-def parse_legacy_districts(sql_text: str) -> dict[int, str]:
+def parse_legacy_districts(sql_text: DumpSource) -> dict[int, str]:
     return _parse_legacy_districts(sql_text)
 
 
 def parse_legacy_venues(
-    sql_text: str,
+    sql_text: DumpSource,
     *,
     districts: Mapping[int, str] | None = None,
 ) -> list[LegacyVenue]:
@@ -26,38 +26,62 @@ def _string_scan_advance(
     return i + 1, True
 
 
+#: Rest of a single-quoted string after its opening quote, through the closing quote.
+#: ``''`` is treated as close + reopen, which is equivalent for structural scans.
+STRING_TAIL_RE = re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", re.DOTALL)
+_GROUP_TOKEN_RE = re.compile(r"[()']")
+_SEMICOLON_TOKEN_RE = re.compile(r"[;']")
+#: One field inside a tuple body: quoted string or bare atom, then ``,`` or end.
+_FIELD_RE = re.compile(
+    r"\s*(?:'(?P<s>[^'\\]*(?:(?:\\.|'')[^'\\]*)*)'|(?P<a>[^,'\s]*))\s*(?P<end>,|\Z)",
+    re.DOTALL,
+)
+_UNESCAPE_RE = re.compile(r"\\(.)|''", re.DOTALL)
+
+
+def skip_string(s: str, i: int) -> int:
+    """Index just past the string whose opening quote is at ``i - 1``, or -1 if open."""
+    m = STRING_TAIL_RE.match(s, i)
+    return -1 if m is None else m.end()
+
+
+def unescape_string(body: str) -> str:
+    """Decode mysqldump ``\\x`` escapes and SQL ``''`` inside a quoted string body."""
+    if "\\" not in body and "''" not in body:
+        return body
+    return _UNESCAPE_RE.sub(
+        lambda m: m.group(1) if m.group(1) is not None else "'", body
+    )
+
+
 def iter_groups(values_sql: str) -> list[str]:
     """Split a MySQL ``VALUES (..),(..)`` fragment into ``(..)`` group strings."""
     depth = 0
     start: int | None = None
-    i = 0
     groups: list[str] = []
-    in_string = False
-    n = len(values_sql)
-    while i < n:
+    search = _GROUP_TOKEN_RE.search
+    pos = 0
+    while True:
+        m = search(values_sql, pos)
+        if m is None:
+            return groups
+        i = m.start()
         c = values_sql[i]
-        if in_string:
-            i, in_string = _string_scan_advance(values_sql, i, n=n, in_string=True)
-            continue
         if c == "'":
-            in_string = True
-            i += 1
+            pos = skip_string(values_sql, i + 1)
+            if pos == -1:
+                return groups
             continue
         if c == "(":
             depth += 1
             if depth == 1:
                 start = i
-            i += 1
-            continue
-        if c == ")":
+        else:
             if depth == 1 and start is not None:
                 groups.append(values_sql[start : i + 1])
                 start = None
             depth -= 1
-            i += 1
-            continue
-        i += 1
-    return groups
+        pos = i + 1
 
 
 def split_fields(inner: str) -> list[str | None]:
@@ -67,6 +91,36 @@ def split_fields(inner: str) -> list[str | None]:
         msg = f"Expected tuple wrapped in parentheses, got: {inner[:80]!r}"
         raise ValueError(msg)
     body = inner[1:-1]
+    fast = _split_fields_fast(body)
+    if fast is not None:
+        return fast
+    return _split_fields_slow(body)
+
+
+def _split_fields_fast(body: str) -> list[str | None] | None:
+    """Regex field scan; ``None`` when the body needs the character-level fallback."""
+    fields: list[str | None] = []
+    pos = 0
+    n = len(body)
+    match = _FIELD_RE.match
+    while True:
+        m = match(body, pos)
+        if m is None:
+            return None
+        sval = m.group("s")
+        raw = unescape_string(sval) if sval is not None else m.group("a")
+        pos = m.end()
+        if not m.group("end"):
+            if pos != n:
+                return None
+            # Same as the slow path: a lone empty trailing value yields no fields.
+            if fields or raw.strip():
+                fields.append(parse_atom(raw))
+            return fields
+        fields.append(parse_atom(raw))
+
+
+def _split_fields_slow(body: str) -> list[str | None]:
     fields: list[str | None] = []
     i = 0
     buf: list[str] = []
@@ -121,22 +175,18 @@ def parse_atom(raw: str) -> str | None:
 
 def first_semicolon_outside_strings(s: str, start: int = 0) -> int:
     """Index of first ``;`` not inside a single-quoted SQL string, or -1."""
-    i = start
-    n = len(s)
-    in_string = False
-    while i < n:
-        c = s[i]
-        if in_string:
-            i, in_string = _string_scan_advance(s, i, n=n, in_string=True)
-            continue
-        if c == "'":
-            in_string = True
-            i += 1
-            continue
-        if c == ";":
+    search = _SEMICOLON_TOKEN_RE.search
+    pos = start
+    while True:
+        m = search(s, pos)
+        if m is None:
+            return -1
+        i = m.start()
+        if s[i] == ";":
             return i
-        i += 1
-    return -1
+        pos = skip_string(s, i + 1)
+        if pos == -1:
+            return -1
 
 
 INSERT_HEAD_RE = re.compile(
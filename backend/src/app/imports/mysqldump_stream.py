@@ -0,0 +1,345 @@
+"""Single-pass, bounded-memory mysqldump tokenizer.
+
+:func:`iter_dump_rows` reads a text stream in fixed-size chunks and yields one
+:class:`DumpRow` per ``INSERT`` tuple for the requested tables, so every importer
+table is tokenized in a single scan instead of re-searching the full dump text per
+table. Memory is bounded by ``read_size`` plus the largest single tuple.
+
+Unlike :func:`app.imports.mysqldump.extract_insert_statement` (first statement
+only), rows from **every** ``INSERT`` statement for a table are yielded — mysqldump
+splits large tables across several extended inserts.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Collection
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import NamedTuple
+from typing import TextIO
+
+from app.imports import mysqldump
+
+#: Characters read from the stream per refill.
+DEFAULT_READ_SIZE = 1 << 20
+#: Upper bound for an ``INSERT``/``CREATE TABLE`` header before it is skipped.
+_MAX_HEADER_CHARS = 1 << 16
+#: Tail kept between refills so a statement keyword split across chunks is found.
+_KEYWORD_OVERLAP = 64
+
+_STMT_HEAD_RE = re.compile(r"INSERT\s+INTO\s|CREATE\s+TABLE\s", re.IGNORECASE)
+_INSERT_HEADER_RE = re.compile(
+    r"INSERT\s+INTO\s+"
+    r"(?:(?:`[^`]+`|[A-Za-z_][A-Za-z0-9_]*)\s*\.\s*)?"
+    r"(?:`(?P<table_bt>[^`]+)`|(?P<table_bare>[A-Za-z_][A-Za-z0-9_]*))"
+    r"\s*(?:\((?P<cols>[^)]*)\)\s*)?"
+    r"VALUES\s*",
+    re.IGNORECASE,
+)
+_CREATE_HEADER_RE = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"
+    r"(?:`[^`]+`\s*\.\s*)?`(?P<t>[^`]+)`",
+    re.IGNORECASE,
+)
+_TUPLE_SEP_RE = re.compile(r"[\s,]*")
+_FIELD_RE = re.compile(
+    r"\s*(?:'(?P<s>[^'\\]*(?:(?:\\.|'')[^'\\]*)*)'|(?P<a>[^,()'\s]*))\s*(?P<end>[,)])",
+    re.DOTALL,
+)
+
+
+class DumpRow(NamedTuple):
+    """One ``INSERT`` tuple: lower-case table name and parsed field values."""
+
+    table: str
+    fields: tuple[str | None, ...]
+
+
+@dataclass
+class DumpTable:
+    """Rows and column names collected for one table by :func:`scan_dump`."""
+
+    name: str
+    #: Column list from the first ``INSERT INTO t (...)`` for this table, if any.
+    insert_columns: list[str] | None = None
+    #: Column names from ``CREATE TABLE`` (mysqldump DDL), if present.
+    create_columns: list[str] | None = None
+    rows: list[tuple[str | None, ...]] = field(default_factory=list)
+    #: True once at least one ``INSERT`` statement for the table was seen.
+    has_insert: bool = False
+
+
+@dataclass
+class ScannedDump:
+    """Result of one streaming pass over a dump (tables keyed by lower-case name)."""
+
+    tables: dict[str, DumpTable] = field(default_factory=dict)
+
+    def table(self, name: str) -> DumpTable | None:
+        return self.tables.get(name.lower())
+
+    def has_insert(self, name: str) -> bool:
+        t = self.table(name)
+        return t is not None and t.has_insert
+
+
+#: What legacy entity parsers accept: full dump text or one streamed scan.
+DumpSource = str | ScannedDump
+
+
+class _Reader:
+    """Sliding text window over a stream with explicit refills."""
+
+    def __init__(self, stream: TextIO, read_size: int) -> None:
+        self._stream = stream
+        self._read_size = read_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> int:
+        """Drop text before ``pos`` and append one chunk.
+
+        Returns how far existing indices shifted left, or -1 at end of stream.
+        """
+        if self.eof:
+            return -1
+        chunk = self._stream.read(self._read_size)
+        if not chunk:
+            self.eof = True
+            return -1
+        shift = self.pos
+        if shift:
+            self.buf = self.buf[shift:]
+            self.pos = 0
+        self.buf += chunk
+        return shift
+
+    def ensure(self, n: int) -> None:
+        """Make at least ``n`` unread chars available unless the stream ends first."""
+        while len(self.buf) - self.pos < n:
+            if self.fill() < 0:
+                return
+
+
+def _norm_columns(raw: str | None) -> list[str] | None:
+    if raw is None:
+        return None
+    names: list[str] = []
+    for part in raw.split(","):
+        p = part.strip()
+        if p.startswith("`") and p.endswith("`") and len(p) >= 2:
+            p = p[1:-1]
+        names.append(p)
+    return names
+
+
+def _find_terminator(s: str, pos: int, token_re: re.Pattern[str]) -> tuple[int, int]:
+    """Find the first ``token_re`` match outside strings from ``pos``.
+
+    Returns ``(index, -1)`` when found, else ``(-1, resume)`` where ``resume`` is the
+    opening quote of a string left unterminated at the end of ``s`` (or ``len(s)``).
+    """
+    search = token_re.search
+    while True:
+        m = search(s, pos)
+        if m is None:
+            return -1, len(s)
+        i = m.start()
+        if s[i] != "'":
+            return i, -1
+        end = mysqldump.skip_string(s, i + 1)
+        if end == -1:
+            return -1, i
+        pos = end
+
+
+_SEMI_OR_QUOTE_RE = re.compile(r"[;']")
+
+
+def _skip_statement(r: _Reader) -> str | None:
+    """Advance past the next ``;`` outside strings.
+
+    Returns the statement text when it fits in ``_MAX_HEADER_CHARS`` (used for
+    ``CREATE TABLE``), else ``None``; long statements stream through the window.
+    """
+    start: int | None = r.pos
+    scan = r.pos
+    while True:
+        semi, resume = _find_terminator(r.buf, scan, _SEMI_OR_QUOTE_RE)
+        if semi != -1:
+            text = r.buf[start : semi + 1] if start is not None else None
+            r.pos = semi + 1
+            return text
+        scan = resume
+        if start is not None and len(r.buf) - start > _MAX_HEADER_CHARS:
+            start = None
+        r.pos = start if start is not None else scan
+        shift = r.fill()
+        if shift < 0:
+            r.pos = len(r.buf)
+            return None
+        scan -= shift
+        if start is not None:
+            start -= shift
+
+
+_PAREN_OR_QUOTE_RE = re.compile(r"[()']")
+
+
+def _group_end(s: str, start: int) -> int:
+    """Index of the ``)`` closing the group opened at ``start``, or -1 if not in ``s``."""
+    depth = 0
+    pos = start
+    while True:
+        i, _resume = _find_terminator(s, pos, _PAREN_OR_QUOTE_RE)
+        if i == -1:
+            return -1
+        if s[i] == "(":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return i
+        pos = i + 1
+
+
+def _parse_tuple(r: _Reader) -> tuple[str | None, ...] | None:
+    """Parse one ``(...)`` at ``r.pos`` (which points at ``(``)."""
+    while True:
+        buf = r.buf
+        fields: list[str | None] = []
+        pos = r.pos + 1
+        while True:
+            m = _FIELD_RE.match(buf, pos)
+            if m is None:
+                break
+            sval = m.group("s")
+            raw = mysqldump.unescape_string(sval) if sval is not None else m.group("a")
+            pos = m.end()
+            if m.group("end") == ")":
+                if fields or raw.strip():
+                    fields.append(mysqldump.parse_atom(raw))
+                r.pos = pos
+                return tuple(fields)
+            fields.append(mysqldump.parse_atom(raw))
+        # Tuple continues past the window, or needs the character-level parser.
+        close = _group_end(buf, r.pos)
+        if close != -1:
+            group = buf[r.pos : close + 1]
+            r.pos = close + 1
+            return tuple(mysqldump.split_fields(group))
+        if r.fill() < 0:
+            return None
+
+
+def _iter_insert_rows(r: _Reader, table: str) -> Iterator[DumpRow]:
+    while True:
+        m = _TUPLE_SEP_RE.match(r.buf, r.pos)
+        r.pos = m.end() if m else r.pos
+        if r.pos >= len(r.buf):
+            if r.fill() < 0:
+                return
+            continue
+        c = r.buf[r.pos]
+        if c == ";":
+            r.pos += 1
+            return
+        if c != "(":
+            _skip_statement(r)
+            return
+        fields = _parse_tuple(r)
+        if fields is None:
+            return
+        yield DumpRow(table, fields)
+
+
+def iter_dump_rows(
+    stream: TextIO,
+    tables: Collection[str] | None = None,
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+    scanned: ScannedDump | None = None,
+) -> Iterator[DumpRow]:
+    """Yield ``INSERT`` tuples for ``tables`` (all tables when ``None``) in one pass.
+
+    When ``scanned`` is given, column names from ``INSERT`` column lists and
+    ``CREATE TABLE`` blocks of the requested tables are recorded on it as they are
+    seen (rows are not stored; see :func:`scan_dump`).
+    """
+    want = {t.lower() for t in tables} if tables is not None else None
+    r = _Reader(stream, read_size)
+    r.fill()
+    while True:
+        m = _STMT_HEAD_RE.search(r.buf, r.pos)
+        if m is None:
+            r.pos = max(r.pos, len(r.buf) - _KEYWORD_OVERLAP)
+            if r.fill() < 0:
+                return
+            continue
+        r.pos = m.start()
+        r.ensure(_MAX_HEADER_CHARS)
+        if m.group(0)[:1].upper() == "C":
+            cm = _CREATE_HEADER_RE.match(r.buf, r.pos)
+            name = cm.group("t").lower() if cm else None
+            stmt = _skip_statement(r)
+            if (
+                scanned is not None
+                and name is not None
+                and stmt is not None
+                and (want is None or name in want)
+            ):
+                entry = scanned.tables.setdefault(name, DumpTable(name=name))
+                entry.create_columns = mysqldump.parse_create_table_column_names(
+                    stmt,
+                    name,
+                )
+            continue
+        hm = _INSERT_HEADER_RE.match(r.buf, r.pos)
+        if hm is None:
+            _skip_statement(r)
+            continue
+        name = (hm.group("table_bt") or hm.group("table_bare") or "").lower()
+        if want is not None and name not in want:
+            _skip_statement(r)
+            continue
+        if scanned is not None:
+            entry = scanned.tables.setdefault(name, DumpTable(name=name))
+            entry.has_insert = True
+            if entry.insert_columns is None:
+                entry.insert_columns = _norm_columns(hm.group("cols"))
+        r.pos = hm.end()
+        yield from _iter_insert_rows(r, name)
+
+
+def scan_dump(
+    stream: TextIO,
+    tables: Collection[str] | None = None,
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> ScannedDump:
+    """Tokenize ``stream`` once and collect rows + column names per table."""
+    scanned = ScannedDump()
+    for row in iter_dump_rows(
+        stream,
+        tables,
+        read_size=read_size,
+        scanned=scanned,
+    ):
+        entry = scanned.tables.setdefault(row.table, DumpTable(name=row.table))
+        entry.rows.append(row.fields)
+    return scanned
+
+
+def scan_dump_file(
+    path: str | Path,
+    tables: Collection[str] | None = None,
+    *,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> ScannedDump:
+    """:func:`scan_dump` over a UTF-8 file (undecodable bytes are replaced)."""
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        return scan_dump(fh, tables, read_size=read_size)
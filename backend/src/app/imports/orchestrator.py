@@ -0,0 +1,168 @@
+"""Run every registered legacy importer in dependency order over one dump.
+
+Used by the ``legacy_crm`` Lambda's import-all mode: the dump is tokenized once
+(:func:`~app.imports.base.load_dump_source_for`), importers run in ``DEPENDS_ON``
+topological order, dependency ref maps are shared in memory between entities, and
+each finished entity is checkpointed in ``legacy_import_checkpoints`` so a re-invoke
+with the same ``run_key`` resumes at the next entity.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from graphlib import CycleError
+from graphlib import TopologicalSorter
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models.legacy_import_checkpoint import LegacyImportCheckpoint
+from app.imports import refs
+from app.imports.base import ImportStats
+from app.imports.base import LegacyImporter
+from app.imports.base import resolve_importer_context
+from app.imports.base import supports_bulk_apply
+from app.imports.mysqldump_stream import DumpSource
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: Ordering-only edges for importers that read another entity's refs without a
+#: ``DEPENDS_ON`` guard (scoped discount codes skip when service/instance refs are
+#: missing, so they must run after both).
+_RUNS_AFTER: Mapping[str, tuple[str, ...]] = {
+    "event_discount_codes": ("event_services", "event_instances"),
+}
+
+
+@dataclass
+class ImportAllResult:
+    """Outcome of one import-all invocation."""
+
+    run_key: str
+    dry_run: bool
+    #: Stats for entities imported by this invocation, in run order.
+    completed: list[ImportStats] = field(default_factory=list)
+    #: Entities skipped because an earlier invocation checkpointed them.
+    already_completed: list[str] = field(default_factory=list)
+    #: Entities not started because the time budget ran out.
+    pending: list[str] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending
+
+
+def import_order(importers: Iterable[LegacyImporter]) -> list[LegacyImporter]:
+    """Topologically sort ``importers`` by ``DEPENDS_ON`` (ties by entity name).
+
+    Dependencies that are not among ``importers`` are ignored; a cycle raises
+    ``ValueError``.
+    """
+    by_entity = {imp.ENTITY: imp for imp in importers}
+    sorter: TopologicalSorter[str] = TopologicalSorter()
+    for entity in sorted(by_entity):
+        deps = (*by_entity[entity].DEPENDS_ON, *_RUNS_AFTER.get(entity, ()))
+        sorter.add(entity, *sorted(d for d in set(deps) if d in by_entity))
+    try:
+        sorter.prepare()
+    except CycleError as exc:
+        msg = f"Legacy importer dependency cycle: {exc.args[1]}"
+        raise ValueError(msg) from exc
+    ordered: list[str] = []
+    while sorter.is_active():
+        ready = sorted(sorter.get_ready())
+        ordered.extend(ready)
+        sorter.done(*ready)
+    return [by_entity[entity] for entity in ordered]
+
+
+def completed_entities(session: Session, run_key: str) -> frozenset[str]:
+    """Entities already checkpointed for ``run_key``."""
+    q = select(LegacyImportCheckpoint.entity).where(
+        LegacyImportCheckpoint.run_key == run_key
+    )
+    return frozenset(str(e) for e in session.execute(q).scalars().all())
+
+
+def _record_checkpoint(session: Session, run_key: str, stats: ImportStats) -> None:
+    session.merge(
+        LegacyImportCheckpoint(
+            run_key=run_key,
+            entity=stats.entity,
+            inserted=stats.inserted,
+            completed_at=datetime.now(timezone.utc),
+        )
+    )
+    session.commit()
+
+
+def run_import_all(
+    session: Session,
+    importers: Iterable[LegacyImporter],
+    source: DumpSource,
+    *,
+    run_key: str,
+    dry_run: bool,
+    bulk_chunk_size: int | None = None,
+    should_continue: Callable[[], bool] = lambda: True,
+) -> ImportAllResult:
+    """Import every entity not yet checkpointed for ``run_key``.
+
+    ``should_continue`` is checked before each entity; once it returns False the
+    remaining entities are reported as ``pending`` (re-invoke to resume). Dry runs
+    neither read nor write checkpoints.
+    """
+    ordered = import_order(importers)
+    needed = {dep for imp in ordered for dep in imp.DEPENDS_ON}
+    done = frozenset() if dry_run else completed_entities(session, run_key)
+    result = ImportAllResult(run_key=run_key, dry_run=dry_run)
+    ref_maps: dict[str, Mapping[str, UUID]] = {}
+    for index, importer in enumerate(ordered):
+        entity = importer.ENTITY
+        if entity in done:
+            result.already_completed.append(entity)
+            continue
+        if not should_continue():
+            result.pending = [
+                imp.ENTITY for imp in ordered[index:] if imp.ENTITY not in done
+            ]
+            logger.info(
+                "Import-all paused run_key=%s pending=%s",
+                run_key,
+                ",".join(result.pending),
+            )
+            break
+        rows = importer.parse(source)
+        ctx = resolve_importer_context(
+            importer,
+            session,
+            dry_run=dry_run,
+            source_sql_text=source,
+            bulk_chunk_size=(
+                bulk_chunk_size if supports_bulk_apply(importer) else None
+            ),
+            ref_maps=ref_maps,
+        )
+        stats = importer.apply(session, rows, ctx, dry_run=dry_run)
+        del rows
+        result.completed.append(stats)
+        if entity in needed and not dry_run:
+            ref_maps[entity] = refs.load_mapping(session, entity)
+        if not dry_run:
+            _record_checkpoint(session, run_key, stats)
+        logger.info(
+            "Import-all entity done run_key=%s entity=%s inserted=%s dry_run=%s",
+            run_key,
+            entity,
+            stats.inserted,
+            dry_run,
+        )
+    return result
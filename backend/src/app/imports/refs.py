@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -32,6 +34,43 @@ def record_mapping(
     )
 
 
+def record_mappings(
+    session: Session,
+    entity: str,
+    mappings: Mapping[str, UUID],
+    *,
+    chunk_size: int = 1000,
+) -> int:
+    """Insert absent ``legacy_key → new_id`` rows in chunks; returns rows inserted.
+
+    Existing keys are skipped (same idempotency as :func:`record_mapping`), so each
+    chunk costs one ``SELECT`` plus at most one multi-row ``INSERT``.
+    """
+    keys = list(mappings)
+    inserted = 0
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        present = set(
+            session.execute(
+                select(LegacyImportRef.legacy_key).where(
+                    LegacyImportRef.entity == entity,
+                    LegacyImportRef.legacy_key.in_(chunk),
+                )
+            )
+            .scalars()
+            .all()
+        )
+        values = [
+            {"entity": entity, "legacy_key": key, "new_id": mappings[key]}
+            for key in chunk
+            if key not in present
+        ]
+        if values:
+            session.execute(insert(LegacyImportRef).values(values))
+            inserted += len(values)
+    return inserted
+
+
 def load_mapping(session: Session, entity: str) -> dict[str, UUID]:
     """Load all legacy_key → new_id for ``entity``."""
     q = select(LegacyImportRef.legacy_key, LegacyImportRef.new_id).where(
@@ -1,30 +1,49 @@
-"""Shared boto3 client factory with caching."""
+"""Shared boto3 client factory with caching.
+
+Clients are thread-safe once built, but creating them is not: boto3's default
+session lazily sets up its credential and endpoint machinery on first use. Worker
+threads (media processing, batch uploads) may be the first callers, so clients are
+created from one dedicated session under a lock.
+"""
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import boto3
 
 _CLIENT_CACHE: dict[tuple[str, str | None], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+_SESSION: boto3.session.Session | None = None
 
 
 def get_client(service: str, region_name: str | None = None) -> Any:
     """Return a cached boto3 client for the given service."""
+    global _SESSION
     cache_key = (service, region_name)
-    if cache_key in _CLIENT_CACHE:
-        return _CLIENT_CACHE[cache_key]
-    client = boto3.client(  # type: ignore[call-overload]
-        service,
-        region_name=region_name,
-    )
-    _CLIENT_CACHE[cache_key] = client
+    client = _CLIENT_CACHE.get(cache_key)
+    if client is not None:
+        return client
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            if _SESSION is None:
+                _SESSION = boto3.session.Session()
+            client = _SESSION.client(  # type: ignore[call-overload]
+                service,
+                region_name=region_name,
+            )
+            _CLIENT_CACHE[cache_key] = client
     return client
 
 
 def clear_client_cache() -> None:
     """Clear cached boto3 clients (useful in tests)."""
-    _CLIENT_CACHE.clear()
+    global _SESSION
+    with _CLIENT_LOCK:
+        _CLIENT_CACHE.clear()
+        _SESSION = None
 
 
 def get_ses_client(region_name: str | None = None) -> Any:
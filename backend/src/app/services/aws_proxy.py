@@ -89,7 +89,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
     allowed = _get_allowed_actions()
 
     if key not in allowed:
-        logger.warning(f"Blocked disallowed AWS action: {key}")
+        logger.warning("Blocked disallowed AWS action: %s", key)
         return {
             "error": {
                 "code": "ActionNotAllowed",
@@ -97,7 +97,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
 
-    logger.info(f"Proxying AWS {key}")
+    logger.info("Proxying AWS %s", key)
 
     try:
         client = get_client(service)  # type: ignore[call-overload]
@@ -119,7 +119,7 @@ def _handle_aws(event: Mapping[str, Any]) -> dict[str, Any]:
             .get("Code", type(exc).__name__)
         )
         message = str(exc)
-        logger.warning(f"Proxy AWS call {key} failed: {code}: {message}")
+        logger.warning("Proxy AWS call %s failed: %s: %s", key, code, message)
         return {"error": {"code": code, "message": message}}
 
 
@@ -167,7 +167,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
     # Check against allow-list
     allowed_prefixes = _get_allowed_http_urls()
     if not any(url.startswith(prefix) for prefix in allowed_prefixes):
-        logger.warning(f"Blocked disallowed HTTP URL: {url}")
+        logger.warning("Blocked disallowed HTTP URL: %s", url)
         return {
             "error": {
                 "code": "URLNotAllowed",
@@ -175,7 +175,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
 
-    logger.info(f"Proxying HTTP {method} {url}")
+    logger.info("Proxying HTTP %s %s", method, url)
 
     try:
         encoded_body = body.encode("utf-8") if body else None
@@ -209,7 +209,7 @@ def _handle_http(event: Mapping[str, Any]) -> dict[str, Any]:
             },
         }
     except Exception as exc:
-        logger.warning(f"HTTP request failed: {type(exc).__name__}: {exc}")
+        logger.warning("HTTP request failed: %s: %s", type(exc).__name__, exc)
         return {
             "error": {
                 "code": type(exc).__name__,
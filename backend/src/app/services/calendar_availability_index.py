@@ -0,0 +1,295 @@
+"""Precomputed availability bitmaps for public consultation / intro-call slots.
+
+``GET /v1/calendar/availability`` answers from one ``calendar_availability_indexes``
+row per purpose: a fixed-width bitset per local day (bit ``i`` = the day's ``i``-th
+candidate slot is free of busy time) covering today through the purpose's request
+horizon. Lead time and ``now`` are applied at read, so the bitmap only changes when
+busy time does.
+
+Maintenance is incremental. Row triggers on ``calendar_manual_blocks`` and
+``instance_session_slots`` (migration ``0074_calendar_availability_index``) widen a
+dirty date range and only those days are recomputed; statement triggers on
+``services`` / ``service_instances`` (eligibility changes) force a full rebuild. When
+the local date rolls over, the window shifts and only the new tail days are built.
+Every rebuilt day is produced by the purpose's existing ``spec.compute`` algorithm,
+and ``CALENDAR_AVAILABILITY_INDEX_VERIFY_RATE`` samples requests for a shadow
+comparison against it.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.orm import Session
+
+from app.db.models.calendar_availability_index import CalendarAvailabilityIndex
+from app.db.repositories.calendar_availability_index import (
+    CalendarAvailabilityIndexRepository,
+)
+from app.services.calendar_blockers import (
+    consultation_candidate_slots,
+    resolve_calendar_blockers_wall_timezone,
+)
+from app.services.intro_call_slots import enumerate_intro_call_candidate_slots
+from app.services.public_calendar_availability import (
+    AvailabilityPurpose,
+    AvailabilitySpec,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_ENV_VERIFY_RATE = "CALENDAR_AVAILABILITY_INDEX_VERIFY_RATE"
+
+#: Bytes per local day; must hold one bit per candidate slot of that purpose.
+INDEX_DAY_BYTES: dict[AvailabilityPurpose, int] = {
+    AvailabilityPurpose.CONSULTATION_BOOKING: 1,  # AM + PM half-days
+    AvailabilityPurpose.INTRO_CALL_BOOKING: 3,  # 18 half-hourly starts 09:00-17:30
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+Slot = tuple[datetime, datetime]
+
+
+def index_horizon_days(spec: AvailabilitySpec) -> int:
+    """Days after today covered by the index (furthest ``to`` a request may ask for)."""
+    return spec.window.max_horizon_days + (spec.window.max_forward_days or 0)
+
+
+def day_candidate_slots(purpose: AvailabilityPurpose, day_local: date) -> list[Slot]:
+    """Bookable template slots for one local date, ignoring busy time and lead time."""
+    if purpose is AvailabilityPurpose.CONSULTATION_BOOKING:
+        zone = ZoneInfo(resolve_calendar_blockers_wall_timezone())
+        return consultation_candidate_slots(day_local, zone=zone)
+    return enumerate_intro_call_candidate_slots(day_local, day_local, now=_EPOCH)
+
+
+def _days(first: date, last: date) -> Iterator[date]:
+    day = first
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+def _contiguous_runs(days: list[date]) -> Iterator[tuple[date, date]]:
+    if not days:
+        return
+    first = prev = days[0]
+    for day in days[1:]:
+        if day != prev + timedelta(days=1):
+            yield first, prev
+            first = day
+        prev = day
+    yield first, prev
+
+
+def build_day_bits(
+    session: Session,
+    spec: AvailabilitySpec,
+    first: date,
+    last: date,
+) -> dict[date, int]:
+    """Run the purpose's current algorithm over ``[first, last]`` and pack it per day."""
+    width = INDEX_DAY_BYTES[spec.purpose]
+    # A ``now`` well before ``first`` disables lead-time trimming inside compute.
+    before = datetime.combine(first - timedelta(days=3), time.min, tzinfo=UTC)
+    free = set(spec.compute(session, first, last, before))
+    out: dict[date, int] = {}
+    for day in _days(first, last):
+        candidates = day_candidate_slots(spec.purpose, day)
+        if len(candidates) > width * 8:
+            msg = f"{spec.purpose.value} has {len(candidates)} slots on {day}"
+            raise ValueError(msg)
+        out[day] = sum(1 << i for i, slot in enumerate(candidates) if slot in free)
+    return out
+
+
+def _decode(row: CalendarAvailabilityIndex, width: int) -> dict[date, int]:
+    if row.start_date is None:
+        return {}
+    bitmap = bytes(row.bitmap or b"")
+    return {
+        row.start_date + timedelta(days=i): int.from_bytes(
+            bitmap[i * width : (i + 1) * width], "little"
+        )
+        for i in range(len(bitmap) // width)
+    }
+
+
+def _encode(days: dict[date, int], first: date, last: date, width: int) -> bytes:
+    return b"".join(days[day].to_bytes(width, "little") for day in _days(first, last))
+
+
+def _is_current(
+    row: CalendarAvailabilityIndex,
+    *,
+    today: date,
+    wall_time_zone: str,
+    expected_len: int,
+) -> bool:
+    return (
+        not row.stale
+        and row.dirty_from is None
+        and row.dirty_to is None
+        and row.start_date == today
+        and row.wall_time_zone == wall_time_zone
+        and len(row.bitmap or b"") == expected_len
+    )
+
+
+def _refresh(
+    session: Session,
+    spec: AvailabilitySpec,
+    row: CalendarAvailabilityIndex,
+    *,
+    today: date,
+    wall_time_zone: str,
+    now: datetime,
+) -> dict[date, int]:
+    """Rebuild only the days the locked ``row`` is missing or has marked dirty."""
+    width = INDEX_DAY_BYTES[spec.purpose]
+    last = today + timedelta(days=index_horizon_days(spec))
+    kept: dict[date, int] = {}
+    if not row.stale and row.wall_time_zone == wall_time_zone:
+        kept = _decode(row, width)
+        if row.dirty_from is not None or row.dirty_to is not None:
+            lo = row.dirty_from or date.min
+            hi = row.dirty_to or date.max
+            kept = {d: bits for d, bits in kept.items() if not lo <= d <= hi}
+    days = {d: kept[d] for d in _days(today, last) if d in kept}
+    missing = [d for d in _days(today, last) if d not in days]
+    for first, end in _contiguous_runs(missing):
+        days.update(build_day_bits(session, spec, first, end))
+
+    row.wall_time_zone = wall_time_zone
+    row.start_date = today
+    row.bitmap = _encode(days, today, last, width)
+    row.dirty_from = None
+    row.dirty_to = None
+    row.stale = False
+    row.built_at = now
+    session.commit()
+    logger.info(
+        "calendar_availability_index_refreshed",
+        extra={"purpose": spec.purpose.value, "rebuilt_days": len(missing)},
+    )
+    return days
+
+
+def _index_days(
+    session: Session,
+    spec: AvailabilitySpec,
+    *,
+    today: date,
+    now: datetime,
+) -> dict[date, int] | None:
+    """Current per-day bits, refreshing under a row lock; ``None`` if unavailable."""
+    repository = CalendarAvailabilityIndexRepository(session)
+    width = INDEX_DAY_BYTES[spec.purpose]
+    wall_time_zone = spec.wall_timezone_resolver()
+    expected_len = (index_horizon_days(spec) + 1) * width
+    row = repository.get(spec.purpose.value)
+    if row is None:
+        return None
+    if _is_current(
+        row, today=today, wall_time_zone=wall_time_zone, expected_len=expected_len
+    ):
+        return _decode(row, width)
+    row = repository.lock_for_refresh(spec.purpose.value)
+    if row is None:
+        session.rollback()
+        return None
+    if _is_current(
+        row, today=today, wall_time_zone=wall_time_zone, expected_len=expected_len
+    ):
+        session.commit()
+        return _decode(row, width)
+    return _refresh(
+        session, spec, row, today=today, wall_time_zone=wall_time_zone, now=now
+    )
+
+
+def _trim_lead(spec: AvailabilitySpec, slots: list[Slot], now: datetime) -> list[Slot]:
+    """Apply ``spec.lead`` and drop slots already over (same rules as ``compute``)."""
+    now_u = now if now.tzinfo else now.replace(tzinfo=UTC)
+    zone = ZoneInfo(spec.wall_timezone_resolver())
+    earliest_start = (
+        now_u + timedelta(hours=spec.lead.lead_hours)
+        if spec.lead.lead_hours is not None
+        else None
+    )
+    min_date = (
+        now_u.astimezone(zone).date() + timedelta(days=spec.lead.lead_calendar_days)
+        if spec.lead.lead_calendar_days is not None
+        else None
+    )
+    return [
+        (s0, s1)
+        for s0, s1 in slots
+        if s1 > now_u
+        and (earliest_start is None or s0 >= earliest_start)
+        and (min_date is None or s0.astimezone(zone).date() >= min_date)
+    ]
+
+
+def _verify_rate() -> float:
+    raw = os.getenv(_ENV_VERIFY_RATE, "").strip()
+    try:
+        return min(max(float(raw), 0.0), 1.0) if raw else 0.0
+    except ValueError:
+        return 0.0
+
+
+def load_available_slots(
+    session: Session,
+    spec: AvailabilitySpec,
+    from_date: date,
+    to_date: date,
+    now: datetime,
+) -> list[Slot]:
+    """Available slots for ``[from_date, to_date]`` answered from the bitmap index.
+
+    Falls back to ``spec.compute`` when the range extends past the index horizon or
+    another request is rebuilding the row.
+    """
+    now_u = now if now.tzinfo else now.replace(tzinfo=UTC)
+    today = now_u.astimezone(ZoneInfo(spec.wall_timezone_resolver())).date()
+    days = None
+    if to_date <= today + timedelta(days=index_horizon_days(spec)):
+        days = _index_days(session, spec, today=today, now=now_u)
+    if days is None:
+        return spec.compute(session, from_date, to_date, now)
+
+    slots: list[Slot] = []
+    # Days before ``today`` are never bookable, so the index starts at ``today``.
+    for day in _days(max(from_date, today), to_date):
+        bits = days.get(day, 0)
+        if not bits:
+            continue
+        for i, slot in enumerate(day_candidate_slots(spec.purpose, day)):
+            if bits >> i & 1:
+                slots.append(slot)
+    slots = _trim_lead(spec, slots, now_u)
+
+    if random.random() < _verify_rate():
+        expected = spec.compute(session, from_date, to_date, now)
+        if expected != slots:
+            logger.warning(
+                "calendar_availability_index_mismatch",
+                extra={
+                    "purpose": spec.purpose.value,
+                    "from": from_date.isoformat(),
+                    "to": to_date.isoformat(),
+                    "index_slots": len(slots),
+                    "computed_slots": len(expected),
+                },
+            )
+            CalendarAvailabilityIndexRepository(session).mark_stale(spec.purpose.value)
+            session.commit()
+            return expected
+    return slots
@@ -436,6 +436,26 @@ def validate_session_slot_chronology(
 _CONSULTATION_OPEN_DAYS = frozenset({0, 1, 2, 3, 4})
 
 
+def consultation_candidate_slots(
+    day_local: date,
+    *,
+    zone: ZoneInfo,
+) -> list[tuple[datetime, datetime]]:
+    """Nominal AM/PM half-day windows (UTC) for one Mon–Fri local date, else ``[]``."""
+    if day_local.weekday() not in _CONSULTATION_OPEN_DAYS:
+        return []
+    ymd = day_local.isoformat()
+    windows = (
+        _window_utc_for_local_hours(
+            ymd, start_hour=_AM_START_HOUR, end_hour=_AM_END_HOUR, zone=zone
+        ),
+        _window_utc_for_local_hours(
+            ymd, start_hour=_PM_START_HOUR, end_hour=_PM_END_HOUR, zone=zone
+        ),
+    )
+    return [w for w in windows if w is not None]
+
+
 def compute_available_consultation_slots(
     session: Session,
     *,
@@ -468,31 +488,9 @@ def compute_available_consultation_slots(
     )
 
     out: list[tuple[datetime, datetime]] = []
-    cur = from_date
+    cur = max(from_date, min_bookable_date)
     while cur <= to_date:
-        if cur.weekday() not in _CONSULTATION_OPEN_DAYS:
-            cur += timedelta(days=1)
-            continue
-        if cur < min_bookable_date:
-            cur += timedelta(days=1)
-            continue
-        ymd = cur.isoformat()
-        am = _window_utc_for_local_hours(
-            ymd,
-            start_hour=_AM_START_HOUR,
-            end_hour=_AM_END_HOUR,
-            zone=zone,
-        )
-        pm = _window_utc_for_local_hours(
-            ymd,
-            start_hour=_PM_START_HOUR,
-            end_hour=_PM_END_HOUR,
-            zone=zone,
-        )
-        for slot in (am, pm):
-            if slot is None:
-                continue
-            s0, s1 = slot
+        for s0, s1 in consultation_candidate_slots(cur, zone=zone):
             if not candidate_overlaps_merged_busy(s0, s1, busy_merged) and s1 > now_u:
                 out.append((s0, s1))
         cur += timedelta(days=1)
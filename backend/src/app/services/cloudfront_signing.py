@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import math
 import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from urllib.parse import quote
 
 from botocore.signers import CloudFrontSigner
@@ -19,6 +22,8 @@ _PRIVATE_KEY_FIELDS = ("private_key_pem", "privateKeyPem", "private_key")
 _DEFAULT_SIGNER_CACHE_TTL_SECONDS = 300
 _MIN_SIGNER_CACHE_TTL_SECONDS = 30
 _MAX_SIGNER_CACHE_TTL_SECONDS = 3600
+_DEFAULT_EXPIRY_BUCKET_SECONDS = 3600
+_URL_MEMO_MAX_ENTRIES = 2048
 
 
 @dataclass(frozen=True)
@@ -30,6 +35,29 @@ class _SignerCacheEntry:
 
 _SIGNER_CACHE: _SignerCacheEntry | None = None
 
+# Signed URLs keyed by (key pair, resource URL, expiry epoch). A signature only
+# depends on those inputs, so it is reused until the expiry bucket rolls over.
+_URL_MEMO: OrderedDict[tuple[str, str, int], str] = OrderedDict()
+_URL_MEMO_LOCK = threading.Lock()
+
+
+def bucket_expiry(
+    expires_at: datetime, *, bucket_seconds: int | None = None
+) -> datetime:
+    """Round ``expires_at`` up to the configured expiry granularity.
+
+    Links issued within the same bucket share an expiry and therefore a
+    memoized signature; rounding up never shortens a link's lifetime.
+    ``ASSET_DOWNLOAD_URL_EXPIRY_BUCKET_SECONDS=0`` disables bucketing;
+    ``bucket_seconds`` overrides the configured granularity.
+    """
+    if bucket_seconds is None:
+        bucket_seconds = _expiry_bucket_seconds()
+    if bucket_seconds <= 0:
+        return expires_at
+    epoch = math.ceil(expires_at.timestamp() / bucket_seconds) * bucket_seconds
+    return datetime.fromtimestamp(epoch, tz=UTC)
+
 
 def generate_signed_download_url(
     *,
@@ -49,25 +77,60 @@ def generate_signed_download_url(
     key_pair_id = require_env("ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID")
     secret_arn = require_env("ASSET_DOWNLOAD_CLOUDFRONT_PRIVATE_KEY_SECRET_ARN")
 
-    normalized_key = s3_key.strip().lstrip("/")
-    if not normalized_key:
-        raise RuntimeError("s3_key is required for signed download URL")
-
-    resource_url = (
-        f"https://{distribution_domain}/{quote(normalized_key, safe='/_.-~')}"
-    )
+    resource_url = _object_url(distribution_domain, s3_key)
     if cache_bust_key is not None and str(cache_bust_key).strip() != "":
         safe_cb = quote(str(cache_bust_key).strip(), safe="")
         sep = "&" if "?" in resource_url else "?"
         resource_url = f"{resource_url}{sep}cb={safe_cb}"
+
+    memo_key = (key_pair_id, resource_url, int(expires_at.timestamp()))
+    with _URL_MEMO_LOCK:
+        memoized = _URL_MEMO.get(memo_key)
+        if memoized is not None:
+            _URL_MEMO.move_to_end(memo_key)
+            return memoized
     signer = _get_signer(key_pair_id=key_pair_id, secret_arn=secret_arn)
-    return signer.generate_presigned_url(resource_url, date_less_than=expires_at)
+    url = signer.generate_presigned_url(resource_url, date_less_than=expires_at)
+    _remember_url(memo_key, url)
+    return url
+
+
+def prime_signer() -> bool:
+    """Load the signing key into the signer cache (Lambda warm-up).
+
+    Returns ``False`` when CloudFront signing is not configured.
+    """
+    key_pair_id = os.getenv("ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID", "").strip()
+    secret_arn = os.getenv(
+        "ASSET_DOWNLOAD_CLOUDFRONT_PRIVATE_KEY_SECRET_ARN", ""
+    ).strip()
+    if not key_pair_id or not secret_arn:
+        return False
+    _get_signer(key_pair_id=key_pair_id, secret_arn=secret_arn)
+    return True
 
 
 def clear_signer_cache() -> None:
-    """Clear signer cache (used by tests and key-rotation flows)."""
+    """Clear signer and signed URL caches (used by tests and key-rotation flows)."""
     global _SIGNER_CACHE
     _SIGNER_CACHE = None
+    with _URL_MEMO_LOCK:
+        _URL_MEMO.clear()
+
+
+def _object_url(distribution_domain: str, s3_key: str) -> str:
+    normalized_key = s3_key.strip().lstrip("/")
+    if not normalized_key:
+        raise RuntimeError("s3_key is required for signed download URL")
+    return f"https://{distribution_domain}/{quote(normalized_key, safe='/_.-~')}"
+
+
+def _remember_url(memo_key: tuple[str, str, int], url: str) -> None:
+    with _URL_MEMO_LOCK:
+        _URL_MEMO[memo_key] = url
+        _URL_MEMO.move_to_end(memo_key)
+        while len(_URL_MEMO) > _URL_MEMO_MAX_ENTRIES:
+            _URL_MEMO.popitem(last=False)
 
 
 def _get_signer(*, key_pair_id: str, secret_arn: str) -> CloudFrontSigner:
@@ -146,3 +209,16 @@ def _signer_cache_ttl_seconds() -> int:
         _MIN_SIGNER_CACHE_TTL_SECONDS,
         min(_MAX_SIGNER_CACHE_TTL_SECONDS, parsed),
     )
+
+
+def _expiry_bucket_seconds() -> int:
+    raw = os.getenv(
+        "ASSET_DOWNLOAD_URL_EXPIRY_BUCKET_SECONDS",
+        f"{_DEFAULT_EXPIRY_BUCKET_SECONDS}",
+    ).strip()
+    try:
+        return max(0, int(raw))
+    except ValueError as exc:
+        raise RuntimeError(
+            "ASSET_DOWNLOAD_URL_EXPIRY_BUCKET_SECONDS must be an integer"
+        ) from exc
@@ -0,0 +1,254 @@
+"""Batch completion certificate issuance for a training cohort.
+
+Issuing certificates one admin request at a time re-resolves the same instance,
+renders each PDF on the request thread and uploads serially. The batch runner
+resolves every draft with set-based queries, renders the PDFs across worker
+processes, inserts the rows together and uploads the PDFs concurrently, then
+optionally packs them into one ZIP.
+
+PDF rendering is CPU-bound ReportLab code and goes through
+``pdf_render_engine.render_many`` (forked worker processes).
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import uuid
+import zipfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.db.models import CompletionCertificate
+from app.db.models.enums import CompletionCertificateStatus
+from app.exceptions import ValidationError
+from app.services.aws_clients import get_s3_client
+from app.services.completion_certificate_common import (
+    ResolvedCertificateDraft,
+    _sha256_bytes,
+    draft_to_pdf_context,
+    issued_pdf_s3_key,
+    resolve_certificate_drafts,
+)
+from app.services.completion_certificate_pdf import (
+    COMPLETION_CERTIFICATE_PDF_TEMPLATE_VERSION,
+    CompletionCertificatePdfContext,
+    render_completion_certificate_pdf,
+)
+from app.services.customer_billing import store_pdf_in_assets_bucket
+from app.services.pdf_render_engine import render_many
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: Largest cohort accepted by one batch request.
+MAX_BATCH_CONTACTS = 100
+#: Concurrent S3 uploads per batch.
+MAX_CONCURRENT_UPLOADS = 8
+
+_FILENAME_UNSAFE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@dataclass(frozen=True)
+class BatchIssueOutcome:
+    """Per-contact result; exactly one of ``certificate`` / ``error`` is set."""
+
+    contact_id: UUID
+    certificate: CompletionCertificate | None = None
+    error: str | None = None
+    field: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchIssueResult:
+    outcomes: list[BatchIssueOutcome]
+    pdfs: dict[UUID, bytes]
+
+
+def batch_zip_s3_key() -> str:
+    return f"completion-certificates/batch/{uuid.uuid4()}.zip"
+
+
+def render_certificate_pdfs(
+    contexts: Sequence[CompletionCertificatePdfContext],
+    *,
+    max_workers: int | None = None,
+) -> list[bytes]:
+    """Render ``contexts`` (in order) across worker processes; see ``render_many``."""
+    return render_many(
+        render_completion_certificate_pdf, contexts, max_workers=max_workers
+    )
+
+
+def _upload_pdfs(
+    uploads: list[tuple[UUID, str, bytes]],
+) -> dict[UUID, BaseException]:
+    """Upload ``(contact_id, s3_key, body)`` in parallel; return failures by contact."""
+    if not uploads:
+        return {}
+    # Build the S3 client on this thread; the workers only reuse it.
+    get_s3_client()
+    workers = min(MAX_CONCURRENT_UPLOADS, len(uploads))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (
+                contact_id,
+                executor.submit(
+                    store_pdf_in_assets_bucket,
+                    s3_key=key,
+                    body=body,
+                    content_type="application/pdf",
+                    require_upload=True,
+                ),
+            )
+            for contact_id, key, body in uploads
+        ]
+    failures: dict[UUID, BaseException] = {}
+    for contact_id, future in futures:
+        error = future.exception()
+        if error is not None:
+            failures[contact_id] = error
+    return failures
+
+
+def issue_certificate_batch(
+    session: Session,
+    *,
+    contact_ids: list[UUID],
+    service_id: UUID,
+    instance_id: UUID,
+    participation_date: date,
+    program_title_override: str | None,
+    partner_organization_id: UUID | None,
+    actor_sub: str,
+    render: Callable[
+        [Sequence[CompletionCertificatePdfContext]], list[bytes]
+    ] = render_certificate_pdfs,
+) -> BatchIssueResult:
+    """Issue one certificate per contact; the caller commits.
+
+    Instance-level validation errors raise for the whole batch. Contacts that
+    fail validation or whose PDF upload fails get an error outcome and no row.
+    """
+    drafts = resolve_certificate_drafts(
+        session,
+        contact_ids=contact_ids,
+        service_id=service_id,
+        instance_id=instance_id,
+        participation_date=participation_date,
+        program_title_override=program_title_override,
+        partner_organization_id=partner_organization_id,
+    )
+    ready: list[tuple[UUID, ResolvedCertificateDraft]] = [
+        (contact_id, draft)
+        for contact_id, draft in drafts.items()
+        if not isinstance(draft, ValidationError)
+    ]
+    rendered = render([draft_to_pdf_context(draft) for _cid, draft in ready])
+
+    now = datetime.now(UTC)
+    certificates = {
+        contact_id: CompletionCertificate(
+            contact_id=draft.contact_id,
+            instance_id=draft.instance_id,
+            service_id=draft.service_id,
+            enrollment_id=draft.enrollment_id,
+            partner_organization_id=draft.partner_organization_id,
+            participation_date=draft.participation_date,
+            recipient_display_name=draft.recipient_display_name,
+            program_title=draft.program_title,
+            partner_display_name=draft.partner_display_name,
+            partner_signer_name=draft.partner_signer_name,
+            body_text=draft.body_text,
+            status=CompletionCertificateStatus.ISSUED,
+            issued_at=now,
+            issued_by=actor_sub,
+        )
+        for contact_id, draft in ready
+    }
+    session.add_all(certificates.values())
+    session.flush()
+
+    pdfs = {contact_id: pdf for (contact_id, _draft), pdf in zip(ready, rendered)}
+    failures = _upload_pdfs(
+        [
+            (contact_id, issued_pdf_s3_key(cert.id), pdfs[contact_id])
+            for contact_id, cert in certificates.items()
+        ]
+    )
+    for contact_id, cert in certificates.items():
+        if contact_id in failures:
+            logger.error(
+                "Failed to upload batch completion certificate PDF",
+                extra={"contact_id": str(contact_id), "certificate_id": str(cert.id)},
+                exc_info=failures[contact_id],
+            )
+            session.delete(cert)
+            pdfs.pop(contact_id)
+            continue
+        cert.issued_pdf_s3_key = issued_pdf_s3_key(cert.id)
+        cert.issued_pdf_sha256 = _sha256_bytes(pdfs[contact_id])
+        cert.pdf_template_version = COMPLETION_CERTIFICATE_PDF_TEMPLATE_VERSION
+    session.flush()
+
+    outcomes: list[BatchIssueOutcome] = []
+    for contact_id, draft in drafts.items():
+        if isinstance(draft, ValidationError):
+            outcomes.append(
+                BatchIssueOutcome(
+                    contact_id=contact_id, error=draft.message, field=draft.field
+                )
+            )
+        elif contact_id in failures:
+            outcomes.append(
+                BatchIssueOutcome(
+                    contact_id=contact_id, error="Certificate PDF upload failed"
+                )
+            )
+        else:
+            outcomes.append(
+                BatchIssueOutcome(
+                    contact_id=contact_id, certificate=certificates[contact_id]
+                )
+            )
+    logger.info(
+        "Issued completion certificate batch",
+        extra={
+            "instance_id": str(instance_id),
+            "requested": len(contact_ids),
+            "issued": sum(1 for o in outcomes if o.certificate is not None),
+            "failed": sum(1 for o in outcomes if o.error is not None),
+        },
+    )
+    return BatchIssueResult(outcomes=outcomes, pdfs=pdfs)
+
+
+def build_certificate_zip(
+    entries: Sequence[tuple[CompletionCertificate, bytes]],
+) -> bytes:
+    """ZIP of issued PDFs named ``<recipient>-<certificate id prefix>.pdf``."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for cert, pdf in entries:
+            stem = (
+                _FILENAME_UNSAFE.sub("-", cert.recipient_display_name).strip("-")
+                or "certificate"
+            )
+            archive.writestr(f"{stem}-{str(cert.id)[:8]}.pdf", pdf)
+    return buf.getvalue()
+
+
+def upload_certificate_zip(archive: bytes) -> str:
+    key = batch_zip_s3_key()
+    store_pdf_in_assets_bucket(
+        s3_key=key,
+        body=archive,
+        content_type="application/zip",
+        require_upload=True,
+    )
+    return key
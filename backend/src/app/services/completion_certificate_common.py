@@ -98,21 +98,22 @@ def _partner_signer_name(session: Session, organization_id: UUID) -> str | None:
     return None
 
 
-def resolve_certificate_draft(
-    session: Session,
-    *,
-    contact_id: UUID,
-    service_id: UUID,
-    instance_id: UUID,
-    participation_date: date,
-    program_title_override: str | None,
-    partner_organization_id: UUID | None,
-) -> ResolvedCertificateDraft:
-    """Validate inputs and assemble snapshot fields for preview/issue."""
-    contact = session.get(Contact, contact_id)
-    if contact is None or contact.archived_at is not None:
-        raise ValidationError("contact_id not found", field="contact_id")
+@dataclass(frozen=True)
+class _CertificateTerms:
+    """Instance-level snapshot fields shared by every recipient."""
+
+    partner_organization_id: UUID | None
+    program_title: str
+    partner_display_name: str | None
+    partner_signer_name: str | None
+    body_text: str
+    trading_name: str
+    es_founder_name: str
 
+
+def _load_certificate_instance(
+    session: Session, *, instance_id: UUID, service_id: UUID
+) -> ServiceInstance:
     instance = session.execute(
         select(ServiceInstance)
         .where(ServiceInstance.id == instance_id)
@@ -130,20 +131,16 @@ def resolve_certificate_draft(
             "instance_id does not belong to service_id",
             field="instance_id",
         )
+    return instance
 
-    enrollment = session.execute(
-        select(Enrollment).where(
-            Enrollment.instance_id == instance_id,
-            Enrollment.contact_id == contact_id,
-            Enrollment.status == EnrollmentStatus.COMPLETED,
-        )
-    ).scalar_one_or_none()
-    if enrollment is None:
-        raise ValidationError(
-            "Contact must have a completed enrollment for this instance",
-            field="contact_id",
-        )
 
+def _resolve_certificate_terms(
+    session: Session,
+    instance: ServiceInstance,
+    *,
+    program_title_override: str | None,
+    partner_organization_id: UUID | None,
+) -> _CertificateTerms:
     service = instance.service
     default_program = (
         instance.title if instance.title is not None else service.title
@@ -204,29 +201,158 @@ def resolve_certificate_draft(
             field="partner_organization_id",
         )
 
-    recipient_display_name = _contact_display_name(contact)
-    body_text = build_certificate_body_text(
-        trading_name=trading_name,
-        partner_display_name=partner_display_name,
-    )
-
-    return ResolvedCertificateDraft(
-        contact_id=contact_id,
-        instance_id=instance_id,
-        service_id=service_id,
-        enrollment_id=enrollment.id,
+    return _CertificateTerms(
         partner_organization_id=resolved_partner_id,
-        participation_date=participation_date,
-        recipient_display_name=recipient_display_name,
         program_title=program_title,
         partner_display_name=partner_display_name,
         partner_signer_name=partner_signer_name,
-        body_text=body_text,
+        body_text=build_certificate_body_text(
+            trading_name=trading_name,
+            partner_display_name=partner_display_name,
+        ),
         trading_name=trading_name,
         es_founder_name=es_founder,
     )
 
 
+def _draft_for(
+    *,
+    contact: Contact,
+    enrollment: Enrollment,
+    instance: ServiceInstance,
+    participation_date: date,
+    terms: _CertificateTerms,
+) -> ResolvedCertificateDraft:
+    return ResolvedCertificateDraft(
+        contact_id=contact.id,
+        instance_id=instance.id,
+        service_id=instance.service_id,
+        enrollment_id=enrollment.id,
+        partner_organization_id=terms.partner_organization_id,
+        participation_date=participation_date,
+        recipient_display_name=_contact_display_name(contact),
+        program_title=terms.program_title,
+        partner_display_name=terms.partner_display_name,
+        partner_signer_name=terms.partner_signer_name,
+        body_text=terms.body_text,
+        trading_name=terms.trading_name,
+        es_founder_name=terms.es_founder_name,
+    )
+
+
+def resolve_certificate_draft(
+    session: Session,
+    *,
+    contact_id: UUID,
+    service_id: UUID,
+    instance_id: UUID,
+    participation_date: date,
+    program_title_override: str | None,
+    partner_organization_id: UUID | None,
+) -> ResolvedCertificateDraft:
+    """Validate inputs and assemble snapshot fields for preview/issue."""
+    contact = session.get(Contact, contact_id)
+    if contact is None or contact.archived_at is not None:
+        raise ValidationError("contact_id not found", field="contact_id")
+
+    instance = _load_certificate_instance(
+        session, instance_id=instance_id, service_id=service_id
+    )
+
+    enrollment = session.execute(
+        select(Enrollment).where(
+            Enrollment.instance_id == instance_id,
+            Enrollment.contact_id == contact_id,
+            Enrollment.status == EnrollmentStatus.COMPLETED,
+        )
+    ).scalar_one_or_none()
+    if enrollment is None:
+        raise ValidationError(
+            "Contact must have a completed enrollment for this instance",
+            field="contact_id",
+        )
+
+    terms = _resolve_certificate_terms(
+        session,
+        instance,
+        program_title_override=program_title_override,
+        partner_organization_id=partner_organization_id,
+    )
+    return _draft_for(
+        contact=contact,
+        enrollment=enrollment,
+        instance=instance,
+        participation_date=participation_date,
+        terms=terms,
+    )
+
+
+def resolve_certificate_drafts(
+    session: Session,
+    *,
+    contact_ids: list[UUID],
+    service_id: UUID,
+    instance_id: UUID,
+    participation_date: date,
+    program_title_override: str | None,
+    partner_organization_id: UUID | None,
+) -> dict[UUID, ResolvedCertificateDraft | ValidationError]:
+    """Batch ``resolve_certificate_draft`` for one instance and many contacts.
+
+    Instance, partner and configuration problems raise for the whole batch;
+    per-contact problems (unknown or archived contact, no completed enrollment)
+    are returned in place of that contact's draft. Contacts and enrollments
+    are each loaded with one query regardless of batch size.
+    """
+    instance = _load_certificate_instance(
+        session, instance_id=instance_id, service_id=service_id
+    )
+    terms = _resolve_certificate_terms(
+        session,
+        instance,
+        program_title_override=program_title_override,
+        partner_organization_id=partner_organization_id,
+    )
+    contacts = {
+        contact.id: contact
+        for contact in session.execute(
+            select(Contact).where(Contact.id.in_(contact_ids))
+        ).scalars()
+    }
+    enrollments: dict[UUID, Enrollment] = {}
+    for enrollment in session.execute(
+        select(Enrollment).where(
+            Enrollment.instance_id == instance_id,
+            Enrollment.contact_id.in_(contact_ids),
+            Enrollment.status == EnrollmentStatus.COMPLETED,
+        )
+    ).scalars():
+        enrollments.setdefault(enrollment.contact_id, enrollment)
+
+    drafts: dict[UUID, ResolvedCertificateDraft | ValidationError] = {}
+    for contact_id in contact_ids:
+        contact = contacts.get(contact_id)
+        enrollment = enrollments.get(contact_id)
+        if contact is None or contact.archived_at is not None:
+            drafts[contact_id] = ValidationError(
+                "contact_id not found", field="contact_id"
+            )
+        elif enrollment is None:
+            drafts[contact_id] = ValidationError(
+                "Contact must have a completed enrollment for this instance",
+                field="contact_id",
+            )
+        else:
+            drafts[contact_id] = _draft_for(
+                contact=contact,
+                enrollment=enrollment,
+                instance=instance,
+                participation_date=participation_date,
+                terms=terms,
+            )
+    return drafts
+
+
 def draft_to_pdf_context(
     draft: ResolvedCertificateDraft,
 ) -> CompletionCertificatePdfContext:
@@ -9,11 +9,12 @@ from datetime import date
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import landscape, A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
 from app.config.public_www import get_public_www
+from app.services.pdf_render_engine import cached_styles, sample_styles
 
 COMPLETION_CERTIFICATE_PDF_TEMPLATE_VERSION = "completion-certificate-v1"
 
@@ -76,20 +77,22 @@ def _credential_footer(participation_date: date) -> str:
     return f"{_CREDENTIAL_FOOTER_PREFIX} · {participation_date.year}"
 
 
-def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> bytes:
-    """Render a landscape completion certificate PDF."""
-    page_size = landscape(A4)
-    buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=page_size,
-        leftMargin=18 * mm,
-        rightMargin=18 * mm,
-        topMargin=16 * mm,
-        bottomMargin=16 * mm,
-    )
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
+@dataclass(frozen=True)
+class _CertificateStyles:
+    title: ParagraphStyle
+    brand: ParagraphStyle
+    program: ParagraphStyle
+    recipient: ParagraphStyle
+    body: ParagraphStyle
+    sig_name: ParagraphStyle
+    date: ParagraphStyle
+    footer: ParagraphStyle
+
+
+@cached_styles
+def _certificate_styles() -> _CertificateStyles:
+    styles = sample_styles()
+    title = ParagraphStyle(
         "CertTitle",
         parent=styles["Heading1"],
         fontName="Helvetica-Bold",
@@ -99,7 +102,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         textColor=colors.HexColor("#1a3d2e"),
         spaceAfter=6,
     )
-    brand_style = ParagraphStyle(
+    brand = ParagraphStyle(
         "CertBrand",
         parent=styles["Normal"],
         fontName="Helvetica-Bold",
@@ -109,7 +112,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         textColor=colors.HexColor("#4a6741"),
         spaceAfter=10,
     )
-    program_style = ParagraphStyle(
+    program = ParagraphStyle(
         "CertProgram",
         parent=styles["Normal"],
         fontName="Helvetica-Bold",
@@ -119,7 +122,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         textColor=colors.HexColor("#2d4a3e"),
         spaceAfter=14,
     )
-    recipient_style = ParagraphStyle(
+    recipient = ParagraphStyle(
         "CertRecipient",
         parent=styles["Normal"],
         fontName="Helvetica-Bold",
@@ -129,7 +132,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         textColor=colors.HexColor("#1a1a1a"),
         spaceAfter=12,
     )
-    body_style = ParagraphStyle(
+    body = ParagraphStyle(
         "CertBody",
         parent=styles["Normal"],
         fontName="Helvetica",
@@ -139,7 +142,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         textColor=colors.HexColor("#333333"),
         spaceAfter=18,
     )
-    sig_name_style = ParagraphStyle(
+    sig_name = ParagraphStyle(
         "CertSigName",
         parent=styles["Normal"],
         fontName="Helvetica-Bold",
@@ -147,7 +150,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         leading=13,
         alignment=TA_CENTER,
     )
-    date_style = ParagraphStyle(
+    date = ParagraphStyle(
         "CertDate",
         parent=styles["Normal"],
         fontName="Helvetica-Bold",
@@ -158,7 +161,7 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         spaceBefore=8,
         spaceAfter=6,
     )
-    footer_style = ParagraphStyle(
+    footer = ParagraphStyle(
         "CertFooter",
         parent=styles["Normal"],
         fontName="Helvetica",
@@ -167,33 +170,58 @@ def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> b
         alignment=TA_CENTER,
         textColor=colors.HexColor("#666666"),
     )
+    return _CertificateStyles(
+        title=title,
+        brand=brand,
+        program=program,
+        recipient=recipient,
+        body=body,
+        sig_name=sig_name,
+        date=date,
+        footer=footer,
+    )
+
+
+def render_completion_certificate_pdf(ctx: CompletionCertificatePdfContext) -> bytes:
+    """Render a landscape completion certificate PDF."""
+    page_size = landscape(A4)
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=page_size,
+        leftMargin=18 * mm,
+        rightMargin=18 * mm,
+        topMargin=16 * mm,
+        bottomMargin=16 * mm,
+    )
+    styles = _certificate_styles()
 
     story: list[object] = []
     story.append(Spacer(1, 8 * mm))
-    story.append(Paragraph(_header_brand_line(ctx), brand_style))
-    story.append(Paragraph("CERTIFICATE OF COMPLETION", title_style))
-    story.append(Paragraph(_escape_xml(ctx.program_title), program_style))
-    story.append(Paragraph("This certifies that", body_style))
-    story.append(Paragraph(_escape_xml(ctx.recipient_display_name), recipient_style))
-    story.append(Paragraph(_escape_xml(ctx.body_text), body_style))
+    story.append(Paragraph(_header_brand_line(ctx), styles.brand))
+    story.append(Paragraph("CERTIFICATE OF COMPLETION", styles.title))
+    story.append(Paragraph(_escape_xml(ctx.program_title), styles.program))
+    story.append(Paragraph("This certifies that", styles.body))
+    story.append(Paragraph(_escape_xml(ctx.recipient_display_name), styles.recipient))
+    story.append(Paragraph(_escape_xml(ctx.body_text), styles.body))
     story.append(Spacer(1, 6 * mm))
 
     sig_blocks: list[str] = []
     sig_blocks.append(
         f'<para align="center"><b>{_escape_xml(ctx.es_founder_name)}</b><br/>'
-        f"FOUNDER · { _escape_xml(ctx.trading_name.upper()) }</para>"
+        f"FOUNDER · {_escape_xml(ctx.trading_name.upper())}</para>"
     )
     if ctx.partner_display_name and ctx.partner_signer_name:
         sig_blocks.append(
             f'<para align="center"><b>{_escape_xml(ctx.partner_signer_name)}</b><br/>'
-            f"FOUNDER · { _escape_xml(ctx.partner_display_name.upper()) }</para>"
+            f"FOUNDER · {_escape_xml(ctx.partner_display_name.upper())}</para>"
         )
     for block in sig_blocks:
-        story.append(Paragraph(block, sig_name_style))
+        story.append(Paragraph(block, styles.sig_name))
         story.append(Spacer(1, 4 * mm))
 
-    story.append(Paragraph(_format_awarded_date(ctx.participation_date), date_style))
-    story.append(Paragraph(_credential_footer(ctx.participation_date), footer_style))
+    story.append(Paragraph(_format_awarded_date(ctx.participation_date), styles.date))
+    story.append(Paragraph(_credential_footer(ctx.participation_date), styles.footer))
 
     doc.build(story)
     return buf.getvalue()
@@ -26,6 +26,7 @@ from app.services.customer_invoice_pdf import (
     render_invoice_pdf,
 )
 from app.services.customer_receipt_pdf import render_receipt_pdf
+from app.services.pdf_render_engine import render_many
 from app.services.email import send_mime_email_with_optional_attachments
 from app.utils.logging import get_logger
 
@@ -130,25 +131,38 @@ def next_receipt_number(session: Session, *, currency: str) -> tuple[str, int]:
     return rnum, seq
 
 
-def allocation_invoice_labels_for_payment(
-    session: Session, payment_id: UUID
-) -> list[tuple[str, Decimal]]:
+def _allocation_invoice_labels_for_payments(
+    session: Session, payment_ids: list[UUID]
+) -> dict[UUID, list[tuple[str, Decimal]]]:
+    """``allocation_invoice_labels_for_payment`` for many payments in one query."""
+    out: dict[UUID, list[tuple[str, Decimal]]] = {pid: [] for pid in payment_ids}
+    if not payment_ids:
+        return out
     rows = session.execute(
-        select(CustomerInvoice.invoice_number, PaymentAllocation.allocated_amount)
+        select(
+            PaymentAllocation.payment_id,
+            CustomerInvoice.invoice_number,
+            PaymentAllocation.allocated_amount,
+        )
         .join(
             CustomerInvoice,
             CustomerInvoice.id == PaymentAllocation.invoice_id,
         )
-        .where(PaymentAllocation.payment_id == payment_id)
+        .where(PaymentAllocation.payment_id.in_(payment_ids))
         .where(CustomerInvoice.invoice_number.isnot(None))
     ).all()
-    out: list[tuple[str, Decimal]] = []
-    for inv_num, amt in rows:
+    for payment_id, inv_num, amt in rows:
         if inv_num and amt is not None:
-            out.append((str(inv_num), Decimal(str(amt))))
+            out[payment_id].append((str(inv_num), Decimal(str(amt))))
     return out
 
 
+def allocation_invoice_labels_for_payment(
+    session: Session, payment_id: UUID
+) -> list[tuple[str, Decimal]]:
+    return _allocation_invoice_labels_for_payments(session, [payment_id])[payment_id]
+
+
 def create_receipt_for_succeeded_inbound_payment(
     session: Session,
     *,
@@ -233,6 +247,51 @@ def finalize_receipt_pdf_upload(session: Session, *, receipt_id: UUID) -> None:
     session.flush()
 
 
+def _render_receipt(
+    item: tuple[CustomerReceipt, CustomerPayment, list[tuple[str, Decimal]]],
+) -> bytes:
+    receipt, payment, labels = item
+    return render_receipt_pdf(
+        receipt=receipt, payment=payment, allocation_invoice_numbers=labels
+    )
+
+
+def refresh_receipt_pdfs(session: Session, receipt_ids: list[UUID]) -> int:
+    """Re-render and store PDFs for many receipts (e.g. after a template bump).
+
+    Receipts with their payments and allocation labels load in two queries and
+    render through ``render_many``; returns the number of receipts refreshed.
+    """
+    if not receipt_ids:
+        return 0
+    rows = session.execute(
+        select(CustomerReceipt, CustomerPayment)
+        .join(
+            CustomerPayment,
+            CustomerPayment.id == CustomerReceipt.customer_payment_id,
+        )
+        .where(CustomerReceipt.id.in_(receipt_ids))
+        .order_by(CustomerReceipt.id)
+    ).all()
+    labels = _allocation_invoice_labels_for_payments(
+        session, [payment.id for _receipt, payment in rows]
+    )
+    pdfs = render_many(
+        _render_receipt,
+        [(receipt, payment, labels[payment.id]) for receipt, payment in rows],
+    )
+    for (receipt, _payment), pdf_bytes in zip(rows, pdfs):
+        key = f"billing/receipts/{receipt.id}.pdf"
+        store_pdf_in_assets_bucket(
+            s3_key=key, body=pdf_bytes, content_type="application/pdf"
+        )
+        receipt.issued_pdf_s3_key = key
+        receipt.issued_pdf_sha256 = _sha256_bytes(pdf_bytes)
+        receipt.pdf_template_version = RECEIPT_PDF_TEMPLATE_VERSION
+    session.flush()
+    return len(rows)
+
+
 def send_receipt_email(session: Session, *, receipt_id: UUID, to_email: str) -> None:
     """Email receipt PDF to customer (best-effort)."""
     receipt = session.get(CustomerReceipt, receipt_id)
@@ -399,6 +458,57 @@ def refresh_invoice_pdf(session: Session, invoice: CustomerInvoice) -> None:
     session.flush()
 
 
+def _render_issued_invoice(
+    item: tuple[CustomerInvoice, list[CustomerInvoiceLine]],
+) -> bytes:
+    invoice, lines = item
+    return render_invoice_pdf(invoice=invoice, lines=lines, preview=False)
+
+
+def refresh_invoice_pdfs(session: Session, invoice_ids: list[UUID]) -> int:
+    """Re-render and store PDFs for many issued invoices (e.g. after a template bump).
+
+    Invoices and their lines load in two queries and render through
+    ``render_many``; returns the number of invoices refreshed.
+    """
+    if not invoice_ids:
+        return 0
+    invoices = list(
+        session.execute(
+            select(CustomerInvoice)
+            .where(CustomerInvoice.id.in_(invoice_ids))
+            .where(CustomerInvoice.status == BillingInvoiceStatus.ISSUED)
+            .order_by(CustomerInvoice.id)
+        )
+        .scalars()
+        .all()
+    )
+    lines_by_invoice: dict[UUID, list[CustomerInvoiceLine]] = {
+        invoice.id: [] for invoice in invoices
+    }
+    for line in session.execute(
+        select(CustomerInvoiceLine).where(
+            CustomerInvoiceLine.invoice_id.in_(list(lines_by_invoice))
+        )
+    ).scalars():
+        lines_by_invoice[line.invoice_id].append(line)
+
+    pdfs = render_many(
+        _render_issued_invoice,
+        [(invoice, lines_by_invoice[invoice.id]) for invoice in invoices],
+    )
+    for invoice, pdf_bytes in zip(invoices, pdfs):
+        key = f"billing/invoices/{invoice.id}.pdf"
+        store_pdf_in_assets_bucket(
+            s3_key=key, body=pdf_bytes, content_type="application/pdf"
+        )
+        invoice.issued_pdf_s3_key = key
+        invoice.issued_pdf_sha256 = _sha256_bytes(pdf_bytes)
+        invoice.pdf_template_version = INVOICE_PDF_TEMPLATE_VERSION
+    session.flush()
+    return len(invoices)
+
+
 def _invoice_preview_s3_key(invoice_id: UUID) -> str:
     return f"billing/invoices/preview/{invoice_id}.pdf"
 
@@ -41,6 +41,7 @@ import html
 import io
 import os
 import re
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from functools import partial
@@ -53,7 +54,7 @@ from app.config.public_www import get_public_www
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.platypus import (
@@ -71,10 +72,15 @@ from reportlab.platypus import (
 from app.db.models.customer_invoice import CustomerInvoice, CustomerInvoiceLine
 from app.db.models.enums import BillingBillToKind, BillingInvoiceStatus
 from app.services.fps_qr_payload import build_fps_payload_detailed
-from app.services.fps_qr_pdf_image import render_fps_qr_png
+from app.services.pdf_render_engine import (
+    asset_image,
+    cached_styles,
+    fps_qr_image,
+    register_asset_image,
+    sample_styles,
+)
 from app.utils.logging import get_logger
 
-_SAMPLE_STYLES = getSampleStyleSheet()
 logger = get_logger(__name__)
 
 
@@ -101,19 +107,20 @@ _INV_FOOTER_TEXT = colors.HexColor("#7f8c8d")
 _INV_PAID_WATERMARK = colors.HexColor(
     "#c0392b"
 )  # muted red, AA against white at large sizes
-_INV_LOGO_PATH = (
+_INV_LOGO_PATH = register_asset_image(
     Path(__file__).resolve().parent.parent
     / "assets"
     / "invoice"
     / "evolvesprouts-invoice-logo.png"
 )
-_INV_FPS_LOGO_PATH = (
+_INV_FPS_LOGO_PATH = register_asset_image(
     Path(__file__).resolve().parent.parent / "assets" / "invoice" / "fps-logo.png"
 )
 
 # Source PNG has ~16.3% transparent padding on each side; render the box at
 # 52mm so the visible content lands at ~35mm to match the reference template.
 _INV_LOGO_BOX_MM = 52
+_INV_SECTION_INSET_MM = 12
 
 
 class RoundedPanel(Flowable):
@@ -225,30 +232,177 @@ def _payment_confirmation_line_html(billing_email: str) -> str:
 
 
 def _invoice_logo_flowable() -> Image | Paragraph:
-    if not _INV_LOGO_PATH.is_file():
-        return Paragraph("", _SAMPLE_STYLES["Normal"])
-    img = Image(
-        str(_INV_LOGO_PATH),
-        width=_INV_LOGO_BOX_MM * mm,
-        height=_INV_LOGO_BOX_MM * mm,
-        kind="proportional",
+    logo = asset_image(
+        _INV_LOGO_PATH, width_mm=_INV_LOGO_BOX_MM, height_mm=_INV_LOGO_BOX_MM
     )
-    img.hAlign = "LEFT"
-    return img
+    if logo is None:
+        return Paragraph("", sample_styles()["Normal"])
+    return logo
 
 
 def _fps_logo_image(*, width_mm: float = 25, height_mm: float = 12) -> Image | None:
     """FPS brand mark to the left of the FPS QR in the payment section."""
-    if not _INV_FPS_LOGO_PATH.is_file():
-        return None
-    img = Image(
-        str(_INV_FPS_LOGO_PATH),
-        width=width_mm * mm,
-        height=height_mm * mm,
-        kind="proportional",
+    return asset_image(_INV_FPS_LOGO_PATH, width_mm=width_mm, height_mm=height_mm)
+
+
+@dataclass(frozen=True)
+class _InvoiceStyles:
+    title: ParagraphStyle
+    label_heading: ParagraphStyle
+    body_text: ParagraphStyle
+    header_label: ParagraphStyle
+    totals_label: ParagraphStyle
+    totals_value: ParagraphStyle
+    totals_total: ParagraphStyle
+    date_label: ParagraphStyle
+    date_value: ParagraphStyle
+    refer_next_page: ParagraphStyle
+    payment_bullet: ParagraphStyle
+    payment_block_continue: ParagraphStyle
+    bank_detail: ParagraphStyle
+    thank_you: ParagraphStyle
+
+
+@cached_styles
+def _invoice_styles() -> _InvoiceStyles:
+    styles = sample_styles()
+    title = ParagraphStyle(
+        "InvTitle",
+        parent=styles["Heading1"],
+        fontName="Helvetica-Bold",
+        fontSize=16,
+        leading=20,
+        textColor=_INV_TITLE,
+        alignment=TA_RIGHT,
+        spaceAfter=0,
+    )
+    label_heading = ParagraphStyle(
+        "InvLabelHeading",
+        parent=styles["Normal"],
+        fontName="Helvetica-Bold",
+        fontSize=10,
+        leading=16,
+        textColor=_INV_LABEL_TEXT,
+    )
+    body_text = ParagraphStyle(
+        "InvBodyText",
+        parent=styles["Normal"],
+        fontName="Helvetica",
+        fontSize=10,
+        leading=16,
+        textColor=_INV_BODY_TEXT,
+    )
+    header_label = ParagraphStyle(
+        "InvHeaderLabel",
+        parent=styles["Normal"],
+        fontName="Helvetica-Bold",
+        fontSize=10,
+        leading=12,
+        textColor=_INV_HEADER_TEXT,
+    )
+    totals_label = ParagraphStyle(
+        "InvTotalsLabel",
+        parent=styles["Normal"],
+        fontName="Helvetica-Bold",
+        fontSize=10,
+        leading=12,
+        textColor=_INV_LABEL_TEXT,
+        alignment=TA_RIGHT,
+    )
+    totals_value = ParagraphStyle(
+        "InvTotalsValue",
+        parent=styles["Normal"],
+        fontName="Helvetica",
+        fontSize=10,
+        leading=12,
+        textColor=_INV_BODY_TEXT,
+        alignment=TA_RIGHT,
+    )
+    totals_total = ParagraphStyle(
+        "InvTotalsTotal",
+        parent=styles["Normal"],
+        fontName="Helvetica-Bold",
+        fontSize=11.5,
+        leading=14,
+        textColor=_INV_BODY_TEXT,
+        alignment=TA_RIGHT,
+    )
+    date_label = ParagraphStyle(
+        "InvDateLabel",
+        parent=styles["Normal"],
+        fontName="Helvetica-Bold",
+        fontSize=10,
+        leading=16,
+        textColor=_INV_LABEL_TEXT,
+        alignment=TA_LEFT,
+    )
+    date_value = ParagraphStyle(
+        "InvDateValue",
+        parent=styles["Normal"],
+        fontName="Helvetica",
+        fontSize=10,
+        leading=16,
+        textColor=_INV_BODY_TEXT,
+        alignment=TA_RIGHT,
+    )
+    refer_next_page = ParagraphStyle(
+        "InvReferNextPage",
+        parent=body_text,
+        fontName="Helvetica-Bold",
+        alignment=TA_CENTER,
+    )
+    # Bullet headings ("By Bank Transfer" / "By FPS scanning...") hang
+    # the bullet glyph at column 0 while the heading text sits at the
+    # same x as the payment-confirmation copy, mirroring a typical
+    # bullet-list look.
+    payment_bullet = ParagraphStyle(
+        "InvPaymentBullet",
+        parent=body_text,
+        leftIndent=12,
+        firstLineIndent=-12,
+    )
+    # Continuation copy under each bullet (the "Please send..." lines)
+    # is indented to the heading-text column so it left-aligns with
+    # "By Bank Transfer:" / "By FPS scanning..." rather than with the
+    # bullet glyph.
+    payment_block_continue = ParagraphStyle(
+        "InvPaymentContinue",
+        parent=body_text,
+        leftIndent=12,
+    )
+    # Bank details (the Bank/Account Number/Account Name lines) and
+    # the FPS logo + QR row are indented one tab-stop further right
+    # than the bullet heading so they sit clearly nested under it.
+    bank_detail = ParagraphStyle(
+        "InvBankDetail",
+        parent=body_text,
+        leftIndent=_INV_SECTION_INSET_MM * mm,
+    )
+    thank_you = ParagraphStyle(
+        "InvThankYou",
+        parent=body_text,
+        fontName="Helvetica-Bold",
+        fontSize=11,
+        leading=16,
+        textColor=_INV_BODY_TEXT,
+        alignment=TA_CENTER,
+    )
+    return _InvoiceStyles(
+        title=title,
+        label_heading=label_heading,
+        body_text=body_text,
+        header_label=header_label,
+        totals_label=totals_label,
+        totals_value=totals_value,
+        totals_total=totals_total,
+        date_label=date_label,
+        date_value=date_value,
+        refer_next_page=refer_next_page,
+        payment_bullet=payment_bullet,
+        payment_block_continue=payment_block_continue,
+        bank_detail=bank_detail,
+        thank_you=thank_you,
     )
-    img.hAlign = "LEFT"
-    return img
 
 
 def invoice_pdf_footer_text() -> str:
@@ -516,86 +670,7 @@ def render_invoice_pdf(
         topMargin=margin_top,
         bottomMargin=margin_bottom,
     )
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        "InvTitle",
-        parent=styles["Heading1"],
-        fontName="Helvetica-Bold",
-        fontSize=16,
-        leading=20,
-        textColor=_INV_TITLE,
-        alignment=TA_RIGHT,
-        spaceAfter=0,
-    )
-    label_heading_style = ParagraphStyle(
-        "InvLabelHeading",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=10,
-        leading=16,
-        textColor=_INV_LABEL_TEXT,
-    )
-    body_text_style = ParagraphStyle(
-        "InvBodyText",
-        parent=styles["Normal"],
-        fontName="Helvetica",
-        fontSize=10,
-        leading=16,
-        textColor=_INV_BODY_TEXT,
-    )
-    header_label_style = ParagraphStyle(
-        "InvHeaderLabel",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=10,
-        leading=12,
-        textColor=_INV_HEADER_TEXT,
-    )
-    totals_label_style = ParagraphStyle(
-        "InvTotalsLabel",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=10,
-        leading=12,
-        textColor=_INV_LABEL_TEXT,
-        alignment=TA_RIGHT,
-    )
-    totals_value_style = ParagraphStyle(
-        "InvTotalsValue",
-        parent=styles["Normal"],
-        fontName="Helvetica",
-        fontSize=10,
-        leading=12,
-        textColor=_INV_BODY_TEXT,
-        alignment=TA_RIGHT,
-    )
-    totals_total_style = ParagraphStyle(
-        "InvTotalsTotal",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=11.5,
-        leading=14,
-        textColor=_INV_BODY_TEXT,
-        alignment=TA_RIGHT,
-    )
-    date_label_style = ParagraphStyle(
-        "InvDateLabel",
-        parent=styles["Normal"],
-        fontName="Helvetica-Bold",
-        fontSize=10,
-        leading=16,
-        textColor=_INV_LABEL_TEXT,
-        alignment=TA_LEFT,
-    )
-    date_value_style = ParagraphStyle(
-        "InvDateValue",
-        parent=styles["Normal"],
-        fontName="Helvetica",
-        fontSize=10,
-        leading=16,
-        textColor=_INV_BODY_TEXT,
-        alignment=TA_RIGHT,
-    )
+    styles = _invoice_styles()
 
     business_name = _esc(get_public_www("BUSINESS_NAME").strip())
     address_lines = [
@@ -648,7 +723,7 @@ def render_invoice_pdf(
         [
             [
                 _invoice_logo_flowable(),
-                Paragraph(_esc(title_line), title_style),
+                Paragraph(_esc(title_line), styles.title),
             ]
         ],
         colWidths=[60 * mm, 130 * mm],
@@ -669,7 +744,7 @@ def render_invoice_pdf(
     story.append(Spacer(1, 14))
 
     divider_table = Table(
-        [[Paragraph(" ", body_text_style)]],
+        [[Paragraph(" ", styles.body_text)]],
         colWidths=[190 * mm],
         rowHeights=[1],
     )
@@ -701,8 +776,8 @@ def render_invoice_pdf(
 
     from_cell = Table(
         [
-            [Paragraph("From:", label_heading_style)],
-            [Paragraph(from_body_html, body_text_style)],
+            [Paragraph("From:", styles.label_heading)],
+            [Paragraph(from_body_html, styles.body_text)],
         ],
         colWidths=[70 * mm],
     )
@@ -742,8 +817,8 @@ def render_invoice_pdf(
 
     bill_cell = Table(
         [
-            [Paragraph("Bill To:", label_heading_style)],
-            [Paragraph(bill_body_html, body_text_style)],
+            [Paragraph("Bill To:", styles.label_heading)],
+            [Paragraph(bill_body_html, styles.body_text)],
         ],
         colWidths=[60 * mm],
     )
@@ -764,15 +839,15 @@ def render_invoice_pdf(
     due_date_s = _esc(due_date.isoformat())
     date_rows: list[list] = [
         [
-            Paragraph("<b>Invoice Date:</b>", date_label_style),
-            Paragraph(inv_date_s, date_value_style),
+            Paragraph("<b>Invoice Date:</b>", styles.date_label),
+            Paragraph(inv_date_s, styles.date_value),
         ],
     ]
     if show_due_date:
         date_rows.append(
             [
-                Paragraph("<b>Due Date:</b>", date_label_style),
-                Paragraph(due_date_s, date_value_style),
+                Paragraph("<b>Due Date:</b>", styles.date_label),
+                Paragraph(due_date_s, styles.date_value),
             ],
         )
     dates_inner = Table(date_rows, colWidths=[28 * mm, 30 * mm])
@@ -826,10 +901,10 @@ def render_invoice_pdf(
     story.append(Spacer(1, 16))
 
     header_row = [
-        Paragraph("<b>Description</b>", header_label_style),
-        Paragraph("<b>Quantity</b>", header_label_style),
-        Paragraph("<b>Unit Price</b>", header_label_style),
-        Paragraph("<b>Total</b>", header_label_style),
+        Paragraph("<b>Description</b>", styles.header_label),
+        Paragraph("<b>Quantity</b>", styles.header_label),
+        Paragraph("<b>Unit Price</b>", styles.header_label),
+        Paragraph("<b>Total</b>", styles.header_label),
     ]
 
     first_line_item = True
@@ -838,9 +913,9 @@ def render_invoice_pdf(
         qty = line.quantity.quantize(Decimal("0.0001")).normalize()
         unit = format_money(line.unit_amount, inv_currency)
         ltot = format_money(line.line_total, inv_currency)
-        qty_para = Paragraph(_esc(str(qty)), body_text_style)
-        unit_para = Paragraph(_esc(unit), body_text_style)
-        ltot_para = Paragraph(_esc(ltot), body_text_style)
+        qty_para = Paragraph(_esc(str(qty)), styles.body_text)
+        unit_para = Paragraph(_esc(unit), styles.body_text)
+        ltot_para = Paragraph(_esc(ltot), styles.body_text)
         chunks = _description_row_strings(desc)
 
         seg_start = 0
@@ -855,11 +930,11 @@ def render_invoice_pdf(
 
             for i, chunk in enumerate(batch):
                 global_idx = seg_start + i
-                desc_para = Paragraph(_esc(chunk), body_text_style)
+                desc_para = Paragraph(_esc(chunk), styles.body_text)
                 if global_idx == 0:
                     table_rows.append([desc_para, qty_para, unit_para, ltot_para])
                 else:
-                    empty = Paragraph("", body_text_style)
+                    empty = Paragraph("", styles.body_text)
                     table_rows.append([desc_para, empty, empty, empty])
 
             n_rows = len(table_rows)
@@ -934,24 +1009,24 @@ def render_invoice_pdf(
     show_tax = bool(invoice.tax_total and invoice.tax_total != Decimal("0"))
     inner_totals_rows: list[list] = [
         [
-            Paragraph("Subtotal:", totals_label_style),
-            Paragraph(sub, totals_value_style),
+            Paragraph("Subtotal:", styles.totals_label),
+            Paragraph(sub, styles.totals_value),
         ]
     ]
     if show_tax:
         inner_totals_rows.append(
             [
-                Paragraph("Tax:", totals_label_style),
+                Paragraph("Tax:", styles.totals_label),
                 Paragraph(
                     format_money(invoice.tax_total, inv_currency),
-                    totals_value_style,
+                    styles.totals_value,
                 ),
             ]
         )
     inner_totals_rows.append(
         [
-            Paragraph("Total:", totals_total_style),
-            Paragraph(tot, totals_total_style),
+            Paragraph("Total:", styles.totals_total),
+            Paragraph(tot, styles.totals_total),
         ]
     )
     last_row = len(inner_totals_rows) - 1
@@ -982,7 +1057,7 @@ def render_invoice_pdf(
     totals_outer = Table(
         [
             [
-                Paragraph("", body_text_style),
+                Paragraph("", styles.body_text),
                 totals_panel,
             ]
         ],
@@ -1008,57 +1083,15 @@ def render_invoice_pdf(
     terms_intro = (
         f"Payment is due within {terms_days} days from the issue of the invoice."
     )
-    refer_next_page_style = ParagraphStyle(
-        "InvReferNextPage",
-        parent=body_text_style,
-        fontName="Helvetica-Bold",
-        alignment=TA_CENTER,
-    )
 
     if not is_non_positive_total:
-        story.append(Paragraph("Terms &amp; Conditions:", label_heading_style))
+        story.append(Paragraph("Terms &amp; Conditions:", styles.label_heading))
         story.append(Spacer(1, 4))
-        story.append(Paragraph(_esc(terms_intro), body_text_style))
+        story.append(Paragraph(_esc(terms_intro), styles.body_text))
 
         if has_bank_block or fps_payload is not None:
-            # Bullet headings ("By Bank Transfer" / "By FPS scanning...") hang
-            # the bullet glyph at column 0 while the heading text sits at the
-            # same x as the payment-confirmation copy, mirroring a typical
-            # bullet-list look.
-            payment_bullet_style = ParagraphStyle(
-                "InvPaymentBullet",
-                parent=body_text_style,
-                leftIndent=12,
-                firstLineIndent=-12,
-            )
-            # Continuation copy under each bullet (the "Please send..." lines)
-            # is indented to the heading-text column so it left-aligns with
-            # "By Bank Transfer:" / "By FPS scanning..." rather than with the
-            # bullet glyph.
-            payment_block_continue_style = ParagraphStyle(
-                "InvPaymentContinue",
-                parent=body_text_style,
-                leftIndent=12,
-            )
-            # Bank details (the Bank/Account Number/Account Name lines) and
-            # the FPS logo + QR row are indented one tab-stop further right
-            # than the bullet heading so they sit clearly nested under it.
-            section_inset = 12 * mm
-            bank_detail_style = ParagraphStyle(
-                "InvBankDetail",
-                parent=body_text_style,
-                leftIndent=section_inset,
-            )
+            section_inset = _INV_SECTION_INSET_MM * mm
             fps_logo_qr_gap = 4 * mm
-            thank_you_style = ParagraphStyle(
-                "InvThankYou",
-                parent=body_text_style,
-                fontName="Helvetica-Bold",
-                fontSize=11,
-                leading=16,
-                textColor=_INV_BODY_TEXT,
-                alignment=TA_CENTER,
-            )
             billing_email = get_public_www("BILLING_EMAIL").strip()
             confirm_line_html = _payment_confirmation_line_html(billing_email)
 
@@ -1069,13 +1102,13 @@ def render_invoice_pdf(
                         "Please refer to next page for details of different "
                         "payment methods."
                     ),
-                    refer_next_page_style,
+                    styles.refer_next_page,
                 )
             )
             story.append(Spacer(1, 16))
             story.append(PageBreak())
 
-            story.append(Paragraph("Payment Options:", label_heading_style))
+            story.append(Paragraph("Payment Options:", styles.label_heading))
             story.append(Spacer(1, 4))
 
             bank_line_htmls: list[str] = []
@@ -1090,19 +1123,21 @@ def render_invoice_pdf(
 
             if has_bank_block:
                 story.append(
-                    Paragraph("&#8226; By <b>Bank Transfer</b>:", payment_bullet_style)
+                    Paragraph("&#8226; By <b>Bank Transfer</b>:", styles.payment_bullet)
                 )
                 story.append(Spacer(1, 16))
                 story.append(
-                    Paragraph("<br/>".join(bank_line_htmls), bank_detail_style)
+                    Paragraph("<br/>".join(bank_line_htmls), styles.bank_detail)
                 )
                 story.append(Spacer(1, 16))
-                story.append(Paragraph(confirm_line_html, payment_block_continue_style))
+                story.append(
+                    Paragraph(confirm_line_html, styles.payment_block_continue)
+                )
                 story.append(Spacer(1, 10))
 
             if fps_payload is not None:
                 fps_head_html = "&#8226; By <b>FPS</b> scanning the following QR code:"
-                story.append(Paragraph(fps_head_html, payment_bullet_style))
+                story.append(Paragraph(fps_head_html, styles.payment_bullet))
                 story.append(Spacer(1, 4))
                 # The FPS source PNG has an almost-square aspect ratio
                 # (~1.06), so we size the logo bounding box to match: this
@@ -1115,14 +1150,7 @@ def render_invoice_pdf(
                 logo_flow = _fps_logo_image(
                     width_mm=fps_logo_width_mm, height_mm=fps_logo_height_mm
                 )
-                qr_png = render_fps_qr_png(fps_payload, size_px=256)
-                qr_img = Image(
-                    io.BytesIO(qr_png),
-                    width=fps_qr_size_mm * mm,
-                    height=fps_qr_size_mm * mm,
-                    kind="proportional",
-                )
-                qr_img.hAlign = "LEFT"
+                qr_img = fps_qr_image(fps_payload, size_mm=fps_qr_size_mm)
                 gap_w = fps_logo_qr_gap
                 if logo_flow is not None:
                     fps_inner_row: list = [logo_flow, Spacer(gap_w, 1), qr_img]
@@ -1167,16 +1195,18 @@ def render_invoice_pdf(
                 )
                 story.append(fps_indent)
                 story.append(Spacer(1, 6))
-                story.append(Paragraph(confirm_line_html, payment_block_continue_style))
+                story.append(
+                    Paragraph(confirm_line_html, styles.payment_block_continue)
+                )
 
             story.append(Spacer(1, 72))
-            story.append(Paragraph("Thank you!", thank_you_style))
+            story.append(Paragraph("Thank you!", styles.thank_you))
     elif is_zero_total:
         story.append(Spacer(1, 44))
         story.append(
             Paragraph(
                 _esc("Nothing to pay, thank you!"),
-                refer_next_page_style,
+                styles.refer_next_page,
             )
         )
     else:
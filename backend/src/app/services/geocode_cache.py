@@ -0,0 +1,234 @@
+"""Geocode through the ``geocode_cache`` table before calling Nominatim.
+
+Nominatim allows one request per second and each proxied call can take up to
+15 s, so answers (including "no results") are kept per normalized query text
+and country-code filter. ``warm_geocode_cache`` fills the cache for many
+addresses at a paced rate, e.g. legacy-imported venues.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.models import LegacyImportRef, Location
+from app.db.repositories import GeocodeCacheRepository, GeographicAreaRepository
+from app.exceptions import AppError, ConfigurationError, ValidationError
+from app.services.nominatim_geocode import (
+    GeocodeNoResultsError,
+    geocode_address_with_context,
+    geocode_cache_key,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: How long a found address is served from the cache.
+GEOCODE_CACHE_TTL = timedelta(days=180)
+#: How long "no results" is remembered (addresses may be fixed upstream).
+GEOCODE_MISS_TTL = timedelta(days=7)
+#: Nominatim usage policy: at most one request per second.
+NOMINATIM_MIN_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class GeocodeWarmStats:
+    """Outcome counts for ``warm_geocode_cache``."""
+
+    cached: int = 0
+    fetched: int = 0
+    not_found: int = 0
+    failed: int = 0
+
+
+def country_codes_for_area(session: Session, area_id: UUID) -> list[str]:
+    """ISO codes for ``countrycodes``: the area's root country and its sovereign."""
+    geo_repo = GeographicAreaRepository(session)
+    ancestors = geo_repo.get_ancestors(area_id)
+    country_iso_codes: list[str] = []
+    root = ancestors[0] if ancestors else None
+    if root and root.code:
+        country_iso_codes.append(str(root.code))
+    if root is not None:
+        sovereign_code = geo_repo.get_sovereign_country_iso_code(
+            cast(UUID, root.id),
+        )
+        if sovereign_code:
+            country_iso_codes.append(str(sovereign_code))
+    return country_iso_codes
+
+
+def cached_geocode(
+    session: Session,
+    *,
+    address: str,
+    country_iso_codes: Sequence[str] | None = None,
+    now: datetime | None = None,
+) -> tuple[float, float, str | None] | None:
+    """Return the fresh cached answer for ``address``, or ``None`` on a miss.
+
+    A cached "no results" answer is re-raised as ``GeocodeNoResultsError``.
+    """
+    query_text, country_codes = geocode_cache_key(address, country_iso_codes)
+    if not query_text:
+        raise ValidationError("address is required", field="address")
+    entry = GeocodeCacheRepository(session).get_fresh(
+        query_text, country_codes, now=now or datetime.now(UTC)
+    )
+    if entry is None:
+        return None
+    if entry.lat is None or entry.lng is None:
+        raise GeocodeNoResultsError()
+    return float(entry.lat), float(entry.lng), entry.display_name
+
+
+def fetch_geocode(
+    *,
+    address: str,
+    country_iso_codes: Sequence[str] | None = None,
+) -> tuple[float, float, str | None] | None:
+    """Ask the provider; ``None`` means it found nothing.
+
+    Makes a network call of up to 15 s, so callers should not hold a database
+    session open across it. Provider failures propagate and are not cached.
+    """
+    try:
+        return geocode_address_with_context(
+            address=address,
+            country_iso_codes=country_iso_codes,
+        )
+    except GeocodeNoResultsError:
+        return None
+
+
+def store_geocode(
+    session: Session,
+    *,
+    address: str,
+    country_iso_codes: Sequence[str] | None,
+    result: tuple[float, float, str | None] | None,
+    now: datetime | None = None,
+) -> None:
+    """Cache a ``fetch_geocode`` result (``None`` for "no results") and commit."""
+    query_text, country_codes = geocode_cache_key(address, country_iso_codes)
+    current = now or datetime.now(UTC)
+    lat, lng, display_name = result if result is not None else (None, None, None)
+    ttl = GEOCODE_CACHE_TTL if result is not None else GEOCODE_MISS_TTL
+    GeocodeCacheRepository(session).store(
+        query_text,
+        country_codes,
+        lat=lat,
+        lng=lng,
+        display_name=display_name,
+        fetched_at=current,
+        expires_at=current + ttl,
+    )
+    session.commit()
+
+
+def geocode_address_cached(
+    session: Session,
+    *,
+    address: str,
+    country_iso_codes: Sequence[str] | None = None,
+    now: datetime | None = None,
+) -> tuple[float, float, str | None]:
+    """``geocode_address_with_context`` backed by ``geocode_cache``.
+
+    Fresh cached answers are returned without a network call. New answers,
+    including "no results" (re-raised as ``GeocodeNoResultsError``), are
+    stored and committed on ``session``. Provider failures are not cached.
+    Request handlers should use ``cached_geocode``, ``fetch_geocode`` and
+    ``store_geocode`` directly so no session is open during the network call.
+    """
+    cached = cached_geocode(
+        session, address=address, country_iso_codes=country_iso_codes, now=now
+    )
+    if cached is not None:
+        return cached
+    result = fetch_geocode(address=address, country_iso_codes=country_iso_codes)
+    store_geocode(
+        session,
+        address=address,
+        country_iso_codes=country_iso_codes,
+        result=result,
+        now=now,
+    )
+    if result is None:
+        raise GeocodeNoResultsError()
+    return result
+
+
+def legacy_venue_addresses(session: Session) -> list[tuple[str, UUID]]:
+    """``(address, area_id)`` for locations created by the legacy ``venues`` import."""
+    rows = session.execute(
+        select(Location.address, Location.area_id)
+        .join(LegacyImportRef, LegacyImportRef.new_id == Location.id)
+        .where(
+            LegacyImportRef.entity == "venues",
+            Location.address.isnot(None),
+        )
+        .order_by(Location.id)
+    ).all()
+    return [(str(address), area_id) for address, area_id in rows if address.strip()]
+
+
+def warm_geocode_cache(
+    session: Session,
+    addresses: Iterable[tuple[str, UUID]],
+    *,
+    min_interval_seconds: float = NOMINATIM_MIN_INTERVAL_SECONDS,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> GeocodeWarmStats:
+    """Geocode each ``(address, area_id)`` into the cache, pacing network calls.
+
+    Addresses that already have a fresh cache row cost no request and no wait;
+    the rest start at least ``min_interval_seconds`` apart. Provider failures
+    are logged and counted and the run continues; missing configuration aborts.
+    """
+    stats = GeocodeWarmStats()
+    cache = GeocodeCacheRepository(session)
+    codes_by_area: dict[UUID, list[str]] = {}
+    seen: set[tuple[str, str]] = set()
+    last_request: float | None = None
+    for address, area_id in addresses:
+        if area_id not in codes_by_area:
+            codes_by_area[area_id] = country_codes_for_area(session, area_id)
+        codes = codes_by_area[area_id]
+        key = geocode_cache_key(address, codes)
+        if not key[0] or key in seen:
+            continue
+        seen.add(key)
+        if cache.get_fresh(*key, now=datetime.now(UTC)) is not None:
+            stats.cached += 1
+            continue
+
+        if last_request is not None:
+            wait = min_interval_seconds - (clock() - last_request)
+            if wait > 0:
+                sleep(wait)
+        last_request = clock()
+        try:
+            geocode_address_cached(session, address=address, country_iso_codes=codes)
+        except GeocodeNoResultsError:
+            stats.not_found += 1
+        except ConfigurationError:
+            raise
+        except AppError:
+            session.rollback()
+            logger.warning(
+                "Geocode cache warm-up request failed",
+                extra={"area_id": str(area_id)},
+            )
+            stats.failed += 1
+        else:
+            stats.fetched += 1
+    return stats
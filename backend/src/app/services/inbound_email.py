@@ -6,16 +6,20 @@ from dataclasses import dataclass
 from datetime import datetime
 from email import policy
 from email.message import Message
-from email.parser import BytesParser
+from email.parser import BytesFeedParser
 from email.utils import getaddresses, parsedate_to_datetime, parseaddr
 from html.parser import HTMLParser
 import mimetypes
 import os
 import re
 from pathlib import Path
+from typing import BinaryIO
 
 from app.db.models import AssetType
 
+# Raw MIME is fed to the parser in chunks of this size when read from a stream.
+RAW_EMAIL_READ_CHUNK_BYTES = 64 * 1024
+
 # Minimum visible characters in the email body to treat as invoice source material.
 _MIN_INVOICE_BODY_CHARS = 25
 
@@ -82,9 +86,19 @@ class InvoiceAttachment:
     data: bytes
 
 
-def parse_raw_email(raw_email: bytes) -> ParsedInboundEmail:
-    """Parse a raw RFC822 email payload into a structured object."""
-    message = BytesParser(policy=policy.default).parsebytes(raw_email)
+def parse_raw_email(raw_email: bytes | BinaryIO) -> ParsedInboundEmail:
+    """Parse a raw RFC822 email payload into a structured object.
+
+    Accepts the raw bytes or a binary stream (such as an S3 ``StreamingBody``),
+    which is fed to the parser in chunks instead of being read into one blob.
+    """
+    parser = BytesFeedParser(policy=policy.default)
+    if isinstance(raw_email, bytes | bytearray):
+        parser.feed(raw_email)
+    else:
+        while chunk := raw_email.read(RAW_EMAIL_READ_CHUNK_BYTES):
+            parser.feed(chunk)
+    message = parser.close()
     from_name, from_email = _normalize_address(message.get("from"))
     recipients = tuple(
         address
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, cast
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
@@ -30,6 +30,11 @@ from app.db.repositories import (
 from app.services.aws_clients import get_s3_client
 from app.services.expense_events import enqueue_expense_parse
 from app.services.inbound_invoice_allowlist import inbound_invoice_sender_is_allowed
+from app.services.inbound_invoice_storage import (
+    PendingAttachmentUpload,
+    unique_attachments,
+    upload_attachments,
+)
 from app.services.inbound_email import (
     EMAIL_INVOICE_BODY_FILE_NAME,
     InvoiceAttachment,
@@ -197,20 +202,35 @@ def _store_expense_from_email(
         )
         expense.submitted_at = event.received_at
         asset_ids: list[UUID] = []
+        pending: list[PendingAttachmentUpload] = []
 
         try:
-            for attachment in invoice_attachments:
+            for content_sha256, attachment in unique_attachments(invoice_attachments):
+                existing = asset_repo.find_by_content_sha256(content_sha256)
+                if existing is not None:
+                    asset_ids.append(cast(UUID, existing.id))
+                    continue
                 asset_id = uuid4()
-                s3_key = build_s3_key(asset_id, attachment.file_name)
-                s3_client.put_object(
-                    Bucket=assets_bucket,
-                    Key=s3_key,
-                    Body=attachment.data,
-                    ContentType=attachment.content_type,
+                pending.append(
+                    PendingAttachmentUpload(
+                        asset_id=asset_id,
+                        s3_key=build_s3_key(asset_id, attachment.file_name),
+                        content_sha256=content_sha256,
+                        attachment=attachment,
+                    )
                 )
-                uploaded_objects.append(s3_key)
+                asset_ids.append(asset_id)
+
+            upload_attachments(
+                s3_client,
+                bucket=assets_bucket,
+                uploads=pending,
+                uploaded_keys=uploaded_objects,
+            )
+            for upload in pending:
+                attachment = upload.attachment
                 asset_repo.create_asset(
-                    asset_id=asset_id,
+                    asset_id=upload.asset_id,
                     title=_build_asset_title(attachment.file_name),
                     description=(
                         "Invoice text extracted from inbound email body"
@@ -218,15 +238,23 @@ def _store_expense_from_email(
                         else "Imported from inbound invoice email"
                     ),
                     asset_type=_asset_type_for_attachment(attachment),
-                    s3_key=s3_key,
+                    s3_key=upload.s3_key,
                     file_name=attachment.file_name,
                     resource_key=None,
                     content_type=attachment.content_type,
                     content_language=None,
                     visibility=AssetVisibility.RESTRICTED,
                     created_by=_SYSTEM_ACTOR,
+                    content_sha256=upload.content_sha256,
+                )
+            if len(pending) < len(asset_ids):
+                logger.info(
+                    "Reused stored assets for duplicate inbound invoice attachments",
+                    extra={
+                        "ses_message_id": event.ses_message_id,
+                        "reused_count": len(asset_ids) - len(pending),
+                    },
                 )
-                asset_ids.append(asset_id)
 
             expense_repo.replace_attachments(expense, asset_ids)
             tracking = inbound_repo.find_by_ses_message_id(event.ses_message_id)
@@ -382,9 +410,10 @@ def _resolved_subject(
     return event.subject
 
 
-def _load_raw_email(bucket: str, key: str) -> bytes:
+def _load_raw_email(bucket: str, key: str) -> BinaryIO:
+    """Return the raw MIME object body as a stream for chunked parsing."""
     response = get_s3_client().get_object(Bucket=bucket, Key=key)
-    return response["Body"].read()
+    return cast(BinaryIO, response["Body"])
 
 
 def _should_skip_email(event: InboundInvoiceEmailEvent) -> bool:
@@ -0,0 +1,74 @@
+"""Content-addressed, parallel S3 storage for inbound invoice attachments."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+from typing import Any
+from uuid import UUID
+
+from app.services.inbound_email import InvoiceAttachment
+
+MAX_CONCURRENT_UPLOADS = 4
+
+
+@dataclass(frozen=True)
+class PendingAttachmentUpload:
+    """Attachment with no stored asset yet, queued for upload."""
+
+    asset_id: UUID
+    s3_key: str
+    content_sha256: str
+    attachment: InvoiceAttachment
+
+
+def unique_attachments(
+    attachments: list[InvoiceAttachment],
+) -> list[tuple[str, InvoiceAttachment]]:
+    """Pair attachments with their SHA-256 digest, dropping repeated content."""
+    unique: dict[str, InvoiceAttachment] = {}
+    for attachment in attachments:
+        digest = hashlib.sha256(attachment.data).hexdigest()
+        unique.setdefault(digest, attachment)
+    return list(unique.items())
+
+
+def upload_attachments(
+    s3_client: Any,
+    *,
+    bucket: str,
+    uploads: list[PendingAttachmentUpload],
+    uploaded_keys: list[str],
+) -> None:
+    """Upload attachments in parallel; record every key that reached S3.
+
+    All uploads are awaited before the first failure is re-raised, so the
+    caller can clean up the objects that did succeed.
+    """
+    if not uploads:
+        return
+    workers = min(MAX_CONCURRENT_UPLOADS, len(uploads))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (
+                upload.s3_key,
+                executor.submit(
+                    s3_client.put_object,
+                    Bucket=bucket,
+                    Key=upload.s3_key,
+                    Body=upload.attachment.data,
+                    ContentType=upload.attachment.content_type,
+                ),
+            )
+            for upload in uploads
+        ]
+    first_error: BaseException | None = None
+    for s3_key, future in futures:
+        error = future.exception()
+        if error is None:
+            uploaded_keys.append(s3_key)
+        elif first_error is None:
+            first_error = error
+    if first_error is not None:
+        raise first_error
@@ -17,6 +17,13 @@ _NOMINATIM_SEARCH = "https://nominatim.openstreetmap.org/search"
 _FLOOR_SEGMENT = re.compile(r"/\s*[Ff]")
 
 
+class GeocodeNoResultsError(ValidationError):
+    """The geocoder answered but found nothing for the address."""
+
+    def __init__(self) -> None:
+        super().__init__("No geocoding results for this address", field="address")
+
+
 def _geocode_query_text(address: str) -> str:
     """Free-text query for the geocoder: drop segments through one with ``/F``."""
     raw = address.strip()
@@ -48,6 +55,23 @@ def _countrycodes_param(country_iso_codes: Sequence[str] | None) -> str | None:
     return ",".join(ordered) if ordered else None
 
 
+def geocode_cache_key(
+    address: str,
+    country_iso_codes: Sequence[str] | None = None,
+) -> tuple[str, str]:
+    """Normalized ``(query_text, country_codes)`` identifying one geocoder request.
+
+    Applies the same ``/F`` trimming and country-code filtering as
+    ``geocode_address_with_context``, then case-folds and collapses whitespace
+    so cosmetic address differences share a ``geocode_cache`` row.
+    """
+    segments = (
+        " ".join(part.split()) for part in _geocode_query_text(address).split(",")
+    )
+    query_text = ", ".join(part for part in segments if part).casefold()
+    return query_text, _countrycodes_param(country_iso_codes) or ""
+
+
 def geocode_address_with_context(
     *,
     address: str,
@@ -64,7 +88,8 @@ def geocode_address_with_context(
             ``countrycodes`` query parameter (comma-separated OR filter).
 
     Raises:
-        ValidationError: When input is empty or the provider returns no results.
+        ValidationError: When input is empty; ``GeocodeNoResultsError`` when the
+            provider returns no results.
         AppError: On proxy failures, bad HTTP status, or invalid response payload.
     """
     q = _geocode_query_text(address)
@@ -123,10 +148,7 @@ def geocode_address_with_context(
         raise AppError("Invalid geocoding response", status_code=502) from exc
 
     if not isinstance(parsed, list) or not parsed:
-        raise ValidationError(
-            "No geocoding results for this address",
-            field="address",
-        )
+        raise GeocodeNoResultsError()
 
     first = parsed[0]
     if not isinstance(first, dict):
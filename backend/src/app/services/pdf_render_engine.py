@@ -0,0 +1,227 @@
+"""Shared ReportLab resources for invoice, receipt and certificate PDFs.
+
+Each render used to rebuild its paragraph styles, re-read and re-decode the
+brand PNGs and re-encode the FPS QR code. Everything here is built once per
+container (module-level caches survive warm Lambda invocations):
+
+- ``sample_styles`` / ``cached_styles``: the ReportLab sample stylesheet and each
+  renderer's style set. ``ParagraphStyle`` objects are never mutated by
+  platypus, so one instance is safe to share between documents and threads.
+- ``asset_image``: platypus ``Image`` backed by a preloaded ``ImageReader``
+  whose decoded pixel data is reused by every canvas.
+- ``fps_qr_image``: FPS QR PNGs memoized by payload (the payload embeds the
+  amount, so repeats are common for fixed-price services).
+- Binary (not ASCII85) PDF streams; see ``rl_config.useA85`` below.
+- ``render_many``: render a batch (e.g. regenerating PDFs after a template
+  version bump) across forked worker processes.
+
+``preload()`` builds all of the above eagerly; call it during container warm-up.
+"""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from functools import cache, lru_cache
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, TypeVar
+
+from reportlab import rl_config
+from reportlab.lib.styles import StyleSheet1, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Image
+
+from app.services.fps_qr_pdf_image import render_fps_qr_png
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+#: Built-in Type 1 fonts used by the templates (metrics load lazily otherwise).
+STANDARD_FONTS = ("Helvetica", "Helvetica-Bold")
+#: Distinct FPS payloads kept per container.
+FPS_QR_CACHE_SIZE = 256
+
+# Write image and page streams as binary Flate instead of ASCII85 text: the
+# encoder is pure Python without the optional C accelerator and was over half
+# of an invoice render (the logo is re-encoded into every document), and the
+# binary streams are smaller.
+rl_config.useA85 = 0
+
+_style_factories: list[Any] = []
+_preload_images: list[Path] = []
+
+
+class CachedImage(Image):
+    """Platypus ``Image`` drawn from a shared, already-decoded ``ImageReader``."""
+
+    def __init__(
+        self,
+        reader: ImageReader,
+        *,
+        width: float,
+        height: float,
+        kind: str = "proportional",
+    ) -> None:
+        # ``Image`` resolves ``_img`` lazily from ``_file``; setting it first
+        # makes sizing and drawing use the shared reader instead of re-reading.
+        self._img = reader
+        super().__init__(io.BytesIO(), width=width, height=height, kind=kind, lazy=0)
+
+
+@lru_cache(maxsize=1)
+def sample_styles() -> StyleSheet1:
+    return getSampleStyleSheet()
+
+
+def cached_styles(factory: Callable[[], T]) -> Callable[[], T]:
+    """Decorator: build a renderer's style set once and include it in ``preload``."""
+    cached = lru_cache(maxsize=1)(factory)
+    _style_factories.append(cached)
+    return cached
+
+
+@cache
+def _image_reader(path: Path) -> ImageReader | None:
+    if not path.is_file():
+        return None
+    reader = ImageReader(str(path))
+    # Decode now; ``Canvas.drawImage`` reuses the reader's cached RGB data.
+    reader.getRGBData()
+    return reader
+
+
+def register_asset_image(path: Path) -> Path:
+    """Record ``path`` so ``preload`` decodes it; returns ``path`` unchanged."""
+    _preload_images.append(path)
+    return path
+
+
+def asset_image(path: Path, *, width_mm: float, height_mm: float) -> CachedImage | None:
+    """Left-aligned image for a bundled asset, or ``None`` when it is missing."""
+    reader = _image_reader(path)
+    if reader is None:
+        return None
+    img = CachedImage(reader, width=width_mm * mm, height=height_mm * mm)
+    img.hAlign = "LEFT"
+    return img
+
+
+@lru_cache(maxsize=FPS_QR_CACHE_SIZE)
+def fps_qr_png(payload: str, size_px: int = 256) -> bytes:
+    """Memoized ``render_fps_qr_png``."""
+    return render_fps_qr_png(payload, size_px=size_px)
+
+
+@lru_cache(maxsize=FPS_QR_CACHE_SIZE)
+def _fps_qr_reader(payload: str, size_px: int) -> ImageReader:
+    reader = ImageReader(io.BytesIO(fps_qr_png(payload, size_px)))
+    reader.getRGBData()
+    return reader
+
+
+def fps_qr_image(payload: str, *, size_mm: float, size_px: int = 256) -> CachedImage:
+    img = CachedImage(
+        _fps_qr_reader(payload, size_px), width=size_mm * mm, height=size_mm * mm
+    )
+    img.hAlign = "LEFT"
+    return img
+
+
+def preload() -> None:
+    """Load fonts, styles and bundled images so the first render pays nothing."""
+    for name in STANDARD_FONTS:
+        pdfmetrics.getFont(name)
+    sample_styles()
+    for factory in _style_factories:
+        factory()
+    for path in _preload_images:
+        _image_reader(path)
+
+
+def clear_caches() -> None:
+    """Drop every cached resource (tests and the benchmark's cold mode)."""
+    sample_styles.cache_clear()
+    for factory in _style_factories:
+        factory.cache_clear()
+    _image_reader.cache_clear()
+    fps_qr_png.cache_clear()
+    _fps_qr_reader.cache_clear()
+
+
+def _render_chunk(
+    render: Callable[[Any], bytes], items: Sequence[Any], conn: Connection
+) -> None:
+    try:
+        conn.send(("ok", [render(item) for item in items]))
+    except Exception as exc:
+        conn.send(("error", repr(exc)))
+    finally:
+        conn.close()
+
+
+def render_many(
+    render: Callable[[T], bytes],
+    items: Sequence[T],
+    *,
+    max_workers: int | None = None,
+) -> list[bytes]:
+    """Render ``items`` (results in input order) across up to ``max_workers`` processes.
+
+    ReportLab is pure Python, so threads would not overlap the work. Lambda has
+    no ``/dev/shm`` for ``multiprocessing.Pool`` semaphores; workers are plain
+    forked ``Process`` objects returning PDFs over a ``Pipe``, and inherit the
+    parent's preloaded caches. Defaults to one worker per CPU. Falls back to
+    rendering in-process when only one worker is useful, when ``fork`` is
+    unavailable or a worker cannot be started, and for any chunk whose worker
+    fails (so a real render error is raised from the parent).
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [render(item) for item in items]
+
+    preload()
+    mp = multiprocessing.get_context("fork")
+    chunks = [list(items[index::workers]) for index in range(workers)]
+    rendered: list[list[bytes] | None] = [None] * workers
+    started: list[tuple[int, multiprocessing.Process, Connection]] = []
+    try:
+        for index, chunk in enumerate(chunks):
+            receiver, sender = mp.Pipe(duplex=False)
+            process = mp.Process(target=_render_chunk, args=(render, chunk, sender))
+            process.start()
+            sender.close()
+            started.append((index, process, receiver))
+    except OSError:
+        logger.warning(
+            "Could not start PDF render workers; rendering in-process",
+            extra={"started": len(started), "workers": workers},
+        )
+    for index, process, receiver in started:
+        try:
+            status, payload = receiver.recv()
+        except EOFError:
+            status, payload = "error", "worker exited without a result"
+        receiver.close()
+        process.join()
+        if status == "ok":
+            rendered[index] = payload
+        else:
+            logger.warning(
+                "PDF render worker failed; rendering chunk in-process",
+                extra={"chunk": index, "error": payload},
+            )
+
+    pdfs: list[bytes] = [b""] * len(items)
+    for index, chunk in enumerate(chunks):
+        chunk_pdfs = rendered[index]
+        if chunk_pdfs is None:
+            chunk_pdfs = [render(item) for item in chunk]
+        pdfs[index::workers] = chunk_pdfs
+    return pdfs
@@ -0,0 +1,77 @@
+"""Container-level cache for poll control state.
+
+Respondent devices and facilitator screens re-read ``/v1/polls/{slug}/control``
+every few seconds, while the row only changes when a facilitator toggles a
+question. Each warm Lambda container serves the parsed state from memory for
+``POLL_CONTROL_CACHE_TTL_SECONDS``; a facilitator write replaces the entry in
+the container that handled it, and other containers pick it up when their
+entry expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.poll_responses_store import get_poll_control_state
+
+#: How long a control state is served from memory.
+POLL_CONTROL_CACHE_TTL_SECONDS = 2.0
+#: Upper bound on cached polls per container (oldest entries are evicted).
+POLL_CONTROL_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class _Entry:
+    state: dict[str, Any]
+    expires_at: float
+
+
+_LOCK = threading.Lock()
+_ENTRIES: OrderedDict[str, _Entry] = OrderedDict()
+
+
+def clear_poll_control_cache() -> None:
+    """Drop every cached control state."""
+    with _LOCK:
+        _ENTRIES.clear()
+
+
+def get_cached_poll_control_state(
+    poll_slug: str,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> dict[str, Any]:
+    """Return the control state for ``poll_slug``, reading DynamoDB on a miss.
+
+    Callers must treat the returned mapping as read-only; it is shared with
+    other requests on the same container.
+    """
+    now = clock()
+    with _LOCK:
+        entry = _ENTRIES.get(poll_slug)
+        if entry is not None and entry.expires_at > now:
+            return entry.state
+    state = get_poll_control_state(poll_slug=poll_slug)
+    remember_poll_control_state(poll_slug, state, clock=clock)
+    return state
+
+
+def remember_poll_control_state(
+    poll_slug: str,
+    state: dict[str, Any],
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> None:
+    """Store ``state`` (for example right after a facilitator write)."""
+    with _LOCK:
+        _ENTRIES[poll_slug] = _Entry(
+            state=state, expires_at=clock() + POLL_CONTROL_CACHE_TTL_SECONDS
+        )
+        _ENTRIES.move_to_end(poll_slug)
+        while len(_ENTRIES) > POLL_CONTROL_CACHE_MAX_ENTRIES:
+            _ENTRIES.popitem(last=False)
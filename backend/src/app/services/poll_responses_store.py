@@ -7,14 +7,16 @@ import re
 import time
 from collections import Counter
 from datetime import UTC, datetime
+from decimal import Decimal
 from collections.abc import Mapping
 from typing import Any, TypedDict
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 
-from app.exceptions import AppError, RateLimitError
+from app.exceptions import AppError, ConflictError, RateLimitError
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,6 +36,13 @@ _RATE_LIMIT_WINDOW_SECONDS = 3600
 # TTL on expiresAt garbage-collects stale buckets; deletion is lazy (not window timing).
 _RATE_LIMIT_TTL_SECONDS = _RATE_LIMIT_WINDOW_SECONDS * 2
 
+# BatchGetItem may return UnprocessedKeys under throttling; retry briefly.
+_BATCH_GET_MAX_ATTEMPTS = 3
+_BATCH_GET_RETRY_SECONDS = 0.05
+
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
 _dynamodb = None
 _table = None
 
@@ -73,20 +82,58 @@ def _now_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def get_poll_answer_item(
+def _serialize_item(item: Mapping[str, Any]) -> dict[str, Any]:
+    return {name: _SERIALIZER.serialize(value) for name, value in item.items()}
+
+
+def _deserialize_item(item: Mapping[str, Any]) -> dict[str, Any]:
+    return {name: _DESERIALIZER.deserialize(value) for name, value in item.items()}
+
+
+def load_poll_answer_context(
     *,
     poll_slug: str,
     session_id: str,
     question_id: str,
-) -> dict[str, Any] | None:
-    """Return the stored answer row for one session/question, if any."""
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Return ``(control_state, existing_answer)`` from one ``BatchGetItem`` call.
+
+    The answer write path needs both rows before it can decide anything, so they
+    are read together instead of as two sequential ``GetItem`` round trips.
+    """
     table = _get_table()
-    key = {
-        "pk": _partition_key(poll_slug=poll_slug),
-        "sk": _sort_key(session_id=session_id, question_id=question_id),
+    table_name = _table_name()
+    partition_key = _partition_key(poll_slug=poll_slug)
+    answer_sk = _sort_key(session_id=session_id, question_id=question_id)
+    request: dict[str, Any] = {
+        table_name: {
+            "Keys": [
+                _serialize_item({"pk": partition_key, "sk": _SK_CONTROL}),
+                _serialize_item({"pk": partition_key, "sk": answer_sk}),
+            ]
+        }
     }
+    items: dict[str, dict[str, Any]] = {}
     try:
-        item = table.get_item(Key=key).get("Item")
+        for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(_BATCH_GET_RETRY_SECONDS * attempt)
+            response = table.meta.client.batch_get_item(RequestItems=request)
+            for raw in response.get("Responses", {}).get(table_name, []):
+                item = _deserialize_item(raw)
+                items[str(item.get("sk"))] = item
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                break
+        else:
+            logger.warning(
+                "Poll answer context keys left unprocessed",
+                extra={"poll_slug": poll_slug, "question_id": question_id},
+            )
+            raise AppError(
+                "Failed to load poll answer",
+                status_code=500,
+            )
     except ClientError:
         logger.exception(
             "Failed to load poll answer",
@@ -99,7 +146,8 @@ def get_poll_answer_item(
             "Failed to load poll answer",
             status_code=500,
         ) from None
-    return item if isinstance(item, dict) else None
+    control = _control_state_from_item(poll_slug, items.get(_SK_CONTROL))
+    return control, items.get(answer_sk)
 
 
 def poll_answer_payload_unchanged(
@@ -136,7 +184,7 @@ def poll_answer_payload_unchanged(
     return False
 
 
-def upsert_poll_answer(
+def put_poll_answer_rate_limited(
     *,
     poll_slug: str,
     session_id: str,
@@ -148,15 +196,19 @@ def upsert_poll_answer(
     free_text: str | None = None,
     existing_item: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Persist one question answer; overwrites prior value for the same session/question."""
+    """Count the write against the session rate limit and persist the answer.
+
+    Both happen in one ``TransactWriteItems`` call: the answer is only written
+    when the counter increment passes its limit condition, and a rejected write
+    does not consume quota. ``existing_item`` (from ``load_poll_answer_context``)
+    supplies ``createdAt`` for overwrites.
+    """
     table = _get_table()
-    key = {
-        "pk": _partition_key(poll_slug=poll_slug),
-        "sk": _sort_key(session_id=session_id, question_id=question_id),
-    }
+    table_name = _table_name()
     now = _now_iso()
     item: dict[str, Any] = {
-        **key,
+        "pk": _partition_key(poll_slug=poll_slug),
+        "sk": _sort_key(session_id=session_id, question_id=question_id),
         "pollSlug": poll_slug,
         "sessionId": session_id,
         "questionId": question_id,
@@ -171,17 +223,38 @@ def upsert_poll_answer(
         item["booleanAnswer"] = boolean_answer
     if free_text is not None:
         item["freeText"] = free_text
+    if existing_item and existing_item.get("createdAt"):
+        item["createdAt"] = existing_item["createdAt"]
+    else:
+        item["createdAt"] = now
 
+    rate_limit = _rate_limit_update(poll_slug=poll_slug, session_id=session_id)
     try:
-        existing = existing_item
-        if existing is None:
-            existing = table.get_item(Key=key).get("Item")
-        if existing and existing.get("createdAt"):
-            item["createdAt"] = existing["createdAt"]
-        else:
-            item["createdAt"] = now
-        table.put_item(Item=item)
-    except ClientError:
+        table.meta.client.transact_write_items(
+            TransactItems=[
+                {
+                    "Update": {
+                        "TableName": table_name,
+                        "Key": _serialize_item(rate_limit["Key"]),
+                        "UpdateExpression": rate_limit["UpdateExpression"],
+                        "ConditionExpression": rate_limit["ConditionExpression"],
+                        "ExpressionAttributeValues": _serialize_item(
+                            rate_limit["ExpressionAttributeValues"]
+                        ),
+                    }
+                },
+                {"Put": {"TableName": table_name, "Item": _serialize_item(item)}},
+            ]
+        )
+    except ClientError as exc:
+        error_code = exc.response.get("Error", {}).get("Code")
+        reasons = exc.response.get("CancellationReasons") or []
+        if (
+            error_code == "TransactionCanceledException"
+            and reasons
+            and reasons[0].get("Code") == "ConditionalCheckFailed"
+        ):
+            raise RateLimitError("poll_write_rate_limit_exceeded") from None
         logger.exception(
             "Failed to persist poll answer",
             extra={
@@ -375,6 +448,13 @@ def get_poll_control_state(*, poll_slug: str) -> dict[str, Any]:
             status_code=500,
         ) from None
 
+    return _control_state_from_item(poll_slug, item)
+
+
+def _control_state_from_item(
+    poll_slug: str,
+    item: Mapping[str, Any] | None,
+) -> dict[str, Any]:
     enabled: list[str] = []
     if item and isinstance(item.get("enabledQuestionIds"), list):
         for value in item["enabledQuestionIds"]:
@@ -390,6 +470,7 @@ def get_poll_control_state(*, poll_slug: str) -> dict[str, Any]:
     response: dict[str, Any] = {
         "pollSlug": poll_slug,
         "enabledQuestionIds": enabled,
+        "version": _control_version(item),
     }
     if question_options:
         response["questionOptions"] = question_options
@@ -398,13 +479,26 @@ def get_poll_control_state(*, poll_slug: str) -> dict[str, Any]:
     return response
 
 
+def _control_version(item: Mapping[str, Any] | None) -> int:
+    """Stored control version; rows written before versioning count as 0."""
+    raw = item.get("version") if isinstance(item, Mapping) else None
+    if isinstance(raw, bool) or not isinstance(raw, int | Decimal):
+        return 0
+    return int(raw)
+
+
 def put_poll_control_state(
     *,
     poll_slug: str,
     enabled_question_ids: list[str],
     question_options: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    """Replace the set of questions respondents may answer (default is none)."""
+    """Replace the set of questions respondents may answer (default is none).
+
+    Each write bumps the row's ``version`` (conditional on the version read, so
+    concurrent facilitator writes cannot both land); readers use it for
+    ``sinceVersion`` checks. A lost race raises ``ConflictError``.
+    """
     table = _get_table()
     key = {
         "pk": _partition_key(poll_slug=poll_slug),
@@ -425,8 +519,17 @@ def put_poll_control_state(
             item["createdAt"] = existing["createdAt"]
         else:
             item["createdAt"] = now
-        table.put_item(Item=item)
-    except ClientError:
+        previous_version = _control_version(existing)
+        item["version"] = previous_version + 1
+        table.put_item(
+            Item=item,
+            ConditionExpression="attribute_not_exists(version) OR version = :expected",
+            ExpressionAttributeValues={":expected": previous_version},
+        )
+    except ClientError as exc:
+        error_code = exc.response.get("Error", {}).get("Code")
+        if error_code == "ConditionalCheckFailedException":
+            raise ConflictError("poll_control_changed") from None
         logger.exception(
             "Failed to persist poll control state",
             extra={"poll_slug": poll_slug},
@@ -439,6 +542,7 @@ def put_poll_control_state(
     result: dict[str, Any] = {
         "pollSlug": poll_slug,
         "enabledQuestionIds": enabled_question_ids,
+        "version": item["version"],
         "updatedAt": now,
     }
     if question_options:
@@ -446,48 +550,28 @@ def put_poll_control_state(
     return result
 
 
-def check_poll_write_rate_limit(
-    *,
-    poll_slug: str,
-    session_id: str,
-) -> None:
-    """Reject excessive poll answer writes per session within the current hour bucket."""
-    table = _get_table()
+def _rate_limit_update(*, poll_slug: str, session_id: str) -> dict[str, Any]:
+    """Counter increment for the session's current hour bucket (UpdateItem args)."""
     now_epoch = int(time.time())
     window_id = _rate_limit_window_id(now_epoch=now_epoch)
-    expires_at = now_epoch + _RATE_LIMIT_TTL_SECONDS
-    key = {
-        "pk": _partition_key(poll_slug=poll_slug),
-        "sk": _rate_limit_sort_key(session_id=session_id, window_id=window_id),
+    return {
+        "Key": {
+            "pk": _partition_key(poll_slug=poll_slug),
+            "sk": _rate_limit_sort_key(session_id=session_id, window_id=window_id),
+        },
+        "UpdateExpression": (
+            "ADD writeCount :inc SET expiresAt = :expires, updatedAt = :updated"
+        ),
+        "ConditionExpression": (
+            "attribute_not_exists(writeCount) OR writeCount < :limit"
+        ),
+        "ExpressionAttributeValues": {
+            ":inc": 1,
+            ":expires": now_epoch + _RATE_LIMIT_TTL_SECONDS,
+            ":updated": _now_iso(),
+            ":limit": _SESSION_WRITE_LIMIT,
+        },
     }
-    try:
-        table.update_item(
-            Key=key,
-            UpdateExpression=(
-                "ADD writeCount :inc SET expiresAt = :expires, updatedAt = :updated"
-            ),
-            ConditionExpression=(
-                "attribute_not_exists(writeCount) OR writeCount < :limit"
-            ),
-            ExpressionAttributeValues={
-                ":inc": 1,
-                ":expires": expires_at,
-                ":updated": _now_iso(),
-                ":limit": _SESSION_WRITE_LIMIT,
-            },
-        )
-    except ClientError as exc:
-        error_code = exc.response.get("Error", {}).get("Code")
-        if error_code == "ConditionalCheckFailedException":
-            raise RateLimitError("poll_write_rate_limit_exceeded") from None
-        logger.exception(
-            "Failed to update poll write rate limit counter",
-            extra={"poll_slug": poll_slug, "session_id": session_id},
-        )
-        raise AppError(
-            "Failed to enforce poll write rate limit",
-            status_code=500,
-        ) from None
 
 
 def _count_boolean_answers(items: list[dict[str, Any]], *, expected: bool) -> int:
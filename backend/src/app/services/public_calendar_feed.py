@@ -0,0 +1,247 @@
+"""Precomputed public calendar feed: one serialized snapshot shared by all filters.
+
+``GET /v1/calendar/public`` serves every filter combination from one snapshot of
+the serialized event list stored in ``public_calendar_feed_snapshots``. Table
+triggers (migration ``0073_public_calendar_feed``) mark the snapshot stale when
+instances, slots, enrollments or other serialized rows change; the next request
+rebuilds it. Each Lambda container also keeps the last snapshot in memory and only
+re-checks the table every :data:`MEMO_RECHECK_SECONDS`.
+
+Rebuilds only run while holding the snapshot row via ``FOR UPDATE SKIP LOCKED``:
+when a writer transaction (whose trigger updated the row) or another rebuild holds
+it, the request serves a live, unsaved build instead of waiting for that commit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.db.models.enums import ServiceType
+from app.db.repositories.public_calendar_feed_snapshot import (
+    PublicCalendarFeedSnapshotRepository,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+FEED_KEY = "public_calendar"
+#: Maximum events per filtered response (the pre-snapshot SQL ``LIMIT``).
+FEED_RESPONSE_LIMIT = 100
+#: Rebuild even without a trigger after this long: the feed window moves with time.
+SNAPSHOT_MAX_AGE = timedelta(minutes=5)
+#: How long a container reuses its in-memory snapshot without reading the table.
+MEMO_RECHECK_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    """Serialized public feed events (feed order) and their content hash.
+
+    ``truncated`` is set when the source query had more rows than the snapshot
+    keeps, so filtered views may be missing matches beyond the cap.
+    """
+
+    etag: str
+    built_at: datetime
+    events: list[dict[str, Any]]
+    truncated: bool = False
+
+
+_memo: FeedSnapshot | None = None
+_memo_checked_at = 0.0
+
+
+def reset_feed_memo() -> None:
+    """Drop the per-container snapshot (tests, or after a forced rebuild)."""
+    global _memo, _memo_checked_at
+    _memo = None
+    _memo_checked_at = 0.0
+
+
+def feed_etag(events: list[dict[str, Any]]) -> str:
+    """Stable content hash of a serialized event list."""
+    encoded = json.dumps(events, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def load_feed_snapshot(
+    session: Session,
+    *,
+    now: datetime,
+    build: Callable[[], tuple[list[dict[str, Any]], bool]],
+) -> FeedSnapshot:
+    """Return the current feed snapshot, rebuilding it with ``build`` when stale.
+
+    ``build`` returns the unfiltered serialized event list in feed order and
+    whether it was truncated at the snapshot row cap.
+    """
+    global _memo, _memo_checked_at
+    memo = _memo
+    if (
+        memo is not None
+        and time.monotonic() - _memo_checked_at < MEMO_RECHECK_SECONDS
+        and now - memo.built_at < SNAPSHOT_MAX_AGE
+    ):
+        return memo
+
+    repository = PublicCalendarFeedSnapshotRepository(session)
+    state = repository.get_state(FEED_KEY)
+    built_at = _as_utc(state.built_at) if state is not None else None
+    fresh = (
+        state is not None
+        and not state.stale
+        and state.etag is not None
+        and built_at is not None
+        and now - built_at < SNAPSHOT_MAX_AGE
+    )
+    if fresh:
+        if memo is None or memo.etag != state.etag:
+            memo = FeedSnapshot(
+                etag=str(state.etag),
+                built_at=built_at,
+                events=repository.get_payload(FEED_KEY),
+                truncated=state.truncated,
+            )
+    elif state is not None and not repository.try_lock(FEED_KEY):
+        logger.info("Public calendar feed snapshot is locked; serving a live build")
+        return _build_snapshot(build, now=now)
+    else:
+        memo = _rebuild(
+            session, repository, now=now, build=build, exists=state is not None
+        )
+    _memo = memo
+    _memo_checked_at = time.monotonic()
+    return memo
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _build_snapshot(
+    build: Callable[[], tuple[list[dict[str, Any]], bool]],
+    *,
+    now: datetime,
+) -> FeedSnapshot:
+    events, truncated = build()
+    return FeedSnapshot(
+        etag=feed_etag(events), built_at=now, events=events, truncated=truncated
+    )
+
+
+def _rebuild(
+    session: Session,
+    repository: PublicCalendarFeedSnapshotRepository,
+    *,
+    now: datetime,
+    build: Callable[[], tuple[list[dict[str, Any]], bool]],
+    exists: bool,
+) -> FeedSnapshot:
+    """Rebuild and store the snapshot; the caller holds the row lock if ``exists``."""
+    if exists:
+        repository.clear_stale(FEED_KEY)
+        session.commit()
+    snapshot = _build_snapshot(build, now=now)
+    if exists and not repository.try_lock(FEED_KEY):
+        # A writer marked the row stale meanwhile; its next reader rebuilds.
+        session.rollback()
+        return snapshot
+    repository.save(
+        FEED_KEY,
+        payload=snapshot.events,
+        etag=snapshot.etag,
+        built_at=now,
+        truncated=snapshot.truncated,
+    )
+    session.commit()
+    logger.info(
+        "Rebuilt public calendar feed snapshot",
+        extra={
+            "event_count": len(snapshot.events),
+            "etag": snapshot.etag,
+            "truncated": snapshot.truncated,
+        },
+    )
+    return snapshot
+
+
+def _filter_events(
+    events: list[dict[str, Any]],
+    *,
+    service_types: set[ServiceType] | None,
+    slug: str | None,
+    service_key: str | None,
+) -> list[dict[str, Any]]:
+    """Apply the public query filters to snapshot events (same semantics as SQL).
+
+    Slug and service key compare case-insensitively, like the repository's
+    ``lower()`` predicates; feed order is preserved and capped at 100 rows.
+    """
+    type_values = (
+        {t.value for t in service_types} if service_types is not None else None
+    )
+    out: list[dict[str, Any]] = []
+    for item in events:
+        if type_values is not None and item.get("service_type") not in type_values:
+            continue
+        if slug is not None and str(item.get("slug") or "").lower() != slug:
+            continue
+        if (
+            service_key is not None
+            and str(item.get("service_key") or "").lower() != service_key
+        ):
+            continue
+        out.append(item)
+        if len(out) >= FEED_RESPONSE_LIMIT:
+            break
+    return out
+
+
+def _response_etag(
+    snapshot_etag: str,
+    *,
+    service_types: set[ServiceType] | None,
+    slug: str | None,
+    service_key: str | None,
+) -> str:
+    """Quoted ETag for one snapshot + normalized filter combination."""
+    types = (
+        ",".join(sorted(t.value for t in service_types))
+        if service_types is not None
+        else ""
+    )
+    key = f"{snapshot_etag}|{types}|{slug or ''}|{service_key or ''}"
+    return f'"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def filter_feed_snapshot(
+    snapshot: FeedSnapshot,
+    *,
+    service_types: set[ServiceType] | None,
+    slug: str | None,
+    service_key: str | None,
+) -> tuple[str, list[dict[str, Any]]]:
+    """Return ``(etag, events)`` for one normalized filter combination."""
+    etag = _response_etag(
+        snapshot.etag,
+        service_types=service_types,
+        slug=slug,
+        service_key=service_key,
+    )
+    events = _filter_events(
+        snapshot.events,
+        service_types=service_types,
+        slug=slug,
+        service_key=service_key,
+    )
+    return etag, events
@@ -0,0 +1,309 @@
+"""Sales lead dashboard analytics served from daily rollups.
+
+Rollups are bucketed by the lead's UTC creation day (the analytics date range
+filters on ``sales_leads.created_at``). Table triggers (migration
+``0075_sales_lead_daily_rollups``) upsert the creation day of every lead whose row,
+stage events or contact source change into ``sales_lead_rollup_dirty_days``; each
+dashboard load first recomputes only those days, then sums the rollups of the
+whole days in range. Partial first / last days of a timestamp range are aggregated
+directly from the lead rows, so results match the full-table queries exactly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, date, datetime, time, timedelta
+from itertools import groupby
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.models.enums import FunnelStage
+from app.db.models.sales_lead import SalesLead
+from app.db.models.sales_lead_rollup import (
+    SalesLeadDailyRollup,
+    SalesLeadStageDailyRollup,
+)
+from app.db.repositories.sales_lead_rollup import SalesLeadRollupRepository
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+#: Creation days aggregated per query when recomputing rollups.
+ROLLUP_CHUNK_DAYS = 31
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+def aggregate_rollups(
+    session: Session,
+    conditions: Sequence[ColumnElement[bool]],
+) -> tuple[list[SalesLeadDailyRollup], list[SalesLeadStageDailyRollup]]:
+    """Compute (unsaved) rollup rows for the leads matching ``conditions``."""
+    repository = SalesLeadRollupRepository(session)
+    daily: dict[tuple, list] = {}
+    lead_day: dict[object, date] = {}
+    for (
+        lead_id,
+        created_at,
+        stage,
+        source,
+        assigned_to,
+        converted_at,
+    ) in repository.lead_facts(conditions):
+        day = _utc(created_at).date()
+        lead_day[lead_id] = day
+        key = (day, stage, source.value if source is not None else None, assigned_to)
+        acc = daily.setdefault(key, [0, 0, 0.0])
+        acc[0] += 1
+        if converted_at is not None:
+            acc[1] += 1
+            acc[2] += (_utc(converted_at) - _utc(created_at)).total_seconds()
+
+    stages: dict[tuple[date, FunnelStage], list] = {}
+    for lead_id, events in groupby(
+        repository.stage_events(conditions), key=lambda row: row[0]
+    ):
+        day = lead_day.get(lead_id)
+        if day is None:
+            continue
+        reached: set[FunnelStage] = set()
+        previous_at: datetime | None = None
+        for _, from_stage, to_stage, created_at in events:
+            if to_stage is not None:
+                reached.add(to_stage)
+            if previous_at is not None and from_stage is not None:
+                acc = stages.setdefault((day, from_stage), [0, 0, 0.0])
+                acc[1] += 1
+                acc[2] += (_utc(created_at) - previous_at).total_seconds()
+            previous_at = _utc(created_at)
+        for stage in reached:
+            stages.setdefault((day, stage), [0, 0, 0.0])[0] += 1
+
+    return (
+        [
+            SalesLeadDailyRollup(
+                day=day,
+                funnel_stage=stage,
+                source=source,
+                assigned_to=assigned_to,
+                lead_count=count,
+                converted_timed_count=timed,
+                convert_seconds=seconds,
+            )
+            for (day, stage, source, assigned_to), (count, timed, seconds) in (
+                daily.items()
+            )
+        ],
+        [
+            SalesLeadStageDailyRollup(
+                day=day,
+                stage=stage,
+                reached_leads=reached_count,
+                stage_intervals=intervals,
+                stage_seconds=seconds,
+            )
+            for (day, stage), (reached_count, intervals, seconds) in stages.items()
+        ],
+    )
+
+
+def _day_runs(days: Sequence[date]) -> Iterator[tuple[date, date]]:
+    """Contiguous runs of sorted ``days``, each at most ``ROLLUP_CHUNK_DAYS`` long."""
+    start = prev = None
+    for day in days:
+        if start is None:
+            start = prev = day
+            continue
+        if day != prev + _ONE_DAY or (day - start).days >= ROLLUP_CHUNK_DAYS:
+            yield start, prev
+            start = day
+        prev = day
+    if start is not None:
+        yield start, prev
+
+
+def _recompute_range(session: Session, first: date, last: date) -> None:
+    daily, stages = aggregate_rollups(
+        session,
+        [
+            SalesLead.created_at >= _midnight(first),
+            SalesLead.created_at < _midnight(last + _ONE_DAY),
+        ],
+    )
+    covered = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    SalesLeadRollupRepository(session).replace_days(covered, daily=daily, stages=stages)
+
+
+def refresh_sales_lead_rollups(session: Session) -> int:
+    """Recompute the rollups of every dirty day; return how many were rebuilt."""
+    days = SalesLeadRollupRepository(session).claim_dirty_days()
+    for first, last in _day_runs(days):
+        _recompute_range(session, first, last)
+    session.commit()
+    return len(days)
+
+
+def rebuild_sales_lead_rollups(session: Session) -> int:
+    """Recompute every day's rollups from scratch (backfill); return days covered.
+
+    Commits per chunk so a long history never holds one large transaction.
+    """
+    repository = SalesLeadRollupRepository(session)
+    first_at, last_at = repository.created_day_bounds()
+    if first_at is None or last_at is None:
+        repository.delete_outside(None, None)
+        session.commit()
+        return 0
+    first, last = _utc(first_at).date(), _utc(last_at).date()
+    repository.delete_outside(first, last)
+    session.commit()
+    total = (last - first).days + 1
+    all_days = [first + timedelta(days=i) for i in range(total)]
+    for start, end in _day_runs(all_days):
+        _recompute_range(session, start, end)
+        session.commit()
+        logger.info(
+            "sales_lead_rollups_rebuilt_chunk",
+            extra={"from": start.isoformat(), "to": end.isoformat()},
+        )
+    return total
+
+
+def _analytics_from_rollups(
+    daily: Iterable[SalesLeadDailyRollup],
+    stages: Iterable[SalesLeadStageDailyRollup],
+) -> dict[str, object]:
+    stage_counts = {stage.value: 0 for stage in FunnelStage}
+    source_breakdown: dict[str, int] = {}
+    weekly: dict[tuple[int, int], int] = {}
+    assignees: dict[str | None, list[int]] = {}
+    converted_timed = 0
+    convert_seconds = 0.0
+    for row in daily:
+        stage_counts[row.funnel_stage.value] += row.lead_count
+        source = row.source or "unknown"
+        source_breakdown[source] = source_breakdown.get(source, 0) + row.lead_count
+        iso_year, iso_week, _ = row.day.isocalendar()
+        weekly[(iso_year, iso_week)] = (
+            weekly.get((iso_year, iso_week), 0) + row.lead_count
+        )
+        assignee = assignees.setdefault(row.assigned_to, [0, 0])
+        assignee[0] += row.lead_count
+        if row.funnel_stage == FunnelStage.CONVERTED:
+            assignee[1] += row.lead_count
+        converted_timed += row.converted_timed_count
+        convert_seconds += row.convert_seconds
+
+    reached: dict[str, int] = {}
+    stage_totals: dict[str, list] = {}
+    for row in stages:
+        reached[row.stage.value] = reached.get(row.stage.value, 0) + row.reached_leads
+        totals = stage_totals.setdefault(row.stage.value, [0, 0.0])
+        totals[0] += row.stage_intervals
+        totals[1] += row.stage_seconds
+
+    total = sum(stage_counts.values())
+    denominator = max(total - stage_counts[FunnelStage.LOST.value], 1)
+
+    def _rate(to_stage: FunnelStage, from_stage: FunnelStage) -> float:
+        base = reached.get(from_stage.value, 0)
+        return reached.get(to_stage.value, 0) / base if base else 0.0
+
+    return {
+        "funnel": stage_counts,
+        "conversion_rate": stage_counts[FunnelStage.CONVERTED.value] / denominator,
+        "avg_days_to_convert": (
+            convert_seconds / converted_timed / 86400.0 if converted_timed else None
+        ),
+        "source_breakdown": source_breakdown,
+        "stage_conversion_rates": {
+            "new_to_contacted": _rate(FunnelStage.CONTACTED, FunnelStage.NEW),
+            "contacted_to_engaged": _rate(FunnelStage.ENGAGED, FunnelStage.CONTACTED),
+            "engaged_to_qualified": _rate(FunnelStage.QUALIFIED, FunnelStage.ENGAGED),
+            "qualified_to_converted": _rate(
+                FunnelStage.CONVERTED, FunnelStage.QUALIFIED
+            ),
+        },
+        "avg_days_in_stage": {
+            stage: seconds / intervals / 86400.0
+            for stage, (intervals, seconds) in stage_totals.items()
+            if intervals
+        },
+        "leads_over_time": [
+            {"period": f"{year:04d}-{week:02d}", "count": count}
+            for (year, week), count in sorted(weekly.items())
+        ],
+        "assignee_stats": [
+            {
+                "assigned_to": assigned_to,
+                "total": assigned_total,
+                "converted": converted,
+                "conversion_rate": converted / assigned_total
+                if assigned_total
+                else 0.0,
+            }
+            for assigned_to, (assigned_total, converted) in assignees.items()
+        ],
+    }
+
+
+def get_sales_lead_analytics(
+    session: Session,
+    *,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> dict[str, object]:
+    """Dashboard analytics for leads created in ``[date_from, date_to]``."""
+    refresh_sales_lead_rollups(session)
+    start = _utc(date_from) if date_from is not None else None
+    # ``created_at <= date_to`` == ``created_at < date_to + 1µs`` at µs precision.
+    end = _utc(date_to) + timedelta(microseconds=1) if date_to is not None else None
+
+    first_full = None
+    if start is not None:
+        first_full = start.date()
+        if start > _midnight(first_full):
+            first_full += _ONE_DAY
+    last_full = end.date() - _ONE_DAY if end is not None else None
+
+    windows: list[tuple[datetime | None, datetime | None]] = []
+    daily: list[SalesLeadDailyRollup] = []
+    stages: list[SalesLeadStageDailyRollup] = []
+    if first_full is not None and last_full is not None and first_full > last_full:
+        windows.append((start, end))
+    else:
+        daily, stages = SalesLeadRollupRepository(session).list_rollups(
+            first_full, last_full
+        )
+        if (
+            start is not None
+            and first_full is not None
+            and start < _midnight(first_full)
+        ):
+            windows.append((start, _midnight(first_full)))
+        if end is not None and last_full is not None:
+            tail_start = _midnight(last_full + _ONE_DAY)
+            if tail_start < end:
+                windows.append((tail_start, end))
+
+    for window_start, window_end in windows:
+        conditions: list[ColumnElement[bool]] = []
+        if window_start is not None:
+            conditions.append(SalesLead.created_at >= window_start)
+        if window_end is not None:
+            conditions.append(SalesLead.created_at < window_end)
+        partial_daily, partial_stages = aggregate_rollups(session, conditions)
+        daily.extend(partial_daily)
+        stages.extend(partial_stages)
+    return _analytics_from_rollups(daily, stages)
@@ -0,0 +1,318 @@
+"""Stream admin lead exports to gzip'd CSV objects in S3 (SQS worker).
+
+The worker reads plain columns through a server-side cursor
+(``SalesLeadRepository.stream_export_rows``), writes CSV rows through ``gzip``
+straight into an S3 multipart upload, and records progress on the job row from a
+separate session. Memory stays bounded by the fetch batch plus one upload part,
+however many leads match.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import math
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.db.engine import get_engine
+from app.db.models.enums import ContactSource, FunnelStage, LeadType
+from app.db.models.sales_lead_export_job import SalesLeadExportJobStatus
+from app.db.repositories.sales_lead import EXPORT_TAG_SEPARATOR, SalesLeadRepository
+from app.db.repositories.sales_lead_export_job import SalesLeadExportJobRepository
+from app.services.aws_clients import get_s3_client
+from app.utils import require_env
+from app.utils.logging import get_logger
+from app.utils.phone import format_phone_e164
+
+logger = get_logger(__name__)
+
+LEAD_EXPORT_HEADER = [
+    "ID",
+    "First Name",
+    "Last Name",
+    "Email",
+    "Phone E.164",
+    "Source",
+    "Lead Type",
+    "Stage",
+    "Assigned To",
+    "Created",
+    "Last Activity",
+    "Days In Stage",
+    "Tags",
+]
+
+#: Object key prefix for export files in ``ASSETS_BUCKET_NAME``.
+EXPORT_S3_PREFIX = "exports/sales-leads/"
+
+#: S3 requires >= 5 MiB for every part but the last.
+UPLOAD_PART_BYTES = 8 * 1024 * 1024
+FETCH_BATCH_ROWS = 2000
+PROGRESS_EVERY_ROWS = 5000
+
+#: PROCESSING jobs not heartbeating for this long are restarted.
+_STALE_AFTER = timedelta(minutes=15)
+
+
+@dataclass(frozen=True)
+class LeadExportWorkerOutcome:
+    """Whether the SQS message should be deleted (``True``) or retried (``False``)."""
+
+    ack_sqs_message: bool
+
+
+def dump_export_filters(filters: Mapping[str, Any]) -> dict[str, Any]:
+    """JSON form of ``parse_lead_filters`` output for ``sales_lead_export_jobs``."""
+    return {
+        "stage": [item.value for item in filters.get("stage") or []],
+        "source": [item.value for item in filters.get("source") or []],
+        "lead_type": [item.value for item in filters.get("lead_type") or []],
+        "assigned_to": filters.get("assigned_to"),
+        "unassigned": bool(filters.get("unassigned")),
+        "date_from": _iso(filters.get("date_from")),
+        "date_to": _iso(filters.get("date_to")),
+        "search": filters.get("search"),
+    }
+
+
+def load_export_filters(raw: Mapping[str, Any]) -> dict[str, Any]:
+    """Inverse of ``dump_export_filters`` (``SalesLeadRepository`` filter kwargs)."""
+    return {
+        "stage": [FunnelStage(value) for value in raw.get("stage") or []],
+        "source": [ContactSource(value) for value in raw.get("source") or []],
+        "lead_type": [LeadType(value) for value in raw.get("lead_type") or []],
+        "assigned_to": raw.get("assigned_to"),
+        "unassigned": bool(raw.get("unassigned")),
+        "date_from": _parse_iso(raw.get("date_from")),
+        "date_to": _parse_iso(raw.get("date_to")),
+        "search": raw.get("search"),
+    }
+
+
+def export_csv_row(row: Row[Any], *, now: datetime) -> list[Any]:
+    """CSV cells for one ``stream_export_rows`` row (same layout as ``/export``)."""
+    tags = sorted({name for name in (row.tag_names or "").split(EXPORT_TAG_SEPARATOR)})
+    stage_age = now - _utc(row.stage_entered_at)
+    return [
+        str(row.id),
+        row.first_name,
+        row.last_name,
+        row.email,
+        format_phone_e164(row.phone_region, row.phone_national_number),
+        row.source.value if row.source else None,
+        row.lead_type.value,
+        row.funnel_stage.value,
+        row.assigned_to,
+        row.created_at.isoformat() if row.created_at else None,
+        row.last_activity_at.isoformat() if row.last_activity_at else None,
+        math.floor(stage_age.total_seconds() / 86400),
+        ",".join(tag for tag in tags if tag),
+    ]
+
+
+class S3MultipartWriter:
+    """Binary file-like sink that uploads each filled part to S3 as it goes."""
+
+    def __init__(
+        self,
+        s3_client: Any,
+        *,
+        bucket: str,
+        key: str,
+        content_type: str,
+        part_bytes: int = UPLOAD_PART_BYTES,
+    ) -> None:
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._part_bytes = part_bytes
+        self._buffer = bytearray()
+        self._parts: list[dict[str, Any]] = []
+        self.bytes_written = 0
+        self._upload_id = s3_client.create_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            ContentType=content_type,
+            ContentDisposition=f'attachment; filename="{key.rsplit("/", 1)[-1]}"',
+        )["UploadId"]
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        if len(self._buffer) >= self._part_bytes:
+            self._upload_part()
+        return len(data)
+
+    def flush(self) -> None:
+        """Parts are uploaded once full; nothing to do per flush."""
+
+    def complete(self) -> int:
+        """Upload the remaining bytes and finish the object; return its size."""
+        if self._buffer or not self._parts:
+            self._upload_part()
+        self._s3.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+        return self.bytes_written
+
+    def abort(self) -> None:
+        self._s3.abort_multipart_upload(
+            Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+        )
+
+    def _upload_part(self) -> None:
+        part_number = len(self._parts) + 1
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer),
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer.clear()
+
+
+def write_lead_export(
+    rows: Iterable[Row[Any]],
+    sink: Any,
+    *,
+    now: datetime,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """Write the gzip'd CSV (header + ``rows``) to ``sink``; return rows written."""
+    count = 0
+    with gzip.GzipFile(fileobj=sink, mode="wb", mtime=0) as compressed:
+        text = io.TextIOWrapper(compressed, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(LEAD_EXPORT_HEADER)
+        for row in rows:
+            writer.writerow(export_csv_row(row, now=now))
+            count += 1
+            if on_progress is not None and count % PROGRESS_EVERY_ROWS == 0:
+                on_progress(count)
+        text.flush()
+        text.detach()
+    return count
+
+
+def export_s3_key(job_id: UUID, *, created_at: datetime) -> str:
+    return (
+        f"{EXPORT_S3_PREFIX}{job_id}/leads-export-{created_at.date().isoformat()}"
+        ".csv.gz"
+    )
+
+
+def process_sales_lead_export_job(job_id: UUID) -> LeadExportWorkerOutcome:
+    """Stream one export job's leads into S3 and record the result on the job."""
+    with Session(get_engine()) as session:
+        job_repo = SalesLeadExportJobRepository(session)
+        job = job_repo.get_by_id(job_id)
+        if job is None:
+            logger.warning("Lead export job not found", extra={"job_id": str(job_id)})
+            return LeadExportWorkerOutcome(ack_sqs_message=True)
+        if job.status in (
+            SalesLeadExportJobStatus.SUCCEEDED,
+            SalesLeadExportJobStatus.FAILED,
+        ):
+            return LeadExportWorkerOutcome(ack_sqs_message=True)
+        if job.status == SalesLeadExportJobStatus.PROCESSING:
+            updated = job.updated_at
+            if updated is not None and datetime.now(UTC) - updated < _STALE_AFTER:
+                logger.info(
+                    "Lead export job still processing elsewhere; deferring",
+                    extra={"job_id": str(job_id)},
+                )
+                return LeadExportWorkerOutcome(ack_sqs_message=False)
+            logger.warning(
+                "Restarting abandoned lead export job", extra={"job_id": str(job_id)}
+            )
+        filters = load_export_filters(job.filters)
+        key = export_s3_key(job_id, created_at=job.created_at)
+        total = SalesLeadRepository(session).count_leads(**filters)
+        job_repo.mark_processing(job, total_count=total)
+        session.commit()
+
+    upload = S3MultipartWriter(
+        get_s3_client(),
+        bucket=require_env("ASSETS_BUCKET_NAME"),
+        key=key,
+        content_type="application/gzip",
+    )
+    try:
+        with (
+            Session(get_engine()) as read_session,
+            Session(get_engine()) as progress_session,
+        ):
+            progress_repo = SalesLeadExportJobRepository(progress_session)
+
+            def _record(exported: int) -> None:
+                progress_repo.record_progress(job_id, exported_count=exported)
+                progress_session.commit()
+
+            rows = SalesLeadRepository(read_session).stream_export_rows(
+                batch_size=FETCH_BATCH_ROWS, **filters
+            )
+            exported = write_lead_export(
+                rows, upload, now=datetime.now(UTC), on_progress=_record
+            )
+        byte_size = upload.complete()
+    except Exception:
+        logger.exception("Lead export job failed", extra={"job_id": str(job_id)})
+        try:
+            upload.abort()
+        except Exception:
+            logger.exception(
+                "Could not abort lead export upload", extra={"job_id": str(job_id)}
+            )
+        _fail_job(job_id, "Export failed; please try again.")
+        return LeadExportWorkerOutcome(ack_sqs_message=True)
+
+    with Session(get_engine()) as session:
+        job_repo = SalesLeadExportJobRepository(session)
+        job = job_repo.get_by_id(job_id)
+        if job is not None:
+            job_repo.mark_succeeded(
+                job, s3_key=key, exported_count=exported, byte_size=byte_size
+            )
+            session.commit()
+    logger.info(
+        "Lead export job finished",
+        extra={"job_id": str(job_id), "rows": exported, "bytes": byte_size},
+    )
+    return LeadExportWorkerOutcome(ack_sqs_message=True)
+
+
+def _fail_job(job_id: UUID, message: str) -> None:
+    with Session(get_engine()) as session:
+        job_repo = SalesLeadExportJobRepository(session)
+        job = job_repo.get_by_id(job_id)
+        if job is None:
+            return
+        job_repo.mark_failed(job, message)
+        session.commit()
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
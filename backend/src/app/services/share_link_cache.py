@@ -0,0 +1,118 @@
+"""Container-level cache for public share-token lookups.
+
+``/v1/assets/share/{token}`` and ``/v1/assets/email-download/{token}`` are hit
+by embeds and email clients that re-request the same token many times. Each
+warm Lambda container keeps ``token -> (s3_key, visibility, allowed_domains)``
+for a few minutes and remembers unknown tokens briefly so scanners do not
+reach Postgres on every guess.
+
+Admin writes (rotate, revoke, allowed-domain edits, asset visibility/key
+changes, asset deletes) bump the ``asset_share_links`` row in
+``cache_versions``. Readers compare that stamp at most every
+``SHARE_LINK_VERSION_CHECK_SECONDS`` and drop every entry when it moves, so a
+revoked link stops resolving within that window on every container.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.db.models import AssetVisibility
+from app.db.models.cache_version import SHARE_LINK_CACHE_SCOPE
+from app.db.repositories.asset import AssetRepository
+from app.db.repositories.cache_version import CacheVersionRepository
+
+#: How long a resolved token is served from memory.
+SHARE_LINK_CACHE_TTL_SECONDS = 300.0
+#: How long an unknown token is remembered.
+SHARE_LINK_NEGATIVE_TTL_SECONDS = 30.0
+#: Minimum interval between ``cache_versions`` reads.
+SHARE_LINK_VERSION_CHECK_SECONDS = 5.0
+#: Upper bound on cached tokens per container (oldest entries are evicted).
+SHARE_LINK_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class ShareLinkTarget:
+    """What a share token resolves to."""
+
+    s3_key: str
+    visibility: AssetVisibility
+    allowed_domains: frozenset[str]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    target: ShareLinkTarget | None
+    expires_at: float
+
+
+_LOCK = threading.Lock()
+_ENTRIES: OrderedDict[str, _Entry] = OrderedDict()
+_state: dict[str, float | int | None] = {"version": None, "checked_at": None}
+
+
+def clear_share_link_cache() -> None:
+    """Drop every cached token and force the next version check."""
+    with _LOCK:
+        _ENTRIES.clear()
+        _state["version"] = None
+        _state["checked_at"] = None
+
+
+def resolve_share_link_target(
+    session: Session,
+    token: str,
+    *,
+    clock: Callable[[], float] = time.monotonic,
+) -> ShareLinkTarget | None:
+    """Return the cached or freshly loaded target for ``token`` (None if unknown).
+
+    A cache hit within the version-check window issues no SQL, so the session
+    never opens a connection.
+    """
+    now = clock()
+    _sync_version(session, now)
+    with _LOCK:
+        entry = _ENTRIES.get(token)
+        if entry is not None and entry.expires_at > now:
+            return entry.target
+
+    row = AssetRepository(session).get_share_target_by_token(token=token)
+    target = None
+    if row is not None:
+        s3_key, visibility, allowed_domains = row
+        target = ShareLinkTarget(
+            s3_key=s3_key,
+            visibility=visibility,
+            allowed_domains=frozenset(allowed_domains),
+        )
+    ttl = (
+        SHARE_LINK_CACHE_TTL_SECONDS
+        if target is not None
+        else SHARE_LINK_NEGATIVE_TTL_SECONDS
+    )
+    with _LOCK:
+        _ENTRIES[token] = _Entry(target=target, expires_at=now + ttl)
+        _ENTRIES.move_to_end(token)
+        while len(_ENTRIES) > SHARE_LINK_CACHE_MAX_ENTRIES:
+            _ENTRIES.popitem(last=False)
+    return target
+
+
+def _sync_version(session: Session, now: float) -> None:
+    checked_at = _state["checked_at"]
+    if checked_at is not None and now - checked_at < SHARE_LINK_VERSION_CHECK_SECONDS:
+        return
+    version = CacheVersionRepository(session).get_version(SHARE_LINK_CACHE_SCOPE)
+    with _LOCK:
+        if _state["version"] != version:
+            _ENTRIES.clear()
+        _state["version"] = version
+        _state["checked_at"] = now
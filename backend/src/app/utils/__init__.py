@@ -13,6 +13,8 @@ from app.utils.public_http_cache import (
     CACHE_CONTROL_EDGE_CACHEABLE_GET,
     CACHE_CONTROL_NO_STORE,
     public_cacheable_json_response,
+    public_not_modified_response,
+    request_etag_matches,
 )
 from app.utils.responses import (
     get_cors_headers,
@@ -29,6 +31,7 @@ from app.utils.validators import (
 from app.utils.logging import (
     clear_request_context,
     configure_logging,
+    flush_logs,
     get_logger,
     hash_for_correlation,
     mask_email,
@@ -51,6 +54,7 @@ __all__ = [
     "CACHE_CONTROL_NO_STORE",
     "clear_request_context",
     "configure_logging",
+    "flush_logs",
     "get_cors_headers",
     "get_logger",
     "get_security_headers",
@@ -63,6 +67,8 @@ __all__ = [
     "parse_enum",
     "parse_int",
     "public_cacheable_json_response",
+    "public_not_modified_response",
+    "request_etag_matches",
     "require_env",
     "run_with_retry",
     "sanitize_string",
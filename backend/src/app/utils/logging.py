@@ -15,14 +15,21 @@ import hashlib
 import json
 import logging
 import os
+import random
 import sys
+import time
 import traceback
+from collections import Counter
 from contextvars import ContextVar
-from datetime import datetime
-from datetime import timezone
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, TextIO
 from collections.abc import MutableMapping
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup; stdlib json fallback
+    orjson = None
+
 
 def mask_email(email: str) -> str:
     """Mask an email address for safe logging.
@@ -91,9 +98,40 @@ def hash_for_correlation(value: str) -> str:
     return hashlib.sha256(value.encode()).hexdigest()[:12]
 
 
+@dataclass
+class QueryStats:
+    """SQL statements run during one request (recorded by ``app.db.query_stats``).
+
+    ``shapes`` counts statements by normalized text; one shape repeated many
+    times in a request is the signature of an N+1 lazy-load loop.
+    """
+
+    statements: int = 0
+    db_ms: float = 0.0
+    rows: int = 0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, shape: str, *, elapsed_ms: float, rows: int) -> None:
+        self.statements += 1
+        self.db_ms += elapsed_ms
+        self.rows += rows
+        self.shapes[shape] += 1
+
+    def repeated_shapes(self, threshold: int | None = None) -> list[tuple[str, int]]:
+        """Shapes run at least ``threshold`` times, most frequent first."""
+        limit = n_plus_one_threshold() if threshold is None else threshold
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= limit]
+
+
 # Context variables for request tracking
 request_id: ContextVar[str] = ContextVar("request_id", default="")
 correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def n_plus_one_threshold() -> int:
+    """Repeats of one statement shape per request that flag a suspected N+1."""
+    return int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
 
 
 def _logrecord_builtin_keys() -> frozenset[str]:
@@ -117,13 +155,33 @@ class StructuredLogFormatter(logging.Formatter):
     """JSON formatter for structured logging.
 
     Produces log entries compatible with CloudWatch Logs Insights,
-    including request context and exception details.
+    including request context and exception details. The timestamp is taken
+    from ``record.created``; its date/time prefix and the JSON encoder are
+    built once and reused across records. Lines are encoded with ``orjson``
+    when installed (compact separators) and the stdlib encoder otherwise.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._encode = json.JSONEncoder(default=str).encode
+        self._timestamp_second = -1
+        self._timestamp_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """ISO 8601 UTC timestamp, e.g. ``2026-01-31T08:15:02.123456+00:00``."""
+        second = int(created)
+        if second != self._timestamp_second:
+            self._timestamp_prefix = time.strftime(
+                "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+            )
+            self._timestamp_second = second
+        micros = int((created - second) * 1_000_000)
+        return f"{self._timestamp_prefix}.{micros:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as JSON."""
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -167,7 +225,80 @@ class StructuredLogFormatter(logging.Formatter):
                 if key not in log_data:
                     log_data[key] = value
 
-        return json.dumps(log_data, default=str)
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                # orjson.JSONEncodeError (e.g. integers beyond 64 bits).
+                pass
+        return self._encode(log_data)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep about ``rate`` of a logger's records at or below ``max_level``.
+
+    Meant for high-volume INFO lines (public calendar and poll hits). Records
+    above ``max_level`` always pass. Kept records carry ``sample_rate`` so
+    Logs Insights counts can be scaled back up (``count(*) / sample_rate``).
+    """
+
+    def __init__(self, rate: float, max_level: int = logging.INFO) -> None:
+        super().__init__()
+        self.rate = rate
+        self.max_level = max_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        if random.random() >= self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+
+class BufferedLogHandler(logging.Handler):
+    """Hold formatted lines and write them to ``stream`` in one call.
+
+    Lines are written when ``flush()`` is called (``flush_logs()`` at the end
+    of each invocation), when ``capacity`` lines are pending, or immediately
+    after a record at ``flush_level`` or above. Records are formatted when
+    emitted, so request context is captured while it is still set.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        capacity: int = 500,
+        flush_level: int = logging.ERROR,
+    ) -> None:
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stdout
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.buffer: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if len(self.buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.buffer:
+                return
+            lines, self.buffer = self.buffer, []
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
 
 
 class ContextLogger(logging.LoggerAdapter):
@@ -189,9 +320,34 @@ class ContextLogger(logging.LoggerAdapter):
         return msg, kwargs
 
 
+_sampled_loggers: set[str] = set()
+
+
+def log_sample_rates() -> dict[str, float]:
+    """Parse ``LOG_SAMPLE_RATES`` (``logger.name=0.1,other.logger=0.25``).
+
+    Rates are clamped to ``[0, 1]``; malformed entries are ignored.
+    """
+    rates: dict[str, float] = {}
+    for entry in os.getenv("LOG_SAMPLE_RATES", "").split(","):
+        name, sep, raw_rate = entry.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            rate = float(raw_rate)
+        except ValueError:
+            continue
+        rates[name.strip()] = min(max(rate, 0.0), 1.0)
+    return rates
+
+
 def configure_logging(level: str | None = None) -> None:
     """Configure structured logging for Lambda execution.
 
+    ``LOG_BUFFERED=true`` installs a ``BufferedLogHandler`` (call
+    ``flush_logs()`` before returning from the handler). ``LOG_SAMPLE_RATES``
+    attaches a ``SamplingFilter`` per logger (see ``log_sample_rates``).
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR). Defaults to
                LOG_LEVEL environment variable or INFO.
@@ -205,12 +361,30 @@ def configure_logging(level: str | None = None) -> None:
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.flush()
 
     # Add structured handler
-    handler = logging.StreamHandler(sys.stdout)
+    buffered = os.getenv("LOG_BUFFERED", "").lower() in {"1", "true", "yes"}
+    handler = (
+        BufferedLogHandler(sys.stdout)
+        if buffered
+        else logging.StreamHandler(sys.stdout)
+    )
     handler.setFormatter(StructuredLogFormatter())
     root_logger.addHandler(handler)
 
+    # Per-logger sampling; drop filters from a previous call first
+    for name in _sampled_loggers:
+        sampled_logger = logging.getLogger(name)
+        for existing in sampled_logger.filters[:]:
+            if isinstance(existing, SamplingFilter):
+                sampled_logger.removeFilter(existing)
+    _sampled_loggers.clear()
+    for name, rate in log_sample_rates().items():
+        if rate < 1:
+            logging.getLogger(name).addFilter(SamplingFilter(rate))
+            _sampled_loggers.add(name)
+
     # Reduce noise from libraries
     logging.getLogger("boto3").setLevel(logging.WARNING)
     logging.getLogger("botocore").setLevel(logging.WARNING)
@@ -239,7 +413,8 @@ def set_request_context(
     """Set request context for logging.
 
     Call this at the start of each Lambda invocation to set
-    context that will be included in all log messages.
+    context that will be included in all log messages. It also starts the
+    request's ``QueryStats`` (see ``log_query_summary``).
 
     Args:
         req_id: AWS request ID from Lambda context.
@@ -249,12 +424,26 @@ def set_request_context(
         request_id.set(req_id)
     if corr_id:
         correlation_id.set(corr_id)
+    # Keep counters an outer scope already started (e.g. a test's query budget).
+    if query_stats.get() is None:
+        query_stats.set(QueryStats())
 
 
 def clear_request_context() -> None:
     """Clear request context after Lambda invocation."""
     request_id.set("")
     correlation_id.set("")
+    query_stats.set(None)
+
+
+def flush_logs() -> None:
+    """Write out lines held by a ``BufferedLogHandler`` on the root logger.
+
+    Call at the end of each invocation: Lambda may freeze the container as
+    soon as the handler returns.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
 
 
 def log_lambda_event(
@@ -299,3 +488,30 @@ def log_response(
 
     level = logging.INFO if status_code < 400 else logging.WARNING
     logger.log(level, "Lambda response", extra={"response": log_data})
+
+
+def log_query_summary(logger: ContextLogger, **fields: Any) -> None:
+    """Log one ``SQL summary`` line for the current request's ``QueryStats``.
+
+    Logged at WARNING with ``n_plus_one_suspected`` and the top repeated
+    statements when any statement shape reached ``SQL_N_PLUS_ONE_THRESHOLD``.
+    ``fields`` (e.g. method and path) are included in the summary.
+    """
+    stats = query_stats.get()
+    if stats is None:
+        return
+    repeated = stats.repeated_shapes()
+    summary: dict[str, Any] = {
+        **fields,
+        "statements": stats.statements,
+        "distinct_statements": len(stats.shapes),
+        "db_ms": round(stats.db_ms, 2),
+        "rows": stats.rows,
+        "n_plus_one_suspected": bool(repeated),
+    }
+    if repeated:
+        summary["repeated_statements"] = [
+            {"count": count, "statement": shape[:500]} for shape, count in repeated[:3]
+        ]
+    level = logging.WARNING if repeated else logging.INFO
+    logger.log(level, "SQL summary", extra={"sql": summary})
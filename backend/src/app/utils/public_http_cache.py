@@ -11,7 +11,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-from app.utils.responses import json_response
+from app.utils.responses import get_cors_headers, get_security_headers, json_response
 
 CACHE_CONTROL_EDGE_CACHEABLE_GET = (
     "public, max-age=60, s-maxage=300, stale-while-revalidate=600"
@@ -24,16 +24,58 @@ def public_cacheable_json_response(
     body: Any,
     *,
     event: Mapping[str, Any],
+    etag: str | None = None,
 ) -> dict[str, Any]:
-    """JSON response with cache headers for public calendar / free-asset GET routes."""
+    """JSON response with cache headers for public calendar / free-asset GET routes.
+
+    ``etag`` (a quoted entity tag) is sent on 200 responses only.
+    """
     cache = (
         CACHE_CONTROL_EDGE_CACHEABLE_GET
         if status_code == 200
         else CACHE_CONTROL_NO_STORE
     )
+    headers = {"Cache-Control": cache}
+    if etag is not None and status_code == 200:
+        headers["ETag"] = etag
     return json_response(
         status_code,
         body,
-        headers={"Cache-Control": cache},
+        headers=headers,
         event=event,
     )
+
+
+def request_etag_matches(event: Mapping[str, Any], etag: str) -> bool:
+    """True when the request's ``If-None-Match`` lists ``etag`` (or ``*``).
+
+    Weak validators (``W/"..."``) match their strong form, per RFC 9110 weak
+    comparison for ``If-None-Match``.
+    """
+    headers = event.get("headers") or {}
+    raw = next(
+        (v for k, v in headers.items() if str(k).lower() == "if-none-match"),
+        None,
+    )
+    if not isinstance(raw, str) or not raw.strip():
+        return False
+    wanted = etag.removeprefix("W/")
+    for candidate in raw.split(","):
+        tag = candidate.strip()
+        if tag == "*" or tag.removeprefix("W/") == wanted:
+            return True
+    return False
+
+
+def public_not_modified_response(
+    *,
+    etag: str,
+    event: Mapping[str, Any],
+) -> dict[str, Any]:
+    """Empty ``304 Not Modified`` with the same cache headers as a 200."""
+    headers = get_security_headers()
+    headers.update(get_cors_headers(event))
+    headers.pop("Pragma", None)
+    headers["Cache-Control"] = CACHE_CONTROL_EDGE_CACHEABLE_GET
+    headers["ETag"] = etag
+    return {"statusCode": 304, "headers": headers, "body": ""}
@@ -2,16 +2,69 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
 import json
+import logging
 import os
-from dataclasses import asdict
+import re
+import time
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
 from typing import Any
+from uuid import UUID
 from collections.abc import Mapping
 
 
 from pydantic import BaseModel
 
 from app.exceptions import ValidationError
+from app.utils.logging import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup; stdlib json fallback
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional; gzip is always available
+    brotli = None
+
+logger = get_logger(__name__)
+
+#: Bodies smaller than this are sent uncompressed (not worth the CPU or header).
+COMPRESSION_MIN_BYTES = 1024
+_GZIP_LEVEL = 5
+_BROTLI_QUALITY = 5
+
+_SECURITY_HEADERS: dict[str, str] = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Cache-Control": "no-store, no-cache, must-revalidate",
+    "Pragma": "no-cache",
+}
+
+_CORS_BASE_HEADERS: dict[str, str] = {
+    "Access-Control-Allow-Headers": (
+        "Content-Type,Authorization,X-Amz-Date,X-Api-Key,"
+        "X-Amz-Security-Token,X-Turnstile-Token"
+    ),
+    "Access-Control-Allow-Methods": "GET,POST,PUT,PATCH,DELETE,OPTIONS",
+    # Chromium Private Network Access: browsers may send
+    # Access-Control-Request-Private-Network on preflight; without this
+    # allow header, requests fail with "local address space" CORS errors.
+    "Access-Control-Allow-Private-Network": "true",
+}
+
+_UUID_SEGMENT = re.compile(
+    r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
 
 def api_gateway_http_method(event: Mapping[str, Any]) -> str:
@@ -112,13 +165,7 @@ def get_security_headers() -> dict[str, str]:
     Returns:
         Dictionary of security headers.
     """
-    return {
-        "X-Content-Type-Options": "nosniff",
-        "X-Frame-Options": "DENY",
-        "X-XSS-Protection": "1; mode=block",
-        "Cache-Control": "no-store, no-cache, must-revalidate",
-        "Pragma": "no-cache",
-    }
+    return dict(_SECURITY_HEADERS)
 
 
 def get_cors_headers(
@@ -135,9 +182,6 @@ def get_cors_headers(
     # Read allowlist from environment only; infrastructure must provide
     # CORS_ALLOWED_ORIGINS to keep runtime and API Gateway behavior aligned.
     allowed_origins_env = os.getenv("CORS_ALLOWED_ORIGINS", "")
-    allowed_origins = [
-        origin.strip() for origin in allowed_origins_env.split(",") if origin.strip()
-    ]
 
     # Get the request origin
     request_origin = None
@@ -146,9 +190,30 @@ def get_cors_headers(
         # Headers may be case-insensitive, check both
         request_origin = headers.get("origin") or headers.get("Origin")
 
+    # Unknown origins share the fallback entry, so the cache stays bounded by the
+    # allowlist size.
+    if request_origin not in _parse_allowed_origins(allowed_origins_env):
+        request_origin = None
+    return dict(_build_cors_headers(allowed_origins_env, request_origin))
+
+
+@lru_cache(maxsize=8)
+def _parse_allowed_origins(allowed_origins_env: str) -> tuple[str, ...]:
+    return tuple(
+        origin.strip() for origin in allowed_origins_env.split(",") if origin.strip()
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_cors_headers(
+    allowed_origins_env: str, request_origin: str | None
+) -> dict[str, str]:
+    """CORS headers for one allowlist / origin pair, built once per pair."""
+    allowed_origins = _parse_allowed_origins(allowed_origins_env)
+
     # If the request origin is in our allowed list, return it
     # Otherwise, return the first allowed origin (for non-browser clients)
-    if request_origin and request_origin in allowed_origins:
+    if request_origin:
         allow_origin: str | None = request_origin
     elif allowed_origins:
         # For requests without an Origin header (like curl), we can't
@@ -158,17 +223,7 @@ def get_cors_headers(
     else:
         allow_origin = None
 
-    headers = {
-        "Access-Control-Allow-Headers": (
-            "Content-Type,Authorization,X-Amz-Date,X-Api-Key,"
-            "X-Amz-Security-Token,X-Turnstile-Token"
-        ),
-        "Access-Control-Allow-Methods": "GET,POST,PUT,PATCH,DELETE,OPTIONS",
-        # Chromium Private Network Access: browsers may send
-        # Access-Control-Request-Private-Network on preflight; without this
-        # allow header, requests fail with "local address space" CORS errors.
-        "Access-Control-Allow-Private-Network": "true",
-    }
+    headers = dict(_CORS_BASE_HEADERS)
     if allow_origin:
         headers["Access-Control-Allow-Origin"] = allow_origin
         headers["Vary"] = "Origin"
@@ -183,6 +238,9 @@ def json_response(
 ) -> dict[str, Any]:
     """Create a JSON API Gateway response.
 
+    Bodies of at least ``COMPRESSION_MIN_BYTES`` are gzip/brotli-compressed
+    (base64, ``isBase64Encoded``) when the request's ``Accept-Encoding`` allows.
+
     Args:
         status_code: HTTP status code.
         body: Response body (dict, Pydantic model, or dataclass).
@@ -197,7 +255,7 @@ def json_response(
     }
 
     # Add security headers
-    response_headers.update(get_security_headers())
+    response_headers.update(_SECURITY_HEADERS)
 
     # Add CORS headers
     response_headers.update(get_cors_headers(event))
@@ -211,13 +269,147 @@ def json_response(
             # confused by contradictory directives (see RFC 7234).
             response_headers.pop("Pragma", None)
 
-    payload = _serialize_body(body)
+    started = time.perf_counter()
+    encoded = encode_json(_serialize_body(body))
+    serialize_ms = (time.perf_counter() - started) * 1000
 
-    return {
+    response: dict[str, Any] = {
         "statusCode": status_code,
         "headers": response_headers,
-        "body": json.dumps(payload, default=str),
     }
+    coding = None
+    if len(encoded) >= COMPRESSION_MIN_BYTES and "Content-Encoding" not in (
+        headers or {}
+    ):
+        coding = _negotiate_content_coding(event)
+    if coding is None:
+        response["body"] = encoded.decode("utf-8")
+        sent_bytes = len(encoded)
+    else:
+        compressed = _compress(encoded, coding)
+        response_headers["Content-Encoding"] = coding
+        vary = response_headers.get("Vary")
+        response_headers["Vary"] = (
+            f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+        )
+        etag = response_headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            # The representation differs per content-coding (RFC 9110 8.8.3).
+            response_headers["ETag"] = f"W/{etag}"
+        response["body"] = base64.b64encode(compressed).decode("ascii")
+        response["isBase64Encoded"] = True
+        sent_bytes = len(compressed)
+
+    _log_response_size(
+        event,
+        status_code=status_code,
+        body_bytes=len(encoded),
+        sent_bytes=sent_bytes,
+        coding=coding,
+        serialize_ms=serialize_ms,
+    )
+    return response
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a JSON-compatible payload to UTF-8 bytes.
+
+    Uses ``orjson`` when installed and the stdlib encoder otherwise; both render
+    datetimes as ISO 8601, UUIDs and Decimals as strings, and enums by value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. integers beyond 64 bits).
+            pass
+    return json.dumps(payload, default=_json_default).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback conversion for values the JSON encoders do not handle natively."""
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+
+def _negotiate_content_coding(event: Mapping[str, Any] | None) -> str | None:
+    """Pick ``br`` or ``gzip`` from the request's ``Accept-Encoding`` header."""
+    if not event:
+        return None
+    headers = event.get("headers") or {}
+    raw = next(
+        (v for k, v in headers.items() if str(k).lower() == "accept-encoding"),
+        None,
+    )
+    if not isinstance(raw, str) or not raw.strip():
+        return None
+    accepted: set[str] = set()
+    for item in raw.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(data: bytes, coding: str) -> bytes:
+    if coding == "br":
+        return brotli.compress(data, quality=_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def _log_response_size(
+    event: Mapping[str, Any] | None,
+    *,
+    status_code: int,
+    body_bytes: int,
+    sent_bytes: int,
+    coding: str | None,
+    serialize_ms: float,
+) -> None:
+    """Per-route JSON size / encode time; INFO only for bodies worth compressing."""
+    if body_bytes < COMPRESSION_MIN_BYTES and not logger.isEnabledFor(logging.DEBUG):
+        return
+    route = None
+    if event:
+        path = event.get("path") or event.get("rawPath") or ""
+        route = f"{api_gateway_http_method(event)} {_UUID_SEGMENT.sub('/{id}', path)}"
+    log = logger.info if body_bytes >= COMPRESSION_MIN_BYTES else logger.debug
+    log(
+        "JSON response encoded",
+        extra={
+            "response": {
+                "route": route,
+                "status_code": status_code,
+                "body_bytes": body_bytes,
+                "sent_bytes": sent_bytes,
+                "content_encoding": coding,
+                "serialize_ms": round(serialize_ms, 2),
+            }
+        },
+    )
 
 
 def _serialize_body(body: Any) -> Any:
@@ -81,7 +81,8 @@ def run_with_retry(
             sleep_seconds = min(max_delay_seconds, delay_seconds * jitter_factor)
             if logger is not None:
                 logger.warning(
-                    f"Retryable failure for {name}; retrying",
+                    "Retryable failure for %s; retrying",
+                    name,
                     extra={
                         "operation": name,
                         "attempt": attempt,
@@ -0,0 +1,80 @@
+"""Warm-up invocations for API Lambdas and authorizers.
+
+A scheduled EventBridge rule invokes the admin Lambda and the authorizers with
+``{"warmup": true}``. Instead of routing a request, the handler runs the init
+work a cold container would otherwise do on the first customer request (lazy
+imports, database URL and connection, JWKS download, signing key load, PDF
+assets) and returns a per-phase timing report.
+
+Phases run in order. A phase returns ``False`` when it is not configured in
+this container (reported as ``skipped``); failures are logged and reported as
+``error`` but never raised, so a warm-up never counts as a Lambda error.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+WARMUP_EVENT_KEY = "warmup"
+
+WarmupPhase = tuple[str, Callable[[], object]]
+
+_cold = True
+
+
+def is_warmup_event(event: Any) -> bool:
+    """Return True for the scheduled ``{"warmup": true}`` event."""
+    return isinstance(event, Mapping) and event.get(WARMUP_EVENT_KEY) is True
+
+
+def import_modules(*names: str) -> Callable[[], None]:
+    """Phase that imports modules the handler otherwise loads on first use."""
+
+    def _import() -> None:
+        for name in names:
+            importlib.import_module(name)
+
+    return _import
+
+
+def run_warmup(phases: Sequence[WarmupPhase]) -> dict[str, Any]:
+    """Run ``phases`` and return ``{"warmup", "cold_start", "phases", "total_ms"}``."""
+    global _cold
+    cold_start = _cold
+    _cold = False
+
+    started = time.perf_counter()
+    report: list[dict[str, Any]] = []
+    for name, phase in phases:
+        phase_started = time.perf_counter()
+        entry: dict[str, Any] = {"phase": name}
+        try:
+            entry["status"] = "skipped" if phase() is False else "ok"
+        except Exception as exc:
+            entry["status"] = "error"
+            entry["error"] = type(exc).__name__
+            logger.warning(
+                "Warm-up phase %s failed", name, extra={"phase": name}, exc_info=True
+            )
+        entry["ms"] = _elapsed_ms(phase_started)
+        report.append(entry)
+
+    result = {
+        "warmup": True,
+        "cold_start": cold_start,
+        "phases": report,
+        "total_ms": _elapsed_ms(started),
+    }
+    logger.info("Lambda warm-up complete", extra=result)
+    return result
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
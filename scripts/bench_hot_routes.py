@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""Benchmark hot API routes end to end against a seeded local Postgres.
+
+Seeds the migrated database at ``DATABASE_URL`` (use a disposable local
+database) with production-like volumes, then calls
+``app.api.admin.lambda_handler`` with API Gateway events for each route:
+
+* 100k contacts, 20k of them with sales leads;
+* 20 services with 10k instances (one session slot each, spread over the last
+  three years and the next six months);
+* 1M ``audit_log`` rows;
+* 50k customer payments.
+
+Routes: public calendar, calendar availability, reservations, admin contacts
+list, audit logs, billing export and leads analytics. Each route runs
+``--warmup`` untimed calls, then ``--iterations`` timed calls, then one call
+under ``tracemalloc``. Per route it records p50/p95/max latency, SQL statements
+and DB time per request (the ``QueryStats`` hooks on ``get_engine``), peak
+Python memory and the response status codes.
+
+Turnstile verification and the reservation post-success hooks (emails,
+Mailchimp) are stubbed; everything else hits the database.
+
+Prints one JSON object per route. ``--output`` writes the results as a baseline
+file; ``--compare`` checks them against an earlier baseline and exits 1 when a
+route's p95 grows by more than ``--tolerance`` or it runs more statements.
+Seeded rows carry the ``bench-hot-routes`` marker; run with ``--seed-scale 0``
+to reuse them and ``--cleanup`` to delete them afterwards.
+
+Usage::
+
+    DATABASE_URL=postgresql://... python scripts/bench_hot_routes.py \\
+        --output bench-hot-routes.json
+    DATABASE_URL=postgresql://... python scripts/bench_hot_routes.py \\
+        --seed-scale 0 --compare bench-hot-routes.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+
+_MARKER = "bench-hot-routes"
+_EMAIL_DOMAIN = "hot-routes.bench"
+_SERVICES = 20
+# Row counts at ``--seed-scale 1``.
+_VOLUMES = {
+    "contacts": 100_000,
+    "sales_leads": 20_000,
+    "service_instances": 10_000,
+    "audit_log": 1_000_000,
+    "customer_payments": 50_000,
+}
+_ADMIN_CONTEXT = {
+    "userSub": "bench-admin",
+    "email": "admin@example.com",
+    "groups": "admin",
+}
+_ENV = {"ADMIN_GROUP": "admin"}
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    admin: bool = False
+    body: Callable[[int], dict[str, Any]] | None = None
+
+
+def _reservation_body(instance_slug: str) -> Callable[[int], dict[str, Any]]:
+    run = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+
+    def _body(call: int) -> dict[str, Any]:
+        return {
+            "attendeeName": f"Bench Attendee {call}",
+            "attendeeEmail": f"res-{run}-{call}@{_EMAIL_DOMAIN}",
+            "attendeePhone": "91234567",
+            "attendeeCountry": "HK",
+            "bookingSystem": "event-booking",
+            "serviceKey": f"{_MARKER}-1",
+            "serviceInstanceSlug": instance_slug,
+            "paymentMethod": "bank_transfer",
+            "totalAmount": 100,
+            "title": "Bench event",
+            "agreedToTermsAndConditions": True,
+            "locale": "en",
+        }
+
+    return _body
+
+
+def _routes(instances: int) -> list[Route]:
+    # Service 1 is an event; its last instance has an upcoming session.
+    event_instance = max(n for n in range(1, instances + 1) if n % _SERVICES == 1)
+    return [
+        Route("public_calendar", "GET", "/v1/calendar/public"),
+        Route(
+            "calendar_availability",
+            "GET",
+            "/v1/calendar/availability",
+            {"purpose": "intro_call_booking"},
+        ),
+        Route(
+            "reservation",
+            "POST",
+            "/v1/reservations",
+            body=_reservation_body(f"{_MARKER}-{event_instance}"),
+        ),
+        Route("admin_contacts_list", "GET", "/v1/admin/contacts", admin=True),
+        Route(
+            "admin_audit_logs",
+            "GET",
+            "/v1/admin/audit-logs",
+            {"table": "contacts"},
+            admin=True,
+        ),
+        Route(
+            "admin_billing_export",
+            "GET",
+            "/v1/admin/billing/export",
+            {"limit": "1000"},
+            admin=True,
+        ),
+        Route("admin_leads_analytics", "GET", "/v1/admin/leads/analytics", admin=True),
+    ]
+
+
+def _event(route: Route, call: int) -> dict[str, Any]:
+    headers = {"Content-Type": "application/json"}
+    if route.body is not None:
+        headers["X-Turnstile-Token"] = "bench"
+    return {
+        "httpMethod": route.method,
+        "path": route.path,
+        "headers": headers,
+        "queryStringParameters": route.query or None,
+        "multiValueQueryStringParameters": None,
+        "body": json.dumps(route.body(call)) if route.body is not None else None,
+        "isBase64Encoded": False,
+        "requestContext": {
+            "requestId": f"{_MARKER}-{call}",
+            "authorizer": _ADMIN_CONTEXT if route.admin else {},
+        },
+    }
+
+
+_SEED_SQL = (
+    # Contacts; the first ``sales_leads`` of them are leads.
+    """
+    WITH new_contacts AS (
+        INSERT INTO contacts (
+            first_name, last_name, email, contact_type, source, source_detail,
+            created_at
+        )
+        SELECT 'Bench', 'Contact ' || n, 'contact' || n || '@' || :domain,
+               'parent', 'manual', :marker,
+               now() - (random() * interval '730 days')
+        FROM generate_series(1, :contacts) AS n
+        RETURNING id, email
+    )
+    INSERT INTO sales_leads (
+        contact_id, lead_type, funnel_stage, assigned_to, created_at
+    )
+    SELECT id, 'free_guide',
+           (ARRAY['new', 'contacted', 'engaged', 'qualified', 'converted',
+                  'lost'])[1 + floor(random() * 6)::int],
+           :marker, now() - (random() * interval '365 days')
+    FROM new_contacts
+    WHERE substring(email from 'contact(\\d+)@')::int <= :sales_leads
+    """,
+    """
+    INSERT INTO services (
+        service_type, title, service_key, status, delivery_mode, created_by
+    )
+    SELECT CASE WHEN k % 2 = 1 THEN 'event' ELSE 'training_course' END,
+           'Bench service ' || k, :marker || '-' || k, 'published', 'in_person',
+           :marker
+    FROM generate_series(0, :services - 1) AS k
+    """,
+    # Instances spread over three years back and six months ahead.
+    """
+    WITH spread AS (
+        SELECT n,
+               now() - interval '1095 days'
+                   + (n * interval '1 day' * 1277 / :service_instances) AS starts_at
+        FROM generate_series(1, :service_instances) AS n
+    ),
+    new_instances AS (
+        INSERT INTO service_instances (
+            service_id, title, slug, status, delivery_mode, created_by
+        )
+        SELECT s.id, 'Bench instance ' || spread.n, :marker || '-' || spread.n,
+               CASE WHEN spread.starts_at > now() THEN 'open' ELSE 'completed' END,
+               'in_person', :marker
+        FROM spread
+        JOIN services s ON s.service_key = :marker || '-' || (spread.n % :services)
+        RETURNING id, slug
+    )
+    INSERT INTO instance_session_slots (instance_id, starts_at, ends_at)
+    SELECT i.id, spread.starts_at, spread.starts_at + interval '2 hours'
+    FROM new_instances i
+    JOIN spread ON i.slug = :marker || '-' || spread.n
+    """,
+    """
+    INSERT INTO audit_log (
+        timestamp, table_name, record_id, action, user_id, changed_fields,
+        new_values
+    )
+    SELECT now() - (random() * interval '365 days'),
+           (ARRAY['contacts', 'sales_leads', 'enrollments',
+                  'customer_payments'])[1 + n % 4],
+           gen_random_uuid()::text, 'UPDATE', :marker, ARRAY['updated_at'],
+           jsonb_build_object('updated_at', now())
+    FROM generate_series(1, :audit_log) AS n
+    """,
+    """
+    INSERT INTO customer_payments (
+        direction, status, method, amount, currency, external_reference,
+        succeeded_at, contact_id, created_at
+    )
+    SELECT 'inbound', 'succeeded', 'bank_transfer', 100 + (n % 50) * 10, 'HKD',
+           :marker, paid_at, c.id, paid_at
+    FROM (
+        SELECT n, now() - (random() * interval '365 days') AS paid_at
+        FROM generate_series(1, :customer_payments) AS n
+    ) AS p
+    JOIN LATERAL (
+        SELECT id FROM contacts
+        WHERE email = 'contact' || (1 + p.n % :contacts) || '@' || :domain
+    ) AS c ON true
+    """,
+)
+
+_CLEANUP_SQL = (
+    (
+        "DELETE FROM customer_payments WHERE external_reference = :marker "
+        "OR contact_id IN (SELECT id FROM contacts WHERE email LIKE :email_like)"
+    ),
+    (
+        "DELETE FROM sales_leads WHERE assigned_to = :marker "
+        "OR contact_id IN (SELECT id FROM contacts WHERE email LIKE :email_like)"
+    ),
+    "DELETE FROM services WHERE created_by = :marker",
+    "DELETE FROM contacts WHERE email LIKE :email_like",
+    "DELETE FROM audit_log WHERE user_id = :marker",
+)
+
+
+def _seed(scale: float) -> dict[str, int]:
+    from app.db.engine import get_engine
+    from sqlalchemy import text
+
+    volumes = {name: max(1, int(count * scale)) for name, count in _VOLUMES.items()}
+    params = {
+        **volumes,
+        "services": _SERVICES,
+        "marker": _MARKER,
+        "domain": _EMAIL_DOMAIN,
+    }
+    for statement in _SEED_SQL:
+        started = time.perf_counter()
+        with get_engine().begin() as conn:
+            conn.execute(text(statement), params)
+        sys.stderr.write(
+            f"seeded {statement.split('INSERT INTO', 1)[1].split()[0]} "
+            f"in {time.perf_counter() - started:.1f}s\n"
+        )
+    with get_engine().begin() as conn:
+        conn.execute(text("ANALYZE"))
+    return volumes
+
+
+def _cleanup() -> None:
+    from app.db.engine import get_engine
+    from sqlalchemy import text
+
+    with get_engine().begin() as conn:
+        for statement in _CLEANUP_SQL:
+            conn.execute(
+                text(statement),
+                {"marker": _MARKER, "email_like": f"%@{_EMAIL_DOMAIN}"},
+            )
+
+
+def _stub_external_calls() -> None:
+    from app.api import public_reservations
+
+    public_reservations.verify_turnstile_token = lambda *_a, **_k: True
+    public_reservations._run_reservation_post_success_hooks = lambda *_a, **_k: None
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _bench_route(route: Route, *, warmup: int, iterations: int) -> dict[str, Any]:
+    from app.api.admin import lambda_handler
+    from app.utils.logging import QueryStats, query_stats
+
+    call = 0
+    for _ in range(warmup):
+        call += 1
+        lambda_handler(_event(route, call), None)
+
+    timings: list[float] = []
+    statements: list[int] = []
+    db_ms: list[float] = []
+    statuses: Counter[int] = Counter()
+    for _ in range(iterations):
+        call += 1
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        started = time.perf_counter()
+        try:
+            response = lambda_handler(_event(route, call), None)
+        finally:
+            query_stats.reset(token)
+        timings.append((time.perf_counter() - started) * 1000)
+        statements.append(stats.statements)
+        db_ms.append(stats.db_ms)
+        statuses[response["statusCode"]] += 1
+
+    call += 1
+    tracemalloc.start()
+    try:
+        lambda_handler(_event(route, call), None)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "route": route.name,
+        "method": route.method,
+        "path": route.path,
+        "iterations": iterations,
+        "p50_ms": round(_percentile(timings, 50), 2),
+        "p95_ms": round(_percentile(timings, 95), 2),
+        "max_ms": round(timings[-1], 2),
+        "statements": max(statements),
+        "db_ms_p50": round(_percentile(sorted(db_ms), 50), 2),
+        "peak_memory_mb": round(peak / (1024 * 1024), 2),
+        "statuses": {str(code): n for code, n in sorted(statuses.items())},
+    }
+
+
+def _compare(
+    results: dict[str, dict[str, Any]], baseline_path: Path, tolerance: float
+) -> list[dict[str, Any]]:
+    baseline = json.loads(baseline_path.read_text())["routes"]
+    regressions: list[dict[str, Any]] = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                {
+                    "route": name,
+                    "metric": "p95_ms",
+                    "baseline": before["p95_ms"],
+                    "current": result["p95_ms"],
+                }
+            )
+        if result["statements"] > before["statements"]:
+            regressions.append(
+                {
+                    "route": name,
+                    "metric": "statements",
+                    "baseline": before["statements"],
+                    "current": result["statements"],
+                }
+            )
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--seed-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier for seeded volumes; 0 reuses rows from an earlier run.",
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--routes", default="", help="Comma-separated route names (default: all)."
+    )
+    parser.add_argument("--output", type=Path, help="Write a baseline JSON file.")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare to.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed p95 growth over the baseline (0.2 = 20%%).",
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Delete seeded rows at the end."
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(_BACKEND_SRC))
+    for key, value in _ENV.items():
+        os.environ.setdefault(key, value)
+    _stub_external_calls()
+
+    volumes = _seed(args.seed_scale) if args.seed_scale > 0 else None
+    instances = (volumes or _VOLUMES)["service_instances"]
+    selected = {name.strip() for name in args.routes.split(",") if name.strip()}
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for route in _routes(instances):
+            if selected and route.name not in selected:
+                continue
+            result = _bench_route(route, warmup=args.warmup, iterations=args.iterations)
+            results[route.name] = result
+            sys.stdout.write(json.dumps(result) + "\n")
+    finally:
+        if args.cleanup:
+            _cleanup()
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "generated_at": datetime.now(UTC).isoformat(),
+                    "commit": _git_commit(),
+                    "volumes": volumes,
+                    "iterations": args.iterations,
+                    "routes": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+    if args.compare:
+        regressions = _compare(results, args.compare, args.tolerance)
+        for regression in regressions:
+            sys.stdout.write(json.dumps({"regression": regression}) + "\n")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
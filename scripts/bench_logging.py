@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Micro-benchmark structured logging throughput (records per second).
+
+No database or AWS access is needed; handlers write to ``os.devnull``.
+
+Scenarios (``--scenarios``):
+
+* ``format`` — ``StructuredLogFormatter.format`` on a record with ``extra``
+  fields, i.e. the per-record JSON cost.
+* ``eager_disabled`` / ``lazy_disabled`` — a DEBUG call with an f-string vs
+  ``%``-style args while the logger is at INFO.
+* ``stream`` — INFO calls through ``get_logger`` to a ``StreamHandler``.
+* ``buffered`` — the same through ``BufferedLogHandler``, flushed every 20
+  records (one invocation's worth of lines).
+* ``sampled`` — ``stream`` with a ``SamplingFilter`` at ``--sample-rate``.
+
+With ``--baseline-ref`` the ``format`` scenario also runs against
+``app/utils/logging.py`` at that commit (``format_baseline``).
+
+Prints one JSON object per scenario.
+
+Usage::
+
+    python scripts/bench_logging.py
+    python scripts/bench_logging.py --records 500000 --baseline-ref HEAD~1
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+_LOGGING_MODULE = "backend/src/app/utils/logging.py"
+
+_SCENARIOS = (
+    "format",
+    "eager_disabled",
+    "lazy_disabled",
+    "stream",
+    "buffered",
+    "sampled",
+)
+_EXTRA = {"path": "/www/v1/calendar/public", "method": "GET", "status_code": 200}
+
+
+def _load_baseline(ref: str) -> Any:
+    """Import ``app/utils/logging.py`` as it was at ``ref``."""
+    source = subprocess.run(
+        ["git", "-C", str(_REPO_ROOT), "show", f"{ref}:{_LOGGING_MODULE}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as handle:
+        handle.write(source)
+    spec = importlib.util.spec_from_file_location("baseline_logging", handle.name)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load {_LOGGING_MODULE} at {ref}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    os.unlink(handle.name)
+    return module
+
+
+def _timed(records: int, call: Callable[[int], None]) -> dict[str, Any]:
+    started = time.perf_counter()
+    for index in range(records):
+        call(index)
+    elapsed = time.perf_counter() - started
+    return {
+        "records": records,
+        "seconds": round(elapsed, 4),
+        "records_per_second": round(records / elapsed),
+    }
+
+
+def _format_call(formatter: logging.Formatter) -> Callable[[int], None]:
+    record = logging.LogRecord(
+        "app.api.public_events",
+        logging.INFO,
+        __file__,
+        1,
+        "Handling public events feed request %s",
+        ("GET",),
+        None,
+    )
+    record.__dict__.update(_EXTRA)
+    return lambda _index: formatter.format(record)
+
+
+def _logger(name: str, handler: logging.Handler) -> Any:
+    from app.utils.logging import StructuredLogFormatter, get_logger
+
+    handler.setFormatter(StructuredLogFormatter())
+    base = logging.getLogger(name)
+    base.handlers[:] = [handler]
+    base.filters.clear()
+    base.propagate = False
+    base.setLevel(logging.INFO)
+    return get_logger(name)
+
+
+def _run(
+    scenario: str,
+    records: int,
+    sample_rate: float,
+    devnull: Any,
+    baseline: Any,
+) -> dict[str, Any]:
+    from app.utils.logging import (
+        BufferedLogHandler,
+        SamplingFilter,
+        StructuredLogFormatter,
+    )
+
+    if scenario == "format":
+        return _timed(records, _format_call(StructuredLogFormatter()))
+    if scenario == "format_baseline":
+        return _timed(records, _format_call(baseline.StructuredLogFormatter()))
+
+    name = f"bench_logging.{scenario}"
+    if scenario == "buffered":
+        handler: logging.Handler = BufferedLogHandler(devnull, capacity=10_000)
+    else:
+        handler = logging.StreamHandler(devnull)
+    logger = _logger(name, handler)
+    if scenario == "sampled":
+        logging.getLogger(name).addFilter(SamplingFilter(sample_rate))
+
+    if scenario == "eager_disabled":
+
+        def call(index: int) -> None:
+            logger.debug(f"Public calendar hit {index} for {_EXTRA['path']}")
+
+    elif scenario == "lazy_disabled":
+
+        def call(index: int) -> None:
+            logger.debug("Public calendar hit %s for %s", index, _EXTRA["path"])
+
+    elif scenario == "buffered":
+
+        def call(index: int) -> None:
+            logger.info("Public calendar hit %s", index, extra=dict(_EXTRA))
+            if index % 20 == 19:
+                handler.flush()
+
+    else:
+
+        def call(index: int) -> None:
+            logger.info("Public calendar hit %s", index, extra=dict(_EXTRA))
+
+    result = _timed(records, call)
+    handler.flush()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(_SCENARIOS),
+        help=f"Comma-separated scenarios ({', '.join(_SCENARIOS)}).",
+    )
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    parser.add_argument(
+        "--baseline-ref",
+        help="Also time the formatter at this git ref (format_baseline).",
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(_BACKEND_SRC))
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = sorted(set(scenarios) - set(_SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    baseline = None
+    if args.baseline_ref:
+        baseline = _load_baseline(args.baseline_ref)
+        scenarios.insert(0, "format_baseline")
+
+    with open(os.devnull, "w") as devnull:
+        for scenario in scenarios:
+            result = _run(scenario, args.records, args.sample_rate, devnull, baseline)
+            print(json.dumps({"scenario": scenario, **result}), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Benchmark PDF render throughput with and without the shared render engine.
+
+Renders ``--count`` synthetic HKD invoices (with the FPS QR payment page) and
+completion certificates per mode. No database or AWS access is needed.
+
+* ``cold`` — ``pdf_render_engine.clear_caches()`` before every render, i.e. the
+  previous behaviour of rebuilding styles, decoding logos and encoding the QR
+  each time.
+* ``warm`` — caches preloaded once, renders sequentially on one process.
+* ``many`` — ``render_many`` across ``--workers`` forked processes (defaults
+  to one per CPU).
+
+Prints one JSON object per mode and document kind.
+
+Usage::
+
+    python scripts/bench_pdf_render.py
+    python scripts/bench_pdf_render.py --count 500 --modes warm,many --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+
+_ENV = {
+    "INVOICE_DISPLAY_TIMEZONE": "Asia/Hong_Kong",
+    "INVOICE_PAYMENT_TERMS_DAYS": "7",
+    "PUBLIC_WWW_BUSINESS_NAME": "Evolve Sprouts",
+    "PUBLIC_WWW_BUSINESS_ADDRESS": "1 Bench Street\nHong Kong",
+    "PUBLIC_WWW_BANK_NAME": "Bench Bank",
+    "PUBLIC_WWW_BANK_ACCOUNT_NUMBER": "123 456789",
+    "PUBLIC_WWW_BANK_ACCOUNT_HOLDER": "Bench Holder",
+    "PUBLIC_WWW_FPS_MERCHANT_NAME": "Evolve Sprouts",
+    "PUBLIC_WWW_FPS_MOBILE_NUMBER": "91234567",
+}
+
+
+def _invoices(count: int) -> list[tuple[Any, list[Any]]]:
+    from app.db.models.enums import BillingInvoiceStatus
+
+    items = []
+    for index in range(count):
+        # A handful of fixed prices, as for real services: QR payloads repeat.
+        amount = Decimal(500 + 100 * (index % 5))
+        invoice = SimpleNamespace(
+            id=index,
+            invoice_number=f"I-2607-{index:04d}",
+            currency="HKD",
+            subtotal=amount,
+            tax_total=Decimal("0"),
+            total=amount,
+            bill_to_display_name=f"Client {index}",
+            bill_to_email=f"client{index}@example.com",
+            issued_at=datetime(2026, 7, 1, 12, 0, tzinfo=UTC),
+            invoice_date=date(2026, 7, 1),
+            due_date=date(2026, 7, 8),
+            status=BillingInvoiceStatus.ISSUED,
+        )
+        line = SimpleNamespace(
+            line_order=0,
+            description="Weaning workshop",
+            quantity=Decimal("1"),
+            unit_amount=amount,
+            line_total=amount,
+            currency="HKD",
+        )
+        items.append((invoice, [line]))
+    return items
+
+
+def _certificates(count: int) -> list[Any]:
+    from app.services.completion_certificate_pdf import (
+        CompletionCertificatePdfContext,
+        build_certificate_body_text,
+    )
+
+    body = build_certificate_body_text(
+        trading_name="Evolve Sprouts", partner_display_name="Parachute"
+    )
+    return [
+        CompletionCertificatePdfContext(
+            recipient_display_name=f"Recipient {index}",
+            program_title="Montessori Postnatal Caretaker",
+            participation_date=date(2026, 6, 14),
+            trading_name="Evolve Sprouts",
+            partner_display_name="Parachute",
+            partner_signer_name="Rosalind",
+            es_founder_name="Ida De Gregorio",
+            body_text=body,
+        )
+        for index in range(count)
+    ]
+
+
+def _render_invoice(item: tuple[Any, list[Any]]) -> bytes:
+    from app.services.customer_invoice_pdf import render_invoice_pdf
+
+    invoice, lines = item
+    return render_invoice_pdf(invoice=invoice, lines=lines)
+
+
+def _run(
+    mode: str,
+    render: Callable[[Any], bytes],
+    items: Sequence[Any],
+    workers: int | None,
+) -> list[bytes]:
+    from app.services.pdf_render_engine import clear_caches, preload, render_many
+
+    if mode == "cold":
+        out = []
+        for item in items:
+            clear_caches()
+            out.append(render(item))
+        return out
+    preload()
+    if mode == "warm":
+        return [render(item) for item in items]
+    return render_many(render, items, max_workers=workers)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--count", type=int, default=200, help="Documents per kind.")
+    parser.add_argument(
+        "--modes", default="cold,warm,many", help="Comma-separated modes to run."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Processes for the many mode."
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(_BACKEND_SRC))
+    for key, value in _ENV.items():
+        os.environ.setdefault(key, value)
+    from app.services.completion_certificate_pdf import (
+        render_completion_certificate_pdf,
+    )
+
+    kinds: dict[str, tuple[Callable[[Any], bytes], list[Any]]] = {
+        "invoice": (_render_invoice, _invoices(args.count)),
+        "certificate": (render_completion_certificate_pdf, _certificates(args.count)),
+    }
+    for mode in (m.strip() for m in args.modes.split(",") if m.strip()):
+        for kind, (render, items) in kinds.items():
+            started = time.perf_counter()
+            pdfs = _run(mode, render, items, args.workers)
+            elapsed = time.perf_counter() - started
+            sys.stdout.write(
+                json.dumps(
+                    {
+                        "mode": mode,
+                        "kind": kind,
+                        "documents": len(pdfs),
+                        "seconds": round(elapsed, 3),
+                        "per_second": round(len(pdfs) / elapsed, 1),
+                        "ms_per_document": round(1000 * elapsed / len(pdfs), 2),
+                    }
+                )
+                + "\n"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Load-test the public poll answer write path against DynamoDB Local.
+
+Simulates a facilitator opening a question and ``--respondents`` people (default
+300) answering it at the same moment: every respondent thread waits on a barrier,
+then sends ``PUT /www/v1/polls/{slug}/answers`` through
+``handle_public_polls_request`` with its own session id. DynamoDB calls are
+counted per operation via botocore ``before-call`` hooks, so the output shows
+both latency percentiles and round trips per answer (one ``BatchGetItem`` plus
+one ``TransactWriteItems`` for a new answer, the read alone for an idempotent
+re-submit).
+
+Start DynamoDB Local first (``docker run -p 8000:8000 amazon/dynamodb-local``);
+the table is created on the first run. Prints one JSON object per wave; pass
+``--resubmit`` to replay identical answers as a second wave.
+
+Usage::
+
+    python scripts/bench_poll_answers.py
+    python scripts/bench_poll_answers.py --respondents 600 --resubmit \\
+        --endpoint-url http://localhost:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+
+_TABLE_NAME = "bench-poll-responses"
+_QUESTION_ID = "role"
+_OPTIONS = ["Parent", "Professional", "Grandparent"]
+
+
+def _ensure_table(client: Any) -> None:
+    existing = client.list_tables().get("TableNames", [])
+    if _TABLE_NAME in existing:
+        return
+    client.create_table(
+        TableName=_TABLE_NAME,
+        KeySchema=[
+            {"AttributeName": "pk", "KeyType": "HASH"},
+            {"AttributeName": "sk", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "pk", "AttributeType": "S"},
+            {"AttributeName": "sk", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.get_waiter("table_exists").wait(TableName=_TABLE_NAME)
+
+
+def _answer_event(poll_slug: str, session_id: str, option: str) -> dict[str, Any]:
+    path = f"/www/v1/polls/{poll_slug}/answers"
+    return {
+        "httpMethod": "PUT",
+        "path": path,
+        "headers": {"content-type": "application/json"},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "body": json.dumps(
+            {
+                "sessionId": session_id,
+                "questionId": _QUESTION_ID,
+                "questionType": "select",
+                "selectedOption": option,
+            }
+        ),
+        "isBase64Encoded": False,
+        "requestContext": {"requestId": f"bench-{session_id}", "authorizer": {}},
+    }
+
+
+def _wave(
+    name: str,
+    *,
+    poll_slug: str,
+    session_ids: list[str],
+    calls: Counter[str],
+) -> dict[str, Any]:
+    from app.api.public_polls import handle_public_polls_request
+
+    barrier = threading.Barrier(len(session_ids))
+    calls.clear()
+
+    def respond(index: int) -> tuple[int, float]:
+        event = _answer_event(
+            poll_slug, session_ids[index], _OPTIONS[index % len(_OPTIONS)]
+        )
+        barrier.wait()
+        started = time.perf_counter()
+        response = handle_public_polls_request(event, "PUT", event["path"])
+        return response["statusCode"], time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(session_ids)) as pool:
+        outcomes = list(pool.map(respond, range(len(session_ids))))
+    elapsed = time.perf_counter() - started
+
+    latencies_ms = sorted(seconds * 1000 for _status, seconds in outcomes)
+    cuts = statistics.quantiles(latencies_ms, n=100)
+    return {
+        "wave": name,
+        "respondents": len(session_ids),
+        "statuses": dict(Counter(str(status) for status, _seconds in outcomes)),
+        "seconds": round(elapsed, 2),
+        "p50_ms": round(cuts[49], 1),
+        "p95_ms": round(cuts[94], 1),
+        "p99_ms": round(cuts[98], 1),
+        "max_ms": round(latencies_ms[-1], 1),
+        "dynamodb_calls": dict(calls),
+        "calls_per_answer": round(sum(calls.values()) / len(session_ids), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--endpoint-url",
+        default="http://localhost:8000",
+        help="DynamoDB Local endpoint (default: http://localhost:8000).",
+    )
+    parser.add_argument(
+        "--respondents", type=int, default=300, help="Concurrent respondents."
+    )
+    parser.add_argument(
+        "--resubmit",
+        action="store_true",
+        help="Send the same answers again as a second (idempotent) wave.",
+    )
+    args = parser.parse_args()
+    if args.respondents < 2:
+        parser.error("--respondents must be at least 2")
+
+    os.environ["AWS_ENDPOINT_URL_DYNAMODB"] = args.endpoint_url
+    os.environ["POLL_RESPONSES_TABLE_NAME"] = _TABLE_NAME
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+    sys.path.insert(0, str(_BACKEND_SRC))
+
+    import boto3
+    from botocore.config import Config
+
+    from app.services import poll_responses_store as store
+
+    # One pooled connection per respondent so the client is not the bottleneck.
+    resource = boto3.resource(
+        "dynamodb", config=Config(max_pool_connections=args.respondents)
+    )
+    _ensure_table(resource.meta.client)
+    store.configure_table_for_tests(resource.Table(_TABLE_NAME))
+
+    calls: Counter[str] = Counter()
+    lock = threading.Lock()
+
+    def count_call(event_name: str, **_kwargs: Any) -> None:
+        with lock:
+            calls[event_name.rsplit(".", 1)[-1]] += 1
+
+    resource.meta.client.meta.events.register("before-call.dynamodb", count_call)
+
+    poll_slug = f"bench-{uuid.uuid4().hex[:8]}"
+    store.put_poll_control_state(
+        poll_slug=poll_slug,
+        enabled_question_ids=[_QUESTION_ID],
+        question_options={_QUESTION_ID: {"type": "select", "options": _OPTIONS}},
+    )
+    session_ids = [str(uuid.uuid4()) for _ in range(args.respondents)]
+    waves = ["answer", "resubmit"] if args.resubmit else ["answer"]
+    for name in waves:
+        result = _wave(name, poll_slug=poll_slug, session_ids=session_ids, calls=calls)
+        sys.stdout.write(json.dumps({"poll_slug": poll_slug, **result}) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
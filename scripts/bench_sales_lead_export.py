@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Benchmark admin lead CSV export: inline ``/export`` vs the streamed export job.
+
+Seeds synthetic leads (default 50,000) into the database at ``DATABASE_URL`` (a
+migrated local Postgres), then runs each mode in a fresh child process so peak
+RSS is measured independently:
+
+* ``inline`` — ``GET /v1/admin/leads/export``: pages of ``list_leads(limit=500)``
+  with eager-loaded contacts/tags, the whole CSV built in memory.
+* ``job`` — ``SalesLeadRepository.stream_export_rows`` + ``write_lead_export``
+  into ``S3MultipartWriter`` backed by a fake S3 client that discards parts.
+
+Both modes filter on the synthetic email domain, so the ``rows`` fields should
+match. Prints one JSON object per mode; run with ``--seed 0`` to reuse rows from
+an earlier run and ``--cleanup`` to delete them afterwards.
+
+Usage::
+
+    DATABASE_URL=postgresql://... python scripts/bench_sales_lead_export.py
+    DATABASE_URL=postgresql://... python scripts/bench_sales_lead_export.py \\
+        --seed 0 --modes job --cleanup
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+
+_EMAIL_DOMAIN = "lead-export.bench"
+_MARKER = "bench-lead-export"
+
+
+class _DiscardingS3:
+    """Multipart API stand-in that only counts bytes."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def create_multipart_upload(self, **_kwargs: Any) -> dict[str, str]:
+        return {"UploadId": "bench"}
+
+    def upload_part(self, **kwargs: Any) -> dict[str, str]:
+        self.bytes += len(kwargs["Body"])
+        return {"ETag": str(kwargs["PartNumber"])}
+
+    def complete_multipart_upload(self, **_kwargs: Any) -> None:
+        return None
+
+    def abort_multipart_upload(self, **_kwargs: Any) -> None:
+        return None
+
+
+def _seed(count: int) -> None:
+    from sqlalchemy import text
+
+    from app.db.engine import get_engine
+
+    with get_engine().begin() as conn:
+        conn.execute(
+            text(
+                """
+                WITH new_contacts AS (
+                    INSERT INTO contacts (
+                        first_name, last_name, email, phone_region,
+                        phone_national_number, contact_type, source, source_detail
+                    )
+                    SELECT 'Bench', 'Lead ' || n, 'lead' || n || '@' || :domain,
+                           'HK', (91000000 + n)::text, 'parent', 'free_guide',
+                           :marker
+                    FROM generate_series(1, :count) AS n
+                    RETURNING id
+                )
+                INSERT INTO sales_leads (
+                    contact_id, lead_type, funnel_stage, assigned_to, created_at
+                )
+                SELECT id, 'free_guide', 'contacted', 'bench-admin',
+                       now() - (random() * interval '180 days')
+                FROM new_contacts
+                """
+            ),
+            {"count": count, "domain": _EMAIL_DOMAIN, "marker": _MARKER},
+        )
+
+
+def _cleanup() -> None:
+    from sqlalchemy import text
+
+    from app.db.engine import get_engine
+
+    with get_engine().begin() as conn:
+        conn.execute(
+            text(
+                "DELETE FROM sales_leads WHERE contact_id IN "
+                "(SELECT id FROM contacts WHERE source_detail = :marker)"
+            ),
+            {"marker": _MARKER},
+        )
+        conn.execute(
+            text("DELETE FROM contacts WHERE source_detail = :marker"),
+            {"marker": _MARKER},
+        )
+
+
+def _child(mode: str) -> None:
+    from sqlalchemy.orm import Session
+
+    from app.db.engine import get_engine
+
+    started = time.perf_counter()
+    if mode == "inline":
+        from app.api.admin_leads import _export_leads
+
+        response = _export_leads({"queryStringParameters": {"search": _EMAIL_DOMAIN}})
+        rows = response["body"].count("\n") - 1
+        size = len(response["body"].encode("utf-8"))
+    else:
+        from app.db.repositories.sales_lead import SalesLeadRepository
+        from app.services.sales_lead_export import (
+            FETCH_BATCH_ROWS,
+            S3MultipartWriter,
+            write_lead_export,
+        )
+
+        s3 = _DiscardingS3()
+        upload = S3MultipartWriter(
+            s3, bucket="bench", key="bench.csv.gz", content_type="application/gzip"
+        )
+        with Session(get_engine()) as session:
+            stream = SalesLeadRepository(session).stream_export_rows(
+                batch_size=FETCH_BATCH_ROWS, search=_EMAIL_DOMAIN
+            )
+            rows = write_lead_export(stream, upload, now=datetime.now(UTC))
+        size = upload.complete()
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sys.stdout.write(
+        json.dumps(
+            {
+                "mode": mode,
+                "rows": rows,
+                "bytes": size,
+                "seconds": round(elapsed, 2),
+                "peak_rss_mb": round(peak_kb / 1024, 1),
+            }
+        )
+        + "\n"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument(
+        "--seed", type=int, default=50000, help="Synthetic leads to insert first."
+    )
+    parser.add_argument(
+        "--modes",
+        default="inline,job",
+        help="Comma-separated modes to run (inline, job).",
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Delete synthetic leads at the end."
+    )
+    parser.add_argument("--child", choices=("inline", "job"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(_BACKEND_SRC))
+    if args.child:
+        _child(args.child)
+        return 0
+
+    if args.seed > 0:
+        _seed(args.seed)
+    try:
+        for mode in (m.strip() for m in args.modes.split(",") if m.strip()):
+            subprocess.run([sys.executable, __file__, "--child", mode], check=True)
+    finally:
+        if args.cleanup:
+            _cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
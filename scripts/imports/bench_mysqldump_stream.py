@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Benchmark legacy dump loading + ``parse``: baseline text parser vs streaming scan.
+
+Generates a synthetic mysqldump (default 500 MB) and, for each entity, runs the
+production path in a fresh child process so peak RSS is measured independently:
+
+* ``stream`` — this tree: ``load_dump_source(importer, path)`` then
+  ``importer.parse(source)`` (one streaming scan that keeps every source row).
+* ``baseline`` — the importer code at ``--baseline-ref`` (or ``--baseline-src``):
+  ``path.read_text()`` then ``importer.parse(text)`` with the old character-loop
+  parser, as the import handler did before the streaming scan.
+
+Each table is written as one extended ``INSERT`` so both modes see every row;
+compare the ``rows`` field to confirm they parsed the same data. Prints one JSON
+object per (mode, entity).
+
+Usage::
+
+    python scripts/imports/bench_mysqldump_stream.py --baseline-ref <commit>
+    python scripts/imports/bench_mysqldump_stream.py --dump /path/to/backup.sql \\
+        --baseline-src /path/to/old/backend/src --entities contacts
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_BACKEND_SRC = _REPO_ROOT / "backend" / "src"
+
+_DEFAULT_ENTITIES = ("venues", "contacts", "notes")
+_WORDS = ("Central", "O\\'Brien", "Hall; 2/F", "(annex)", "line\\nbreak", "café")
+
+#: (table, columns, share of the dump size)
+_TABLES: tuple[tuple[str, tuple[str, ...], float], ...] = (
+    ("district", ("id", "name"), 0.0),
+    ("country", ("id", "iso3", "name", "region_id", "dial_code"), 0.0),
+    ("venue", ("id", "name", "address_line1", "address_line2", "district_id"), 0.1),
+    (
+        "person",
+        (
+            "id",
+            "family_id",
+            "kind",
+            "first_name",
+            "last_name",
+            "email",
+            "instagram_id",
+            "date_of_birth",
+            "phone",
+            "phone_country_code_id",
+            "occupation",
+            "company",
+            "referral_source",
+            "referral_person_id",
+            "is_newsletter_subscribed",
+            "deleted_at",
+        ),
+        0.45,
+    ),
+    ("note", ("id", "created_at", "took_at", "content"), 0.35),
+    ("person_note", ("note_id", "person_id"), 0.1),
+)
+
+
+def _text(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 12)))
+
+
+def _values(table: str, rng: random.Random, rid: int) -> str:
+    if table == "district":
+        return f"({rid},'District {rid}')"
+    if table == "country":
+        return f"({rid},'C{rid:02d}','Country {rid}',1,'+{800 + rid}')"
+    if table == "venue":
+        return f"({rid},'{_text(rng)}','{rid} Road',NULL,{rng.randint(1, 18)})"
+    if table == "person":
+        return (
+            f"({rid},{rng.randint(1, 50000)},'parent','{_text(rng)}','Chan',"
+            f"'p{rid}@example.com',NULL,'1990-01-0{rid % 9 + 1}',"
+            f"'9123{rid % 10000:04d}',{rng.randint(1, 20)},NULL,NULL,'instagram',"
+            "NULL,1,NULL)"
+        )
+    if table == "note":
+        return (
+            f"({rid},'2024-01-0{rid % 9 + 1} 10:00:00',"
+            f"'2024-01-0{rid % 9 + 1} 09:00:00','{_text(rng)}')"
+        )
+    return f"({rid},{rng.randint(1, 100000)})"
+
+
+def _write_dump(path: Path, size_mb: int) -> None:
+    rng = random.Random(0)
+    total = size_mb * (1 << 20)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("-- synthetic mysqldump\n/*!40101 SET NAMES utf8mb4 */;\n")
+        for table, columns, share in _TABLES:
+            cols_ddl = ",\n".join(f"  `{c}` text" for c in columns)
+            fh.write(f"CREATE TABLE `{table}` (\n{cols_ddl}\n);\n")
+            cols = ", ".join(f"`{c}`" for c in columns)
+            fh.write(f"INSERT INTO `{table}` ({cols}) VALUES ")
+            if share == 0.0:
+                fh.write(",".join(_values(table, rng, rid) for rid in range(1, 21)))
+            else:
+                budget = int(total * share)
+                written = 0
+                rid = 1
+                while written < budget:
+                    chunk = ",".join(_values(table, rng, rid + i) for i in range(1000))
+                    fh.write(("," if rid > 1 else "") + chunk)
+                    written += len(chunk)
+                    rid += 1000
+            fh.write(";\n")
+
+
+def _export_baseline(ref: str, dest: Path) -> Path:
+    """Extract ``backend/src`` at ``ref`` with ``git archive``; return its path."""
+    archive = dest / "baseline.tar"
+    with archive.open("wb") as fh:
+        subprocess.run(
+            ["git", "-C", str(_REPO_ROOT), "archive", ref, "backend/src"],
+            check=True,
+            stdout=fh,
+        )
+    with tarfile.open(archive) as tar:
+        tar.extractall(dest, filter="data")
+    return dest / "backend" / "src"
+
+
+def _child(mode: str, entity: str, path: Path, src: Path) -> None:
+    sys.path.insert(0, str(src))
+    from app.imports import entities  # noqa: F401 — register importers
+    from app.imports.registry import get
+
+    importer = get(entity)
+    started = time.perf_counter()
+    if mode == "stream":
+        from app.imports.base import load_dump_source
+
+        rows = importer.parse(load_dump_source(importer, path))
+    else:
+        rows = importer.parse(path.read_text(encoding="utf-8", errors="replace"))
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sys.stdout.write(
+        json.dumps(
+            {
+                "mode": mode,
+                "entity": entity,
+                "rows": len(rows),
+                "seconds": round(elapsed, 2),
+                "peak_rss_mb": round(peak_kb / 1024, 1),
+            }
+        )
+        + "\n"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument("--dump", type=Path, default=None, help="Existing dump file.")
+    parser.add_argument(
+        "--entities",
+        default=",".join(_DEFAULT_ENTITIES),
+        help="Comma-separated importer entities to parse.",
+    )
+    parser.add_argument(
+        "--modes",
+        default="baseline,stream",
+        help="Comma-separated modes to run (baseline, stream).",
+    )
+    baseline = parser.add_mutually_exclusive_group()
+    baseline.add_argument(
+        "--baseline-ref",
+        help="Git ref whose backend/src holds the pre-streaming importers.",
+    )
+    baseline.add_argument(
+        "--baseline-src",
+        type=Path,
+        help="Checkout of the pre-streaming backend/src.",
+    )
+    parser.add_argument(
+        "--child", choices=("baseline", "stream"), help=argparse.SUPPRESS
+    )
+    parser.add_argument("--entity", help=argparse.SUPPRESS)
+    parser.add_argument("--src", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.entity, args.dump, args.src)
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    if "baseline" in modes and not (args.baseline_ref or args.baseline_src):
+        parser.error("baseline mode needs --baseline-ref or --baseline-src")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        src_by_mode = {"stream": _BACKEND_SRC}
+        if "baseline" in modes:
+            src_by_mode["baseline"] = args.baseline_src or _export_baseline(
+                args.baseline_ref,
+                tmp_dir,
+            )
+        path = args.dump
+        if path is None:
+            path = tmp_dir / "synthetic.sql"
+            _write_dump(path, args.size_mb)
+        for entity in (e.strip() for e in args.entities.split(",") if e.strip()):
+            for mode in modes:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--child",
+                        mode,
+                        "--entity",
+                        entity,
+                        "--dump",
+                        str(path),
+                        "--src",
+                        str(src_by_mode[mode]),
+                    ],
+                    check=True,
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
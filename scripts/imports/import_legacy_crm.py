@@ -26,6 +26,7 @@ from sqlalchemy.orm import Session
 
 from app.db.engine import get_engine
 from app.imports import entities  # noqa: F401 — register importers
+from app.imports.base import load_dump_source
 from app.imports.base import parse_skip_legacy_keys_csv
 from app.imports.base import resolve_importer_context
 from app.imports.registry import get
@@ -70,6 +71,16 @@ def main() -> int:
             "Whitespace around entries is trimmed; empty tokens are ignored."
         ),
     )
+    parser.add_argument(
+        "--bulk-chunk-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Bulk apply mode: pre-generate UUIDs and insert rows and "
+            "legacy_import_refs in multi-row chunks of N (supported importers only)."
+        ),
+    )
     args = parser.parse_args()
     path: Path = args.sql_path
     if not path.is_file():
@@ -77,7 +88,7 @@ def main() -> int:
         return 1
 
     importer = get(args.entity)
-    sql_text = path.read_text(encoding="utf-8", errors="replace")
+    sql_text = load_dump_source(importer, path)
     rows = importer.parse(sql_text)
 
     skip_keys = parse_skip_legacy_keys_csv(args.skip_legacy_keys or None)
@@ -88,6 +99,7 @@ def main() -> int:
             session,
             dry_run=args.dry_run,
             skip_legacy_keys=skip_keys,
+            bulk_chunk_size=args.bulk_chunk_size,
         )
         stats = importer.apply(session, rows, ctx, dry_run=args.dry_run)
 
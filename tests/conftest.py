@@ -139,3 +139,39 @@ def turnstile_http_proxy_error() -> Any:
         raise AwsProxyError("ProxyError", "blocked")
 
     return _invoke
+
+
+@pytest.fixture
+def query_budget() -> Any:
+    """Context manager failing the test when its block exceeds a SQL budget.
+
+    Counts statements on engines from ``get_engine`` (or passed through
+    ``app.db.query_stats.instrument_engine``). Also fails on a suspected N+1
+    (one statement shape repeated ``SQL_N_PLUS_ONE_THRESHOLD`` times) unless
+    ``allow_n_plus_one`` is set. Wrap one handler invocation per block: the
+    admin handler clears the request's counters when it returns.
+    """
+    from contextlib import contextmanager
+
+    from app.utils.logging import QueryStats, query_stats
+
+    @contextmanager
+    def _budget(max_statements: int, *, allow_n_plus_one: bool = False) -> Any:
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        try:
+            yield stats
+        finally:
+            query_stats.reset(token)
+        shapes = "\n".join(
+            f"  {count}x {shape}" for shape, count in stats.shapes.most_common()
+        )
+        if stats.statements > max_statements:
+            pytest.fail(
+                f"{stats.statements} SQL statements exceed the budget of "
+                f"{max_statements}:\n{shapes}"
+            )
+        if stats.repeated_shapes() and not allow_n_plus_one:
+            pytest.fail(f"N+1 suspected:\n{shapes}")
+
+    return _budget
@@ -10,13 +10,13 @@ import pytest
 from app.db.models.enums import ContactSource
 from app.db.models.enums import OrganizationRole
 from app.db.models.enums import RelationshipType
+from app.imports import refs
 from app.imports.base import resolve_importer_context
 from app.imports.entities._legacy_family_common import LegacyPersonRow
 from app.imports.entities._legacy_family_common import parse_legacy_country_dial_codes
 from app.imports.entities._legacy_family_common import parse_legacy_person_rows
 from app.imports.entities.contacts import ContactsImporter
 
-
 COUNTRY_SQL = """
 INSERT INTO `country` (`id`, `dial_code`) VALUES (196, '852'), (138, '63');
 """
@@ -44,9 +44,7 @@ def test_parse_person_rows() -> None:
 
 
 def test_apply_phone_format(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import contacts as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock()
     contact_id = uuid.uuid4()
 
@@ -96,9 +94,7 @@ def test_apply_phone_format(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_apply_org_partner_membership(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import contacts as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock()
     new_cid = uuid.uuid4()
 
@@ -152,9 +148,8 @@ def test_apply_org_partner_membership(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_inserts_contact_without_membership_when_parent_unmapped(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    from app.imports.entities import contacts as mod
 
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock()
     new_cid = uuid.uuid4()
 
@@ -197,7 +192,7 @@ def test_inserts_contact_without_membership_when_parent_unmapped(
     assert stats.inserted == 1
     assert stats.diagnostics["skipped_membership_no_parent_ref"] == 1
     assert stats.diagnostics["dependency_ref_count_families"] == 0
-    mod.refs.record_mapping.assert_called_once()
+    refs.record_mapping.assert_called_once()
 
 
 def test_resolve_context_contacts_no_required_mapping(
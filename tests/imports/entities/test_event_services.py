@@ -12,6 +12,7 @@ from app.db.models.enums import EventCategory
 from app.db.models.enums import ServiceDeliveryMode
 from app.db.models.enums import ServiceStatus
 from app.db.models.enums import ServiceType
+from app.imports import refs
 from app.imports.entities._legacy_event_common import DELIVERY_MODE_HYBRID_TOKENS
 from app.imports.entities._legacy_event_common import DELIVERY_MODE_ONLINE_TOKENS
 from app.imports.entities._legacy_event_common import LegacyEvent
@@ -59,9 +60,7 @@ def test_slugify_event_title() -> None:
 
 
 def test_apply_skips_deleted_and_empty_title(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import event_services as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock(spec=Session)
     new_id = uuid.uuid4()
 
@@ -127,9 +126,7 @@ def test_apply_skips_deleted_and_empty_title(monkeypatch: pytest.MonkeyPatch) ->
 
 
 def test_slug_collision_probes(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import event_services as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock(spec=Session)
     new_id = uuid.uuid4()
 
@@ -7,12 +7,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from app.imports import refs
 from app.imports.entities._legacy_family_common import LegacyFamilyRow
 from app.imports.entities._legacy_family_common import parse_legacy_family_rows
 from app.imports.entities.families import FamiliesImporter
 from app.imports.entities.families import apply_families
 
-
 MINIMAL_FAMILY = """
 INSERT INTO `district` (`id`, `name`) VALUES (1, 'Central');
 
@@ -61,7 +61,7 @@ def test_apply_families_dry_run(monkeypatch: pytest.MonkeyPatch) -> None:
         "district_area_map",
         lambda _s, _h: {"Central": area},
     )
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     session = MagicMock()
     sql = """
@@ -89,7 +89,7 @@ INSERT INTO `person` (`id`, `family_id`, `kind`, `first_name`, `last_name`, `ema
     stats = apply_families(session, rows, dry_run=True, source_sql_text=sql)
     assert stats.inserted == 1
     session.add.assert_not_called()
-    mod.refs.record_mapping.assert_not_called()
+    refs.record_mapping.assert_not_called()
 
 
 def test_apply_skips_deleted_and_excluded(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -103,7 +103,7 @@ def test_apply_skips_deleted_and_excluded(monkeypatch: pytest.MonkeyPatch) -> No
         "district_area_map",
         lambda _s, _h: {"Central": area},
     )
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     session = MagicMock()
     sql = """
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 from sqlalchemy.orm import Session
 
+from app.imports import refs
 from app.imports.entities._legacy_event_common import LegacyLabel
 from app.imports.entities.labels import LabelsImporter
 
@@ -15,9 +16,7 @@ from app.imports.entities.labels import LabelsImporter
 def test_apply_inserts_and_case_insensitive_reuse(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    from app.imports.entities import labels as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock(spec=Session)
     new_id = uuid.uuid4()
 
@@ -42,14 +41,12 @@ def test_apply_inserts_and_case_insensitive_reuse(
     ctx = replace(ctx, existing_import_keys=frozenset())
     stats = importer.apply(session, rows, ctx, dry_run=False)
     assert stats.inserted == 1
-    assert mod.refs.record_mapping.call_count == 2
+    assert refs.record_mapping.call_count == 2
     assert session.add.call_count == 1
 
 
 def test_category_description_on_tag(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import labels as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock(spec=Session)
     new_id = uuid.uuid4()
 
@@ -72,9 +69,7 @@ def test_category_description_on_tag(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_unknown_entity_description(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import labels as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock(spec=Session)
     new_id = uuid.uuid4()
 
@@ -9,12 +9,12 @@ from unittest.mock import MagicMock
 import pytest
 
 from app.db.models.note import Note
+from app.imports import refs
 from app.imports.entities._legacy_family_common import parse_legacy_notes
 from app.imports.entities._legacy_family_common import parse_legacy_person_notes
 from app.imports.entities.notes import NotesImporter
 from app.imports.entities.notes import apply_notes
 
-
 NOTE_SQL = """
 INSERT INTO `note` (`id`, `created_at`, `took_at`, `content`) VALUES
 (1, '2024-01-01 10:00:00', '2024-01-02 15:30:00', 'Hello *world*\\nLine2');
@@ -37,9 +37,7 @@ def test_parse_person_note_pairs() -> None:
 
 
 def test_apply_notes_dry_run_two_contacts(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import notes as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock()
 
     sql = NOTE_SQL + PN_SQL
@@ -63,8 +61,6 @@ def test_apply_notes_dry_run_two_contacts(monkeypatch: pytest.MonkeyPatch) -> No
 
 def test_apply_notes_writes_unified_note_rows(monkeypatch: pytest.MonkeyPatch) -> None:
     """Legacy note with two person links inserts two ``notes`` rows; ref maps to first id."""
-    from app.imports.entities import notes as mod
-
     recorded: list[tuple[str, str, uuid.UUID]] = []
 
     def _record(
@@ -76,7 +72,7 @@ def test_apply_notes_writes_unified_note_rows(monkeypatch: pytest.MonkeyPatch) -
         del session_arg
         recorded.append((entity, legacy_key, new_id))
 
-    monkeypatch.setattr(mod.refs, "record_mapping", _record)
+    monkeypatch.setattr(refs, "record_mapping", _record)
     session = MagicMock()
 
     def _flush_sets_note_id() -> None:
@@ -117,9 +113,7 @@ def test_apply_notes_writes_unified_note_rows(monkeypatch: pytest.MonkeyPatch) -
 
 
 def test_skipped_no_dep_unresolved(monkeypatch: pytest.MonkeyPatch) -> None:
-    from app.imports.entities import notes as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     session = MagicMock()
     sql = NOTE_SQL + PN_SQL
     importer = NotesImporter()
@@ -134,19 +128,15 @@ def test_skipped_no_dep_unresolved(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_apply_notes_helper_loads_contact_refs(monkeypatch: pytest.MonkeyPatch) -> None:
     """``apply_notes`` must load contact UUIDs from ``legacy_import_refs``."""
-    from app.imports.entities import notes as mod
-
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
     c1 = uuid.uuid4()
     c2 = uuid.uuid4()
     monkeypatch.setattr(
-        mod.refs,
+        refs,
         "load_mapping",
         lambda _session, entity: {"10": c1, "11": c2} if entity == "contacts" else {},
     )
-    monkeypatch.setattr(
-        mod.refs, "load_legacy_keys", lambda _session, _entity: frozenset()
-    )
+    monkeypatch.setattr(refs, "load_legacy_keys", lambda _session, _entity: frozenset())
 
     session = MagicMock()
 
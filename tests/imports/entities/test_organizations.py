@@ -9,10 +9,11 @@ import pytest
 
 from app.db.models.enums import OrganizationType
 from app.db.models.enums import RelationshipType
+from app.imports import refs
 from app.imports.entities._legacy_family_common import LegacyFamilyRow
 from app.imports.entities.organizations import ORGANIZATION_TYPE_RULES
-from app.imports.entities.organizations import infer_organization_type_from_name
 from app.imports.entities.organizations import apply_organizations
+from app.imports.entities.organizations import infer_organization_type_from_name
 
 
 def test_organization_type_rules_constant() -> None:
@@ -57,7 +58,7 @@ def test_partner_promotes_relationship_type(monkeypatch: pytest.MonkeyPatch) ->
         "district_area_map",
         lambda _s, _h: {"Central": area},
     )
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     session = MagicMock()
     assigned = uuid.uuid4()
@@ -94,7 +95,7 @@ def test_no_partner_stays_prospect(monkeypatch: pytest.MonkeyPatch) -> None:
     hk = uuid.uuid4()
     monkeypatch.setattr(mod, "hk_country_id", lambda _s: hk)
     monkeypatch.setattr(mod, "district_area_map", lambda _s, _h: {})
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     sql_no_person = """
 INSERT INTO `district` (`id`, `name`) VALUES (1, 'Central');
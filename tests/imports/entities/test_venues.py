@@ -9,12 +9,12 @@ import pytest
 from sqlalchemy.exc import SAWarning
 
 from app.imports import mysqldump
+from app.imports import refs
 from app.imports.entities.venues import LegacyVenue
 from app.imports.entities.venues import apply_venues
 from app.imports.entities.venues import parse_legacy_districts
 from app.imports.entities.venues import parse_legacy_venues
 
-
 MINIMAL_DUMP = """
 INSERT INTO `crm`.`district` (`id`, `name`) VALUES
 (1, 'Central'),
@@ -87,7 +87,7 @@ def test_apply_venues_dry_run_no_commit(monkeypatch: pytest.MonkeyPatch) -> None
         "_district_area_map",
         lambda _s, _h: {"Central": area},
     )
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     session = MagicMock()
     session.execute.return_value.all.return_value = []
@@ -123,7 +123,7 @@ def test_apply_venues_dry_run_no_commit(monkeypatch: pytest.MonkeyPatch) -> None
     )
     session.add.assert_not_called()
     session.commit.assert_not_called()
-    mod.refs.record_mapping.assert_not_called()
+    refs.record_mapping.assert_not_called()
 
 
 @pytest.mark.filterwarnings("ignore", category=SAWarning)
@@ -138,7 +138,7 @@ def test_apply_venues_inserts_and_commits(monkeypatch: pytest.MonkeyPatch) -> No
         "_district_area_map",
         lambda _s, _h: {"Central": area},
     )
-    monkeypatch.setattr(mod.refs, "record_mapping", MagicMock())
+    monkeypatch.setattr(refs, "record_mapping", MagicMock())
 
     session = MagicMock()
     session.execute.return_value.all.return_value = []
@@ -171,9 +171,9 @@ def test_apply_venues_inserts_and_commits(monkeypatch: pytest.MonkeyPatch) -> No
     session.add.assert_called_once()
     session.flush.assert_called()
     session.commit.assert_called_once()
-    mod.refs.record_mapping.assert_called_once()
-    assert mod.refs.record_mapping.call_args[0][2] == "1"
-    assert mod.refs.record_mapping.call_args[0][3] == assigned_id
+    refs.record_mapping.assert_called_once()
+    assert refs.record_mapping.call_args[0][2] == "1"
+    assert refs.record_mapping.call_args[0][3] == assigned_id
 
 
 def test_apply_venues_skips_duplicate_case_insensitive(
@@ -0,0 +1,377 @@
+"""Tests for importer row writers (per-row vs bulk apply mode)."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import replace
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.models import Contact
+from app.db.models import DiscountCode
+from app.db.models import Family
+from app.db.models import FamilyMember
+from app.db.models import Organization
+from app.db.models import OrganizationMember
+from app.db.models import Tag
+from app.db.models.enums import ContactSource
+from app.db.models.enums import ContactType
+from app.db.models.enums import FamilyRole
+from app.db.models.enums import OrganizationType
+from app.db.models.enums import RelationshipType
+from app.db.models.legacy_import_ref import LegacyImportRef
+from app.imports import refs
+from app.imports.base import ImporterContext
+from app.imports.base import resolve_importer_context
+from app.imports.bulk import BulkWriter
+from app.imports.bulk import RowWriter
+from app.imports.bulk import make_writer
+from app.imports.entities._legacy_event_common import LegacyDiscount
+from app.imports.entities._legacy_event_common import LegacyLabel
+from app.imports.entities._legacy_family_common import LegacyPersonRow
+from app.imports.entities.contacts import ContactsImporter
+from app.imports.entities.event_discount_codes import EventDiscountCodesImporter
+from app.imports.entities.labels import LabelsImporter
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(_type, _compiler, **_kw) -> str:  # type: ignore[no-untyped-def]
+    return "JSON"
+
+
+def _memory_session(
+    statements: list[str] | None = None,
+    *,
+    extra_tables: tuple[Any, ...] = (),
+) -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _pg_functions(dbapi_conn, _record) -> None:  # type: ignore[no-untyped-def]
+        # Server defaults on ``tags`` use Postgres functions.
+        dbapi_conn.create_function("now", 0, lambda: "2026-01-01 00:00:00")
+        dbapi_conn.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+
+    Base.metadata.create_all(
+        engine,
+        tables=[LegacyImportRef.__table__, Tag.__table__, *extra_tables],
+    )
+    if statements is not None:
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _count(_conn, _cursor, statement, *_args) -> None:  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+    return Session(engine)
+
+
+def _crm_session() -> Session:
+    """SQLite session with FK enforcement for contacts + membership tables."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_conn, _record) -> None:  # type: ignore[no-untyped-def]
+        dbapi_conn.create_function("now", 0, lambda: "2026-01-01 00:00:00")
+        dbapi_conn.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
+    with engine.begin() as conn:
+        # ``locations`` uses Postgres-only server defaults; contacts / families /
+        # organizations only need the FK target to exist (location ids stay NULL).
+        conn.exec_driver_sql("CREATE TABLE locations (id CHAR(32) PRIMARY KEY)")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            Contact.__table__,
+            Family.__table__,
+            FamilyMember.__table__,
+            Organization.__table__,
+            OrganizationMember.__table__,
+            LegacyImportRef.__table__,
+        ],
+    )
+    return Session(engine)
+
+
+def _person(
+    legacy_id: int,
+    *,
+    family_id: int | None,
+    email: str | None = None,
+) -> LegacyPersonRow:
+    return LegacyPersonRow(
+        legacy_id=legacy_id,
+        family_id=family_id,
+        kind="parent",
+        first_name=f"P{legacy_id}",
+        last_name=None,
+        email=email,
+        instagram_id=None,
+        date_of_birth=None,
+        phone=None,
+        phone_country_code_id=None,
+        occupation=None,
+        company=None,
+        referral_source=None,
+        referral_person_id=None,
+        is_newsletter_subscribed=None,
+        deleted_at=None,
+    )
+
+
+def _labels(n: int) -> list[LegacyLabel]:
+    return [
+        LegacyLabel(legacy_id=i, name=f"Label {i}", entity="tag", deleted_at=None)
+        for i in range(1, n + 1)
+    ]
+
+
+def test_make_writer_selects_mode() -> None:
+    session = Session()
+    assert isinstance(make_writer(session, bulk_chunk_size=None), RowWriter)
+    assert isinstance(make_writer(session, bulk_chunk_size=50), BulkWriter)
+
+
+def test_bulk_writer_pregenerates_ids_and_flushes_in_chunks() -> None:
+    statements: list[str] = []
+    with _memory_session(statements) as session:
+        writer = BulkWriter(session, chunk_size=4)
+        ids = [
+            writer.insert(Tag, {"name": f"t{i}", "created_by": "test"})
+            for i in range(3)
+        ]
+        for i, tid in enumerate(ids):
+            writer.record_ref("labels", str(i), tid)
+        writer.finish()
+        session.commit()
+
+        stored = set(session.execute(select(Tag.id)).scalars().all())
+        assert stored == set(ids)
+        assert refs.load_mapping(session, "labels") == {
+            str(i): tid for i, tid in enumerate(ids)
+        }
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    # 3 tags + 3 refs, chunk_size=4 → two flushes, ≤ one INSERT per table each.
+    assert len(inserts) <= 4
+
+
+@pytest.mark.parametrize("bulk_chunk_size", [None, 2])
+def test_discount_codes_reuse_in_run_code_in_row_and_bulk_mode(
+    bulk_chunk_size: int | None,
+) -> None:
+    rows = [
+        LegacyDiscount(
+            legacy_id=i,
+            code=code,
+            type="percentage",
+            value=Decimal(10),
+            valid_from=None,
+            valid_to=None,
+            max_uses=None,
+            event_id=None,
+            event_date_id=None,
+            deleted_at=None,
+        )
+        for i, code in enumerate(("save10", "OTHER", "Save10"), start=1)
+    ]
+    with _memory_session(extra_tables=(DiscountCode.__table__,)) as session:
+        ctx = replace(ImporterContext(), bulk_chunk_size=bulk_chunk_size)
+        stats = EventDiscountCodesImporter().apply(session, rows, ctx, dry_run=False)
+
+        assert stats.inserted == 3
+        mapping = refs.load_mapping(session, "event_discount_codes")
+        assert mapping["3"] == mapping["1"] != mapping["2"]
+        assert len(session.execute(select(DiscountCode.id)).all()) == 2
+
+
+@pytest.mark.parametrize("bulk_chunk_size", [None, 2])
+def test_labels_apply_same_stats_in_row_and_bulk_mode(
+    bulk_chunk_size: int | None,
+) -> None:
+    rows = [
+        *_labels(5),
+        LegacyLabel(legacy_id=6, name="label 1", entity="tag", deleted_at=None),
+    ]
+    with _memory_session() as session:
+        importer = LabelsImporter()
+        ctx = replace(ImporterContext(), bulk_chunk_size=bulk_chunk_size)
+        stats = importer.apply(session, rows, ctx, dry_run=False)
+
+        assert stats.inserted == 5
+        mapping = refs.load_mapping(session, "labels")
+        assert set(mapping) == {"1", "2", "3", "4", "5", "6"}
+        assert mapping["6"] == mapping["1"]
+        assert len(session.execute(select(Tag.id)).all()) == 5
+
+
+def test_labels_bulk_dry_run_keeps_preview_and_writes_nothing() -> None:
+    with _memory_session() as session:
+        importer = LabelsImporter()
+        ctx = replace(ImporterContext(), bulk_chunk_size=100)
+        stats = importer.apply(session, _labels(3), ctx, dry_run=True)
+
+        assert stats.inserted == 3
+        assert len(stats.preview) == 3
+        assert session.execute(select(Tag.id)).first() is None
+
+
+def test_bulk_apply_issues_fewer_statements_than_row_mode() -> None:
+    counts: dict[str, int] = {}
+    for mode, chunk in (("row", None), ("bulk", 500)):
+        statements: list[str] = []
+        with _memory_session(statements) as session:
+            ctx = replace(ImporterContext(), bulk_chunk_size=chunk)
+            LabelsImporter().apply(session, _labels(200), ctx, dry_run=False)
+        counts[mode] = len(statements)
+    assert counts["bulk"] * 20 < counts["row"]
+
+
+def test_resolve_context_rejects_bulk_for_unsupported_importer() -> None:
+    class _RowOnly:
+        ENTITY = "_row_only"
+        DEPENDS_ON: tuple[str, ...] = ()
+
+    with pytest.raises(ValueError, match="does not support bulk apply"):
+        resolve_importer_context(
+            _RowOnly(),  # type: ignore[arg-type]
+            Session(),
+            dry_run=True,
+            bulk_chunk_size=100,
+        )
+
+
+def test_bulk_writer_rejects_non_positive_chunk() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        BulkWriter(Session(), chunk_size=0)
+
+
+def test_record_ref_keeps_first_mapping_within_buffer() -> None:
+    with _memory_session() as session:
+        writer = BulkWriter(session, chunk_size=10)
+        first = uuid.uuid4()
+        writer.record_ref("labels", "1", first)
+        writer.record_ref("labels", "1", uuid.uuid4())
+        writer.finish()
+        session.commit()
+        assert refs.load_mapping(session, "labels") == {"1": first}
+
+
+def _run_contacts(bulk_chunk_size: int | None) -> tuple[object, dict, set]:
+    with _crm_session() as session:
+        existing = Contact(
+            first_name="Existing",
+            email="reuse@example.com",
+            contact_type=ContactType.PARENT,
+            source=ContactSource.MANUAL,
+        )
+        fam = Family(family_name="Fam", relationship_type=RelationshipType.PROSPECT)
+        org = Organization(
+            name="Org",
+            organization_type=OrganizationType.OTHER,
+            relationship_type=RelationshipType.PROSPECT,
+        )
+        session.add_all([existing, fam, org])
+        session.commit()
+        importer = ContactsImporter()
+        ctx = replace(
+            importer.resolve_context(session, dry_run=False),
+            refs_by_entity={
+                "families": {"10": fam.id},
+                "organizations": {"20": org.id},
+            },
+            bulk_chunk_size=bulk_chunk_size,
+        )
+        rows = [
+            # Reused contact with a membership is processed before any new contact.
+            _person(1, family_id=10, email="Reuse@example.com"),
+            _person(2, family_id=10),
+            _person(3, family_id=20),
+            _person(4, family_id=10),
+        ]
+        stats = importer.apply(session, rows, ctx, dry_run=False)
+
+        names = dict(session.execute(select(Contact.id, Contact.first_name)).all())
+        ref_names = {
+            key: names[cid]
+            for key, cid in refs.load_mapping(session, "contacts").items()
+        }
+        memberships = {
+            ("family", names[cid])
+            for (cid,) in session.execute(select(FamilyMember.contact_id)).all()
+        } | {
+            ("org", names[cid])
+            for (cid,) in session.execute(select(OrganizationMember.contact_id)).all()
+        }
+    return stats, ref_names, memberships
+
+
+def test_contacts_bulk_matches_row_mode_with_foreign_keys() -> None:
+    row_stats, row_refs, row_members = _run_contacts(None)
+    bulk_stats, bulk_refs, bulk_members = _run_contacts(2)
+
+    # ``row_details`` embed freshly generated contact ids; everything else matches.
+    assert replace(bulk_stats, row_details=[]) == replace(row_stats, row_details=[])
+    assert len(bulk_stats.row_details) == len(row_stats.row_details)
+    assert (
+        bulk_refs
+        == row_refs
+        == {
+            "1": "Existing",
+            "2": "P2",
+            "3": "P3",
+            "4": "P4",
+        }
+    )
+    assert (
+        bulk_members
+        == row_members
+        == {
+            ("family", "Existing"),
+            ("family", "P2"),
+            ("org", "P3"),
+            ("family", "P4"),
+        }
+    )
+
+
+def test_bulk_writer_flushes_parents_before_children() -> None:
+    statements: list[str] = []
+    with _crm_session() as session:
+
+        @event.listens_for(session.get_bind(), "before_cursor_execute")
+        def _record(_conn, _cursor, statement, *_args) -> None:  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        fam = Family(family_name="Fam", relationship_type=RelationshipType.PROSPECT)
+        session.add(fam)
+        session.commit()
+        statements.clear()
+        writer = BulkWriter(session, chunk_size=100)
+        cid = uuid.uuid4()
+        # Child buffered first; the flush must still insert ``contacts`` first.
+        writer.add(
+            FamilyMember,
+            {"family_id": fam.id, "contact_id": cid, "role": FamilyRole.CHILD},
+        )
+        writer.insert(
+            Contact,
+            {
+                "id": cid,
+                "first_name": "Kid",
+                "contact_type": ContactType.CHILD,
+                "source": ContactSource.MANUAL,
+            },
+        )
+        writer.finish()
+        session.commit()
+    inserts = [s.split("(")[0].strip() for s in statements if s.startswith("INSERT")]
+    assert inserts == ["INSERT INTO contacts", "INSERT INTO family_members"]
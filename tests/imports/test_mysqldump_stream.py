@@ -0,0 +1,116 @@
+"""Tests for the single-pass streaming mysqldump tokenizer."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from app.imports import mysqldump
+from app.imports.entities._legacy_family_common import parse_legacy_person_rows
+from app.imports.entities._mysqldump_rows import insert_rows
+from app.imports.entities._mysqldump_rows import iter_row_dicts
+from app.imports.entities.venues import VenueImporter
+from app.imports.mysqldump_stream import iter_dump_rows
+from app.imports.mysqldump_stream import scan_dump
+from app.imports.mysqldump_stream import scan_dump_file
+
+_DUMP = """-- MySQL dump; 'quoted' header
+/*!40101 SET NAMES utf8mb4 */;
+CREATE TABLE `district` (
+  `id` int NOT NULL,
+  `name` varchar(64) DEFAULT ';',
+  PRIMARY KEY (`id`)
+);
+INSERT INTO `district` VALUES (1,'Central; West'),(2,'It\\'s (North)');
+INSERT INTO `other` VALUES (9,'INSERT INTO `district` VALUES (99,''x'');');
+INSERT INTO `district` VALUES (3,NULL);
+INSERT INTO `legacy`.`venue` (`id`, `name`, `line1`, `line2`, `district_id`)
+VALUES (10,'Hall','1 Road',NULL,1),
+(11, 'Room\\nB', '', 'Floor 2', 2);
+"""
+
+
+@pytest.mark.parametrize("read_size", [1, 2, 7, 64, 1 << 20])
+def test_iter_dump_rows_across_chunk_boundaries(read_size: int) -> None:
+    rows = list(
+        iter_dump_rows(
+            io.StringIO(_DUMP),
+            ("district", "venue"),
+            read_size=read_size,
+        ),
+    )
+    assert [(r.table, r.fields) for r in rows] == [
+        ("district", ("1", "Central; West")),
+        ("district", ("2", "It's (North)")),
+        ("district", ("3", None)),
+        ("venue", ("10", "Hall", "1 Road", None, "1")),
+        ("venue", ("11", "RoomnB", None, "Floor 2", "2")),
+    ]
+
+
+def test_iter_dump_rows_all_tables_when_unfiltered() -> None:
+    tables = {r.table for r in iter_dump_rows(io.StringIO(_DUMP), read_size=5)}
+    assert tables == {"district", "other", "venue"}
+
+
+def test_scan_dump_records_insert_and_create_columns() -> None:
+    scanned = scan_dump(io.StringIO(_DUMP), ("district", "venue"), read_size=3)
+    district = scanned.table("district")
+    venue = scanned.table("venue")
+    assert district is not None and venue is not None
+    assert district.create_columns == ["id", "name"]
+    assert district.insert_columns is None
+    assert venue.insert_columns == ["id", "name", "line1", "line2", "district_id"]
+    assert scanned.has_insert("venue")
+    assert not scanned.has_insert("other")
+
+
+def test_fallback_for_function_call_atoms_matches_split_fields() -> None:
+    sql = "INSERT INTO `t` VALUES (1,NOW(),_binary 'a',0x1F);\n"
+    (row,) = iter_dump_rows(io.StringIO(sql), ("t",), read_size=4)
+    stmt = mysqldump.extract_insert_statement(sql, "t")
+    assert stmt is not None
+    (group,) = mysqldump.iter_groups(mysqldump.extract_values_sql_fragment(stmt))
+    assert list(row.fields) == mysqldump.split_fields(group)
+
+
+def test_unterminated_tuple_at_eof_is_dropped() -> None:
+    sql = "INSERT INTO `t` VALUES (1,'a'),(2,'b"
+    rows = list(iter_dump_rows(io.StringIO(sql), ("t",), read_size=4))
+    assert [r.fields for r in rows] == [("1", "a")]
+
+
+def test_row_dicts_match_text_parser() -> None:
+    scanned = scan_dump(io.StringIO(_DUMP), ("venue",))
+    positional = {0: "id", 1: "name"}
+    assert iter_row_dicts(scanned, "venue", positional=positional) == (
+        iter_row_dicts(_DUMP, "venue", positional=positional)
+    )
+
+
+def test_text_and_scanned_sources_read_every_insert() -> None:
+    scanned = scan_dump(io.StringIO(_DUMP), ("district",))
+    from_text = insert_rows(_DUMP, "district")
+    assert from_text == insert_rows(scanned, "district")
+    assert from_text is not None
+    assert [row[0] for row in from_text[1]] == ["1", "2", "3"]
+
+
+def test_missing_table_raises_like_text_parser() -> None:
+    scanned = scan_dump(io.StringIO(_DUMP), ("person",))
+    with pytest.raises(ValueError, match="`person`"):
+        parse_legacy_person_rows(scanned)
+    with pytest.raises(ValueError, match="`person`"):
+        parse_legacy_person_rows(_DUMP)
+
+
+def test_scan_dump_file_feeds_importer_parse(tmp_path: Path) -> None:
+    path = tmp_path / "dump.sql"
+    path.write_text(_DUMP, encoding="utf-8")
+    importer = VenueImporter()
+    scanned = scan_dump_file(path, importer.SOURCE_TABLES, read_size=16)
+    from_stream = importer.parse(scanned)
+    assert from_stream == importer.parse(_DUMP)
+    assert [v.district_label for v in from_stream] == ["Central; West", "It's (North)"]
@@ -0,0 +1,165 @@
+"""Tests for the multi-entity legacy import orchestrator."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+from typing import ClassVar
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.models.legacy_import_checkpoint import LegacyImportCheckpoint
+from app.db.models.legacy_import_ref import LegacyImportRef
+from app.imports import entities  # noqa: F401
+from app.imports import refs
+from app.imports.base import ImporterContext
+from app.imports.base import ImportStats
+from app.imports.orchestrator import import_order
+from app.imports.orchestrator import run_import_all
+from app.imports.registry import get
+from app.imports.registry import known_entities
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(
+        engine,
+        tables=[LegacyImportRef.__table__, LegacyImportCheckpoint.__table__],
+    )
+    return Session(engine)
+
+
+class _Stub:
+    """Importer that records one ref per run and remembers the refs it was given."""
+
+    DEPENDS_ON: ClassVar[tuple[str, ...]] = ()
+    SOURCE_TABLES: ClassVar[tuple[str, ...]] = ("t",)
+
+    def __init__(self, entity: str, depends_on: tuple[str, ...] = ()) -> None:
+        self.ENTITY = entity
+        self.DEPENDS_ON = depends_on
+        self.seen_refs: dict[str, dict[str, uuid.UUID]] = {}
+        self.runs = 0
+
+    def parse(self, sql_text: Any) -> Sequence[Any]:
+        return ["row"]
+
+    def resolve_context(self, session: Session, *, dry_run: bool) -> ImporterContext:
+        return ImporterContext()
+
+    def apply(
+        self,
+        session: Session,
+        rows: Sequence[Any],
+        ctx: ImporterContext,
+        *,
+        dry_run: bool,
+    ) -> ImportStats:
+        self.runs += 1
+        self.seen_refs = {k: dict(v) for k, v in ctx.refs_by_entity.items()}
+        if not dry_run:
+            refs.record_mapping(session, self.ENTITY, "1", uuid.uuid4())
+            session.commit()
+        return ImportStats(entity=self.ENTITY, inserted=len(rows), dry_run=dry_run)
+
+    def format_preview(self, row: Any, mapped_id: uuid.UUID | None) -> str:
+        return ""
+
+
+def _positions(names: list[str]) -> dict[str, int]:
+    return {name: i for i, name in enumerate(names)}
+
+
+def test_import_order_follows_registry_dependencies() -> None:
+    order = [imp.ENTITY for imp in import_order(get(e) for e in known_entities())]
+    pos = _positions(order)
+    assert sorted(order) == known_entities()
+    for entity in order:
+        for dep in get(entity).DEPENDS_ON:
+            assert pos[dep] < pos[entity]
+    assert pos["event_instances"] < pos["event_discount_codes"]
+    assert pos["contacts"] < pos["notes"]
+
+
+def test_import_order_rejects_cycles() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        import_order([_Stub("a", ("b",)), _Stub("b", ("a",))])
+
+
+def test_run_import_all_shares_ref_maps_in_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parent = _Stub("parent")
+    child = _Stub("child", ("parent",))
+    grandchild = _Stub("grandchild", ("parent", "child"))
+    loads: list[str] = []
+    real_load = refs.load_mapping
+
+    def _counting_load(session: Session, entity: str) -> dict[str, uuid.UUID]:
+        loads.append(entity)
+        return real_load(session, entity)
+
+    monkeypatch.setattr(refs, "load_mapping", _counting_load)
+    with _session() as session:
+        result = run_import_all(
+            session,
+            [grandchild, child, parent],
+            "",
+            run_key="dumps/x.sql",
+            dry_run=False,
+        )
+    assert [s.entity for s in result.completed] == ["parent", "child", "grandchild"]
+    assert result.finished
+    assert sorted(loads) == ["child", "parent"]
+    assert set(grandchild.seen_refs) == {"parent", "child"}
+    assert grandchild.seen_refs["parent"] == child.seen_refs["parent"]
+
+
+def test_run_import_all_resumes_after_checkpoint() -> None:
+    first = _Stub("first")
+    second = _Stub("second", ("first",))
+    with _session() as session:
+        paused = run_import_all(
+            session,
+            [first, second],
+            "",
+            run_key="run-1",
+            dry_run=False,
+            should_continue=lambda: first.runs == 0,
+        )
+        assert [s.entity for s in paused.completed] == ["first"]
+        assert paused.pending == ["second"]
+        assert not paused.finished
+
+        resumed = run_import_all(
+            session,
+            [first, second],
+            "",
+            run_key="run-1",
+            dry_run=False,
+        )
+        assert resumed.already_completed == ["first"]
+        assert [s.entity for s in resumed.completed] == ["second"]
+        assert first.runs == 1
+        assert "1" in second.seen_refs["first"]
+        done = session.execute(
+            select(LegacyImportCheckpoint.entity).where(
+                LegacyImportCheckpoint.run_key == "run-1"
+            )
+        ).scalars()
+        assert sorted(done) == ["first", "second"]
+
+
+def test_run_import_all_dry_run_skips_checkpoints() -> None:
+    only = _Stub("only")
+    with _session() as session:
+        run_import_all(session, [only], "", run_key="run-2", dry_run=True)
+        run_import_all(session, [only], "", run_key="run-2", dry_run=True)
+        assert only.runs == 2
+        rows = session.execute(select(LegacyImportCheckpoint)).scalars().all()
+        assert rows == []
@@ -44,3 +44,21 @@ def test_has_mapping() -> None:
         refs.record_mapping(session, "venues", "1", uuid.uuid4())
         session.commit()
         assert refs.has_mapping(session, "venues") is True
+
+
+def test_record_mappings_bulk_skips_existing_keys() -> None:
+    with _memory_session() as session:
+        kept = uuid.uuid4()
+        refs.record_mapping(session, "venues", "1", kept)
+        session.commit()
+        inserted = refs.record_mappings(
+            session,
+            "venues",
+            {"1": uuid.uuid4(), "2": uuid.uuid4(), "3": uuid.uuid4()},
+            chunk_size=2,
+        )
+        session.commit()
+        m = refs.load_mapping(session, "venues")
+        assert inserted == 2
+        assert set(m) == {"1", "2", "3"}
+        assert m["1"] == kept
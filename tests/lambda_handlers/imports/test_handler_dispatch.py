@@ -108,7 +108,7 @@ def test_lambda_handler_dispatches_stub(
     monkeypatch.setattr(
         h,
         "_download_dump",
-        lambda _b, _k, _rid: "INSERT INTO district ...",
+        lambda _b, _k, _rid, _imp: "INSERT INTO district ...",
     )
     monkeypatch.setattr(h, "get_engine", MagicMock())
 
@@ -153,7 +153,7 @@ def test_lambda_handler_raises_when_dependency_missing(
     monkeypatch.setattr(
         h,
         "_download_dump",
-        lambda _b, _k, _rid: "INSERT INTO district ...",
+        lambda _b, _k, _rid, _imp: "INSERT INTO district ...",
     )
     monkeypatch.setattr(h, "get_engine", MagicMock())
     monkeypatch.setattr(refs, "has_mapping", lambda _s, _dep: False)
@@ -197,7 +197,7 @@ def test_lambda_handler_allows_missing_dependency_in_dry_run(
     monkeypatch.setattr(
         h,
         "_download_dump",
-        lambda _b, _k, _rid: "INSERT INTO district ...",
+        lambda _b, _k, _rid, _imp: "INSERT INTO district ...",
     )
     monkeypatch.setattr(h, "get_engine", MagicMock())
     monkeypatch.setattr(refs, "has_mapping", lambda _s, _dep: False)
@@ -231,6 +231,121 @@ def test_lambda_handler_allows_missing_dependency_in_dry_run(
     assert out["inserted"] == 1
 
 
+def test_lambda_handler_import_all_dispatches_to_orchestrator(
+    mock_env: object,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="buck", MAX_IMPORT_DUMP_BYTES="2097152")
+    downloads: list[list[str]] = []
+
+    def _download(_b: str, _k: str, _rid: str, importers: Any) -> str:
+        downloads.append([imp.ENTITY for imp in importers])
+        return "INSERT INTO district ..."
+
+    captured: dict[str, Any] = {}
+
+    def _run(session: Any, importers: Any, source: Any, **kwargs: Any) -> Any:
+        captured.update(kwargs)
+        captured["continue"] = kwargs["should_continue"]()
+        return h.ImportAllResult(
+            run_key=kwargs["run_key"],
+            dry_run=kwargs["dry_run"],
+            completed=[ImportStats(entity="venues", inserted=2)],
+            pending=["notes"],
+        )
+
+    monkeypatch.setattr(h, "_download_dump", _download)
+    monkeypatch.setattr(h, "run_import_all", _run)
+    monkeypatch.setattr(h, "_default_run_key", lambda _b, key: f"{key}@etag1")
+    monkeypatch.setattr(h, "get_engine", MagicMock())
+
+    class _Sess:
+        def __init__(self, _e: object) -> None:
+            pass
+
+        def __enter__(self) -> MagicMock:
+            return MagicMock()
+
+        def __exit__(self, *a: object) -> None:
+            return None
+
+    monkeypatch.setattr(h, "Session", _Sess)
+
+    ctx = MagicMock()
+    ctx.aws_request_id = "abc-def-123"
+    ctx.get_remaining_time_in_millis.return_value = 60_000
+
+    out = h.lambda_handler(
+        {
+            "entity": "all",
+            "s3_bucket": "buck",
+            "s3_key": "dumps/all/1/all.sql",
+            "dry_run": False,
+        },
+        ctx,
+    )
+    assert downloads == [known_entities()]
+    assert captured["run_key"] == "dumps/all/1/all.sql@etag1"
+    assert captured["continue"] is False
+    assert out["finished"] is False
+    assert out["pending"] == ["notes"]
+    assert out["completed"][0]["entity"] == "venues"
+    assert out["completed"][0]["inserted"] == 2
+    assert "preview" not in out["completed"][0]
+    assert out["noop_resume"] is False
+
+
+def test_lambda_handler_import_all_reports_noop_resume(
+    mock_env: object,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="buck", MAX_IMPORT_DUMP_BYTES="2097152")
+
+    def _run(session: Any, importers: Any, source: Any, **kwargs: Any) -> Any:
+        return h.ImportAllResult(
+            run_key=kwargs["run_key"],
+            dry_run=kwargs["dry_run"],
+            already_completed=["venues", "notes"],
+        )
+
+    monkeypatch.setattr(h, "_download_dump", lambda *_a: "INSERT INTO district ...")
+    monkeypatch.setattr(h, "run_import_all", _run)
+    monkeypatch.setattr(h, "get_engine", MagicMock())
+
+    class _Sess:
+        def __init__(self, _e: object) -> None:
+            pass
+
+        def __enter__(self) -> MagicMock:
+            return MagicMock()
+
+        def __exit__(self, *a: object) -> None:
+            return None
+
+    monkeypatch.setattr(h, "Session", _Sess)
+    logger = MagicMock()
+    monkeypatch.setattr(h, "logger", logger)
+
+    out = h.lambda_handler(
+        {
+            "entity": "all",
+            "s3_bucket": "buck",
+            "s3_key": "dumps/all/1/all.sql",
+            "dry_run": False,
+            "run_key": "march",
+        },
+        MagicMock(aws_request_id="abc-def-123"),
+    )
+
+    assert out["run_key"] == "march"
+    assert out["noop_resume"] is True
+    assert out["already_completed"] == ["venues", "notes"]
+    logger.warning.assert_called_once()
+    assert logger.warning.call_args.args[1] == "march"
+
+
 @pytest.fixture(autouse=True)
 def _restore_importer_registry() -> Any:
     original = dict(_IMPORTERS)
@@ -78,4 +78,120 @@ def test_download_rejects_large(mock_env: object) -> None:
     s3.head_object.return_value = {"ContentLength": 99999}
     with patch.object(h, "get_s3_client", return_value=s3):
         with pytest.raises(ValueError, match="exceeds"):
-            h._download_dump("b", "k.sql", "req-1")
+            h._download_dump("b", "k.sql", "req-1", MagicMock())
+
+
+def test_validate_bulk_chunk_size_passthrough(mock_env: object) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    payload = h._validate_event(
+        {
+            "entity": "contacts",
+            "s3_bucket": "b",
+            "s3_key": "k",
+            "dry_run": False,
+            "bulk_chunk_size": 500,
+        },
+    )
+    assert payload["bulk_chunk_size"] == 500
+
+
+@pytest.mark.parametrize("value", [0, -1, "500", True])
+def test_validate_bulk_chunk_size_rejects_non_positive_int(
+    mock_env: object,
+    value: object,
+) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    with pytest.raises(ValueError, match="bulk_chunk_size"):
+        h._validate_event(
+            {
+                "entity": "venues",
+                "s3_bucket": "b",
+                "s3_key": "k",
+                "dry_run": False,
+                "bulk_chunk_size": value,
+            },
+        )
+
+
+def test_validate_bulk_chunk_size_unsupported_entity(
+    mock_env: object,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.imports import registry
+
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    # Every shipped importer supports bulk apply; simulate one that does not.
+    monkeypatch.setattr(type(registry.get("notes")), "SUPPORTS_BULK_APPLY", False)
+    with pytest.raises(ValueError, match="does not support bulk_chunk_size"):
+        h._validate_event(
+            {
+                "entity": "notes",
+                "s3_bucket": "b",
+                "s3_key": "k",
+                "dry_run": False,
+                "bulk_chunk_size": 500,
+            },
+        )
+
+
+def test_validate_import_all_leaves_run_key_unset(mock_env: object) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    payload = h._validate_event(
+        {
+            "entity": "all",
+            "s3_bucket": "b",
+            "s3_key": "dumps/all/1/all.sql",
+            "dry_run": False,
+            "bulk_chunk_size": 500,
+        },
+    )
+    assert payload["entity"] == "all"
+    assert payload["run_key"] is None
+
+
+def test_default_run_key_pins_version_or_etag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    h = _load_handler()
+    s3 = MagicMock()
+    monkeypatch.setattr(h, "get_s3_client", lambda: s3)
+
+    s3.head_object.return_value = {"VersionId": "v2", "ETag": '"abc"'}
+    assert h._default_run_key("b", "dumps/all.sql") == "dumps/all.sql@v2"
+    s3.head_object.return_value = {"VersionId": "null", "ETag": '"abc"'}
+    assert h._default_run_key("b", "dumps/all.sql") == "dumps/all.sql@abc"
+    s3.head_object.assert_called_with(Bucket="b", Key="dumps/all.sql")
+
+
+def test_validate_import_all_rejects_skip_legacy_keys(mock_env: object) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    with pytest.raises(ValueError, match="skip_legacy_keys"):
+        h._validate_event(
+            {
+                "entity": "all",
+                "s3_bucket": "b",
+                "s3_key": "k",
+                "dry_run": False,
+                "skip_legacy_keys": "1,2",
+            },
+        )
+
+
+def test_validate_run_key_requires_import_all(mock_env: object) -> None:
+    h = _load_handler()
+    mock_env(IMPORT_DUMP_BUCKET_NAME="b")
+    with pytest.raises(ValueError, match="run_key"):
+        h._validate_event(
+            {
+                "entity": "venues",
+                "s3_bucket": "b",
+                "s3_key": "k",
+                "dry_run": False,
+                "run_key": "r",
+            },
+        )
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import io
+import logging
+import threading
+import zipfile
 from datetime import date
+from types import SimpleNamespace
 from typing import Any
-from uuid import uuid4
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
 
 import pytest
 
 from app.api.admin_completion_certificates import (
+    _parse_batch_issue_payload,
     _parse_issue_payload,
     handle_admin_completion_certificates_request,
 )
 from app.exceptions import AppError, ValidationError
+from app.services import completion_certificate_batch
+from app.services.completion_certificate_batch import (
+    MAX_BATCH_CONTACTS,
+    build_certificate_zip,
+    issue_certificate_batch,
+    render_certificate_pdfs,
+)
+from app.services.completion_certificate_common import (
+    ResolvedCertificateDraft,
+    issued_pdf_s3_key,
+)
 from app.services.customer_billing import store_pdf_in_assets_bucket
 from app.services.completion_certificate_pdf import (
     build_certificate_body_text,
@@ -114,3 +132,194 @@ def test_handle_unknown_route_returns_404(api_gateway_event: Any) -> None:
         "/v1/admin/unknown",
     )
     assert response["statusCode"] == 404
+
+
+def _terms() -> dict[str, str]:
+    return {
+        "service_id": str(uuid4()),
+        "instance_id": str(uuid4()),
+        "participation_date": "2026-06-14",
+    }
+
+
+def test_parse_batch_issue_payload_dedupes_contact_ids() -> None:
+    first, second = uuid4(), uuid4()
+    parsed = _parse_batch_issue_payload(
+        {
+            **_terms(),
+            "contact_ids": [str(first), str(second), str(first)],
+            "include_zip": True,
+        }
+    )
+    assert parsed["contact_ids"] == [first, second]
+    assert parsed["include_zip"] is True
+    assert parsed["participation_date"] == date(2026, 6, 14)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "field"),
+    [
+        ({"contact_ids": []}, "contact_ids"),
+        ({"contact_ids": ["not-a-uuid"]}, "contact_ids[0]"),
+        (
+            {"contact_ids": [str(uuid4()) for _ in range(MAX_BATCH_CONTACTS + 1)]},
+            "contact_ids",
+        ),
+        ({"contact_ids": [str(uuid4())], "include_zip": "yes"}, "include_zip"),
+    ],
+)
+def test_parse_batch_issue_payload_rejects_invalid(
+    overrides: dict[str, Any], field: str
+) -> None:
+    with pytest.raises(ValidationError) as excinfo:
+        _parse_batch_issue_payload({**_terms(), **overrides})
+    assert excinfo.value.field == field
+
+
+def _pdf_context(name: str) -> CompletionCertificatePdfContext:
+    return CompletionCertificatePdfContext(
+        recipient_display_name=name,
+        program_title="Program",
+        participation_date=date(2026, 6, 14),
+        trading_name="Evolve Sprouts",
+        partner_display_name=None,
+        partner_signer_name=None,
+        es_founder_name="Ida De Gregorio",
+        body_text="Body",
+    )
+
+
+def test_render_certificate_pdfs_keeps_input_order_across_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        completion_certificate_batch,
+        "render_completion_certificate_pdf",
+        lambda ctx: f"pdf:{ctx.recipient_display_name}".encode(),
+    )
+    names = [f"recipient-{index}" for index in range(7)]
+
+    pdfs = render_certificate_pdfs(
+        [_pdf_context(name) for name in names], max_workers=3
+    )
+
+    assert pdfs == [f"pdf:{name}".encode() for name in names]
+
+
+def _draft(contact_id: UUID, name: str) -> ResolvedCertificateDraft:
+    return ResolvedCertificateDraft(
+        contact_id=contact_id,
+        instance_id=uuid4(),
+        service_id=uuid4(),
+        enrollment_id=uuid4(),
+        partner_organization_id=None,
+        participation_date=date(2026, 6, 14),
+        recipient_display_name=name,
+        program_title="Program",
+        partner_display_name=None,
+        partner_signer_name=None,
+        body_text="Body",
+        trading_name="Evolve Sprouts",
+        es_founder_name="Ida De Gregorio",
+    )
+
+
+def test_issue_certificate_batch_reports_per_contact_outcomes(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    issued_id, invalid_id, upload_failed_id = uuid4(), uuid4(), uuid4()
+    drafts = {
+        issued_id: _draft(issued_id, "Ada"),
+        invalid_id: ValidationError(
+            "Contact is not enrolled in this instance", field="contact_id"
+        ),
+        upload_failed_id: _draft(upload_failed_id, "Grace"),
+    }
+    monkeypatch.setattr(
+        completion_certificate_batch,
+        "resolve_certificate_drafts",
+        lambda _session, **_kwargs: drafts,
+    )
+    uploaded: list[str] = []
+    failing_keys: set[str] = set()
+
+    def _store(*, s3_key: str, **_kwargs: Any) -> None:
+        if s3_key in failing_keys:
+            raise AppError("S3 unavailable", status_code=502)
+        uploaded.append(s3_key)
+
+    monkeypatch.setattr(
+        completion_certificate_batch, "store_pdf_in_assets_bucket", _store
+    )
+    client_threads: list[int] = []
+    monkeypatch.setattr(
+        completion_certificate_batch,
+        "get_s3_client",
+        lambda: client_threads.append(threading.get_ident()),
+    )
+
+    session = MagicMock()
+    added: list[Any] = []
+
+    def _assign_ids() -> None:
+        for cert in added:
+            if cert.id is None:
+                cert.id = uuid4()
+                if cert.contact_id == upload_failed_id:
+                    failing_keys.add(issued_pdf_s3_key(cert.id))
+
+    session.add_all.side_effect = added.extend
+    session.flush.side_effect = _assign_ids
+
+    with caplog.at_level(logging.INFO):
+        result = issue_certificate_batch(
+            session,
+            contact_ids=list(drafts),
+            service_id=uuid4(),
+            instance_id=uuid4(),
+            participation_date=date(2026, 6, 14),
+            program_title_override=None,
+            partner_organization_id=None,
+            actor_sub="admin-sub",
+            render=lambda contexts: [
+                f"pdf:{ctx.recipient_display_name}".encode() for ctx in contexts
+            ],
+        )
+
+    by_contact = {outcome.contact_id: outcome for outcome in result.outcomes}
+    assert [outcome.contact_id for outcome in result.outcomes] == list(drafts)
+    issued = by_contact[issued_id].certificate
+    assert issued is not None
+    assert issued.issued_pdf_s3_key == uploaded[0]
+    assert issued.issued_pdf_sha256 is not None
+    assert by_contact[invalid_id].field == "contact_id"
+    assert by_contact[upload_failed_id].certificate is None
+    assert by_contact[upload_failed_id].error == "Certificate PDF upload failed"
+    assert result.pdfs == {issued_id: b"pdf:Ada"}
+    session.add_all.assert_called_once()
+    session.delete.assert_called_once()
+    assert session.delete.call_args.args[0].contact_id == upload_failed_id
+    assert client_threads == [threading.get_ident()]
+    (summary,) = [
+        r
+        for r in caplog.records
+        if r.getMessage() == "Issued completion certificate batch"
+    ]
+    assert (summary.requested, summary.issued, summary.failed) == (3, 1, 2)
+
+
+def test_build_certificate_zip_names_entries_by_recipient() -> None:
+    cert_id = uuid4()
+    archive = build_certificate_zip(
+        [
+            (SimpleNamespace(id=cert_id, recipient_display_name="Ada Lovelace"), b"a"),
+            (SimpleNamespace(id=cert_id, recipient_display_name="<>"), b"b"),
+        ]
+    )
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as opened:
+        assert opened.namelist() == [
+            f"Ada-Lovelace-{str(cert_id)[:8]}.pdf",
+            f"certificate-{str(cert_id)[:8]}.pdf",
+        ]
+        assert opened.read(f"Ada-Lovelace-{str(cert_id)[:8]}.pdf") == b"a"
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import Any
 from uuid import uuid4
 
 import pytest
 
-from app.api import admin_leads
+from app.api import admin_leads, admin_leads_export
 from app.api.admin_leads_common import parse_lead_filters
 from app.api.assets.assets_common import RequestIdentity
+from app.db.models import SalesLeadExportJobStatus
 from app.exceptions import ValidationError
 
 
@@ -95,6 +98,46 @@ def test_handle_admin_leads_dispatches_resource_patch(
     assert captured["actor_sub"] == admin_identity["userSub"]
 
 
+def test_serialize_lead_export_job_reuses_bucketed_link_across_polls(
+    monkeypatch: Any,
+) -> None:
+    polled_at = iter(
+        [
+            datetime(2026, 3, 1, 9, 0, 5, tzinfo=UTC),
+            datetime(2026, 3, 1, 9, 3, 55, tzinfo=UTC),
+        ]
+    )
+    signed: list[datetime] = []
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz: Any = None) -> datetime:  # type: ignore[override]
+            return next(polled_at)
+
+    def _fake_download_url(*, s3_key: str, expires_at: datetime) -> dict[str, Any]:
+        signed.append(expires_at)
+        return {"download_url": f"https://cdn/{s3_key}", "expires_at": ""}
+
+    monkeypatch.setattr(admin_leads_export, "datetime", _Clock)
+    monkeypatch.setattr(admin_leads_export, "generate_download_url", _fake_download_url)
+    job = SimpleNamespace(
+        id=uuid4(),
+        status=SalesLeadExportJobStatus.SUCCEEDED,
+        total_count=3,
+        exported_count=3,
+        error_message=None,
+        created_at=None,
+        updated_at=None,
+        s3_key="exports/leads.csv",
+    )
+
+    for _ in range(2):
+        admin_leads_export.serialize_lead_export_job(job)  # type: ignore[arg-type]
+
+    assert signed == [datetime(2026, 3, 1, 10, 5, tzinfo=UTC)] * 2
+    assert signed[0] - datetime(2026, 3, 1, 9, 3, 55, tzinfo=UTC) >= timedelta(hours=1)
+
+
 def test_handle_admin_leads_dispatches_note_creation(
     monkeypatch: Any,
     api_gateway_event: Any,
@@ -120,6 +163,47 @@ def test_handle_admin_leads_dispatches_note_creation(
     assert response is marker
 
 
+def test_handle_admin_leads_dispatches_export_job_poll(
+    monkeypatch: Any,
+    api_gateway_event: Any,
+    admin_identity: dict[str, str],
+) -> None:
+    marker = {"statusCode": 200, "body": "{}"}
+    captured: dict[str, Any] = {}
+    monkeypatch.setattr(
+        admin_leads,
+        "extract_identity",
+        lambda _: _build_admin_identity(admin_identity),
+    )
+
+    def _fake_get(_event: Any, *, job_id: Any, actor_sub: str) -> dict[str, Any]:
+        captured["job_id"] = job_id
+        captured["actor_sub"] = actor_sub
+        return marker
+
+    monkeypatch.setattr(admin_leads, "get_lead_export_job", _fake_get)
+    monkeypatch.setattr(
+        admin_leads, "create_lead_export_job", lambda *_args, **_kwargs: marker
+    )
+    job_id = str(uuid4())
+
+    created = admin_leads.handle_admin_leads_request(
+        api_gateway_event(method="POST", path="/v1/admin/leads/export-jobs"),
+        "POST",
+        "/v1/admin/leads/export-jobs",
+    )
+    response = admin_leads.handle_admin_leads_request(
+        api_gateway_event(method="GET", path=f"/v1/admin/leads/export-jobs/{job_id}"),
+        "GET",
+        f"/v1/admin/leads/export-jobs/{job_id}",
+    )
+
+    assert created is marker
+    assert response is marker
+    assert str(captured["job_id"]) == job_id
+    assert captured["actor_sub"] == admin_identity["userSub"]
+
+
 def test_parse_lead_filters_defaults_to_standard_admin_limit(
     api_gateway_event: Any,
 ) -> None:
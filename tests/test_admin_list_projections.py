@@ -0,0 +1,250 @@
+"""Tests for the single-query admin contacts / families / organizations lists."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.api import admin_contacts
+from app.api.admin_entities_serializers import (
+    serialize_contact_summary,
+    serialize_contact_summary_row,
+    serialize_family_summary,
+    serialize_family_summary_row,
+)
+from app.db.models.enums import (
+    ContactSource,
+    ContactType,
+    FamilyRole,
+    MailchimpSyncStatus,
+    RelationshipType,
+)
+from app.db.repositories.contact import ContactRepository
+
+_NOW = datetime(2026, 5, 1, 9, 30, tzinfo=UTC)
+
+
+def _location() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name="Studio",
+        area_id=uuid4(),
+        area=SimpleNamespace(name="Central"),
+        address="1 Queen's Road",
+        lat=Decimal("22.281000"),
+        lng=Decimal("114.158000"),
+    )
+
+
+def _venue_json(location: SimpleNamespace) -> dict[str, Any]:
+    """What ``location_venue_object`` yields once the driver decodes the JSON."""
+    return {
+        "id": str(location.id),
+        "name": location.name,
+        "area_id": str(location.area_id),
+        "area_name": location.area.name,
+        "address": location.address,
+        "lat": float(location.lat),
+        "lng": float(location.lng),
+    }
+
+
+def test_contact_summary_row_matches_orm_serializer() -> None:
+    location = _location()
+    family_location = _location()
+    tags = [
+        SimpleNamespace(id=uuid4(), name="vip", color="#ff0000"),
+        SimpleNamespace(id=uuid4(), name="Alumni", color=None),
+    ]
+    family = SimpleNamespace(
+        id=uuid4(), location_id=family_location.id, location=family_location
+    )
+    organization_id = uuid4()
+    columns = {
+        "id": uuid4(),
+        "email": "ada@example.com",
+        "instagram_handle": None,
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "phone_region": "HK",
+        "phone_national_number": "91234567",
+        "contact_type": ContactType.PARENT,
+        "relationship_type": RelationshipType.CLIENT,
+        "date_of_birth": date(1990, 12, 10),
+        "location_id": location.id,
+        "source": ContactSource.REFERRAL,
+        "source_detail": "friend",
+        "source_metadata": {"referral_contact_id": str(uuid4())},
+        "mailchimp_status": MailchimpSyncStatus.PENDING,
+        "archived_at": None,
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+    contact = SimpleNamespace(
+        **columns,
+        phone_e164="+85291234567",
+        location=location,
+        contact_tags=[SimpleNamespace(tag=tag) for tag in tags],
+        family_members=[SimpleNamespace(family_id=family.id, family=family)],
+        organization_members=[
+            SimpleNamespace(
+                organization_id=organization_id,
+                organization=SimpleNamespace(
+                    id=organization_id, location_id=None, location=None
+                ),
+            )
+        ],
+    )
+    row = {
+        **columns,
+        "tags": [
+            {"id": str(tag.id), "name": tag.name, "color": tag.color} for tag in tags
+        ],
+        "family_ids": [str(family.id)],
+        "organization_ids": [str(organization_id)],
+        "location_summary": _venue_json(location),
+        "family_location_summary": _venue_json(family_location),
+        "organization_location_summary": None,
+        "standalone_note_count": 2,
+        "has_completion_certificate": True,
+    }
+
+    assert serialize_contact_summary_row(row) == serialize_contact_summary(
+        contact, standalone_note_count=2, has_completion_certificate=True
+    )
+
+
+def test_family_summary_row_matches_orm_serializer() -> None:
+    tag = SimpleNamespace(id=uuid4(), name="Weekend", color=None)
+    members = [
+        SimpleNamespace(
+            id=uuid4(),
+            contact_id=uuid4(),
+            contact=SimpleNamespace(first_name="Zoe", last_name=None, email=None),
+            role=FamilyRole.CHILD,
+            is_primary_contact=False,
+        ),
+        SimpleNamespace(
+            id=uuid4(),
+            contact_id=uuid4(),
+            contact=SimpleNamespace(first_name="", last_name="", email="p@x.com"),
+            role=FamilyRole.PARENT,
+            is_primary_contact=True,
+        ),
+    ]
+    columns = {
+        "id": uuid4(),
+        "family_name": "Chan",
+        "relationship_type": RelationshipType.PROSPECT,
+        "location_id": None,
+        "archived_at": None,
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+    family = SimpleNamespace(
+        **columns,
+        location=None,
+        family_tags=[SimpleNamespace(tag=tag)],
+        family_members=members,
+    )
+    row = {
+        **columns,
+        "tags": [{"id": str(tag.id), "name": tag.name, "color": None}],
+        "members": [
+            {
+                "id": str(m.id),
+                "contact_id": str(m.contact_id),
+                "first_name": m.contact.first_name,
+                "last_name": m.contact.last_name,
+                "email": m.contact.email,
+                "role": m.role.value,
+                "is_primary_contact": m.is_primary_contact,
+            }
+            for m in members
+        ],
+        "location_summary": None,
+    }
+
+    assert serialize_family_summary_row(row) == serialize_family_summary(family)
+
+
+def test_contact_list_projection_is_one_lateral_statement() -> None:
+    session = MagicMock()
+
+    ContactRepository(session).list_summaries_for_admin(
+        limit=26, cursor=uuid4(), query="ada", active=True
+    )
+
+    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert sql.count("JOIN LATERAL") == 3
+    assert "json_agg" in sql
+    assert "AS total_count" in sql
+    assert "AS standalone_note_count" in sql
+    assert "AS has_completion_certificate" in sql
+
+
+def test_list_contacts_uses_projection_total_and_counts_empty_pages(
+    monkeypatch: Any,
+    api_gateway_event: Any,
+) -> None:
+    calls: list[str] = []
+    pages: list[list[dict[str, Any]]] = [
+        [{"id": uuid4(), "total_count": 7}, {"id": uuid4(), "total_count": 7}],
+        [],
+    ]
+
+    class _FakeRepo:
+        def __init__(self, _session: object) -> None:
+            pass
+
+        def list_summaries_for_admin(self, **kwargs: Any) -> list[dict[str, Any]]:
+            calls.append("list")
+            return pages.pop(0)
+
+        def count_for_admin(self, **kwargs: Any) -> int:
+            calls.append("count")
+            return 3
+
+    class _FakeSessionCtx:
+        def __enter__(self) -> object:
+            return object()
+
+        def __exit__(self, *args: object) -> None:
+            return None
+
+    monkeypatch.setattr(admin_contacts, "ContactRepository", _FakeRepo)
+    monkeypatch.setattr(admin_contacts, "Session", lambda _engine: _FakeSessionCtx())
+    monkeypatch.setattr(admin_contacts, "get_engine", lambda: object())
+    monkeypatch.setattr(
+        admin_contacts, "serialize_contact_summary_row", lambda row: str(row["id"])
+    )
+    monkeypatch.setattr(
+        admin_contacts,
+        "extract_identity",
+        lambda _event: type("Identity", (), {"user_sub": "admin-sub"})(),
+    )
+    event = api_gateway_event(
+        method="GET", path="/v1/admin/contacts", query_params={"limit": "1"}
+    )
+
+    first = admin_contacts.handle_admin_contacts_request(
+        event, "GET", "/v1/admin/contacts"
+    )
+    empty = admin_contacts.handle_admin_contacts_request(
+        event, "GET", "/v1/admin/contacts"
+    )
+
+    first_body = json.loads(first["body"])
+    assert len(first_body["items"]) == 1
+    assert first_body["next_cursor"] is not None
+    assert first_body["total_count"] == 7
+    assert json.loads(empty["body"])["total_count"] == 3
+    assert calls == ["list", "list", "count"]
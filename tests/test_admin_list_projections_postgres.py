@@ -0,0 +1,188 @@
+"""PostgreSQL integration: admin contacts list projection vs the ORM load path.
+
+Seeds a page of contacts with tags, a located family, an organization and a
+note, then compares statement counts for one list page: the projection must be
+a single round trip and serialize identically to ``serialize_contact_summary``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from tests.helpers.db import database_url
+from app.api.admin_entities_serializers import (
+    serialize_contact_summary,
+    serialize_contact_summary_row,
+)
+from app.db.models import (
+    Contact,
+    ContactTag,
+    Family,
+    FamilyMember,
+    GeographicArea,
+    Location,
+    Note,
+    Organization,
+    OrganizationMember,
+    Tag,
+)
+from app.db.models.enums import (
+    ContactSource,
+    ContactType,
+    FamilyRole,
+    OrganizationRole,
+    OrganizationType,
+    RelationshipType,
+)
+from app.db.repositories.contact import ContactRepository
+from app.services.completion_certificate_common import (
+    contact_ids_with_issued_certificates,
+)
+
+psycopg = pytest.importorskip(
+    "psycopg", reason="psycopg required for DB integration test"
+)
+
+_PAGE_SIZE = 25
+
+
+def _sqlalchemy_engine_url(url: str) -> str:
+    """Use psycopg v3; bare ``postgresql://`` defaults to psycopg2 in SQLAlchemy."""
+    if url.startswith("postgresql+") or url.startswith("postgres+"):
+        return url
+    if url.startswith("postgresql://"):
+        return "postgresql+psycopg://" + url.removeprefix("postgresql://")
+    if url.startswith("postgres://"):
+        return "postgresql+psycopg://" + url.removeprefix("postgres://")
+    return url
+
+
+def _seed(session: Any, run: str) -> None:
+    area = GeographicArea(
+        id=uuid4(),
+        parent_id=None,
+        name="Projection Area",
+        name_translations={},
+        level="country",
+        code="HK",
+        active=True,
+        display_order=0,
+        sovereign_country_id=None,
+    )
+    location = Location(id=uuid4(), area_id=area.id, name="Hall", address="1 Bench St")
+    tags = [Tag(name=f"{run}-{label}", created_by="pytest") for label in "ab"]
+    organization = Organization(
+        name=f"{run} School",
+        organization_type=OrganizationType.SCHOOL,
+        relationship_type=RelationshipType.CLIENT,
+        location_id=location.id,
+    )
+    session.add_all([area, location, *tags, organization])
+    session.flush()
+    for index in range(_PAGE_SIZE):
+        contact = Contact(
+            first_name=f"{run}-{index}",
+            email=f"{run}-{index}@example.com",
+            contact_type=ContactType.PARENT,
+            source=ContactSource.MANUAL,
+        )
+        family = Family(family_name=f"{run} family {index}", location_id=location.id)
+        session.add_all([contact, family])
+        session.flush()
+        session.add_all(
+            [
+                *(ContactTag(contact_id=contact.id, tag_id=tag.id) for tag in tags),
+                FamilyMember(
+                    family_id=family.id, contact_id=contact.id, role=FamilyRole.PARENT
+                ),
+                OrganizationMember(
+                    organization_id=organization.id,
+                    contact_id=contact.id,
+                    role=OrganizationRole.STAFF,
+                ),
+                Note(contact_id=contact.id, content="hello", created_by="pytest"),
+            ]
+        )
+    session.commit()
+
+
+def _orm_list_page(session: Any, run: str) -> list[dict[str, Any]]:
+    """The previous list path: selectinload chains, then per-page lookups."""
+    contacts = list(
+        session.execute(
+            select(Contact)
+            .where(Contact.first_name.startswith(f"{run}-"))
+            .options(
+                selectinload(Contact.contact_tags).selectinload(ContactTag.tag),
+                selectinload(Contact.family_members)
+                .selectinload(FamilyMember.family)
+                .selectinload(Family.location)
+                .selectinload(Location.area),
+                selectinload(Contact.organization_members)
+                .selectinload(OrganizationMember.organization)
+                .selectinload(Organization.location)
+                .selectinload(Location.area),
+                selectinload(Contact.location).selectinload(Location.area),
+            )
+            .order_by(Contact.created_at.desc(), Contact.id.desc())
+        )
+        .scalars()
+        .all()
+    )
+    repository = ContactRepository(session)
+    repository.count_for_admin(query=run)
+    ids = [contact.id for contact in contacts]
+    note_counts = repository.count_standalone_notes_for_contacts(ids)
+    certified = contact_ids_with_issued_certificates(session, ids)
+    return [
+        serialize_contact_summary(
+            contact,
+            standalone_note_count=note_counts.get(contact.id, 0),
+            has_completion_certificate=contact.id in certified,
+        )
+        for contact in contacts
+    ]
+
+
+@pytest.mark.skipif(database_url() is None, reason="TEST_DATABASE_URL not set")
+def test_contact_list_projection_is_one_round_trip_with_same_payload() -> None:
+    url = database_url()
+    assert url is not None
+    engine = create_engine(_sqlalchemy_engine_url(url))
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    run = f"proj{uuid4().hex[:8]}"
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, *_args) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    with SessionLocal() as session:
+        _seed(session, run)
+
+    statements.clear()
+    with SessionLocal() as session:
+        orm_items = _orm_list_page(session, run)
+    orm_statements = len(statements)
+
+    statements.clear()
+    with SessionLocal() as session:
+        rows = ContactRepository(session).list_summaries_for_admin(
+            limit=_PAGE_SIZE, query=run
+        )
+        projected_items = [serialize_contact_summary_row(row) for row in rows]
+    projection_statements = len(statements)
+
+    print(
+        f"\nadmin contacts page ({_PAGE_SIZE} rows): "
+        f"ORM path {orm_statements} statements, projection {projection_statements}"
+    )
+    assert projection_statements == 1
+    assert orm_statements >= 10
+    assert rows[0]["total_count"] == _PAGE_SIZE
+    assert projected_items == orm_items
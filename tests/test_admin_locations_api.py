@@ -150,3 +150,62 @@ def test_serialize_location_partner_metadata() -> None:
     assert payload["locked_from_partner_org"] is True
     assert payload["partner_organization_labels"] == ["Alpha Partners", "Beta Co"]
     assert payload["partner_organization_ids"] == [str(org_a), str(org_b)]
+
+
+def test_geocode_location_calls_provider_with_no_session_open(
+    monkeypatch: Any,
+    api_gateway_event: Any,
+) -> None:
+    open_sessions: list[object] = []
+    stored: list[Any] = []
+
+    class _Session:
+        def __init__(self, _engine: Any) -> None:
+            pass
+
+        def __enter__(self) -> _Session:
+            open_sessions.append(self)
+            return self
+
+        def __exit__(self, *_exc: Any) -> None:
+            open_sessions.remove(self)
+
+    def _fetch(*, address: str, country_iso_codes: Any) -> Any:
+        assert open_sessions == []
+        return 22.3, 114.17, f"Found {address}"
+
+    monkeypatch.setattr(admin_locations, "Session", _Session)
+    monkeypatch.setattr(admin_locations, "get_engine", lambda: None)
+    monkeypatch.setattr(
+        admin_locations,
+        "GeographicAreaRepository",
+        lambda _session: SimpleNamespace(get_by_id=lambda _id: object()),
+    )
+    monkeypatch.setattr(
+        admin_locations, "country_codes_for_area", lambda _session, _id: ["HK"]
+    )
+    monkeypatch.setattr(admin_locations, "cached_geocode", lambda _s, **_kw: None)
+    monkeypatch.setattr(admin_locations, "fetch_geocode", _fetch)
+    monkeypatch.setattr(
+        admin_locations,
+        "store_geocode",
+        lambda session, **kwargs: stored.append((session in open_sessions, kwargs)),
+    )
+    body = json.dumps({"address": "1 Queen's Road", "area_id": str(uuid4())})
+
+    response = admin_locations._geocode_location(
+        api_gateway_event(method="POST", path="/v1/admin/locations/geocode", body=body)
+    )
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["display_name"] == "Found 1 Queen's Road"
+    assert stored == [
+        (
+            True,
+            {
+                "address": "1 Queen's Road",
+                "country_iso_codes": ["HK"],
+                "result": (22.3, 114.17, "Found 1 Queen's Road"),
+            },
+        )
+    ]
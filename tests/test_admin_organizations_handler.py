@@ -265,7 +265,7 @@ def test_list_organizations_default_excludes_vendors_from_repository_filter(
         def __init__(self, _session: object) -> None:
             pass
 
-        def list_organizations(self, **kwargs: Any) -> list[object]:
+        def list_organization_summaries(self, **kwargs: Any) -> list[object]:
             captured["list"] = kwargs
             return []
 
@@ -315,7 +315,7 @@ def test_list_organizations_vendor_query_sets_vendor_filter_and_skips_relationsh
         def __init__(self, _session: object) -> None:
             pass
 
-        def list_organizations(self, **kwargs: Any) -> list[object]:
+        def list_organization_summaries(self, **kwargs: Any) -> list[object]:
             captured["list"] = kwargs
             return []
 
@@ -367,7 +367,7 @@ def test_list_organizations_sort_name_sets_name_asc_list_order(
         def __init__(self, _session: object) -> None:
             pass
 
-        def list_organizations(self, **kwargs: Any) -> list[object]:
+        def list_organization_summaries(self, **kwargs: Any) -> list[object]:
             captured["list"] = kwargs
             return []
 
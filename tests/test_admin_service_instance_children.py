@@ -0,0 +1,161 @@
+"""Tests for the keyed session-slot / ticket-tier merge on instance updates."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.api.admin_service_instance_children import (
+    ChildRowChanges,
+    merge_session_slots,
+    merge_ticket_tiers,
+)
+from app.db.base import Base
+from app.db.models import EventTicketTier, InstanceSessionSlot, ServiceInstance
+
+_START = datetime(2026, 7, 1, 10, 0, tzinfo=UTC)
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_json(_type, _compiler, **_kw) -> str:  # type: ignore[no-untyped-def]
+    return "JSON"
+
+
+def _session(statements: list[str]) -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _pg_functions(dbapi_conn, _record) -> None:  # type: ignore[no-untyped-def]
+        dbapi_conn.create_function("now", 0, lambda: "2026-01-01 00:00:00")
+        dbapi_conn.create_function("gen_random_uuid", 0, lambda: uuid.uuid4().hex)
+
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            ServiceInstance.__table__,
+            InstanceSessionSlot.__table__,
+            EventTicketTier.__table__,
+        ],
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(_conn, _cursor, statement, *_args) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    # SQLite drops tzinfo on reload; keep the aware values the API would compare.
+    return Session(engine, expire_on_commit=False)
+
+
+def _writes(statements: list[str]) -> list[str]:
+    return [
+        " ".join(statement.split()[:3])
+        for statement in statements
+        if statement.split()[0] in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+def _slot(index: int, *, hours: int = 2) -> dict[str, Any]:
+    starts_at = _START + timedelta(days=index)
+    return {
+        "location_id": None,
+        "starts_at": starts_at,
+        "ends_at": starts_at + timedelta(hours=hours),
+        "sort_order": index,
+    }
+
+
+def _tier(index: int, *, price: str = "100") -> dict[str, Any]:
+    return {
+        "name": f"Tier {index}",
+        "description": None,
+        "price": Decimal(price),
+        "currency": "HKD",
+        "max_quantity": None,
+        "sort_order": index,
+    }
+
+
+def _seeded(statements: list[str]) -> tuple[Session, ServiceInstance]:
+    session = _session(statements)
+    instance = ServiceInstance(
+        service_id=uuid.uuid4(),
+        title="Workshop",
+        slug="workshop",
+        delivery_mode="in_person",
+        created_by="admin",
+    )
+    session.add(instance)
+    merge_session_slots(instance, [_slot(0), _slot(1), _slot(2)])
+    merge_ticket_tiers(instance, [_tier(0), _tier(1, price="150.00")])
+    session.commit()
+    statements.clear()
+    return session, instance
+
+
+def test_unchanged_save_issues_no_child_writes() -> None:
+    statements: list[str] = []
+    session, instance = _seeded(statements)
+    slot_ids = [slot.id for slot in instance.session_slots]
+    tier_ids = [tier.id for tier in instance.ticket_tiers]
+
+    slot_changes = merge_session_slots(instance, [_slot(0), _slot(1), _slot(2)])
+    tier_changes = merge_ticket_tiers(instance, [_tier(0), _tier(1, price="150")])
+    session.commit()
+
+    assert slot_changes == ChildRowChanges(unchanged=3)
+    assert tier_changes == ChildRowChanges(unchanged=2)
+    assert _writes(statements) == []
+    assert [slot.id for slot in instance.session_slots] == slot_ids
+    assert [tier.id for tier in instance.ticket_tiers] == tier_ids
+
+
+def test_edit_writes_only_changed_rows() -> None:
+    statements: list[str] = []
+    session, instance = _seeded(statements)
+    kept_slot_ids = [slot.id for slot in instance.session_slots][:2]
+    tier_ids = [tier.id for tier in instance.ticket_tiers]
+
+    slot_changes = merge_session_slots(instance, [_slot(0), _slot(1, hours=3)])
+    tier_changes = merge_ticket_tiers(
+        instance, [_tier(0), _tier(1, price="150"), _tier(2)]
+    )
+    session.commit()
+
+    assert slot_changes == ChildRowChanges(updated=1, deleted=1, unchanged=1)
+    assert tier_changes == ChildRowChanges(inserted=1, unchanged=2)
+    assert sorted(_writes(statements)) == [
+        "DELETE FROM instance_session_slots",
+        "INSERT INTO event_ticket_tiers",
+        "UPDATE instance_session_slots SET",
+    ]
+    assert [slot.id for slot in instance.session_slots] == kept_slot_ids
+    assert [tier.id for tier in instance.ticket_tiers][:2] == tier_ids
+
+
+def test_payload_ids_take_precedence_over_sort_order() -> None:
+    statements: list[str] = []
+    session, instance = _seeded(statements)
+    first, second = sorted(instance.ticket_tiers, key=lambda tier: tier.sort_order)
+
+    # Swap the two tiers' positions; ids keep each row attached to its data.
+    changes = merge_ticket_tiers(
+        instance,
+        [
+            {**_tier(1, price="150"), "id": first.id, "name": "Tier 0"},
+            {**_tier(0), "id": second.id, "name": "Tier 1"},
+        ],
+    )
+    session.commit()
+
+    assert changes == ChildRowChanges(updated=2)
+    assert (first.sort_order, first.name) == (1, "Tier 0")
+    assert (second.sort_order, second.name) == (0, "Tier 1")
+    # Both rows are updated in place (batched into one executemany).
+    assert set(_writes(statements)) == {"UPDATE event_ticket_tiers SET"}
@@ -0,0 +1,49 @@
+"""Tests for the shared boto3 client factory."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from app.services import aws_clients
+
+
+@pytest.fixture(autouse=True)
+def _clear_clients() -> Iterator[None]:
+    aws_clients.clear_client_cache()
+    yield
+    aws_clients.clear_client_cache()
+
+
+class _SlowSession:
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.created: list[tuple[str, str | None]] = []
+        self._lock = threading.Lock()
+
+    def client(self, service: str, region_name: str | None = None) -> Any:
+        time.sleep(0.01)
+        with self._lock:
+            self.created.append((service, region_name))
+        return object()
+
+
+def test_concurrent_first_calls_build_one_client_from_one_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _SlowSession.instances = 0
+    monkeypatch.setattr(aws_clients.boto3.session, "Session", _SlowSession)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: aws_clients.get_s3_client(), range(16)))
+
+    assert _SlowSession.instances == 1
+    assert len({id(client) for client in clients}) == 1
+    assert aws_clients._SESSION.created == [("s3", None)]
+    assert aws_clients.get_ses_client("ap-southeast-1") is not clients[0]
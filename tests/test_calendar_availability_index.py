@@ -0,0 +1,204 @@
+"""Tests for the precomputed calendar availability bitmap."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services import calendar_availability_index as index
+from app.services.public_calendar_availability import (
+    _PUBLIC_AVAILABILITY_SPECS,
+    AvailabilityPurpose,
+    AvailabilitySpec,
+)
+
+_HKT = ZoneInfo("Asia/Hong_Kong")
+# Monday 2026-05-04 10:00 HKT.
+_NOW = datetime(2026, 5, 4, 10, 0, tzinfo=_HKT).astimezone(UTC)
+
+_CONSULTATION = _PUBLIC_AVAILABILITY_SPECS[AvailabilityPurpose.CONSULTATION_BOOKING]
+_INTRO = _PUBLIC_AVAILABILITY_SPECS[AvailabilityPurpose.INTRO_CALL_BOOKING]
+
+
+def _hkt(day: date, hour: int, minute: int = 0) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=_HKT).astimezone(
+        UTC
+    )
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE calendar_availability_indexes ("
+                "purpose TEXT PRIMARY KEY, wall_time_zone TEXT, start_date DATE, "
+                "bitmap BLOB NOT NULL DEFAULT x'', dirty_from DATE, dirty_to DATE, "
+                "stale BOOLEAN NOT NULL DEFAULT 1, built_at TIMESTAMP)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO calendar_availability_indexes (purpose) "
+                "VALUES ('consultation_booking'), ('intro_call_booking')"
+            )
+        )
+    with Session(engine) as s:
+        yield s
+
+
+@pytest.fixture
+def busy(monkeypatch: pytest.MonkeyPatch) -> list[tuple[datetime, datetime]]:
+    """Mutable busy-interval list both compute algorithms read."""
+    intervals: list[tuple[datetime, datetime]] = []
+
+    def _busy(*_a: object, **_k: object) -> list[tuple[datetime, datetime]]:
+        return sorted(intervals)
+
+    monkeypatch.setattr(
+        "app.services.public_calendar_availability.busy_intervals_utc", _busy
+    )
+    monkeypatch.setattr("app.services.intro_call_slots.busy_intervals_utc", _busy)
+    return intervals
+
+
+class _CountingSpec:
+    def __init__(self, spec: AvailabilitySpec) -> None:
+        self.calls: list[tuple[date, date]] = []
+        self.original = spec
+        self.spec = dataclasses.replace(spec, compute=self._compute)
+
+    def _compute(
+        self, session: Session, from_date: date, to_date: date, now: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        self.calls.append((from_date, to_date))
+        return self.original.compute(session, from_date, to_date, now)
+
+
+@pytest.mark.parametrize("spec", [_CONSULTATION, _INTRO], ids=lambda s: s.purpose)
+def test_index_matches_current_algorithm(
+    session: Session,
+    busy: list[tuple[datetime, datetime]],
+    spec: AvailabilitySpec,
+) -> None:
+    busy.append((_hkt(date(2026, 5, 6), 9), _hkt(date(2026, 5, 6), 11)))
+    busy.append((_hkt(date(2026, 5, 12), 15), _hkt(date(2026, 5, 12), 16)))
+    from_date = date(2026, 5, 4)
+    to_date = from_date + timedelta(days=spec.window.default_horizon_days)
+
+    for now in (_NOW, _NOW + timedelta(hours=5), _NOW + timedelta(minutes=50)):
+        expected = spec.compute(session, from_date, to_date, now)
+        assert index.load_available_slots(session, spec, from_date, to_date, now) == (
+            expected
+        )
+
+
+def test_fresh_index_answers_without_compute(
+    session: Session, busy: list[tuple[datetime, datetime]]
+) -> None:
+    counting = _CountingSpec(_INTRO)
+    from_date, to_date = date(2026, 5, 4), date(2026, 5, 25)
+    index.load_available_slots(session, counting.spec, from_date, to_date, _NOW)
+    counting.calls.clear()
+
+    index.load_available_slots(session, counting.spec, from_date, to_date, _NOW)
+
+    assert counting.calls == []
+
+
+def test_dirty_range_rebuilds_only_those_days(
+    session: Session, busy: list[tuple[datetime, datetime]]
+) -> None:
+    counting = _CountingSpec(_CONSULTATION)
+    day = date(2026, 5, 20)
+    from_date, to_date = date(2026, 5, 4), date(2026, 6, 30)
+    before = index.load_available_slots(
+        session, counting.spec, from_date, to_date, _NOW
+    )
+    counting.calls.clear()
+    busy.append((_hkt(day, 9), _hkt(day, 10)))
+    # What the instance_session_slots row trigger records (UTC dates +/- 1 day).
+    session.execute(
+        text(
+            "UPDATE calendar_availability_indexes "
+            "SET dirty_from = '2026-05-19', dirty_to = '2026-05-21'"
+        )
+    )
+    session.commit()
+
+    after = index.load_available_slots(session, counting.spec, from_date, to_date, _NOW)
+
+    assert counting.calls == [(date(2026, 5, 19), date(2026, 5, 21))]
+    assert (_hkt(day, 9), _hkt(day, 12)) in before
+    assert (_hkt(day, 9), _hkt(day, 12)) not in after
+    assert after == _CONSULTATION.compute(session, from_date, to_date, _NOW)
+
+
+def test_day_rollover_builds_only_new_tail(
+    session: Session, busy: list[tuple[datetime, datetime]]
+) -> None:
+    counting = _CountingSpec(_INTRO)
+    index.load_available_slots(
+        session, counting.spec, date(2026, 5, 4), date(2026, 5, 25), _NOW
+    )
+    counting.calls.clear()
+    tomorrow = _NOW + timedelta(days=1)
+
+    slots = index.load_available_slots(
+        session, counting.spec, date(2026, 5, 5), date(2026, 5, 26), tomorrow
+    )
+
+    last = date(2026, 5, 5) + timedelta(days=index.index_horizon_days(_INTRO))
+    assert counting.calls == [(last, last)]
+    assert slots == _INTRO.compute(
+        session, date(2026, 5, 5), date(2026, 5, 26), tomorrow
+    )
+
+
+def test_range_past_horizon_falls_back_to_compute(
+    session: Session, busy: list[tuple[datetime, datetime]]
+) -> None:
+    counting = _CountingSpec(_CONSULTATION)
+    from_date = date(2026, 6, 1)
+    to_date = from_date + timedelta(days=120)
+
+    index.load_available_slots(session, counting.spec, from_date, to_date, _NOW)
+
+    assert counting.calls == [(from_date, to_date)]
+    stale = session.execute(
+        text(
+            "SELECT stale FROM calendar_availability_indexes "
+            "WHERE purpose = 'consultation_booking'"
+        )
+    ).scalar_one()
+    assert stale
+
+
+def test_verify_mismatch_serves_computed_and_marks_stale(
+    session: Session,
+    busy: list[tuple[datetime, datetime]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from_date, to_date = date(2026, 5, 4), date(2026, 5, 29)
+    index.load_available_slots(session, _CONSULTATION, from_date, to_date, _NOW)
+    # A change the triggers did not record: the index is now wrong.
+    busy.append((_hkt(date(2026, 5, 14), 14), _hkt(date(2026, 5, 14), 15)))
+    monkeypatch.setenv("CALENDAR_AVAILABILITY_INDEX_VERIFY_RATE", "1")
+
+    slots = index.load_available_slots(session, _CONSULTATION, from_date, to_date, _NOW)
+
+    assert slots == _CONSULTATION.compute(session, from_date, to_date, _NOW)
+    stale = session.execute(
+        text(
+            "SELECT stale FROM calendar_availability_indexes "
+            "WHERE purpose = 'consultation_booking'"
+        )
+    ).scalar_one()
+    assert stale
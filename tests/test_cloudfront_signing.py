@@ -1,13 +1,47 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from typing import Any
+from urllib.parse import urlsplit
 
 import pytest
 
+from app.api.assets.assets_common import generate_list_download_urls
 from app.exceptions import ConfigurationError
 from app.services import cloudfront_signing
 
+_SECRET_ARN = "arn:aws:secretsmanager:ap-southeast-1:111111111111:secret:cf/private"
+
+
+@pytest.fixture(autouse=True)
+def _clear_signing_caches() -> Iterator[None]:
+    cloudfront_signing.clear_signer_cache()
+    yield
+    cloudfront_signing.clear_signer_cache()
+
+
+class _CountingSigner:
+    def __init__(self) -> None:
+        self.signatures = 0
+
+    def generate_presigned_url(
+        self,
+        url: str,
+        date_less_than: datetime | None = None,
+    ) -> str:
+        self.signatures += 1
+        return f"{url}?Expires=1&Signature=S{self.signatures}&Key-Pair-Id=K"
+
+
+def _configure_signing(monkeypatch: Any, signer: Any) -> None:
+    monkeypatch.setenv(
+        "ASSET_DOWNLOAD_CLOUDFRONT_DOMAIN", "d111111abcdef8.cloudfront.net"
+    )
+    monkeypatch.setenv("ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID", "K123EXAMPLE")
+    monkeypatch.setenv("ASSET_DOWNLOAD_CLOUDFRONT_PRIVATE_KEY_SECRET_ARN", _SECRET_ARN)
+    monkeypatch.setattr(cloudfront_signing, "_get_signer", lambda **_: signer)
+
 
 def test_generate_signed_download_url_uses_cloudfront_signer(
     monkeypatch: Any,
@@ -156,3 +190,65 @@ def test_generate_signed_download_url_requires_configured_env(monkeypatch: Any)
             s3_key="assets/doc.pdf",
             expires_at=datetime(2035, 1, 1, 12, 0, tzinfo=UTC),
         )
+
+
+def test_generate_signed_download_url_memoizes_per_key_and_expiry(
+    monkeypatch: Any,
+) -> None:
+    signer = _CountingSigner()
+    _configure_signing(monkeypatch, signer)
+    expires_at = datetime(2035, 1, 1, 12, 0, tzinfo=UTC)
+
+    first = cloudfront_signing.generate_signed_download_url(
+        s3_key="assets/a.pdf", expires_at=expires_at
+    )
+    again = cloudfront_signing.generate_signed_download_url(
+        s3_key="assets/a.pdf", expires_at=expires_at
+    )
+    cloudfront_signing.generate_signed_download_url(
+        s3_key="assets/a.pdf", expires_at=expires_at, cache_bust_key="2"
+    )
+    cloudfront_signing.generate_signed_download_url(
+        s3_key="assets/a.pdf", expires_at=datetime(2035, 1, 1, 13, 0, tzinfo=UTC)
+    )
+
+    assert first == again
+    assert signer.signatures == 3
+
+
+def test_bucket_expiry_rounds_up_to_configured_granularity(
+    monkeypatch: Any,
+) -> None:
+    monkeypatch.setenv("ASSET_DOWNLOAD_URL_EXPIRY_BUCKET_SECONDS", "3600")
+    early = datetime(2035, 1, 1, 12, 0, 1, tzinfo=UTC)
+    late = datetime(2035, 1, 1, 12, 59, 59, tzinfo=UTC)
+    on_boundary = datetime(2035, 1, 1, 12, 0, tzinfo=UTC)
+
+    assert cloudfront_signing.bucket_expiry(early) == datetime(
+        2035, 1, 1, 13, 0, tzinfo=UTC
+    )
+    assert cloudfront_signing.bucket_expiry(late) == cloudfront_signing.bucket_expiry(
+        early
+    )
+    assert cloudfront_signing.bucket_expiry(on_boundary) == on_boundary
+
+    monkeypatch.setenv("ASSET_DOWNLOAD_URL_EXPIRY_BUCKET_SECONDS", "0")
+    assert cloudfront_signing.bucket_expiry(early) == early
+
+
+def test_list_download_urls_sign_each_key_with_a_short_bucketed_expiry(
+    monkeypatch: Any,
+) -> None:
+    signer = _CountingSigner()
+    _configure_signing(monkeypatch, signer)
+    now = datetime.now(UTC)
+
+    urls, expires_at = generate_list_download_urls(["assets/1/a.pdf", "assets/2/b.pdf"])
+    again, _ = generate_list_download_urls(["assets/1/a.pdf"])
+
+    expiry = datetime.fromisoformat(expires_at)
+    assert now + timedelta(minutes=15) <= expiry <= now + timedelta(minutes=21)
+    assert int(expiry.timestamp()) % 300 == 0
+    assert signer.signatures == 2
+    assert again["assets/1/a.pdf"] == urls["assets/1/a.pdf"]
+    assert urlsplit(urls["assets/2/b.pdf"]).path == "/assets/2/b.pdf"
@@ -0,0 +1,164 @@
+"""Tests for the persistent geocode cache and its paced warm-up."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.exceptions import AppError
+from app.services import geocode_cache
+from app.services.nominatim_geocode import GeocodeNoResultsError, geocode_cache_key
+
+_AREA_ID = UUID("00000000-0000-0000-0000-0000000000aa")
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE geocode_cache (query_text TEXT NOT NULL, "
+                "country_codes VARCHAR(64) NOT NULL, lat NUMERIC, lng NUMERIC, "
+                "display_name TEXT, fetched_at TIMESTAMP NOT NULL, "
+                "expires_at TIMESTAMP NOT NULL, "
+                "PRIMARY KEY (query_text, country_codes))"
+            )
+        )
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+
+    def fake_geocode(
+        *, address: str, country_iso_codes: Any = None
+    ) -> tuple[float, float, str | None]:
+        calls.append(address)
+        if "nowhere" in address.lower():
+            raise GeocodeNoResultsError()
+        if "down" in address.lower():
+            raise AppError("Geocoding service unavailable", status_code=502)
+        return 22.3, 114.17, f"Found {address}"
+
+    monkeypatch.setattr(geocode_cache, "geocode_address_with_context", fake_geocode)
+    monkeypatch.setattr(
+        geocode_cache, "country_codes_for_area", lambda _session, _area: ["HK", "CN"]
+    )
+    return calls
+
+
+def test_geocode_cache_key_normalizes_case_spacing_and_floor() -> None:
+    assert geocode_cache_key("5/F,  1  Queen's Road ,Central", ["HK", "cn"]) == (
+        "1 queen's road, central",
+        "hk,cn",
+    )
+    assert geocode_cache_key("1 Queen's Road, CENTRAL") == (
+        "1 queen's road, central",
+        "",
+    )
+
+
+def test_geocode_address_cached_reuses_hits_and_misses(
+    session: Session, provider: list[str]
+) -> None:
+    first = geocode_cache.geocode_address_cached(
+        session, address="1 Queen's Road", country_iso_codes=["HK"]
+    )
+    again = geocode_cache.geocode_address_cached(
+        session, address="  1 QUEEN'S ROAD ", country_iso_codes=["hk"]
+    )
+    for _ in range(2):
+        with pytest.raises(GeocodeNoResultsError):
+            geocode_cache.geocode_address_cached(
+                session, address="Nowhere Lane", country_iso_codes=["HK"]
+            )
+
+    assert first == again == (22.3, 114.17, "Found 1 Queen's Road")
+    assert provider == ["1 Queen's Road", "Nowhere Lane"]
+
+
+def test_geocode_address_cached_refetches_expired_rows(
+    session: Session, provider: list[str]
+) -> None:
+    past = datetime.now(UTC) - geocode_cache.GEOCODE_CACHE_TTL - timedelta(days=1)
+    geocode_cache.geocode_address_cached(session, address="2 Main St", now=past)
+    geocode_cache.geocode_address_cached(session, address="2 Main St")
+
+    assert provider == ["2 Main St", "2 Main St"]
+
+
+def test_warm_geocode_cache_paces_only_network_calls(
+    session: Session, provider: list[str]
+) -> None:
+    geocode_cache.geocode_address_cached(
+        session, address="Cached Road", country_iso_codes=["HK", "CN"]
+    )
+    provider.clear()
+    sleeps: list[float] = []
+    ticks = iter([0.0, 0.25, 1.0, 2.5, 2.5])
+
+    stats = geocode_cache.warm_geocode_cache(
+        session,
+        [
+            ("Cached Road", _AREA_ID),
+            ("3 New St", _AREA_ID),
+            ("3 NEW ST", _AREA_ID),
+            ("Nowhere Lane", _AREA_ID),
+            ("Server Down Rd", _AREA_ID),
+        ],
+        sleep=sleeps.append,
+        clock=lambda: next(ticks),
+    )
+
+    assert provider == ["3 New St", "Nowhere Lane", "Server Down Rd"]
+    assert sleeps == [0.75]
+    assert (stats.cached, stats.fetched, stats.not_found, stats.failed) == (
+        1,
+        1,
+        1,
+        1,
+    )
+
+
+def test_legacy_venue_addresses_selects_imported_locations() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    imported, manual = uuid4(), uuid4()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE locations (id CHAR(32) PRIMARY KEY, "
+                "area_id CHAR(32), address TEXT)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE legacy_import_refs (entity TEXT, legacy_key TEXT, "
+                "new_id CHAR(32), imported_at TIMESTAMP)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO locations VALUES (:imported, :area, '1 Old Rd'), "
+                "(:manual, :area, '2 New Rd')"
+            ),
+            {"imported": imported.hex, "manual": manual.hex, "area": _AREA_ID.hex},
+        )
+        conn.execute(
+            text(
+                "INSERT INTO legacy_import_refs VALUES "
+                "('venues', '7', :imported, '2026-01-01')"
+            ),
+            {"imported": imported.hex},
+        )
+
+    with Session(engine) as session:
+        assert geocode_cache.legacy_venue_addresses(session) == [("1 Old Rd", _AREA_ID)]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from email.message import EmailMessage
+import io
+from typing import Any
 
 from app.db.models import AssetType
+from app.services import inbound_email
 from app.services.inbound_email import (
     EMAIL_INVOICE_BODY_FILE_NAME,
     invoice_attachments_for_ingest,
@@ -184,3 +187,22 @@ def test_invoice_attachments_for_ingest_prefers_file_attachments() -> None:
 
     assert len(attachments) == 1
     assert attachments[0].file_name == "invoice.pdf"
+
+
+def test_parse_raw_email_reads_stream_in_chunks(monkeypatch: Any) -> None:
+    message = EmailMessage()
+    message["From"] = "billing@example.com"
+    message["Subject"] = "Invoice INV-200"
+    message.set_content("Invoice attached.")
+    message.add_attachment(
+        b"%PDF-1.7" * 500,
+        maintype="application",
+        subtype="pdf",
+        filename="invoice.pdf",
+    )
+    monkeypatch.setattr(inbound_email, "RAW_EMAIL_READ_CHUNK_BYTES", 256)
+
+    parsed = parse_raw_email(io.BytesIO(message.as_bytes()))
+
+    assert parsed == parse_raw_email(message.as_bytes())
+    assert parsed.attachments[0].data == b"%PDF-1.7" * 500
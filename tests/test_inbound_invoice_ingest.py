@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import UTC, datetime
+import hashlib
 from types import SimpleNamespace
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from app.db.models import InboundEmailStatus
+import pytest
+
+from app.db.models import AssetType, InboundEmailStatus
+from app.services.inbound_email import InvoiceAttachment
 from app.services.inbound_invoice_ingest import (
     InboundInvoiceEmailEvent,
     InboundInvoiceProcessResult,
+    _store_expense_from_email,
     process_inbound_invoice_email,
 )
 
@@ -77,11 +83,9 @@ def test_process_inbound_invoice_email_marks_failed_when_no_supported_attachment
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._upsert_tracking_record",
-        lambda _event,
-        *,
-        status,
-        parsed_email=None,
-        failure_reason=None: upsert_calls.append((status, failure_reason)),
+        lambda _event, *, status, parsed_email=None, failure_reason=None: (
+            upsert_calls.append((status, failure_reason))
+        ),
     )
 
     result = process_inbound_invoice_email(_base_event())
@@ -111,11 +115,9 @@ def test_process_inbound_invoice_email_skips_spam_without_loading_raw_email(
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._upsert_tracking_record",
-        lambda _event,
-        *,
-        status,
-        parsed_email=None,
-        failure_reason=None: statuses.append(status),
+        lambda _event, *, status, parsed_email=None, failure_reason=None: (
+            statuses.append(status)
+        ),
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._load_raw_email",
@@ -156,11 +158,9 @@ def test_process_inbound_invoice_email_fails_when_sender_not_allowlisted(
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._upsert_tracking_record",
-        lambda _event,
-        *,
-        status,
-        parsed_email=None,
-        failure_reason=None: upsert_calls.append((status, failure_reason)),
+        lambda _event, *, status, parsed_email=None, failure_reason=None: (
+            upsert_calls.append((status, failure_reason))
+        ),
     )
 
     result = process_inbound_invoice_email(_base_event())
@@ -207,11 +207,9 @@ def test_process_inbound_invoice_email_allowlisted_by_envelope_substring(
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._upsert_tracking_record",
-        lambda _event,
-        *,
-        status,
-        parsed_email=None,
-        failure_reason=None: upsert_calls.append((status, failure_reason)),
+        lambda _event, *, status, parsed_email=None, failure_reason=None: (
+            upsert_calls.append((status, failure_reason))
+        ),
     )
 
     process_inbound_invoice_email(_base_event())
@@ -258,11 +256,9 @@ def test_process_inbound_invoice_email_stores_and_enqueues_parse(
     )
     monkeypatch.setattr(
         "app.services.inbound_invoice_ingest._upsert_tracking_record",
-        lambda _event,
-        *,
-        status,
-        parsed_email=None,
-        failure_reason=None: upsert_calls.append((status, failure_reason)),
+        lambda _event, *, status, parsed_email=None, failure_reason=None: (
+            upsert_calls.append((status, failure_reason))
+        ),
     )
 
     result = process_inbound_invoice_email(_base_event())
@@ -273,3 +269,121 @@ def test_process_inbound_invoice_email_stores_and_enqueues_parse(
     )
     assert parse_requests == [stored_expense_id]
     assert upsert_calls == [(InboundEmailStatus.PROCESSING, None)]
+
+
+class _FakeS3:
+    def __init__(self, fail_keys: tuple[str, ...] = ()) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.deleted: list[str] = []
+        self._fail_keys = fail_keys
+
+    def put_object(self, **kwargs: Any) -> None:
+        if any(part in kwargs["Key"] for part in self._fail_keys):
+            raise RuntimeError("upload failed")
+        self.objects[kwargs["Key"]] = kwargs["Body"]
+
+    def delete_object(self, **kwargs: Any) -> None:
+        self.deleted.append(kwargs["Key"])
+
+
+class _FakeAssetRepository:
+    stored: dict[str, Any] = {}
+
+    def __init__(self, _session: Any) -> None:
+        pass
+
+    def find_by_content_sha256(self, content_sha256: str) -> Any:
+        return self.stored.get(content_sha256)
+
+    def create_asset(self, **kwargs: Any) -> Any:
+        asset = SimpleNamespace(id=kwargs["asset_id"], **kwargs)
+        self.stored[kwargs["content_sha256"]] = asset
+        return asset
+
+
+def _patch_store_dependencies(monkeypatch: Any, s3: _FakeS3) -> list[list[UUID]]:
+    linked: list[list[UUID]] = []
+    module = "app.services.inbound_invoice_ingest"
+    session = SimpleNamespace(commit=lambda: None, rollback=lambda: None)
+    monkeypatch.setattr(f"{module}.Session", lambda _engine: nullcontext(session))
+    monkeypatch.setattr(f"{module}.get_engine", lambda: None)
+    monkeypatch.setattr(f"{module}.set_audit_context", lambda *_a, **_k: None)
+    monkeypatch.setattr(f"{module}.get_s3_client", lambda: s3)
+    monkeypatch.setattr(f"{module}._resolve_inbound_vendor_id", lambda *_a: None)
+    monkeypatch.setattr(f"{module}.AssetRepository", _FakeAssetRepository)
+    monkeypatch.setattr(
+        f"{module}.ExpenseRepository",
+        lambda _session: SimpleNamespace(
+            create_expense=lambda **_kwargs: SimpleNamespace(id=uuid4()),
+            replace_attachments=lambda _expense, ids: linked.append(list(ids)),
+        ),
+    )
+    monkeypatch.setattr(
+        f"{module}.InboundEmailRepository",
+        lambda _session: SimpleNamespace(
+            find_by_ses_message_id=lambda _id: SimpleNamespace(),
+            update=lambda _tracking: None,
+        ),
+    )
+    monkeypatch.setattr(f"{module}._apply_tracking_update", lambda *_a, **_k: None)
+    monkeypatch.setenv("ASSETS_BUCKET_NAME", "assets")
+    monkeypatch.setattr(_FakeAssetRepository, "stored", {})
+    return linked
+
+
+def _attachment(file_name: str, data: bytes) -> InvoiceAttachment:
+    return InvoiceAttachment(
+        file_name=file_name,
+        content_type="application/pdf",
+        asset_type=AssetType.PDF,
+        data=data,
+    )
+
+
+def test_store_expense_reuses_assets_for_identical_attachments(
+    monkeypatch: Any,
+) -> None:
+    s3 = _FakeS3()
+    linked = _patch_store_dependencies(monkeypatch, s3)
+    parsed = SimpleNamespace(from_email="billing@example.com", subject="Invoice")
+    first_batch = [
+        _attachment("invoice.pdf", b"%PDF-1"),
+        _attachment("invoice-copy.pdf", b"%PDF-1"),
+        _attachment("receipt.pdf", b"%PDF-2"),
+    ]
+
+    for attachments in (first_batch, [_attachment("fwd-invoice.pdf", b"%PDF-1")]):
+        _store_expense_from_email(
+            event=_base_event(),
+            parsed_email=parsed,
+            invoice_attachments=attachments,
+        )
+
+    assert len(s3.objects) == 2
+    assert len(linked[0]) == 2
+    assert linked[1] == linked[0][:1]
+    stored = _FakeAssetRepository.stored[hashlib.sha256(b"%PDF-1").hexdigest()]
+    assert stored.file_name == "invoice.pdf"
+
+
+def test_store_expense_cleans_up_parallel_uploads_after_failure(
+    monkeypatch: Any,
+) -> None:
+    s3 = _FakeS3(fail_keys=("broken",))
+    linked = _patch_store_dependencies(monkeypatch, s3)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        _store_expense_from_email(
+            event=_base_event(),
+            parsed_email=SimpleNamespace(from_email=None, subject=None),
+            invoice_attachments=[
+                _attachment("a.pdf", b"a"),
+                _attachment("broken.pdf", b"b"),
+                _attachment("c.pdf", b"c"),
+            ],
+        )
+
+    assert sorted(s3.deleted) == sorted(s3.objects)
+    assert len(s3.deleted) == 2
+    assert linked == []
+    assert _FakeAssetRepository.stored == {}
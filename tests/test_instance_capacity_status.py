@@ -5,8 +5,12 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
 from app.api.instance_capacity_status import bulk_reconcile_instance_capacity_status
 from app.db.models import ServiceInstance
+from app.db.repositories import ServiceInstanceRepository
 from app.db.models.enums import (
     InstanceStatus,
     ServiceDeliveryMode,
@@ -60,70 +64,45 @@ def _minimal_instance(
     return inst
 
 
-def test_reconcile_sets_full_when_open_and_at_capacity(monkeypatch) -> None:
-    iid = uuid4()
-    instance = _minimal_instance(
-        instance_id=iid, max_capacity=2, status=InstanceStatus.OPEN
-    )
-    session = MagicMock()
-
+def _patch_repo(monkeypatch, changed, seen=None) -> None:
     class _Repo:
         def __init__(self, _session) -> None:
             pass
 
-        def get_enrollment_counts_for_instances(self, ids):
-            assert ids == [iid]
-            return {iid: 2}
+        def reconcile_capacity_status(self, ids):
+            if seen is not None:
+                seen.append(list(ids))
+            return changed
 
     monkeypatch.setattr(
         "app.api.instance_capacity_status.ServiceInstanceRepository", _Repo
     )
-    bulk_reconcile_instance_capacity_status(session, [instance])
-    assert instance.status == InstanceStatus.FULL
-    session.flush.assert_called_once()
 
 
-def test_reconcile_sets_full_from_scheduled_when_at_capacity(monkeypatch) -> None:
+def test_reconcile_applies_full_status_from_update(monkeypatch) -> None:
     iid = uuid4()
     instance = _minimal_instance(
-        instance_id=iid, max_capacity=1, status=InstanceStatus.SCHEDULED
+        instance_id=iid, max_capacity=2, status=InstanceStatus.OPEN
     )
-    session = MagicMock()
+    seen: list[list[UUID]] = []
+    _patch_repo(monkeypatch, {iid: InstanceStatus.FULL}, seen)
 
-    class _Repo:
-        def __init__(self, _session) -> None:
-            pass
+    bulk_reconcile_instance_capacity_status(MagicMock(), [instance])
 
-        def get_enrollment_counts_for_instances(self, ids):
-            return {iid: 1}
-
-    monkeypatch.setattr(
-        "app.api.instance_capacity_status.ServiceInstanceRepository", _Repo
-    )
-    bulk_reconcile_instance_capacity_status(session, [instance])
+    assert seen == [[iid]]
     assert instance.status == InstanceStatus.FULL
 
 
-def test_reconcile_opens_full_when_seats_available(monkeypatch) -> None:
+def test_reconcile_applies_open_status_from_update(monkeypatch) -> None:
     iid = uuid4()
     instance = _minimal_instance(
         instance_id=iid, max_capacity=3, status=InstanceStatus.FULL
     )
-    session = MagicMock()
+    _patch_repo(monkeypatch, {iid: InstanceStatus.OPEN})
 
-    class _Repo:
-        def __init__(self, _session) -> None:
-            pass
+    bulk_reconcile_instance_capacity_status(MagicMock(), [instance])
 
-        def get_enrollment_counts_for_instances(self, ids):
-            return {iid: 1}
-
-    monkeypatch.setattr(
-        "app.api.instance_capacity_status.ServiceInstanceRepository", _Repo
-    )
-    bulk_reconcile_instance_capacity_status(session, [instance])
     assert instance.status == InstanceStatus.OPEN
-    session.flush.assert_called_once()
 
 
 def test_reconcile_skips_when_session_has_no_execute(monkeypatch) -> None:
@@ -143,64 +122,99 @@ def test_reconcile_skips_when_session_has_no_execute(monkeypatch) -> None:
     assert instance.status == InstanceStatus.OPEN
 
 
-def test_reconcile_no_flush_when_nothing_changes(monkeypatch) -> None:
-    iid = uuid4()
-    instance = _minimal_instance(
-        instance_id=iid, max_capacity=None, status=InstanceStatus.OPEN
+def test_reconcile_only_sends_capped_instances(monkeypatch) -> None:
+    capped_id, uncapped_id = uuid4(), uuid4()
+    capped = _minimal_instance(
+        instance_id=capped_id, max_capacity=5, status=InstanceStatus.OPEN
     )
-    session = MagicMock()
-
-    class _Repo:
-        def __init__(self, _session) -> None:
-            pass
-
-        def get_enrollment_counts_for_instances(self, ids):
-            return {iid: 99}
-
-    monkeypatch.setattr(
-        "app.api.instance_capacity_status.ServiceInstanceRepository", _Repo
+    uncapped = _minimal_instance(
+        instance_id=uncapped_id, max_capacity=None, status=InstanceStatus.OPEN
     )
-    bulk_reconcile_instance_capacity_status(session, [instance])
-    assert instance.status == InstanceStatus.OPEN
-    session.flush.assert_not_called()
-
-
-def test_reconcile_sets_full_only_when_enrollments_reach_max_ignores_override(
-    monkeypatch,
-) -> None:
-    """FULL follows enrollment count vs max_capacity; display override does not apply."""
-    iid = uuid4()
-    instance = _minimal_instance(
-        instance_id=iid,
-        max_capacity=10,
-        status=InstanceStatus.OPEN,
-        capacity_left_override=2,
+    seen: list[list[UUID]] = []
+    _patch_repo(monkeypatch, {}, seen)
+
+    bulk_reconcile_instance_capacity_status(MagicMock(), [uncapped])
+    bulk_reconcile_instance_capacity_status(MagicMock(), [capped, uncapped])
+
+    assert seen == [[capped_id]]
+    assert capped.status == uncapped.status == InstanceStatus.OPEN
+
+
+def _capacity_session() -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE service_instances (id CHAR(32) PRIMARY KEY, "
+                "max_capacity INTEGER, capacity_left_override INTEGER, "
+                "status VARCHAR(16) NOT NULL)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TABLE enrollments (id CHAR(32) PRIMARY KEY, "
+                "instance_id CHAR(32), status VARCHAR(16))"
+            )
+        )
+    return Session(engine)
+
+
+def _seed_instance(
+    session: Session, *, max_capacity: int | None, status: str, enrolled: list[str]
+) -> UUID:
+    instance_id = uuid4()
+    session.execute(
+        text(
+            "INSERT INTO service_instances (id, max_capacity, status) "
+            "VALUES (:id, :cap, :status)"
+        ),
+        {"id": instance_id.hex, "cap": max_capacity, "status": status},
     )
-    session = MagicMock()
-
-    class _RepoNine:
-        def __init__(self, _session) -> None:
-            pass
-
-        def get_enrollment_counts_for_instances(self, ids):
-            assert ids == [iid]
-            return {iid: 9}
-
-    monkeypatch.setattr(
-        "app.api.instance_capacity_status.ServiceInstanceRepository", _RepoNine
+    for enrollment_status in enrolled:
+        session.execute(
+            text("INSERT INTO enrollments VALUES (:id, :instance, :status)"),
+            {
+                "id": uuid4().hex,
+                "instance": instance_id.hex,
+                "status": enrollment_status,
+            },
+        )
+    return instance_id
+
+
+def test_reconcile_capacity_status_updates_in_one_statement() -> None:
+    session = _capacity_session()
+    becomes_full = _seed_instance(
+        session, max_capacity=2, status="open", enrolled=["registered", "confirmed"]
     )
-    bulk_reconcile_instance_capacity_status(session, [instance])
-    assert instance.status == InstanceStatus.OPEN
-
-    class _RepoTen:
-        def __init__(self, _session) -> None:
-            pass
-
-        def get_enrollment_counts_for_instances(self, ids):
-            return {iid: 10}
-
-    monkeypatch.setattr(
-        "app.api.instance_capacity_status.ServiceInstanceRepository", _RepoTen
+    scheduled_full = _seed_instance(
+        session, max_capacity=1, status="scheduled", enrolled=["completed"]
     )
-    bulk_reconcile_instance_capacity_status(session, [instance])
-    assert instance.status == InstanceStatus.FULL
+    reopens = _seed_instance(
+        session, max_capacity=2, status="full", enrolled=["registered", "cancelled"]
+    )
+    waitlist_only = _seed_instance(
+        session, max_capacity=1, status="open", enrolled=["waitlisted"]
+    )
+    cancelled = _seed_instance(
+        session, max_capacity=1, status="cancelled", enrolled=["registered"]
+    )
+    uncapped = _seed_instance(
+        session, max_capacity=None, status="open", enrolled=["registered"]
+    )
+    repository = ServiceInstanceRepository(session)
+
+    assert repository.reconcile_capacity_status([reopens, waitlist_only]) == {
+        reopens: InstanceStatus.OPEN
+    }
+    assert repository.reconcile_capacity_status([]) == {}
+    assert repository.reconcile_capacity_status() == {
+        becomes_full: InstanceStatus.FULL,
+        scheduled_full: InstanceStatus.FULL,
+    }
+    assert repository.reconcile_capacity_status() == {}
+    statuses = dict(
+        session.execute(text("SELECT id, status FROM service_instances")).all()
+    )
+    assert statuses[cancelled.hex] == "cancelled"
+    assert statuses[uncapped.hex] == "open"
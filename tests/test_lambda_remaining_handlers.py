@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import importlib.util
 import json
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
+from uuid import uuid4
 
 
 def _load_lambda_module(relative_path: str, module_name: str) -> Any:
@@ -119,6 +121,38 @@ def test_admin_bootstrap_create_reports_failure_on_missing_property(
     assert sent == ["FAILED"]
 
 
+def test_capacity_reconcile_sweeps_all_instances_and_commits(
+    monkeypatch: Any,
+) -> None:
+    from app.db.models.enums import InstanceStatus
+
+    handler = _load_lambda_module(
+        "capacity_reconcile/handler.py",
+        "test_capacity_reconcile_sweep",
+    )
+    session = MagicMock()
+    calls: list[Any] = []
+
+    class _Repo:
+        def __init__(self, _session: Any) -> None:
+            pass
+
+        def reconcile_capacity_status(self, instance_ids: Any = None) -> Any:
+            calls.append(instance_ids)
+            return {uuid4(): InstanceStatus.FULL, uuid4(): InstanceStatus.OPEN}
+
+    monkeypatch.setattr(handler, "Session", lambda _engine: nullcontext(session))
+    monkeypatch.setattr(handler, "get_engine", lambda: object())
+    monkeypatch.setattr(handler, "set_audit_context", lambda *_a, **_k: None)
+    monkeypatch.setattr(handler, "ServiceInstanceRepository", _Repo)
+
+    result = handler.lambda_handler({}, None)
+
+    assert calls == [None]
+    assert result == {"changed": 2, "by_status": {"full": 1, "open": 1}}
+    session.commit.assert_called_once()
+
+
 def test_api_key_rotation_returns_500_when_unconfigured(monkeypatch: Any) -> None:
     handler = _load_lambda_module(
         "api_key_rotation/handler.py",
@@ -0,0 +1,175 @@
+"""Tests for ``{"warmup": true}`` invocations of the admin Lambda and authorizers."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+import pytest
+from app.api import admin
+from app.auth import attestation, jwt_validator
+from app.services import cloudfront_signing
+from app.utils import warmup
+from app.utils.warmup import is_warmup_event, run_warmup
+
+
+def _load_lambda_module(relative_path: str, module_name: str) -> Any:
+    module_path = (
+        Path(__file__).resolve().parents[1] / "backend" / "lambda" / relative_path
+    )
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module at {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _FakeJwksClient:
+    def __init__(self) -> None:
+        self.fetches = 0
+
+    def get_signing_keys(self) -> list[Any]:
+        self.fetches += 1
+        return []
+
+
+@pytest.mark.parametrize(
+    ("event", "expected"),
+    [
+        ({"warmup": True}, True),
+        ({"warmup": "true"}, False),
+        ({"path": "/v1/admin/contacts"}, False),
+        (None, False),
+    ],
+)
+def test_is_warmup_event(event: Any, expected: bool) -> None:
+    assert is_warmup_event(event) is expected
+
+
+def test_run_warmup_reports_each_phase_without_raising(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(warmup, "_cold", True)
+    calls: list[str] = []
+
+    def _fail() -> None:
+        raise RuntimeError("secret unavailable")
+
+    phases = [
+        ("ok", lambda: calls.append("ok")),
+        ("skipped", lambda: False),
+        ("error", _fail),
+        ("after_error", lambda: calls.append("after_error")),
+    ]
+    first = run_warmup(phases)
+    second = run_warmup(phases)
+
+    assert calls == ["ok", "after_error", "ok", "after_error"]
+    assert first["warmup"] is True
+    assert first["cold_start"] is True
+    assert second["cold_start"] is False
+    assert [(p["phase"], p["status"]) for p in first["phases"]] == [
+        ("ok", "ok"),
+        ("skipped", "skipped"),
+        ("error", "error"),
+        ("after_error", "ok"),
+    ]
+    assert first["phases"][2]["error"] == "RuntimeError"
+    assert all(p["ms"] >= 0 for p in first["phases"])
+    assert first["total_ms"] >= sum(p["ms"] for p in first["phases"]) - 1
+
+
+def test_admin_warmup_event_runs_phases_instead_of_routing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for name in (
+        "DATABASE_URL",
+        "DATABASE_SECRET_ARN",
+        "COGNITO_USER_POOL_ID",
+        "ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+    response = admin.lambda_handler({"warmup": True}, None)
+
+    assert "statusCode" not in response
+    statuses = {p["phase"]: p["status"] for p in response["phases"]}
+    assert statuses == {
+        "imports": "ok",
+        "database_url": "error",
+        "database_connect": "error",
+        "jwks": "skipped",
+        "cloudfront_signer": "skipped",
+        "pdf_assets": "ok",
+    }
+
+
+def test_prime_jwks_fetches_configured_user_pool_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("COGNITO_USER_POOL_ID", "ap-southeast-1_pool")
+    monkeypatch.setenv("AWS_REGION", "ap-southeast-1")
+    client = _FakeJwksClient()
+    requested: list[tuple[str, str]] = []
+
+    def _get_jwks_client(user_pool_id: str, region: str) -> _FakeJwksClient:
+        requested.append((user_pool_id, region))
+        return client
+
+    monkeypatch.setattr(jwt_validator, "_get_jwks_client", _get_jwks_client)
+    handler = _load_lambda_module(
+        "authorizers/cognito_user/handler.py", "test_warmup_cognito_user_authorizer"
+    )
+
+    response = handler.lambda_handler({"warmup": True}, None)
+
+    assert [(p["phase"], p["status"]) for p in response["phases"]] == [("jwks", "ok")]
+    assert requested == [("ap-southeast-1_pool", "ap-southeast-1")]
+    assert client.fetches == 1
+
+
+def test_prime_attestation_jwks_reuses_one_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ATTESTATION_JWKS_URL", "https://attest.example/jwks.json")
+    created: list[str] = []
+
+    def _client(url: str) -> _FakeJwksClient:
+        created.append(url)
+        return _FakeJwksClient()
+
+    attestation._jwk_client.cache_clear()
+    monkeypatch.setattr(attestation.jwt, "PyJWKClient", _client)
+    try:
+        assert attestation.prime_attestation_jwks() is True
+        assert attestation.prime_attestation_jwks() is True
+    finally:
+        attestation._jwk_client.cache_clear()
+
+    assert created == ["https://attest.example/jwks.json"]
+
+
+def test_prime_signer_skips_when_unconfigured_and_loads_key_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID", raising=False)
+    assert cloudfront_signing.prime_signer() is False
+
+    loaded: list[str] = []
+    monkeypatch.setenv("ASSET_DOWNLOAD_CLOUDFRONT_KEY_PAIR_ID", "K123")
+    monkeypatch.setenv(
+        "ASSET_DOWNLOAD_CLOUDFRONT_PRIVATE_KEY_SECRET_ARN", "arn:secret:cf"
+    )
+    monkeypatch.setattr(
+        cloudfront_signing, "_load_private_key", lambda arn: loaded.append(arn)
+    )
+    cloudfront_signing.clear_signer_cache()
+    try:
+        assert cloudfront_signing.prime_signer() is True
+        cloudfront_signing._get_signer(key_pair_id="K123", secret_arn="arn:secret:cf")
+    finally:
+        cloudfront_signing.clear_signer_cache()
+
+    assert loaded == ["arn:secret:cf"]
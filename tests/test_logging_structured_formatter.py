@@ -3,8 +3,19 @@ from __future__ import annotations
 import io
 import json
 import logging
+from datetime import datetime
+from typing import Any
 
-from app.utils.logging import StructuredLogFormatter
+import pytest
+from app.utils import logging as app_logging
+from app.utils.logging import (
+    BufferedLogHandler,
+    SamplingFilter,
+    StructuredLogFormatter,
+    configure_logging,
+    flush_logs,
+    log_sample_rates,
+)
 
 
 def test_structured_formatter_merges_logger_extra_into_json() -> None:
@@ -27,3 +38,86 @@ def test_structured_formatter_merges_logger_extra_into_json() -> None:
     assert data["message"] == "OpenRouter request failed"
     assert data["status_code"] == 404
     assert data["response_preview"] == '{"error":"model"}'
+
+
+def _record(level: int = logging.INFO, msg: str = "hit", *args: object) -> Any:
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_structured_formatter_uses_record_time_and_lazy_args() -> None:
+    record = _record(logging.INFO, "Admin request: %s %s", "GET", "/v1/admin/contacts")
+    record.created = 1769847302.25
+
+    data = json.loads(StructuredLogFormatter().format(record))
+
+    assert data["message"] == "Admin request: GET /v1/admin/contacts"
+    assert data["timestamp"] == "2026-01-31T08:15:02.250000+00:00"
+    assert datetime.fromisoformat(data["timestamp"]).timestamp() == record.created
+
+
+def test_sampling_filter_drops_info_but_keeps_warnings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sampler = SamplingFilter(0.1)
+    monkeypatch.setattr(app_logging.random, "random", lambda: 0.5)
+    assert sampler.filter(_record()) is False
+    assert sampler.filter(_record(logging.WARNING)) is True
+
+    monkeypatch.setattr(app_logging.random, "random", lambda: 0.05)
+    kept = _record()
+    assert sampler.filter(kept) is True
+    assert json.loads(StructuredLogFormatter().format(kept))["sample_rate"] == 0.1
+
+
+def test_log_sample_rates_parses_and_clamps(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(
+        "LOG_SAMPLE_RATES",
+        "app.api.public_events=0.1, app.api.public_polls=2,bad,=0.5,x=abc",
+    )
+    assert log_sample_rates() == {
+        "app.api.public_events": 0.1,
+        "app.api.public_polls": 1.0,
+    }
+
+
+def test_buffered_handler_writes_once_on_flush_and_on_errors() -> None:
+    stream = io.StringIO()
+    handler = BufferedLogHandler(stream, capacity=10)
+    handler.setFormatter(StructuredLogFormatter())
+
+    handler.handle(_record(msg="first"))
+    handler.handle(_record(msg="second"))
+    assert stream.getvalue() == ""
+    handler.flush()
+    assert [json.loads(line)["message"] for line in stream.getvalue().splitlines()] == [
+        "first",
+        "second",
+    ]
+
+    handler.handle(_record(logging.ERROR, "boom"))
+    assert json.loads(stream.getvalue().splitlines()[-1])["message"] == "boom"
+    assert handler.buffer == []
+
+
+def test_configure_logging_installs_buffering_and_sampling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    sampled = logging.getLogger("test_configure_logging_sampled")
+    monkeypatch.setenv("LOG_BUFFERED", "true")
+    monkeypatch.setenv("LOG_SAMPLE_RATES", "test_configure_logging_sampled=0.25")
+    try:
+        configure_logging()
+        configure_logging()
+        assert isinstance(root.handlers[0], BufferedLogHandler)
+        assert [f.rate for f in sampled.filters] == [0.25]
+
+        monkeypatch.delenv("LOG_SAMPLE_RATES")
+        configure_logging()
+        assert sampled.filters == []
+        flush_logs()
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        sampled.filters.clear()
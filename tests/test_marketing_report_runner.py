@@ -0,0 +1,96 @@
+"""Tests for the marketing assessment report runner (cache, replay, limits)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _load_runner_module() -> Any:
+    module_path = (
+        Path(__file__).resolve().parents[1]
+        / "apps"
+        / "public_www"
+        / "marketing"
+        / "scripts"
+        / "report_runner.py"
+    )
+    spec = importlib.util.spec_from_file_location("report_runner", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module at {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+runner_module = _load_runner_module()
+
+
+def test_response_cache_modes_use_record_and_replay(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def loader() -> str:
+        calls.append("fetch")
+        return f'{{"n": {len(calls)}}}'
+
+    request = {"endpoint": "act_1/insights", "params": {"level": "ad"}}
+    use = runner_module.ResponseCache(str(tmp_path), "use")
+    assert use.fetch("meta", request, ("2026-04-01", "2026-04-30"), loader) == (
+        '{"n": 1}'
+    )
+    assert use.fetch("meta", request, ("2026-04-01", "2026-04-30"), loader) == (
+        '{"n": 1}'
+    )
+    assert use.fetch("meta", request, ("2026-04-02", "2026-05-01"), loader) == (
+        '{"n": 2}'
+    )
+
+    record = runner_module.ResponseCache(str(tmp_path), "record")
+    record.fetch("meta", request, ("2026-04-01", "2026-04-30"), loader)
+    replay = runner_module.ResponseCache(str(tmp_path), "replay")
+    assert replay.fetch("meta", request, ("2026-04-01", "2026-04-30"), loader) == (
+        '{"n": 3}'
+    )
+    with pytest.raises(runner_module.ReplayMissError):
+        replay.fetch("meta", {"endpoint": "other"}, None, loader)
+    assert calls == ["fetch", "fetch", "fetch"]
+
+
+def test_report_runner_limits_only_network_calls_and_keeps_order(
+    tmp_path: Path,
+) -> None:
+    runner = runner_module.ReportRunner(
+        runner_module.ResponseCache(str(tmp_path), "use"), max_workers=1
+    )
+    waits: list[str] = []
+    runner.limiter.wait = lambda: waits.append("wait")
+
+    def job(index: int) -> Any:
+        if index == 2:
+            raise RuntimeError("boom")
+        return runner.fetch("ga4", {"i": index % 2}, None, lambda: str(index))
+
+    outcomes = runner.run_all([lambda i=i: job(i) for i in range(4)])
+
+    assert [result for result, _error in outcomes][:2] == ["0", "1"]
+    assert str(outcomes[2][1]) == "boom"
+    assert outcomes[3][0] == "1"
+    assert outcomes[3][0] == runner.fetch("ga4", {"i": 1}, None, lambda: "x")
+    assert len(waits) == 2
+
+
+def test_rate_limiter_spaces_calls() -> None:
+    ticks = iter([0.0, 0.1, 0.5])
+    sleeps: list[float] = []
+    limiter = runner_module.RateLimiter(
+        0.25, clock=lambda: next(ticks), sleep=sleeps.append
+    )
+
+    limiter.wait()
+    limiter.wait()
+    limiter.wait()
+
+    assert sleeps == [pytest.approx(0.15)]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import json
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -456,3 +457,110 @@ def test_send_media_lead_sales_recap_delegates_to_send_sales_form_recap(
     assert len(calls) == 1
     assert calls[0]["form_title"] == "Media download"
     assert "Guide" in "\n".join(calls[0]["body_lines"])
+
+
+def _media_record(message_id: str, **message: Any) -> dict[str, Any]:
+    payload = {"event_type": "media_request.submitted", "first_name": "P", **message}
+    return {
+        "messageId": message_id,
+        "body": json.dumps({"Message": json.dumps(payload)}),
+    }
+
+
+def test_lambda_handler_coalesces_duplicates_and_reports_failures(
+    monkeypatch: Any,
+) -> None:
+    handler = _load_handler_module()
+    processed: list[tuple[str, Any]] = []
+    cache = handler._MediaBatchCache()
+
+    def _fake_process(message: dict[str, Any], *, cache: Any) -> bool:
+        processed.append((message["email"], cache))
+        if message["email"] == "broken@example.com":
+            raise RuntimeError("boom")
+        return message.get("resource_key") != "seen-before"
+
+    monkeypatch.setattr(handler, "_preload_media_batch", lambda _messages: cache)
+    monkeypatch.setattr(handler, "_process_message", _fake_process)
+
+    result = handler.lambda_handler(
+        {
+            "Records": [
+                _media_record("m1", email="a@example.com", resource_key="guide"),
+                _media_record("m2", email="A@example.com ", resource_key="Guide"),
+                _media_record("m3", email="a@example.com", resource_key="seen-before"),
+                _media_record("m4", email="broken@example.com"),
+            ]
+        },
+        None,
+    )
+
+    assert sorted(email for email, _cache in processed) == [
+        "a@example.com",
+        "a@example.com",
+        "broken@example.com",
+    ]
+    assert all(seen is cache for _email, seen in processed)
+    assert result["batchItemFailures"] == [{"itemIdentifier": "m4"}]
+    assert (result["processed"], result["skipped"]) == (1, 2)
+
+
+def test_preload_media_batch_resolves_each_resource_once(monkeypatch: Any) -> None:
+    handler = _load_handler_module()
+    asset_id = UUID("11111111-1111-1111-1111-111111111111")
+    tag_id = UUID("22222222-2222-2222-2222-222222222222")
+    calls: list[str] = []
+
+    class _FakeSession:
+        def __init__(self, _engine: Any):
+            pass
+
+        def __enter__(self) -> _FakeSession:
+            return self
+
+        def __exit__(self, *_args: Any) -> None:
+            return None
+
+        def commit(self) -> None:
+            calls.append("commit")
+
+    def _fake_resolve(*, session: Any, message: dict[str, Any]) -> Any:
+        calls.append(f"resolve:{message['resource_key']}")
+        if message["resource_key"] == "missing":
+            raise RuntimeError("No media asset found for resource key 'missing'")
+        return "guide", asset_id, "public-www-media-guide", "Guide"
+
+    monkeypatch.setattr(handler, "get_engine", lambda: object())
+    monkeypatch.setattr(handler, "Session", _FakeSession)
+    monkeypatch.setattr(handler, "_resolve_media_resource", _fake_resolve)
+    monkeypatch.setattr(
+        handler,
+        "_get_or_create_tag_id",
+        lambda **_: calls.append("tag") or tag_id,
+    )
+    monkeypatch.setattr(
+        handler,
+        "_ensure_share_link_url_for_asset",
+        lambda **_: calls.append("share") or "https://media.example.com/s/T",
+    )
+
+    cache = handler._preload_media_batch(
+        [
+            {"resource_key": "guide"},
+            {"resource_key": "Guide"},
+            {"resource_key": "missing"},
+        ]
+    )
+
+    assert sorted(calls) == [
+        "commit",
+        "resolve:guide",
+        "resolve:missing",
+        "share",
+        "tag",
+    ]
+    assert cache.resource_for({"resource_key": "GUIDE"})[1] == asset_id
+    assert cache.tag_ids == {"public-www-media-guide": tag_id}
+    assert cache.download_urls == {asset_id: "https://media.example.com/s/T"}
+    with pytest.raises(RuntimeError, match="missing"):
+        cache.resource_for({"resource_key": "missing"})
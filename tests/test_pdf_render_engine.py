@@ -0,0 +1,167 @@
+"""Tests for the shared ReportLab render engine (cached assets, ``render_many``)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from app.db.models.enums import BillingInvoiceStatus
+from app.services import customer_billing, pdf_render_engine
+from app.services.customer_invoice_pdf import _invoice_styles, render_invoice_pdf
+from app.services.pdf_render_engine import (
+    asset_image,
+    clear_caches,
+    preload,
+    render_many,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches() -> Any:
+    clear_caches()
+    yield
+    clear_caches()
+
+
+def _invoice_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("INVOICE_DISPLAY_TIMEZONE", "Asia/Hong_Kong")
+    monkeypatch.setenv("INVOICE_PAYMENT_TERMS_DAYS", "7")
+    monkeypatch.setenv("PUBLIC_WWW_BUSINESS_NAME", "Trading Co")
+    monkeypatch.setenv("PUBLIC_WWW_FPS_MERCHANT_NAME", "FPSMerchant")
+    monkeypatch.setenv("PUBLIC_WWW_FPS_MOBILE_NUMBER", "91234567")
+
+
+def _invoice(number: str) -> tuple[SimpleNamespace, list[SimpleNamespace]]:
+    invoice = SimpleNamespace(
+        id=uuid4(),
+        invoice_number=number,
+        currency="HKD",
+        subtotal=Decimal("100"),
+        tax_total=Decimal("0"),
+        total=Decimal("100"),
+        bill_to_display_name="Client",
+        bill_to_email="client@example.com",
+        issued_at=datetime(2026, 3, 25, 12, 0, tzinfo=UTC),
+        invoice_date=date(2026, 3, 25),
+        due_date=date(2026, 4, 1),
+        status=BillingInvoiceStatus.ISSUED,
+    )
+    line = SimpleNamespace(
+        line_order=0,
+        description="Workshop",
+        quantity=Decimal("1"),
+        unit_amount=Decimal("100"),
+        line_total=Decimal("100"),
+        currency="HKD",
+    )
+    return invoice, [line]
+
+
+def test_identical_fps_payloads_encode_the_qr_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _invoice_env(monkeypatch)
+    encoded: list[str] = []
+    real = pdf_render_engine.render_fps_qr_png
+
+    def _counting(payload: str, *, size_px: int = 256) -> bytes:
+        encoded.append(payload)
+        return real(payload, size_px=size_px)
+
+    monkeypatch.setattr(pdf_render_engine, "render_fps_qr_png", _counting)
+
+    for number in ("I-1", "I-2", "I-3"):
+        invoice, lines = _invoice(number)
+        assert render_invoice_pdf(invoice=invoice, lines=lines).startswith(b"%PDF")
+
+    assert len(encoded) == 1
+
+
+def test_preload_builds_styles_and_images_once() -> None:
+    preload()
+
+    assert _invoice_styles() is _invoice_styles()
+    assert pdf_render_engine._image_reader.cache_info().currsize >= 1
+    logo = asset_image(pdf_render_engine._preload_images[0], width_mm=10, height_mm=10)
+    assert logo is not None
+    assert logo._img is pdf_render_engine._image_reader(
+        pdf_render_engine._preload_images[0]
+    )
+
+
+def test_asset_image_is_none_for_missing_file(tmp_path: Path) -> None:
+    assert asset_image(tmp_path / "missing.png", width_mm=10, height_mm=10) is None
+
+
+def _label(item: int) -> bytes:
+    if item < 0:
+        raise ValueError("negative item")
+    return f"pdf-{item}".encode()
+
+
+def test_render_many_keeps_input_order_across_workers() -> None:
+    assert render_many(_label, list(range(10)), max_workers=3) == [
+        f"pdf-{item}".encode() for item in range(10)
+    ]
+
+
+def test_render_many_raises_render_errors_from_the_parent() -> None:
+    with pytest.raises(ValueError, match="negative item"):
+        render_many(_label, [1, 2, -3, 4], max_workers=2)
+
+
+def _result(values: list[Any]) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = values
+    result.scalars.return_value.__iter__.return_value = iter(values)
+    return result
+
+
+def test_refresh_invoice_pdfs_renders_and_stores_each_invoice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first, first_lines = _invoice("I-1")
+    second, second_lines = _invoice("I-2")
+    for line in first_lines:
+        line.invoice_id = first.id
+    for line in second_lines:
+        line.invoice_id = second.id
+    session = MagicMock()
+    session.execute.side_effect = [
+        _result([first, second]),
+        _result([*first_lines, *second_lines]),
+    ]
+    batches: list[list[Any]] = []
+
+    def _render_many(render: Any, items: list[Any], **_kwargs: Any) -> list[bytes]:
+        batches.append(items)
+        return [f"pdf:{invoice.invoice_number}".encode() for invoice, _ in items]
+
+    stored: dict[str, bytes] = {}
+    monkeypatch.setattr(customer_billing, "render_many", _render_many)
+    monkeypatch.setattr(
+        customer_billing,
+        "store_pdf_in_assets_bucket",
+        lambda *, s3_key, body, content_type: stored.__setitem__(s3_key, body),
+    )
+
+    refreshed = customer_billing.refresh_invoice_pdfs(session, [first.id, second.id])
+
+    assert refreshed == 2
+    assert session.execute.call_count == 2
+    assert batches[0] == [
+        (first, first_lines),
+        (second, second_lines),
+    ]
+    assert stored == {
+        f"billing/invoices/{first.id}.pdf": b"pdf:I-1",
+        f"billing/invoices/{second.id}.pdf": b"pdf:I-2",
+    }
+    assert first.pdf_template_version == customer_billing.INVOICE_PDF_TEMPLATE_VERSION
+    assert second.issued_pdf_sha256 == customer_billing._sha256_bytes(b"pdf:I-2")
@@ -6,7 +6,10 @@ from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
 
+from app.exceptions import AppError, RateLimitError
 from app.services import poll_responses_store as store
 
 
@@ -17,7 +20,28 @@ def _reset_store_table() -> None:
     store.reset_table_for_tests()
 
 
-def test_check_poll_write_rate_limit_uses_hourly_window_bucket(
+def _put_answer(**kwargs: Any) -> dict[str, Any]:
+    return store.put_poll_answer_rate_limited(
+        poll_slug="workshop-food-jun-26",
+        session_id="550e8400-e29b-41d4-a716-446655440000",
+        question_id="role",
+        question_type="select",
+        selected_option="Parent",
+        **kwargs,
+    )
+
+
+def _transact_items(table: MagicMock) -> list[dict[str, Any]]:
+    call = table.meta.client.transact_write_items.call_args
+    return call.kwargs["TransactItems"]
+
+
+def _deserialize(item: dict[str, Any]) -> dict[str, Any]:
+    deserializer = TypeDeserializer()
+    return {name: deserializer.deserialize(value) for name, value in item.items()}
+
+
+def test_put_poll_answer_rate_limited_uses_hourly_window_bucket(
     monkeypatch: pytest.MonkeyPatch,
     mock_env: Any,
 ) -> None:
@@ -28,26 +52,21 @@ def test_check_poll_write_rate_limit_uses_hourly_window_bucket(
     fixed_epoch = 1_700_000_123
     monkeypatch.setattr(store.time, "time", lambda: fixed_epoch)
 
-    store.check_poll_write_rate_limit(
-        poll_slug="workshop-food-jun-26",
-        session_id="550e8400-e29b-41d4-a716-446655440000",
-    )
+    _put_answer()
 
-    table.update_item.assert_called_once()
-    key = table.update_item.call_args.kwargs["Key"]
+    table.meta.client.transact_write_items.assert_called_once()
+    update = _transact_items(table)[0]["Update"]
     window_id = fixed_epoch // store._RATE_LIMIT_WINDOW_SECONDS
-    assert key == {
+    assert _deserialize(update["Key"]) == {
         "pk": "POLL#workshop-food-jun-26",
-        "sk": (
-            "RATELIMIT#SESSION#550e8400-e29b-41d4-a716-446655440000" f"#W#{window_id}"
-        ),
+        "sk": (f"RATELIMIT#SESSION#550e8400-e29b-41d4-a716-446655440000#W#{window_id}"),
     }
-    values = table.update_item.call_args.kwargs["ExpressionAttributeValues"]
+    values = _deserialize(update["ExpressionAttributeValues"])
     assert values[":limit"] == store._SESSION_WRITE_LIMIT
     assert values[":expires"] == fixed_epoch + store._RATE_LIMIT_TTL_SECONDS
 
 
-def test_check_poll_write_rate_limit_uses_new_bucket_each_hour(
+def test_put_poll_answer_rate_limited_uses_new_bucket_each_hour(
     monkeypatch: pytest.MonkeyPatch,
     mock_env: Any,
 ) -> None:
@@ -58,24 +77,111 @@ def test_check_poll_write_rate_limit_uses_new_bucket_each_hour(
     epoch_hour_one = 3_600
     epoch_hour_two = 7_200
     monkeypatch.setattr(store.time, "time", lambda: epoch_hour_one)
-    store.check_poll_write_rate_limit(
-        poll_slug="workshop-food-jun-26",
-        session_id="550e8400-e29b-41d4-a716-446655440000",
-    )
-    first_sk = table.update_item.call_args.kwargs["Key"]["sk"]
+    _put_answer()
+    first_sk = _transact_items(table)[0]["Update"]["Key"]["sk"]["S"]
 
     monkeypatch.setattr(store.time, "time", lambda: epoch_hour_two)
-    store.check_poll_write_rate_limit(
-        poll_slug="workshop-food-jun-26",
-        session_id="550e8400-e29b-41d4-a716-446655440000",
-    )
-    second_sk = table.update_item.call_args.kwargs["Key"]["sk"]
+    _put_answer()
+    second_sk = _transact_items(table)[0]["Update"]["Key"]["sk"]["S"]
 
     assert first_sk != second_sk
     assert first_sk.endswith("#W#1")
     assert second_sk.endswith("#W#2")
 
 
+def test_put_poll_answer_rate_limited_maps_cancellations(mock_env: Any) -> None:
+    table = MagicMock()
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+
+    def cancelled(first_reason: str) -> ClientError:
+        return ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException", "Message": "x"},
+                "CancellationReasons": [{"Code": first_reason}, {"Code": "None"}],
+            },
+            "TransactWriteItems",
+        )
+
+    table.meta.client.transact_write_items.side_effect = cancelled(
+        "ConditionalCheckFailed"
+    )
+    with pytest.raises(RateLimitError):
+        _put_answer()
+
+    table.meta.client.transact_write_items.side_effect = cancelled(
+        "TransactionConflict"
+    )
+    with pytest.raises(AppError) as exc_info:
+        _put_answer()
+    assert exc_info.value.status_code == 500
+
+
+def test_load_poll_answer_context_reads_both_rows_in_one_batch(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_env: Any,
+) -> None:
+    table = MagicMock()
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+    monkeypatch.setattr(store.time, "sleep", lambda _seconds: None)
+
+    answer_sk = "SESSION#550e8400-e29b-41d4-a716-446655440000#Q#role"
+    table.meta.client.batch_get_item.side_effect = [
+        {
+            "Responses": {
+                "evolvesprouts-poll-responses": [
+                    {
+                        "pk": {"S": "POLL#workshop-food-jun-26"},
+                        "sk": {"S": "CONTROL"},
+                        "enabledQuestionIds": {"L": [{"S": "role"}]},
+                    }
+                ]
+            },
+            "UnprocessedKeys": {
+                "evolvesprouts-poll-responses": {
+                    "Keys": [
+                        {
+                            "pk": {"S": "POLL#workshop-food-jun-26"},
+                            "sk": {"S": answer_sk},
+                        }
+                    ]
+                }
+            },
+        },
+        {
+            "Responses": {
+                "evolvesprouts-poll-responses": [
+                    {
+                        "pk": {"S": "POLL#workshop-food-jun-26"},
+                        "sk": {"S": answer_sk},
+                        "selectedOption": {"S": "Parent"},
+                    }
+                ]
+            }
+        },
+    ]
+
+    control, existing = store.load_poll_answer_context(
+        poll_slug="workshop-food-jun-26",
+        session_id="550e8400-e29b-41d4-a716-446655440000",
+        question_id="role",
+    )
+
+    assert control == {
+        "pollSlug": "workshop-food-jun-26",
+        "enabledQuestionIds": ["role"],
+        "version": 0,
+    }
+    assert existing is not None
+    assert existing["selectedOption"] == "Parent"
+    first_request = table.meta.client.batch_get_item.call_args_list[0].kwargs
+    keys = first_request["RequestItems"]["evolvesprouts-poll-responses"]["Keys"]
+    assert [key["sk"]["S"] for key in keys] == ["CONTROL", answer_sk]
+    assert table.meta.client.batch_get_item.call_count == 2
+    table.get_item.assert_not_called()
+
+
 def test_poll_answer_payload_unchanged_detects_matching_select() -> None:
     existing = {
         "selectedOption": "Parent",
@@ -114,7 +220,7 @@ def test_poll_answer_payload_unchanged_treats_multiselect_order_as_idempotent()
     )
 
 
-def test_upsert_poll_answer_reuses_existing_item_without_get_item(
+def test_put_poll_answer_rate_limited_keeps_existing_created_at(
     mock_env: Any,
 ) -> None:
     table = MagicMock()
@@ -126,18 +232,13 @@ def test_upsert_poll_answer_reuses_existing_item_without_get_item(
         "sk": "SESSION#550e8400-e29b-41d4-a716-446655440000#Q#role",
         "createdAt": "2026-06-01T11:00:00Z",
     }
-    store.upsert_poll_answer(
-        poll_slug="workshop-food-jun-26",
-        session_id="550e8400-e29b-41d4-a716-446655440000",
-        question_id="role",
-        question_type="select",
-        selected_option="Parent",
-        existing_item=existing,
-    )
+    _put_answer(existing_item=existing)
 
     table.get_item.assert_not_called()
-    item = table.put_item.call_args.kwargs["Item"]
+    table.put_item.assert_not_called()
+    item = _deserialize(_transact_items(table)[1]["Put"]["Item"])
     assert item["createdAt"] == "2026-06-01T11:00:00Z"
+    assert item["selectedOption"] == "Parent"
 
 
 def test_clear_poll_answers_deletes_rate_limit_rows(
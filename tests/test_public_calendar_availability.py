@@ -25,6 +25,16 @@ class _Ctx:
         return None
 
 
+@pytest.fixture(autouse=True)
+def _compute_without_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "app.api.public_calendar_availability.load_available_slots",
+        lambda session, spec, from_date, to_date, now: spec.compute(
+            session, from_date, to_date, now
+        ),
+    )
+
+
 def test_purpose_required_400(
     api_gateway_event: Any, monkeypatch: pytest.MonkeyPatch
 ) -> None:
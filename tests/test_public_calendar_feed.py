@@ -0,0 +1,216 @@
+"""Tests for the precomputed public calendar feed snapshot."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.models.enums import ServiceType
+from app.db.repositories.public_calendar_feed_snapshot import (
+    PublicCalendarFeedSnapshotRepository,
+)
+from app.services import public_calendar_feed as feed
+
+_NOW = datetime(2026, 5, 1, 9, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _reset_memo() -> Iterator[None]:
+    feed.reset_feed_memo()
+    yield
+    feed.reset_feed_memo()
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE public_calendar_feed_snapshots ("
+                "feed_key TEXT PRIMARY KEY, payload JSON NOT NULL DEFAULT '[]', "
+                "etag TEXT, stale BOOLEAN NOT NULL DEFAULT 1, built_at TIMESTAMP, "
+                "truncated BOOLEAN NOT NULL DEFAULT 0)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO public_calendar_feed_snapshots (feed_key) "
+                "VALUES ('public_calendar')"
+            )
+        )
+    with Session(engine) as s:
+        yield s
+
+
+class _Builder:
+    def __init__(self, events: list[dict[str, Any]], truncated: bool = False) -> None:
+        self.events = events
+        self.truncated = truncated
+        self.calls = 0
+
+    def __call__(self) -> tuple[list[dict[str, Any]], bool]:
+        self.calls += 1
+        return list(self.events), self.truncated
+
+
+def _mark_stale(session: Session) -> None:
+    session.execute(text("UPDATE public_calendar_feed_snapshots SET stale = 1"))
+    session.commit()
+
+
+def test_stale_snapshot_is_rebuilt_and_stored(session: Session) -> None:
+    build = _Builder([{"slug": "a", "service_type": "event"}])
+
+    snapshot = feed.load_feed_snapshot(session, now=_NOW, build=build)
+
+    assert build.calls == 1
+    assert snapshot.events == [{"slug": "a", "service_type": "event"}]
+    stale, etag = session.execute(
+        text("SELECT stale, etag FROM public_calendar_feed_snapshots")
+    ).one()
+    assert not stale
+    assert etag == snapshot.etag == feed.feed_etag(snapshot.events)
+
+
+def test_fresh_snapshot_is_served_from_table_then_memo(session: Session) -> None:
+    feed.load_feed_snapshot(session, now=_NOW, build=_Builder([{"slug": "a"}]))
+    feed.reset_feed_memo()
+    build = _Builder([{"slug": "b"}])
+
+    first = feed.load_feed_snapshot(session, now=_NOW, build=build)
+    _mark_stale(session)
+    second = feed.load_feed_snapshot(session, now=_NOW, build=build)
+
+    assert build.calls == 0
+    assert first.events == [{"slug": "a"}]
+    # Within MEMO_RECHECK_SECONDS the container does not re-read the table.
+    assert second is first
+
+
+def test_trigger_marked_stale_snapshot_rebuilds_after_recheck(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    feed.load_feed_snapshot(session, now=_NOW, build=_Builder([{"slug": "a"}]))
+    _mark_stale(session)
+    monkeypatch.setattr(feed, "MEMO_RECHECK_SECONDS", 0.0)
+    build = _Builder([{"slug": "b"}])
+
+    snapshot = feed.load_feed_snapshot(session, now=_NOW, build=build)
+
+    assert build.calls == 1
+    assert snapshot.events == [{"slug": "b"}]
+
+
+def test_old_snapshot_rebuilds_without_trigger(session: Session) -> None:
+    feed.load_feed_snapshot(session, now=_NOW, build=_Builder([{"slug": "a"}]))
+    build = _Builder([{"slug": "a"}])
+    later = _NOW + feed.SNAPSHOT_MAX_AGE + timedelta(seconds=1)
+
+    snapshot = feed.load_feed_snapshot(session, now=later, build=build)
+
+    assert build.calls == 1
+    assert snapshot.built_at == later
+
+
+def test_locked_snapshot_row_serves_live_build_without_waiting(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        PublicCalendarFeedSnapshotRepository, "try_lock", lambda _self, _key: False
+    )
+    build = _Builder([{"slug": "live"}], truncated=True)
+
+    snapshot = feed.load_feed_snapshot(session, now=_NOW, build=build)
+    again = feed.load_feed_snapshot(session, now=_NOW, build=build)
+
+    assert build.calls == 2
+    assert snapshot.events == [{"slug": "live"}]
+    assert snapshot.truncated
+    assert again is not snapshot
+    stale, etag = session.execute(
+        text("SELECT stale, etag FROM public_calendar_feed_snapshots")
+    ).one()
+    assert stale
+    assert etag is None
+
+
+def test_rebuild_skips_save_when_row_is_locked_after_build(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    locks = iter([True, False])
+    monkeypatch.setattr(
+        PublicCalendarFeedSnapshotRepository,
+        "try_lock",
+        lambda _self, _key: next(locks),
+    )
+
+    snapshot = feed.load_feed_snapshot(
+        session, now=_NOW, build=_Builder([{"slug": "a"}])
+    )
+
+    assert snapshot.events == [{"slug": "a"}]
+    assert (
+        session.execute(
+            text("SELECT etag FROM public_calendar_feed_snapshots")
+        ).scalar_one()
+        is None
+    )
+
+
+def test_truncated_flag_round_trips_through_the_table(session: Session) -> None:
+    feed.load_feed_snapshot(
+        session, now=_NOW, build=_Builder([{"slug": "a"}], truncated=True)
+    )
+    feed.reset_feed_memo()
+
+    snapshot = feed.load_feed_snapshot(session, now=_NOW, build=_Builder([]))
+
+    assert snapshot.truncated
+    assert snapshot.events == [{"slug": "a"}]
+
+
+def test_filter_feed_snapshot_matches_sql_filters() -> None:
+    events = [
+        {"slug": "Spring-1", "service_type": "event", "service_key": "Spring"},
+        {"slug": "course-1", "service_type": "training_course", "service_key": "mba"},
+        {"slug": "spring-2", "service_type": "event", "service_key": "spring"},
+    ]
+    snapshot = feed.FeedSnapshot(etag="e", built_at=_NOW, events=events)
+
+    _, by_key = feed.filter_feed_snapshot(
+        snapshot, service_types=None, slug=None, service_key="spring"
+    )
+    _, by_type = feed.filter_feed_snapshot(
+        snapshot,
+        service_types={ServiceType.TRAINING_COURSE},
+        slug=None,
+        service_key=None,
+    )
+    _, by_slug = feed.filter_feed_snapshot(
+        snapshot, service_types=None, slug="spring-1", service_key=None
+    )
+
+    assert [e["slug"] for e in by_key] == ["Spring-1", "spring-2"]
+    assert [e["slug"] for e in by_type] == ["course-1"]
+    assert [e["slug"] for e in by_slug] == ["Spring-1"]
+
+
+def test_filter_feed_snapshot_caps_response_rows() -> None:
+    events = [{"slug": f"e-{i}", "service_type": "event"} for i in range(150)]
+    snapshot = feed.FeedSnapshot(etag="e", built_at=_NOW, events=events)
+
+    etag, items = feed.filter_feed_snapshot(
+        snapshot, service_types=None, slug=None, service_key=None
+    )
+    other_etag, _ = feed.filter_feed_snapshot(
+        snapshot, service_types={ServiceType.EVENT}, slug=None, service_key=None
+    )
+
+    assert len(items) == feed.FEED_RESPONSE_LIMIT
+    assert etag != other_etag
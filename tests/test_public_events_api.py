@@ -7,13 +7,43 @@ from types import SimpleNamespace
 from typing import Any
 from uuid import uuid4
 
+import pytest
+
 from app.api import public_events
 from app.db.models import ServiceType
+from app.services.public_calendar_feed import FeedSnapshot, feed_etag
 from app.utils import CACHE_CONTROL_EDGE_CACHEABLE_GET
 
 _EXPECTED_CACHE_CONTROL_SUCCESS = CACHE_CONTROL_EDGE_CACHEABLE_GET
 
 
+@pytest.fixture(autouse=True)
+def _in_memory_feed_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Build the feed snapshot on every request without the snapshot table."""
+
+    def _load(_session: Any, *, now: datetime, build: Any) -> FeedSnapshot:
+        events, truncated = build()
+        return FeedSnapshot(
+            etag=feed_etag(events), built_at=now, events=events, truncated=truncated
+        )
+
+    monkeypatch.setattr(public_events, "load_feed_snapshot", _load)
+
+
+@pytest.fixture
+def feed_filters(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Normalized filters the handler applied to the snapshot."""
+    captured: dict[str, Any] = {}
+    real = public_events.filter_feed_snapshot
+
+    def _capture(snapshot: FeedSnapshot, **kwargs: Any) -> Any:
+        captured.update(kwargs)
+        return real(snapshot, **kwargs)
+
+    monkeypatch.setattr(public_events, "filter_feed_snapshot", _capture)
+    return captured
+
+
 def _instance_row(
     *,
     status: Any,
@@ -113,11 +143,12 @@ def test_handle_public_events_returns_items(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            assert limit == 100
+            # Snapshot cap plus one row to detect truncation.
+            assert limit == 1001
             assert isinstance(now, datetime)
             assert slug is None
             assert service_types is None
@@ -201,9 +232,9 @@ def test_handle_public_events_skips_instances_without_valid_slug(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
             return [
                 _instance_row(
@@ -260,9 +291,9 @@ def test_handle_public_events_includes_instance_when_slug_is_set(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
             return [row]
 
@@ -285,10 +316,8 @@ def test_handle_public_events_includes_instance_when_slug_is_set(
 
 
 def test_handle_public_events_slug_filter(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -311,20 +340,23 @@ def test_handle_public_events_slug_filter(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["slug"] = slug
-            captured["service_types"] = service_types
-            captured["service_key"] = service_key
-            return [_instance_row(status=public_events.InstanceStatus.OPEN)]
+            return [
+                _instance_row(
+                    status=public_events.InstanceStatus.OPEN,
+                    slug="may-2026-the-missing-piece",
+                ),
+                _instance_row(status=public_events.InstanceStatus.OPEN),
+            ]
 
         def get_enrollment_counts_for_instances(
             self, instance_ids: list[Any]
         ) -> dict[Any, int]:
-            assert len(instance_ids) == 1
-            return {instance_ids[0]: 0}
+            assert len(instance_ids) == 2
+            return {iid: 0 for iid in instance_ids}
 
     monkeypatch.setattr(public_events, "Session", _SessionCtx)
     monkeypatch.setattr(public_events, "get_engine", lambda: object())
@@ -340,17 +372,15 @@ def test_handle_public_events_slug_filter(
         "GET",
     )
     assert response["statusCode"] == 200
-    assert captured["slug"] == slug
+    assert feed_filters["slug"] == slug
     body = json.loads(response["body"])
     assert len(body["events"]) == 1
     assert response["headers"]["Cache-Control"] == _EXPECTED_CACHE_CONTROL_SUCCESS
 
 
 def test_handle_public_events_invalid_slug_ignored(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -373,12 +403,10 @@ def test_handle_public_events_invalid_slug_ignored(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["slug"] = slug
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -397,14 +425,12 @@ def test_handle_public_events_invalid_slug_ignored(
         ),
         "GET",
     )
-    assert captured["slug"] is None
+    assert feed_filters["slug"] is None
 
 
 def test_handle_public_events_service_type_training_course(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -427,12 +453,10 @@ def test_handle_public_events_service_type_training_course(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_types"] = service_types
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -451,15 +475,13 @@ def test_handle_public_events_service_type_training_course(
         ),
         "GET",
     )
-    assert captured["service_types"] == {ServiceType.TRAINING_COURSE}
-    assert captured["service_key"] is None
+    assert feed_filters["service_types"] == {ServiceType.TRAINING_COURSE}
+    assert feed_filters["service_key"] is None
 
 
 def test_handle_public_events_invalid_service_type_defaults(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -482,12 +504,10 @@ def test_handle_public_events_invalid_service_type_defaults(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_types"] = service_types
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -506,15 +526,13 @@ def test_handle_public_events_invalid_service_type_defaults(
         ),
         "GET",
     )
-    assert captured["service_types"] is None
-    assert captured["service_key"] is None
+    assert feed_filters["service_types"] is None
+    assert feed_filters["service_key"] is None
 
 
 def test_handle_public_events_service_key_passthrough(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -537,11 +555,10 @@ def test_handle_public_events_service_key_passthrough(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -560,14 +577,12 @@ def test_handle_public_events_service_key_passthrough(
         ),
         "GET",
     )
-    assert captured["service_key"] == "my-best-auntie-training-course"
+    assert feed_filters["service_key"] == "my-best-auntie-training-course"
 
 
 def test_handle_public_events_service_key_trims_and_lowercases(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -590,11 +605,10 @@ def test_handle_public_events_service_key_trims_and_lowercases(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -613,14 +627,12 @@ def test_handle_public_events_service_key_trims_and_lowercases(
         ),
         "GET",
     )
-    assert captured["service_key"] == "my-best-auntie-training-course"
+    assert feed_filters["service_key"] == "my-best-auntie-training-course"
 
 
 def test_handle_public_events_service_key_invalid_ignored(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -643,11 +655,10 @@ def test_handle_public_events_service_key_invalid_ignored(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -666,13 +677,12 @@ def test_handle_public_events_service_key_invalid_ignored(
         ),
         "GET",
     )
-    assert captured["service_key"] is None
+    assert feed_filters["service_key"] is None
 
 
 def test_handle_public_events_service_key_too_long_ignored(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
     long_slug = "a" * 81
 
     class _FakeSession:
@@ -697,11 +707,10 @@ def test_handle_public_events_service_key_too_long_ignored(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -720,14 +729,12 @@ def test_handle_public_events_service_key_too_long_ignored(
         ),
         "GET",
     )
-    assert captured["service_key"] is None
+    assert feed_filters["service_key"] is None
 
 
 def test_handle_public_events_service_key_blank_ignored(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -750,11 +757,10 @@ def test_handle_public_events_service_key_blank_ignored(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -773,7 +779,7 @@ def test_handle_public_events_service_key_blank_ignored(
         ),
         "GET",
     )
-    assert captured["service_key"] is None
+    assert feed_filters["service_key"] is None
 
     public_events.handle_public_events(
         api_gateway_event(
@@ -782,7 +788,7 @@ def test_handle_public_events_service_key_blank_ignored(
         ),
         "GET",
     )
-    assert captured["service_key"] is None
+    assert feed_filters["service_key"] is None
 
 
 def test_handle_public_events_service_key_unknown_returns_empty(
@@ -810,12 +816,16 @@ def test_handle_public_events_service_key_unknown_returns_empty(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            assert service_key == "unknown-service"
-            return []
+            return [
+                _instance_row(
+                    status=public_events.InstanceStatus.OPEN,
+                    service_key="spring-parent-key",
+                )
+            ]
 
         def get_enrollment_counts_for_instances(
             self, _instance_ids: list[Any]
@@ -839,10 +849,8 @@ def test_handle_public_events_service_key_unknown_returns_empty(
 
 
 def test_handle_public_events_combined_filters(
-    monkeypatch: Any, api_gateway_event: Any
+    monkeypatch: Any, api_gateway_event: Any, feed_filters: dict[str, Any]
 ) -> None:
-    captured: dict[str, Any] = {}
-
     class _FakeSession:
         pass
 
@@ -865,13 +873,10 @@ def test_handle_public_events_combined_filters(
             *,
             limit: int,
             now: datetime,
-            service_types: Any,
-            slug: str | None,
-            service_key: str | None,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
         ) -> list[Any]:
-            captured["service_types"] = service_types
-            captured["slug"] = slug
-            captured["service_key"] = service_key
             return []
 
         def get_enrollment_counts_for_instances(
@@ -894,9 +899,173 @@ def test_handle_public_events_combined_filters(
         ),
         "GET",
     )
-    assert captured["service_key"] == "my-best-auntie-training-course"
-    assert captured["service_types"] == {ServiceType.TRAINING_COURSE}
-    assert captured["slug"] == "foo-bar"
+    assert feed_filters["service_key"] == "my-best-auntie-training-course"
+    assert feed_filters["service_types"] == {ServiceType.TRAINING_COURSE}
+    assert feed_filters["slug"] == "foo-bar"
+
+
+def _two_service_repository(calls: list[dict[str, Any]] | None = None) -> Any:
+    """Fake repository applying the public filters like the SQL query."""
+
+    class _FakeRepository:
+        def __init__(self, _session: Any) -> None:
+            pass
+
+        def list_public_offerings(
+            self,
+            *,
+            limit: int,
+            now: datetime,
+            service_types: Any = None,
+            slug: str | None = None,
+            service_key: str | None = None,
+        ) -> list[Any]:
+            if calls is not None:
+                calls.append(
+                    {
+                        "limit": limit,
+                        "service_types": service_types,
+                        "slug": slug,
+                        "service_key": service_key,
+                    }
+                )
+            rows = [
+                _instance_row(
+                    status=public_events.InstanceStatus.OPEN,
+                    service_key="Spring-Parent-Key",
+                ),
+                _instance_row(
+                    status=public_events.InstanceStatus.OPEN,
+                    slug="summer-workshop",
+                    service_key="summer-parent-key",
+                ),
+            ]
+            return [
+                row
+                for row in rows
+                if (service_types is None or row.service.service_type in service_types)
+                and (slug is None or row.slug.lower() == slug)
+                and (
+                    service_key is None
+                    or row.service.service_key.lower() == service_key
+                )
+            ][:limit]
+
+        def get_enrollment_counts_for_instances(
+            self, instance_ids: list[Any]
+        ) -> dict[Any, int]:
+            return {iid: 0 for iid in instance_ids}
+
+    return _FakeRepository
+
+
+class _NullSessionCtx:
+    def __init__(self, _engine: Any) -> None:
+        pass
+
+    def __enter__(self) -> object:
+        return object()
+
+    def __exit__(self, *_args: Any) -> bool:
+        return False
+
+
+def test_handle_public_events_sends_slug_and_service_key_filters_to_sql(
+    monkeypatch: Any, api_gateway_event: Any
+) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(public_events, "Session", _NullSessionCtx)
+    monkeypatch.setattr(public_events, "get_engine", lambda: object())
+    monkeypatch.setattr(
+        public_events, "ServiceInstanceRepository", _two_service_repository(calls)
+    )
+
+    by_key = public_events.handle_public_events(
+        api_gateway_event(
+            method="GET", query_params={"service_key": "spring-parent-key"}
+        ),
+        "GET",
+    )
+    by_slug = public_events.handle_public_events(
+        api_gateway_event(method="GET", query_params={"slug": "summer-workshop"}),
+        "GET",
+    )
+    by_type = public_events.handle_public_events(
+        api_gateway_event(
+            method="GET", query_params={"service_type": "training_course"}
+        ),
+        "GET",
+    )
+
+    assert [e["slug"] for e in json.loads(by_key["body"])["events"]] == [
+        "spring-workshop"
+    ]
+    assert [e["slug"] for e in json.loads(by_slug["body"])["events"]] == [
+        "summer-workshop"
+    ]
+    assert json.loads(by_type["body"])["events"] == []
+    assert by_key["headers"]["ETag"] != by_slug["headers"]["ETag"]
+    assert [(c["limit"], c["slug"], c["service_key"]) for c in calls] == [
+        (101, None, "spring-parent-key"),
+        (101, "summer-workshop", None),
+        # A complete (untruncated) snapshot serves the type filter in memory.
+        (1001, None, None),
+    ]
+
+
+def test_handle_public_events_type_filter_uses_sql_when_snapshot_truncated(
+    monkeypatch: Any, api_gateway_event: Any
+) -> None:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(public_events, "Session", _NullSessionCtx)
+    monkeypatch.setattr(public_events, "get_engine", lambda: object())
+    monkeypatch.setattr(
+        public_events, "ServiceInstanceRepository", _two_service_repository(calls)
+    )
+    monkeypatch.setattr(public_events, "_FEED_SNAPSHOT_LIMIT", 1)
+
+    response = public_events.handle_public_events(
+        api_gateway_event(method="GET", query_params={"service_type": "event"}),
+        "GET",
+    )
+
+    assert len(json.loads(response["body"])["events"]) == 2
+    assert [(c["limit"], c["service_types"]) for c in calls] == [
+        (2, None),
+        (101, {ServiceType.EVENT}),
+    ]
+
+
+def test_handle_public_events_if_none_match_returns_304(
+    monkeypatch: Any, api_gateway_event: Any
+) -> None:
+    monkeypatch.setattr(public_events, "Session", _NullSessionCtx)
+    monkeypatch.setattr(public_events, "get_engine", lambda: object())
+    monkeypatch.setattr(
+        public_events, "ServiceInstanceRepository", _two_service_repository()
+    )
+
+    first = public_events.handle_public_events(
+        api_gateway_event(method="GET"),
+        "GET",
+    )
+    etag = first["headers"]["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    revalidated = public_events.handle_public_events(
+        api_gateway_event(method="GET", headers={"If-None-Match": f"W/{etag}"}),
+        "GET",
+    )
+    assert revalidated["statusCode"] == 304
+    assert revalidated["body"] == ""
+    assert revalidated["headers"]["ETag"] == etag
+    assert revalidated["headers"]["Cache-Control"] == _EXPECTED_CACHE_CONTROL_SUCCESS
+
+    changed = public_events.handle_public_events(
+        api_gateway_event(method="GET", headers={"if-none-match": '"other"'}),
+        "GET",
+    )
+    assert changed["statusCode"] == 200
 
 
 def test_parse_service_key_none() -> None:
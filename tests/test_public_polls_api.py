@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import json
+from decimal import Decimal
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 
 from app.api import public_polls as pp
+from app.services import poll_control_cache
 from app.services import poll_responses_store as store
 
 
 @pytest.fixture(autouse=True)
 def reset_poll_store() -> None:
     store.reset_table_for_tests()
+    poll_control_cache.clear_poll_control_cache()
     yield
     store.reset_table_for_tests()
+    poll_control_cache.clear_poll_control_cache()
 
 
 def _event(api_gateway_event: Any, *, body: dict[str, Any]) -> dict[str, Any]:
@@ -43,9 +48,36 @@ def _poll_control_item(
     return {"Item": item}
 
 
-def test_put_poll_answer_persists_select(api_gateway_event: Any, mock_env: Any) -> None:
+def _answer_table(
+    control: dict[str, Any],
+    *,
+    existing: dict[str, Any] | None = None,
+) -> MagicMock:
+    """Mock table whose client serves the answer path's BatchGetItem."""
+    serializer = TypeSerializer()
+    rows = [control["Item"]] + ([existing] if existing else [])
     table = MagicMock()
-    table.get_item.return_value = _poll_control_item("role")
+    table.meta.client.batch_get_item.return_value = {
+        "Responses": {
+            "evolvesprouts-poll-responses": [
+                {name: serializer.serialize(value) for name, value in row.items()}
+                for row in rows
+            ]
+        }
+    }
+    return table
+
+
+def _written_answer(table: MagicMock) -> dict[str, Any]:
+    """Answer item from the Put half of the TransactWriteItems call."""
+    deserializer = TypeDeserializer()
+    transact = table.meta.client.transact_write_items.call_args.kwargs
+    item = transact["TransactItems"][1]["Put"]["Item"]
+    return {name: deserializer.deserialize(value) for name, value in item.items()}
+
+
+def test_put_poll_answer_persists_select(api_gateway_event: Any, mock_env: Any) -> None:
+    table = _answer_table(_poll_control_item("role"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -61,7 +93,7 @@ def test_put_poll_answer_persists_select(api_gateway_event: Any, mock_env: Any)
         "/www/v1/polls/workshop-food-jun-26/answers",
     )
     assert resp["statusCode"] == 200
-    item = table.put_item.call_args.kwargs["Item"]
+    item = _written_answer(table)
     assert item["selectedOption"] == "Parent"
 
 
@@ -69,8 +101,7 @@ def test_put_poll_answer_persists_multiselect(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("challenge")
+    table = _answer_table(_poll_control_item("challenge"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -89,7 +120,7 @@ def test_put_poll_answer_persists_multiselect(
         "/www/v1/polls/workshop-food-jun-26/answers",
     )
     assert resp["statusCode"] == 200
-    item = table.put_item.call_args.kwargs["Item"]
+    item = _written_answer(table)
     assert item["selectedOptions"] == [
         "My child refuses new foods",
         "Mealtimes are stressful for everyone",
@@ -99,8 +130,7 @@ def test_put_poll_answer_persists_multiselect(
 def test_put_poll_answer_persists_truefalse(
     api_gateway_event: Any, mock_env: Any
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("myth1")
+    table = _answer_table(_poll_control_item("myth1"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -116,13 +146,12 @@ def test_put_poll_answer_persists_truefalse(
         "/www/v1/polls/workshop-food-jun-26/answers",
     )
     assert resp["statusCode"] == 200
-    item = table.put_item.call_args.kwargs["Item"]
+    item = _written_answer(table)
     assert item["booleanAnswer"] is False
 
 
 def test_put_poll_answer_persists_text(api_gateway_event: Any, mock_env: Any) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("onething")
+    table = _answer_table(_poll_control_item("onething"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -138,13 +167,12 @@ def test_put_poll_answer_persists_text(api_gateway_event: Any, mock_env: Any) ->
         "/www/v1/polls/workshop-food-jun-26/answers",
     )
     assert resp["statusCode"] == 200
-    item = table.put_item.call_args.kwargs["Item"]
+    item = _written_answer(table)
     assert item["freeText"] == "Offer fruit at every meal"
 
 
 def test_put_poll_answer_persists_email(api_gateway_event: Any, mock_env: Any) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("email")
+    table = _answer_table(_poll_control_item("email"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -498,8 +526,7 @@ def test_put_poll_answer_rejects_disabled_question(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("role")
+    table = _answer_table(_poll_control_item("role"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -517,15 +544,14 @@ def test_put_poll_answer_rejects_disabled_question(
     assert resp["statusCode"] == 409
     body = json.loads(resp["body"])
     assert body["error"] == "question_not_open"
-    table.put_item.assert_not_called()
+    table.meta.client.transact_write_items.assert_not_called()
 
 
 def test_put_poll_answer_rejects_when_poll_not_accepting(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item()
+    table = _answer_table(_poll_control_item())
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -543,7 +569,7 @@ def test_put_poll_answer_rejects_when_poll_not_accepting(
     assert resp["statusCode"] == 409
     payload = json.loads(resp["body"])
     assert payload["error"] == "poll_not_accepting_answers"
-    table.put_item.assert_not_called()
+    table.meta.client.transact_write_items.assert_not_called()
 
 
 def test_put_poll_answer_rejects_unknown_path(api_gateway_event: Any) -> None:
@@ -563,15 +589,16 @@ def test_put_poll_answer_rejects_option_not_in_published_list(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item(
-        "role",
-        question_options={
-            "role": {
-                "type": "select",
-                "options": ["Parent", "Professional"],
-            }
-        },
+    table = _answer_table(
+        _poll_control_item(
+            "role",
+            question_options={
+                "role": {
+                    "type": "select",
+                    "options": ["Parent", "Professional"],
+                }
+            },
+        )
     )
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
@@ -590,22 +617,23 @@ def test_put_poll_answer_rejects_option_not_in_published_list(
     assert resp["statusCode"] == 409
     payload = json.loads(resp["body"])
     assert payload["error"] == "option_not_allowed"
-    table.put_item.assert_not_called()
+    table.meta.client.transact_write_items.assert_not_called()
 
 
 def test_put_poll_answer_accepts_option_in_published_list(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item(
-        "role",
-        question_options={
-            "role": {
-                "type": "select",
-                "options": ["Parent", "Professional"],
-            }
-        },
+    table = _answer_table(
+        _poll_control_item(
+            "role",
+            question_options={
+                "role": {
+                    "type": "select",
+                    "options": ["Parent", "Professional"],
+                }
+            },
+        )
     )
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
@@ -628,8 +656,7 @@ def test_put_poll_answer_skips_option_check_without_published_options(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("role")
+    table = _answer_table(_poll_control_item("role"))
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -686,9 +713,8 @@ def test_put_poll_answer_rejects_rate_limited_session(
     api_gateway_event: Any,
     mock_env: Any,
 ) -> None:
-    table = MagicMock()
-    table.get_item.return_value = _poll_control_item("role")
-    table.update_item.side_effect = _rate_limit_conditional_failure
+    table = _answer_table(_poll_control_item("role"))
+    table.meta.client.transact_write_items.side_effect = _rate_limit_conditional_failure
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -706,6 +732,8 @@ def test_put_poll_answer_rejects_rate_limited_session(
     assert resp["statusCode"] == 429
     payload = json.loads(resp["body"])
     assert payload["error"] == "poll_write_rate_limit_exceeded"
+    # The answer Put rides in the cancelled transaction, so nothing is written.
+    table.meta.client.transact_write_items.assert_called_once()
     table.put_item.assert_not_called()
 
 
@@ -715,20 +743,16 @@ def test_put_poll_answer_idempotent_resubmit_skips_rate_limit_and_write(
 ) -> None:
     session_id = "550e8400-e29b-41d4-a716-446655440000"
     answer_sk = f"SESSION#{session_id}#Q#role"
-    table = MagicMock()
-    table.get_item.side_effect = lambda Key, **_kwargs: (
-        _poll_control_item("role")
-        if Key["sk"] == "CONTROL"
-        else {
-            "Item": {
-                "pk": "POLL#workshop-food-jun-26",
-                "sk": answer_sk,
-                "selectedOption": "Parent",
-                "updatedAt": "2026-06-01T12:00:00Z",
-            }
-        }
+    table = _answer_table(
+        _poll_control_item("role"),
+        existing={
+            "pk": "POLL#workshop-food-jun-26",
+            "sk": answer_sk,
+            "selectedOption": "Parent",
+            "updatedAt": "2026-06-01T12:00:00Z",
+        },
     )
-    table.update_item.side_effect = _rate_limit_conditional_failure
+    table.meta.client.transact_write_items.side_effect = _rate_limit_conditional_failure
     store.configure_table_for_tests(table)
     mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
 
@@ -747,12 +771,181 @@ def test_put_poll_answer_idempotent_resubmit_skips_rate_limit_and_write(
     payload = json.loads(resp["body"])
     assert payload["updatedAt"] == "2026-06-01T12:00:00Z"
     table.update_item.assert_not_called()
-    table.put_item.assert_not_called()
+    table.meta.client.transact_write_items.assert_not_called()
 
 
 def _rate_limit_conditional_failure(*_args: Any, **_kwargs: Any) -> None:
     from botocore.exceptions import ClientError
 
+    raise ClientError(
+        {
+            "Error": {
+                "Code": "TransactionCanceledException",
+                "Message": "Transaction cancelled",
+            },
+            "CancellationReasons": [
+                {"Code": "ConditionalCheckFailed"},
+                {"Code": "None"},
+            ],
+        },
+        "TransactWriteItems",
+    )
+
+
+def _control_event(
+    api_gateway_event: Any,
+    *,
+    query_params: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    return api_gateway_event(
+        method="GET",
+        path="/www/v1/polls/workshop-food-jun-26/control",
+        query_params=query_params,
+        headers=headers,
+    )
+
+
+def test_get_poll_control_caches_state_and_answers_conditional_requests(
+    api_gateway_event: Any,
+    mock_env: Any,
+) -> None:
+    table = MagicMock()
+    control = _poll_control_item("role")
+    control["Item"]["version"] = Decimal(3)
+    table.get_item.return_value = control
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+    path = "/www/v1/polls/workshop-food-jun-26/control"
+
+    first = pp.handle_public_polls_request(
+        _control_event(api_gateway_event), "GET", path
+    )
+    etag = first["headers"]["ETag"]
+    revalidated = pp.handle_public_polls_request(
+        _control_event(api_gateway_event, headers={"If-None-Match": etag}),
+        "GET",
+        path,
+    )
+    unchanged = pp.handle_public_polls_request(
+        _control_event(api_gateway_event, query_params={"sinceVersion": "3"}),
+        "GET",
+        path,
+    )
+    newer = pp.handle_public_polls_request(
+        _control_event(api_gateway_event, query_params={"sinceVersion": "2"}),
+        "GET",
+        path,
+    )
+    invalid = pp.handle_public_polls_request(
+        _control_event(api_gateway_event, query_params={"sinceVersion": "-1"}),
+        "GET",
+        path,
+    )
+
+    assert first["statusCode"] == 200
+    assert json.loads(first["body"])["version"] == 3
+    assert first["headers"]["Cache-Control"] == "private, no-cache"
+    assert (revalidated["statusCode"], revalidated["body"]) == (304, "")
+    assert (unchanged["statusCode"], unchanged["body"]) == (204, "")
+    assert newer["statusCode"] == 200
+    assert invalid["statusCode"] == 400
+    table.get_item.assert_called_once()
+
+
+def test_put_poll_control_bumps_version_and_refreshes_cache(
+    api_gateway_event: Any,
+    mock_env: Any,
+) -> None:
+    table = MagicMock()
+    control = _poll_control_item("role")
+    control["Item"]["version"] = Decimal(3)
+    table.get_item.return_value = control
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+    path = "/www/v1/polls/workshop-food-jun-26/control"
+    put_event = api_gateway_event(
+        method="PUT",
+        path=path,
+        body=json.dumps({"enabledQuestionIds": ["myth1"]}),
+        headers={"content-type": "application/json"},
+    )
+
+    resp = pp.handle_public_polls_request(put_event, "PUT", path)
+    after = pp.handle_public_polls_request(
+        _control_event(api_gateway_event, query_params={"sinceVersion": "3"}),
+        "GET",
+        path,
+    )
+
+    assert resp["statusCode"] == 200
+    put_kwargs = table.put_item.call_args.kwargs
+    assert put_kwargs["Item"]["version"] == 4
+    assert put_kwargs["ExpressionAttributeValues"] == {":expected": 3}
+    assert after["statusCode"] == 200
+    assert json.loads(after["body"])["enabledQuestionIds"] == ["myth1"]
+    table.get_item.assert_called_once()
+
+    table.put_item.side_effect = _control_version_conflict
+    conflict = pp.handle_public_polls_request(put_event, "PUT", path)
+    assert conflict["statusCode"] == 409
+    assert json.loads(conflict["body"])["error"] == "poll_control_changed"
+
+
+def test_get_poll_question_results_returns_304_for_matching_etag(
+    api_gateway_event: Any,
+    mock_env: Any,
+) -> None:
+    table = MagicMock()
+    table.query.return_value = {
+        "Items": [
+            {"questionId": "role", "questionType": "select", "selectedOption": "A"}
+        ]
+    }
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+    path = "/www/v1/polls/workshop-food-jun-26/questions/role/results"
+
+    def results(headers: dict[str, str] | None = None) -> dict[str, Any]:
+        event = api_gateway_event(
+            method="GET",
+            path=path,
+            query_params={"questionType": "select"},
+            headers=headers,
+        )
+        return pp.handle_public_polls_request(event, "GET", path)
+
+    first = results()
+    repeat = results({"if-none-match": first["headers"]["ETag"]})
+    table.query.return_value["Items"].append(
+        {"questionId": "role", "questionType": "select", "selectedOption": "B"}
+    )
+    changed = results({"if-none-match": first["headers"]["ETag"]})
+
+    assert first["statusCode"] == 200
+    assert repeat["statusCode"] == 304
+    assert changed["statusCode"] == 200
+    assert json.loads(changed["body"])["totalResponses"] == 2
+
+
+def test_poll_control_cache_expires_entries(mock_env: Any) -> None:
+    table = MagicMock()
+    table.get_item.return_value = _poll_control_item("role")
+    store.configure_table_for_tests(table)
+    mock_env(POLL_RESPONSES_TABLE_NAME="evolvesprouts-poll-responses")
+    ttl = poll_control_cache.POLL_CONTROL_CACHE_TTL_SECONDS
+
+    for now in (0.0, ttl - 0.1, ttl + 0.1):
+        poll_control_cache.get_cached_poll_control_state(
+            "workshop-food-jun-26", clock=lambda now=now: now
+        )
+
+    assert table.get_item.call_count == 2
+
+
+def _control_version_conflict(*_args: Any, **_kwargs: Any) -> None:
+    from botocore.exceptions import ClientError
+
     raise ClientError(
         {
             "Error": {
@@ -760,5 +953,5 @@ def _rate_limit_conditional_failure(*_args: Any, **_kwargs: Any) -> None:
                 "Message": "conditional check failed",
             }
         },
-        "UpdateItem",
+        "PutItem",
     )
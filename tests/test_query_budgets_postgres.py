@@ -0,0 +1,69 @@
+"""PostgreSQL integration: SQL statement budgets for key admin list routes.
+
+Runs the admin handler end to end against ``TEST_DATABASE_URL`` with the
+``query_budget`` fixture; a list page that starts lazy-loading per row fails
+here instead of showing up as ``n_plus_one_suspected`` in production logs.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from app.api.admin import lambda_handler
+from app.db.engine import clear_engine_cache, get_engine
+from sqlalchemy.orm import Session
+
+from tests.helpers.db import database_url
+from tests.test_admin_list_projections_postgres import _seed
+
+pytest.importorskip("psycopg", reason="psycopg required for DB integration test")
+
+# Statements per request. Each list page is one projection query that also
+# carries the filtered total.
+_ROUTE_BUDGETS = {
+    "/v1/admin/contacts": 1,
+    "/v1/admin/families": 1,
+    "/v1/admin/organizations": 1,
+}
+
+
+@pytest.fixture
+def seeded_run(monkeypatch: pytest.MonkeyPatch) -> Any:
+    url = database_url()
+    assert url is not None
+    monkeypatch.setenv("DATABASE_URL", url)
+    monkeypatch.setenv("DATABASE_SSLMODE", "prefer")
+    monkeypatch.delenv("DATABASE_IAM_AUTH", raising=False)
+    clear_engine_cache()
+    run = f"budget{uuid4().hex[:8]}"
+    with Session(get_engine(), expire_on_commit=False) as session:
+        _seed(session, run)
+    yield run
+    clear_engine_cache()
+
+
+@pytest.mark.skipif(database_url() is None, reason="TEST_DATABASE_URL not set")
+@pytest.mark.parametrize(("path", "budget"), sorted(_ROUTE_BUDGETS.items()))
+def test_admin_list_route_stays_within_query_budget(
+    seeded_run: str,
+    path: str,
+    budget: int,
+    api_gateway_event: Any,
+    admin_identity: dict[str, str],
+    query_budget: Any,
+) -> None:
+    event = api_gateway_event(
+        path=path,
+        query_params={"query": seeded_run, "limit": "25"},
+        authorizer_context=admin_identity,
+    )
+
+    with query_budget(budget) as stats:
+        response = lambda_handler(event, None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["items"]
+    assert stats.rows >= 1
@@ -0,0 +1,144 @@
+"""Tests for per-request SQL statement counting and N+1 detection."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+import pytest
+from app.api.admin import lambda_handler
+from app.db.query_stats import instrument_engine, statement_shape
+from app.utils.logging import (
+    QueryStats,
+    StructuredLogFormatter,
+    get_logger,
+    log_query_summary,
+    query_stats,
+)
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture
+def engine() -> Any:
+    engine = instrument_engine(create_engine("sqlite://"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(
+            text("INSERT INTO items (id, name) VALUES (:id, :name)"),
+            [{"id": i, "name": f"item-{i}"} for i in range(10)],
+        )
+    yield engine
+    engine.dispose()
+
+
+def test_statement_shape_ignores_literals_and_bind_list_length() -> None:
+    assert statement_shape(
+        "SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s)\n  AND n = 5"
+    ) == statement_shape("SELECT *  FROM t WHERE id IN (%(id_1)s) AND n = 7")
+    assert statement_shape("SELECT 'a' FROM t") == "SELECT ? FROM t"
+
+
+def test_hooks_count_statements_rows_and_repeated_shapes(engine: Any) -> None:
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT id FROM items")).all()
+            for item_id in range(6):
+                conn.execute(
+                    text("SELECT name FROM items WHERE id = :id"), {"id": item_id}
+                ).all()
+    finally:
+        query_stats.reset(token)
+
+    assert stats.statements == 7
+    assert stats.db_ms > 0
+    assert stats.repeated_shapes(5) == [("SELECT name FROM items WHERE id = ?", 6)]
+    assert stats.repeated_shapes(7) == []
+
+
+def test_hooks_are_idempotent_and_inert_outside_a_request(engine: Any) -> None:
+    instrument_engine(engine)
+    stats = QueryStats()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    token = query_stats.set(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        query_stats.reset(token)
+
+    assert stats.statements == 1
+
+
+def test_log_query_summary_flags_suspected_n_plus_one(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SQL_N_PLUS_ONE_THRESHOLD", "3")
+    stats = QueryStats()
+    stats.record("SELECT a FROM t", elapsed_ms=1.5, rows=10)
+    for _ in range(3):
+        stats.record("SELECT b FROM u WHERE id = ?", elapsed_ms=0.5, rows=1)
+    token = query_stats.set(stats)
+    try:
+        with caplog.at_level(logging.INFO):
+            log_query_summary(get_logger(__name__), path="/v1/admin/contacts")
+    finally:
+        query_stats.reset(token)
+
+    (record,) = [r for r in caplog.records if r.getMessage() == "SQL summary"]
+    assert record.levelno == logging.WARNING
+    payload = json.loads(StructuredLogFormatter().format(record))
+    assert payload["sql"] == {
+        "path": "/v1/admin/contacts",
+        "statements": 4,
+        "distinct_statements": 2,
+        "db_ms": 3.0,
+        "rows": 13,
+        "n_plus_one_suspected": True,
+        "repeated_statements": [
+            {"count": 3, "statement": "SELECT b FROM u WHERE id = ?"}
+        ],
+    }
+
+
+def test_admin_handler_logs_one_summary_per_request(
+    api_gateway_event: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO):
+        response = lambda_handler(api_gateway_event(path="/v1/unknown"), None)
+
+    assert response["statusCode"] == 404
+    summaries = [r for r in caplog.records if r.getMessage() == "SQL summary"]
+    assert len(summaries) == 1
+    assert summaries[0].sql["statements"] == 0
+    assert summaries[0].sql["n_plus_one_suspected"] is False
+    assert query_stats.get() is None
+
+
+def test_query_budget_fails_when_exceeded(engine: Any, query_budget: Any) -> None:
+    with query_budget(2) as stats, engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert stats.statements == 1
+
+    with (
+        pytest.raises(pytest.fail.Exception, match="exceed the budget of 1"),
+        query_budget(1),
+        engine.connect() as conn,
+    ):
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+
+def test_query_budget_fails_on_suspected_n_plus_one(
+    engine: Any, query_budget: Any
+) -> None:
+    with (
+        pytest.raises(pytest.fail.Exception, match="N\\+1 suspected"),
+        query_budget(10),
+        engine.connect() as conn,
+    ):
+        for item_id in range(5):
+            conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
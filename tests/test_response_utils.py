@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import base64
+import gzip
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID
+
 import pytest
 
+from app.db.models.enums import FunnelStage
 from app.exceptions import ValidationError
 from app.utils import CACHE_CONTROL_EDGE_CACHEABLE_GET
-from app.utils.responses import json_response, validate_content_type
+from app.utils import responses
+from app.utils.responses import (
+    encode_json,
+    get_cors_headers,
+    json_response,
+    validate_content_type,
+)
+
+_LARGE_BODY = {"items": [{"id": index, "name": "lead"} for index in range(200)]}
 
 
 def test_validate_content_type_allows_bodyless_post() -> None:
@@ -61,3 +77,79 @@ def test_validate_content_type_rejects_non_json_content_type() -> None:
 
     with pytest.raises(ValidationError, match="Content-Type must be application/json"):
         validate_content_type(event)
+
+
+def test_json_response_gzips_large_bodies_when_accepted() -> None:
+    response = json_response(
+        200,
+        _LARGE_BODY,
+        headers={"ETag": '"abc"'},
+        event={"headers": {"Accept-Encoding": "gzip, deflate, br;q=0"}},
+    )
+
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Encoding"] == "gzip"
+    assert response["headers"]["Vary"].endswith("Accept-Encoding")
+    assert response["headers"]["ETag"] == 'W/"abc"'
+    decoded = gzip.decompress(base64.b64decode(response["body"]))
+    assert json.loads(decoded) == _LARGE_BODY
+
+
+@pytest.mark.parametrize(
+    ("body", "accept_encoding"),
+    [
+        ({"ok": True}, "gzip"),
+        (_LARGE_BODY, None),
+        (_LARGE_BODY, "gzip;q=0, identity"),
+    ],
+)
+def test_json_response_leaves_body_uncompressed(
+    body: dict[str, object], accept_encoding: str | None
+) -> None:
+    headers = {"accept-encoding": accept_encoding} if accept_encoding else {}
+
+    response = json_response(200, body, event={"headers": headers})
+
+    assert "isBase64Encoded" not in response
+    assert "Content-Encoding" not in response["headers"]
+    assert json.loads(response["body"]) == body
+
+
+def test_encode_json_matches_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = {
+        "at": datetime(2026, 3, 1, 9, 30, tzinfo=UTC),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "amount": Decimal("12.50"),
+        "stage": FunnelStage.NEW,
+        1: "int key",
+    }
+    expected = {
+        "at": "2026-03-01T09:30:00+00:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "amount": "12.50",
+        "stage": "new",
+        "1": "int key",
+    }
+
+    fast = json.loads(encode_json(payload))
+    monkeypatch.setattr(responses, "orjson", None)
+    fallback = json.loads(encode_json(payload))
+
+    assert fast == fallback == expected
+
+
+def test_get_cors_headers_returns_independent_copies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(
+        "CORS_ALLOWED_ORIGINS", "https://admin.example.com,https://www.example.com"
+    )
+
+    known = get_cors_headers({"headers": {"Origin": "https://www.example.com"}})
+    known["Vary"] = "mutated"
+    unknown = get_cors_headers({"headers": {"origin": "https://evil.example"}})
+    again = get_cors_headers({"headers": {"Origin": "https://www.example.com"}})
+
+    assert again["Vary"] == "Origin"
+    assert again["Access-Control-Allow-Origin"] == "https://www.example.com"
+    assert unknown["Access-Control-Allow-Origin"] == "https://admin.example.com"
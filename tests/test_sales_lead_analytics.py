@@ -0,0 +1,265 @@
+"""Tests for sales lead analytics served from daily rollups."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services import sales_lead_analytics as analytics
+
+_CONTACT_ID = uuid4().hex
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        for ddl in (
+            "CREATE TABLE contacts (id CHAR(32) PRIMARY KEY, source TEXT)",
+            (
+                "CREATE TABLE sales_leads (id CHAR(32) PRIMARY KEY, "
+                "contact_id CHAR(32), funnel_stage TEXT NOT NULL, assigned_to TEXT, "
+                "created_at TIMESTAMP, converted_at TIMESTAMP)"
+            ),
+            (
+                "CREATE TABLE sales_lead_events (id CHAR(32) PRIMARY KEY, "
+                "lead_id CHAR(32), event_type TEXT, from_stage TEXT, to_stage TEXT, "
+                "created_at TIMESTAMP)"
+            ),
+            (
+                "CREATE TABLE sales_lead_daily_rollups (id CHAR(32) PRIMARY KEY "
+                "DEFAULT (lower(hex(randomblob(16)))), "
+                "day DATE NOT NULL, funnel_stage TEXT NOT NULL, source TEXT, "
+                "assigned_to TEXT, lead_count INTEGER NOT NULL, "
+                "converted_timed_count INTEGER NOT NULL, "
+                "convert_seconds FLOAT NOT NULL)"
+            ),
+            (
+                "CREATE TABLE sales_lead_stage_daily_rollups (day DATE NOT NULL, "
+                "stage TEXT NOT NULL, reached_leads INTEGER NOT NULL, "
+                "stage_intervals INTEGER NOT NULL, stage_seconds FLOAT NOT NULL, "
+                "PRIMARY KEY (day, stage))"
+            ),
+            (
+                "CREATE TABLE sales_lead_rollup_dirty_days (day DATE PRIMARY KEY, "
+                "marked_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            ),
+        ):
+            conn.execute(text(ddl))
+        conn.execute(
+            text("INSERT INTO contacts (id, source) VALUES (:id, 'referral')"),
+            {"id": _CONTACT_ID},
+        )
+    with Session(engine) as s:
+        yield s
+
+
+def _at(day: int, hour: int, month: int = 3) -> datetime:
+    return datetime(2026, month, day, hour, tzinfo=UTC)
+
+
+def _lead(
+    session: Session,
+    *,
+    created_at: datetime,
+    stage: str,
+    events: list[tuple[str, str | None, str, datetime]],
+    assigned_to: str | None = None,
+    contact_id: str | None = None,
+    converted_at: datetime | None = None,
+    mark_dirty: bool = True,
+) -> str:
+    lead_id = uuid4().hex
+    session.execute(
+        text(
+            "INSERT INTO sales_leads (id, contact_id, funnel_stage, assigned_to, "
+            "created_at, converted_at) VALUES (:id, :contact, :stage, :assigned, "
+            ":created, :converted)"
+        ),
+        {
+            "id": lead_id,
+            "contact": contact_id,
+            "stage": stage,
+            "assigned": assigned_to,
+            "created": created_at.replace(tzinfo=None),
+            "converted": converted_at.replace(tzinfo=None) if converted_at else None,
+        },
+    )
+    for event_type, from_stage, to_stage, at in events:
+        session.execute(
+            text(
+                "INSERT INTO sales_lead_events (id, lead_id, event_type, from_stage, "
+                "to_stage, created_at) VALUES (:id, :lead, :type, :from_, :to, :at)"
+            ),
+            {
+                "id": uuid4().hex,
+                "lead": lead_id,
+                "type": event_type,
+                "from_": from_stage,
+                "to": to_stage,
+                "at": at.replace(tzinfo=None),
+            },
+        )
+    if mark_dirty:
+        # What the sales_leads / sales_lead_events row triggers record.
+        session.execute(
+            text(
+                "INSERT OR IGNORE INTO sales_lead_rollup_dirty_days (day) VALUES (:day)"
+            ),
+            {"day": created_at.date().isoformat()},
+        )
+    session.commit()
+    return lead_id
+
+
+def _seed(session: Session, *, mark_dirty: bool = True) -> None:
+    _lead(
+        session,
+        created_at=_at(2, 10),
+        stage="converted",
+        assigned_to="alice",
+        contact_id=_CONTACT_ID,
+        converted_at=_at(4, 10),
+        events=[
+            ("created", None, "new", _at(2, 10)),
+            ("stage_changed", "new", "contacted", _at(3, 10)),
+            ("note_added", None, "contacted", _at(3, 12)),
+            ("stage_changed", "contacted", "converted", _at(4, 10)),
+        ],
+        mark_dirty=mark_dirty,
+    )
+    _lead(
+        session,
+        created_at=_at(2, 23),
+        stage="new",
+        events=[("created", None, "new", _at(2, 23))],
+        mark_dirty=mark_dirty,
+    )
+    _lead(
+        session,
+        created_at=_at(10, 8),
+        stage="lost",
+        assigned_to="alice",
+        events=[("created", None, "new", _at(10, 8))],
+        mark_dirty=mark_dirty,
+    )
+
+
+def _rollup_count(session: Session) -> int:
+    return session.execute(
+        text("SELECT COUNT(*) FROM sales_lead_daily_rollups")
+    ).scalar_one()
+
+
+def test_analytics_from_rollups(session: Session) -> None:
+    _seed(session)
+
+    result = analytics.get_sales_lead_analytics(session)
+
+    assert result["funnel"] == {
+        "new": 1,
+        "contacted": 0,
+        "engaged": 0,
+        "qualified": 0,
+        "converted": 1,
+        "lost": 1,
+    }
+    assert result["conversion_rate"] == 0.5
+    assert result["avg_days_to_convert"] == 2.0
+    assert result["source_breakdown"] == {"referral": 1, "unknown": 2}
+    assert result["stage_conversion_rates"]["new_to_contacted"] == 1 / 3
+    assert result["avg_days_in_stage"] == {"new": 1.0, "contacted": 1.0}
+    assert result["leads_over_time"] == [
+        {"period": "2026-10", "count": 2},
+        {"period": "2026-11", "count": 1},
+    ]
+    assert sorted(result["assignee_stats"], key=lambda s: str(s["assigned_to"])) == [
+        {"assigned_to": None, "total": 1, "converted": 0, "conversion_rate": 0.0},
+        {"assigned_to": "alice", "total": 2, "converted": 1, "conversion_rate": 0.5},
+    ]
+    assert _rollup_count(session) == 3
+    assert (
+        session.execute(
+            text("SELECT COUNT(*) FROM sales_lead_rollup_dirty_days")
+        ).scalar_one()
+        == 0
+    )
+
+
+def test_only_dirty_days_are_recomputed(session: Session) -> None:
+    _seed(session)
+    analytics.get_sales_lead_analytics(session)
+    session.execute(text("UPDATE sales_leads SET funnel_stage = 'contacted'"))
+    session.execute(
+        text("INSERT INTO sales_lead_rollup_dirty_days (day) VALUES ('2026-03-10')")
+    )
+    session.commit()
+
+    result = analytics.get_sales_lead_analytics(session)
+
+    # 2026-03-02 was not marked dirty, so its rollups are served unchanged.
+    assert result["funnel"]["contacted"] == 1
+    assert result["funnel"]["converted"] == 1
+    assert result["funnel"]["new"] == 1
+    assert result["funnel"]["lost"] == 0
+
+
+def test_partial_day_edges_are_exact(session: Session) -> None:
+    _seed(session)
+
+    result = analytics.get_sales_lead_analytics(
+        session, date_from=_at(2, 12), date_to=_at(10, 8)
+    )
+
+    assert result["funnel"]["new"] == 1
+    assert result["funnel"]["lost"] == 1
+    assert result["funnel"]["converted"] == 0
+    assert result["leads_over_time"] == [
+        {"period": "2026-10", "count": 1},
+        {"period": "2026-11", "count": 1},
+    ]
+
+    same_day = analytics.get_sales_lead_analytics(
+        session, date_from=_at(2, 0), date_to=_at(2, 22)
+    )
+
+    assert sum(same_day["funnel"].values()) == 1
+
+
+def test_rebuild_backfills_and_drops_orphans(session: Session) -> None:
+    _seed(session, mark_dirty=False)
+    session.execute(
+        text(
+            "INSERT INTO sales_lead_daily_rollups (id, day, funnel_stage, "
+            "lead_count, converted_timed_count, convert_seconds) "
+            "VALUES (:id, '2025-01-01', 'new', 5, 0, 0)"
+        ),
+        {"id": uuid4().hex},
+    )
+    session.commit()
+
+    days = analytics.rebuild_sales_lead_rollups(session)
+
+    assert days == 9
+    assert _rollup_count(session) == 3
+    result = analytics.get_sales_lead_analytics(session)
+    assert sum(result["funnel"].values()) == 3
+
+
+def test_day_runs_split_gaps_and_long_ranges() -> None:
+    days = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 5)]
+
+    assert list(analytics._day_runs(days)) == [
+        (days[0], days[1]),
+        (days[2], days[2]),
+    ]
+    long_run = [
+        date(2026, 1, 1) + timedelta(days=i)
+        for i in range(analytics.ROLLUP_CHUNK_DAYS + 1)
+    ]
+    assert len(list(analytics._day_runs(long_run))) == 2
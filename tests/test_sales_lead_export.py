@@ -0,0 +1,243 @@
+"""Tests for the streamed sales lead export job."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.repositories.sales_lead import SalesLeadRepository
+from app.exceptions import ValidationError
+from app.services import sales_lead_export as export
+from app.services.sales_lead_export_events import enqueue_sales_lead_export_job
+
+_NOW = datetime(2026, 3, 20, 12, tzinfo=UTC)
+
+
+class _FakeS3:
+    def __init__(self) -> None:
+        self.parts: dict[int, bytes] = {}
+        self.completed: list[dict[str, Any]] | None = None
+        self.aborted = False
+        self.created: dict[str, Any] = {}
+
+    def create_multipart_upload(self, **kwargs: Any) -> dict[str, str]:
+        self.created = kwargs
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs: Any) -> dict[str, str]:
+        self.parts[kwargs["PartNumber"]] = kwargs["Body"]
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs: Any) -> None:
+        self.completed = kwargs["MultipartUpload"]["Parts"]
+
+    def abort_multipart_upload(self, **kwargs: Any) -> None:
+        self.aborted = True
+
+    def rows(self) -> list[list[str]]:
+        data = b"".join(self.parts[number] for number in sorted(self.parts))
+        return list(csv.reader(io.StringIO(gzip.decompress(data).decode("utf-8"))))
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        for ddl in (
+            (
+                "CREATE TABLE contacts (id CHAR(32) PRIMARY KEY, first_name TEXT, "
+                "last_name TEXT, email TEXT, phone_region TEXT, "
+                "phone_national_number TEXT, source TEXT)"
+            ),
+            (
+                "CREATE TABLE sales_leads (id CHAR(32) PRIMARY KEY, "
+                "contact_id CHAR(32), lead_type TEXT, funnel_stage TEXT, "
+                "assigned_to TEXT, created_at TIMESTAMP, updated_at TIMESTAMP)"
+            ),
+            (
+                "CREATE TABLE sales_lead_events (id CHAR(32) PRIMARY KEY, "
+                "lead_id CHAR(32), event_type TEXT, to_stage TEXT, "
+                "created_at TIMESTAMP)"
+            ),
+            "CREATE TABLE tags (id CHAR(32) PRIMARY KEY, name TEXT)",
+            "CREATE TABLE contact_tags (contact_id CHAR(32), tag_id CHAR(32))",
+            (
+                "CREATE TABLE sales_lead_export_jobs (id CHAR(32) PRIMARY KEY, "
+                "created_by TEXT NOT NULL, filters JSON NOT NULL, "
+                "status VARCHAR(32) NOT NULL, total_count INTEGER, "
+                "exported_count INTEGER NOT NULL DEFAULT 0, s3_key TEXT, "
+                "byte_size BIGINT, error_message TEXT, "
+                "created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL)"
+            ),
+        ):
+            conn.execute(text(ddl))
+    yield engine
+
+
+def _seed(engine: Engine) -> list[str]:
+    contact_id, vip_id, warm_id = uuid4().hex, uuid4().hex, uuid4().hex
+    older, newer = uuid4().hex, uuid4().hex
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO contacts VALUES (:id, 'Ada', 'Lee', 'ada@example.com', "
+                "'HK', '91234567', 'referral')"
+            ),
+            {"id": contact_id},
+        )
+        conn.execute(
+            text("INSERT INTO tags VALUES (:vip, 'vip'), (:warm, 'warm')"),
+            {"vip": vip_id, "warm": warm_id},
+        )
+        conn.execute(
+            text("INSERT INTO contact_tags VALUES (:c, :warm), (:c, :vip)"),
+            {"c": contact_id, "vip": vip_id, "warm": warm_id},
+        )
+        for lead_id, contact, created in (
+            (older, contact_id, "2026-03-01 09:00:00"),
+            (newer, None, "2026-03-10 09:00:00"),
+        ):
+            conn.execute(
+                text(
+                    "INSERT INTO sales_leads VALUES (:id, :contact, 'free_guide', "
+                    "'contacted', 'alice', :created, :created)"
+                ),
+                {"id": lead_id, "contact": contact, "created": created},
+            )
+        conn.execute(
+            text(
+                "INSERT INTO sales_lead_events VALUES (:id, :lead, 'stage_changed', "
+                "'contacted', '2026-03-15 12:00:00')"
+            ),
+            {"id": uuid4().hex, "lead": older},
+        )
+    return [str(UUID(newer)), str(UUID(older))]
+
+
+def test_stream_export_rows_writes_gzip_csv_in_parts(engine: Engine) -> None:
+    expected_ids = _seed(engine)
+    s3 = _FakeS3()
+    upload = export.S3MultipartWriter(
+        s3,
+        bucket="assets",
+        key="exports/sales-leads/x/leads.csv.gz",
+        content_type="application/gzip",
+        part_bytes=64,
+    )
+
+    with Session(engine) as session:
+        rows = SalesLeadRepository(session).stream_export_rows(batch_size=1)
+        count = export.write_lead_export(rows, upload, now=_NOW)
+    size = upload.complete()
+
+    assert count == 2
+    assert size == sum(len(part) for part in s3.parts.values())
+    assert len(s3.parts) > 1
+    assert [part["PartNumber"] for part in s3.completed or []] == sorted(s3.parts)
+    header, first, second = s3.rows()
+    assert header == export.LEAD_EXPORT_HEADER
+    assert [first[0], second[0]] == expected_ids
+    assert second[1:9] == [
+        "Ada",
+        "Lee",
+        "ada@example.com",
+        "+85291234567",
+        "referral",
+        "free_guide",
+        "contacted",
+        "alice",
+    ]
+    assert second[10].startswith("2026-03-15T12:00:00")
+    assert second[11] == "5"
+    assert second[12] == "vip,warm"
+    assert first[1:6] == ["", "", "", "", ""]
+    assert first[11] == "10"
+    assert first[12] == ""
+
+
+def test_process_export_job_uploads_and_records_result(
+    engine: Engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed(engine)
+    job_id = uuid4()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO sales_lead_export_jobs (id, created_by, filters, status, "
+                "created_at, updated_at) VALUES (:id, 'admin-sub', :filters, "
+                "'pending', '2026-03-20 12:00:00', '2026-03-20 12:00:00')"
+            ),
+            {
+                "id": job_id.hex,
+                "filters": json.dumps(
+                    export.dump_export_filters({"search": "ada", "stage": []})
+                ),
+            },
+        )
+    s3 = _FakeS3()
+    monkeypatch.setattr(export, "get_engine", lambda: engine)
+    monkeypatch.setattr(export, "get_s3_client", lambda: s3)
+    monkeypatch.setenv("ASSETS_BUCKET_NAME", "assets")
+
+    outcome = export.process_sales_lead_export_job(job_id)
+
+    assert outcome.ack_sqs_message
+    assert len(s3.rows()) == 2
+    assert s3.created["Key"] == (
+        f"exports/sales-leads/{job_id}/leads-export-2026-03-20.csv.gz"
+    )
+    with engine.connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT status, total_count, exported_count, s3_key "
+                "FROM sales_lead_export_jobs"
+            )
+        ).one()
+    assert row.status == "succeeded"
+    assert (row.total_count, row.exported_count) == (1, 1)
+    assert row.s3_key == s3.created["Key"]
+
+
+def test_export_filters_round_trip() -> None:
+    from app.db.models.enums import ContactSource, FunnelStage
+
+    filters = {
+        "stage": [FunnelStage.NEW],
+        "source": [ContactSource.REFERRAL],
+        "lead_type": [],
+        "assigned_to": None,
+        "unassigned": True,
+        "date_from": datetime(2026, 1, 1, tzinfo=UTC),
+        "date_to": None,
+        "search": "lee",
+    }
+
+    loaded = export.load_export_filters(
+        json.loads(json.dumps(export.dump_export_filters(filters)))
+    )
+
+    assert loaded == filters
+
+
+def test_enqueue_sales_lead_export_requires_queue_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("SALES_LEAD_EXPORT_QUEUE_URL", raising=False)
+    with pytest.raises(ValidationError, match="queue is not configured"):
+        enqueue_sales_lead_export_job(uuid4())
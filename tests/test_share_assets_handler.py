@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Any
-from uuid import UUID, uuid4
 
 from app.api.assets import share_assets
 from app.db.models import AssetVisibility
+from app.services.share_link_cache import ShareLinkTarget
 
 
 class _FakeSession:
@@ -19,41 +18,29 @@ class _FakeSession:
         return False
 
 
-@dataclass
-class _FakeShareLink:
-    asset_id: UUID
-    allowed_domains: list[str]
-
-
-@dataclass
-class _FakeAsset:
-    id: UUID
-    visibility: AssetVisibility
-    s3_key: str
-
-
-def test_handle_share_assets_request_redirects_when_token_domain_and_asset_are_valid(
-    monkeypatch: Any,
-) -> None:
-    asset_id = uuid4()
-    share_link = _FakeShareLink(asset_id=asset_id, allowed_domains=["www.example.com"])
-    asset = _FakeAsset(
-        id=asset_id,
-        visibility=AssetVisibility.PUBLIC,
+def _target(
+    visibility: AssetVisibility = AssetVisibility.PUBLIC,
+) -> ShareLinkTarget:
+    return ShareLinkTarget(
         s3_key="assets/example.pdf",
+        visibility=visibility,
+        allowed_domains=frozenset({"www.example.com"}),
     )
 
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> _FakeShareLink:  # noqa: ARG002
-            return share_link
-
-        def get_by_id(self, _asset_id: UUID) -> _FakeAsset:
-            return asset
 
+def _patch_resolution(monkeypatch: Any, target: ShareLinkTarget | None) -> None:
     monkeypatch.setattr(share_assets, "Session", _FakeSession)
     monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
+    monkeypatch.setattr(
+        share_assets, "resolve_share_link_target", lambda _session, _token: target
+    )
     monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+
+
+def test_handle_share_assets_request_redirects_when_token_domain_and_asset_are_valid(
+    monkeypatch: Any,
+) -> None:
+    _patch_resolution(monkeypatch, _target())
     monkeypatch.setattr(
         share_assets,
         "extract_request_source_domain",
@@ -77,19 +64,7 @@ def test_handle_share_assets_request_redirects_when_token_domain_and_asset_are_v
 def test_handle_share_assets_request_forbidden_for_unapproved_source_domain(
     monkeypatch: Any,
 ) -> None:
-    share_link = _FakeShareLink(asset_id=uuid4(), allowed_domains=["www.example.com"])
-
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> _FakeShareLink:  # noqa: ARG002
-            return share_link
-
-        def get_by_id(self, _asset_id: UUID) -> None:
-            return None
-
-    monkeypatch.setattr(share_assets, "Session", _FakeSession)
-    monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
-    monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+    _patch_resolution(monkeypatch, _target())
     monkeypatch.setattr(
         share_assets,
         "extract_request_source_domain",
@@ -107,25 +82,7 @@ def test_handle_share_assets_request_forbidden_for_unapproved_source_domain(
 def test_handle_email_download_request_redirects_without_source_domain_check(
     monkeypatch: Any,
 ) -> None:
-    asset_id = uuid4()
-    share_link = _FakeShareLink(asset_id=asset_id, allowed_domains=["www.example.com"])
-    asset = _FakeAsset(
-        id=asset_id,
-        visibility=AssetVisibility.PUBLIC,
-        s3_key="assets/example.pdf",
-    )
-
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> _FakeShareLink:  # noqa: ARG002
-            return share_link
-
-        def get_by_id(self, _asset_id: UUID) -> _FakeAsset:
-            return asset
-
-    monkeypatch.setattr(share_assets, "Session", _FakeSession)
-    monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
-    monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+    _patch_resolution(monkeypatch, _target())
     monkeypatch.setattr(
         share_assets,
         "generate_download_url",
@@ -156,14 +113,7 @@ def test_handle_email_download_request_returns_404_for_invalid_token(
 def test_handle_email_download_request_returns_404_when_share_link_missing(
     monkeypatch: Any,
 ) -> None:
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> None:  # noqa: ARG002
-            return None
-
-    monkeypatch.setattr(share_assets, "Session", _FakeSession)
-    monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
-    monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+    _patch_resolution(monkeypatch, None)
 
     response = share_assets.handle_email_download_request(
         {"headers": {}},
@@ -176,19 +126,7 @@ def test_handle_email_download_request_returns_404_when_share_link_missing(
 def test_handle_email_download_request_returns_404_when_asset_missing(
     monkeypatch: Any,
 ) -> None:
-    share_link = _FakeShareLink(asset_id=uuid4(), allowed_domains=["www.example.com"])
-
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> _FakeShareLink:  # noqa: ARG002
-            return share_link
-
-        def get_by_id(self, _asset_id: UUID) -> None:
-            return None
-
-    monkeypatch.setattr(share_assets, "Session", _FakeSession)
-    monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
-    monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+    _patch_resolution(monkeypatch, None)
 
     response = share_assets.handle_email_download_request(
         {"headers": {}},
@@ -201,25 +139,7 @@ def test_handle_email_download_request_returns_404_when_asset_missing(
 def test_handle_email_download_request_returns_401_for_restricted_without_jwt(
     monkeypatch: Any,
 ) -> None:
-    asset_id = uuid4()
-    share_link = _FakeShareLink(asset_id=asset_id, allowed_domains=["www.example.com"])
-    asset = _FakeAsset(
-        id=asset_id,
-        visibility=AssetVisibility.RESTRICTED,
-        s3_key="assets/example.pdf",
-    )
-
-    class _Repo:
-        def get_share_link_by_token(self, token: str) -> _FakeShareLink:  # noqa: ARG002
-            return share_link
-
-        def get_by_id(self, _asset_id: UUID) -> _FakeAsset:
-            return asset
-
-    monkeypatch.setattr(share_assets, "Session", _FakeSession)
-    monkeypatch.setattr(share_assets, "get_engine", lambda: object())
-    monkeypatch.setattr(share_assets, "AssetRepository", lambda _session: _Repo())
-    monkeypatch.setattr(share_assets, "is_valid_share_token", lambda _token: True)
+    _patch_resolution(monkeypatch, _target(AssetVisibility.RESTRICTED))
     monkeypatch.setattr(
         share_assets,
         "_is_restricted_share_request_authenticated",
@@ -0,0 +1,115 @@
+"""Tests for the container-level share-token cache."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.db.models import AssetVisibility
+from app.db.repositories.cache_version import CacheVersionRepository
+from app.services import share_link_cache
+
+
+class _Backend:
+    def __init__(self) -> None:
+        self.rows: dict[str, tuple[str, AssetVisibility, list[str]]] = {}
+        self.version = 0
+        self.lookups: list[str] = []
+        self.version_reads = 0
+
+
+@pytest.fixture
+def backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[_Backend]:
+    state = _Backend()
+
+    class _AssetRepo:
+        def __init__(self, _session: Any) -> None:
+            pass
+
+        def get_share_target_by_token(
+            self, *, token: str
+        ) -> tuple[str, AssetVisibility, list[str]] | None:
+            state.lookups.append(token)
+            return state.rows.get(token)
+
+    class _VersionRepo:
+        def __init__(self, _session: Any) -> None:
+            pass
+
+        def get_version(self, _name: str) -> int:
+            state.version_reads += 1
+            return state.version
+
+    monkeypatch.setattr(share_link_cache, "AssetRepository", _AssetRepo)
+    monkeypatch.setattr(share_link_cache, "CacheVersionRepository", _VersionRepo)
+    share_link_cache.clear_share_link_cache()
+    yield state
+    share_link_cache.clear_share_link_cache()
+
+
+def _resolve(token: str, now: float) -> share_link_cache.ShareLinkTarget | None:
+    return share_link_cache.resolve_share_link_target(
+        None,  # type: ignore[arg-type]
+        token,
+        clock=lambda: now,
+    )
+
+
+def test_resolve_serves_hits_and_misses_from_memory(backend: _Backend) -> None:
+    backend.rows["good"] = ("assets/a.pdf", AssetVisibility.PUBLIC, ["example.com"])
+
+    first = _resolve("good", 0.0)
+    again = _resolve("good", 1.0)
+    assert _resolve("unknown", 1.0) is None
+    assert _resolve("unknown", 2.0) is None
+
+    assert first == again
+    assert first is not None
+    assert first.allowed_domains == frozenset({"example.com"})
+    assert backend.lookups == ["good", "unknown"]
+    assert backend.version_reads == 1
+
+
+def test_negative_entries_expire_before_positive_ones(backend: _Backend) -> None:
+    assert _resolve("late", 0.0) is None
+    backend.rows["late"] = ("assets/b.pdf", AssetVisibility.PUBLIC, [])
+    _resolve("late", share_link_cache.SHARE_LINK_NEGATIVE_TTL_SECONDS - 1)
+    target = _resolve("late", share_link_cache.SHARE_LINK_NEGATIVE_TTL_SECONDS + 1)
+
+    assert target is not None
+    assert target.s3_key == "assets/b.pdf"
+    assert backend.lookups == ["late", "late"]
+
+
+def test_version_bump_drops_cached_targets(backend: _Backend) -> None:
+    backend.rows["tok"] = ("assets/c.pdf", AssetVisibility.PUBLIC, [])
+    _resolve("tok", 0.0)
+    del backend.rows["tok"]
+    backend.version = 1
+
+    assert _resolve("tok", 1.0) is not None
+    assert _resolve("tok", share_link_cache.SHARE_LINK_VERSION_CHECK_SECONDS) is None
+    assert backend.version_reads == 2
+
+
+def test_cache_version_repository_bumps_and_creates_rows() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE cache_versions (name VARCHAR(64) PRIMARY KEY, "
+                "version BIGINT NOT NULL DEFAULT 0, updated_at TIMESTAMP NOT NULL)"
+            )
+        )
+
+    with Session(engine) as session:
+        repository = CacheVersionRepository(session)
+        assert repository.get_version("scope") == 0
+        repository.bump("scope")
+        repository.bump("scope")
+        session.commit()
+        assert repository.get_version("scope") == 2